@@ -7,8 +7,12 @@ COM PERSISTÊNCIA DE LOGIN VIA COOKIES (CORRIGIDO)
 import os
 import psycopg2
 import hashlib
+import threading
 import streamlit as st
 from datetime import datetime, timedelta
+from psycopg2.extras import execute_values
+
+from src.utils.auditoria import GravadorEmLote
 
 # Importar gerenciador de cookies
 try:
@@ -153,6 +157,12 @@ def limpar_sessao_cookie():
 # CLASSE DE AUTENTICAÇÃO (ORIGINAL)
 # ============================================
 
+# Estado por processo (AuthManager é instanciado a cada login)
+_tabelas_criadas = set()  # DATABASE_URLs cujas tabelas já foram verificadas
+_auditorias = {}  # DATABASE_URL -> GravadorEmLote de log_acessos
+_lock_auditoria = threading.Lock()
+
+
 class AuthManager:
     def __init__(self):
         """Inicializa o gerenciador de autenticação"""
@@ -168,7 +178,9 @@ class AuthManager:
         if not self.database_url:
             raise ValueError("❌ DATABASE_URL não configurada! Configure em Secrets (Cloud) ou .env (Local)")
         
-        self._criar_tabela_usuarios()
+        if self.database_url not in _tabelas_criadas:
+            self._criar_tabela_usuarios()
+            _tabelas_criadas.add(self.database_url)
     
     def get_connection(self):
         """Retorna conexão com PostgreSQL"""
@@ -212,6 +224,47 @@ class AuthManager:
             cursor.close()
             conn.close()
     
+    @property
+    def auditoria(self):
+        """Gravador em lote de log_acessos (um por processo e banco)"""
+        with _lock_auditoria:
+            if self.database_url not in _auditorias:
+                _auditorias[self.database_url] = GravadorEmLote(self._gravar_acessos)
+            return _auditorias[self.database_url]
+    
+    def _gravar_acessos(self, registros):
+        """
+        Grava um lote de (usuario_id, acao, detalhes, data_hora) em log_acessos
+        e atualiza ultimo_acesso (último login de cada usuário do lote)
+        """
+        ultimos = {}
+        for usuario_id, acao, _, data_hora in registros:
+            if acao == 'login':
+                ultimos[usuario_id] = max(data_hora, ultimos.get(usuario_id, data_hora))
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            execute_values(cursor, """
+                INSERT INTO log_acessos (usuario_id, acao, detalhes, data_hora) VALUES %s
+            """, registros)
+            
+            if ultimos:
+                execute_values(cursor, """
+                    UPDATE usuarios SET ultimo_acesso = v.data_hora
+                    FROM (VALUES %s) AS v(id, data_hora)
+                    WHERE usuarios.id = v.id
+                """, list(ultimos.items()))
+            
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+    
     def _hash_senha(self, senha):
         """Gera hash SHA-256 da senha"""
         return hashlib.sha256(senha.encode()).hexdigest()
@@ -257,18 +310,10 @@ class AuthManager:
             resultado = cursor.fetchone()
             
             if resultado:
-                cursor.execute("""
-                    UPDATE usuarios 
-                    SET ultimo_acesso = CURRENT_TIMESTAMP 
-                    WHERE id = %s
-                """, (resultado[0],))
-                
-                cursor.execute("""
-                    INSERT INTO log_acessos (usuario_id, acao, detalhes)
-                    VALUES (%s, 'login', 'Login realizado com sucesso')
-                """, (resultado[0],))
-                
-                conn.commit()
+                # ultimo_acesso e log_acessos são gravados em lote, fora do login
+                self.auditoria.registrar(
+                    (resultado[0], 'login', 'Login realizado com sucesso', datetime.now())
+                )
                 
                 return {
                     'id': resultado[0],
@@ -8,11 +8,14 @@ import pandas as pd
 from datetime import datetime
 from psycopg2.extras import execute_batch
 
+from src.utils.cache_tags import depende_de, invalidar
+
 
 # ============================================
 # FUNÇÃO DE CARREGAMENTO (ESCOPO GLOBAL)
 # ============================================
 
+@depende_de("jogadores", "vinculos_clubes")
 @st.cache_data(ttl=300, show_spinner=False)
 def carregar_jogadores(_db):
     """Carrega jogadores do banco com cache"""
@@ -356,6 +359,7 @@ def salvar_avaliacoes_lote(df, avaliador, data_avaliacao, db):
         # Executar em lote
         execute_batch(cursor, insert_query, avaliacoes)
         conn.commit()
+        invalidar("avaliacoes")
         
         st.success(f"✅ {len(avaliacoes)} avaliações salvas com sucesso!")
         st.balloons()
@@ -56,6 +56,8 @@ try:
         exibir_lista_com_fotos_refatorado
     )
     from database import ScoutingDatabase
+    from src.analysis.oportunidades import RegrasOportunidade, listar_oportunidades, marcar_oportunidades
+    from src.utils.cache_tags import depende_de, invalidar
     from visualizacoes_avancadas import (
         criar_grafico_percentil,
         criar_heatmap_performance,
@@ -292,17 +294,32 @@ def get_perfil_url(id_jogador):
 
 
 def calcular_media_jogador(db, id_jogador):
-    """Calcula a média geral das avaliações do jogador (4 pilares)"""
-    avals = db.get_ultima_avaliacao(id_jogador)
-    if not avals.empty:
-        media = (
-            avals["nota_tatico"].iloc[0]
-            + avals["nota_tecnico"].iloc[0]
-            + avals["nota_fisico"].iloc[0]
-            + avals["nota_mental"].iloc[0]
-        ) / 4
-        return media
-    return 0.0
+    """Média dos 4 pilares da última avaliação do jogador (0.0 se não avaliado)"""
+    return float(medias_por_jogador(db, [id_jogador]).iloc[0])
+
+
+def medias_por_jogador(db, ids_jogadores):
+    """
+    Média da última avaliação para vários jogadores de uma vez
+
+    Usa o DataFrame único de db.get_medias_jogadores() (uma consulta em cache),
+    alinhado com ids_jogadores; jogadores sem avaliação ficam com 0.0.
+    """
+    medias = db.get_medias_jogadores()["media"]
+    return pd.Series(ids_jogadores).map(medias).fillna(0.0)
+
+
+@depende_de("avaliacoes")
+@st.cache_data(ttl=600, show_spinner=False)
+def oportunidades_mercado(_db, df_mercado, regras):
+    """
+    Oportunidades de mercado memoizadas por conjunto de filtros
+
+    A chave é o conteúdo de df_mercado (resultado dos filtros da aba) e as
+    regras; novas avaliações invalidam via tag "avaliacoes".
+    """
+    marcados = marcar_oportunidades(df_mercado, _db.get_medias_jogadores()["media"], regras)
+    return listar_oportunidades(marcados)
 
 
 def get_top_jogadores_por_posicao(df_jogadores, db, posicoes_filtro, top_n=15):
@@ -320,13 +337,8 @@ def get_top_jogadores_por_posicao(df_jogadores, db, posicoes_filtro, top_n=15):
     if len(candidatos) == 0:
         return []
 
-    # Calcular médias para esses candidatos
-    medias = []
-    for _, jogador in candidatos.iterrows():
-        media = calcular_media_jogador(db, jogador["id_jogador"])
-        medias.append(media)
-
-    candidatos["media_ranking"] = medias
+    # Médias de todos os candidatos de uma vez
+    candidatos["media_ranking"] = medias_por_jogador(db, candidatos["id_jogador"]).to_numpy()
 
     # Ordenar e pegar os top N
     candidatos = candidatos.sort_values("media_ranking", ascending=False).head(top_n)
@@ -1636,6 +1648,7 @@ def exibir_lista_com_fotos_legacy(df_display, db, debug=False, sufixo_key="padra
 def tab_ranking(db, df_jogadores):
     st.markdown("### 🏆 Ranking de Jogadores por Avaliações")
 
+    @depende_de("avaliacoes", "jogadores", "vinculos_clubes")
     @st.cache_data(ttl=600, show_spinner=False)
     def carregar_avaliacoes(_db):
         """Carrega média das avaliações dos últimos 6 meses por jogador"""
@@ -2340,13 +2353,10 @@ def tab_shadow_team(db, df_jogadores):
                     st.metric("Idade Média", f"{idade_media:.1f}" if idade_media > 0 else "N/A")
                 with col_c:
                     # Calcular média geral do time
-                    medias = []
-                    for id_j in st.session_state.shadow_team.values():
-                        media = calcular_media_jogador(db, id_j)
-                        if media > 0:
-                            medias.append(media)
+                    medias = medias_por_jogador(db, list(st.session_state.shadow_team.values()))
+                    medias = medias[medias > 0]
                     
-                    media_time = np.mean(medias) if len(medias) > 0 else 0
+                    media_time = medias.mean() if len(medias) > 0 else 0
                     st.metric("Média do Time", f"{media_time:.2f}" if media_time > 0 else "N/A")
         else:
             st.info("👆 Selecione jogadores nas posições acima para montar seu time ideal")
@@ -3056,6 +3066,13 @@ def tab_busca_avancada(db, df_jogadores):
         format_func=lambda x: todas_tags[todas_tags['id_tag'] == x]['nome'].iloc[0],
         key="busca_tags"
     )
+    tags_modo = st.radio(
+        "Combinar tags",
+        options=["qualquer", "todas"],
+        format_func=lambda x: "Qualquer uma das tags" if x == "qualquer" else "Todas as tags",
+        horizontal=True,
+        key="busca_tags_modo"
+    )
     
     # === BOTÕES DE AÇÃO ===
     col1, col2, col3 = st.columns([2, 2, 1])
@@ -3083,7 +3100,8 @@ def tab_busca_avancada(db, df_jogadores):
             'idade_max': idade_max,
             'media_min': media_min,
             'contrato_vencendo': contrato_vencendo,
-            'tags': tags_selecionadas if tags_selecionadas else None
+            'tags': tags_selecionadas if tags_selecionadas else None,
+            'tags_modo': tags_modo
         }
         
         with st.spinner("Buscando jogadores..."):
@@ -3275,7 +3293,8 @@ def tab_analise_mercado(db, df_jogadores):
         
         with col1:
             st.markdown("#### Distribuição por Clube")
-            top_clubes = df_mercado['clube'].value_counts().head(15)
+            # Colunas category: value_counts lista também categorias sem jogadores
+            top_clubes = df_mercado['clube'].value_counts().loc[lambda c: c > 0].head(15)
             fig = px.bar(
                 x=top_clubes.values,
                 y=top_clubes.index,
@@ -3287,7 +3306,7 @@ def tab_analise_mercado(db, df_jogadores):
         
         with col2:
             st.markdown("#### Distribuição por Nacionalidade")
-            top_nacs = df_mercado['nacionalidade'].value_counts().head(10)
+            top_nacs = df_mercado['nacionalidade'].value_counts().loc[lambda c: c > 0].head(10)
             fig = px.pie(
                 values=top_nacs.values,
                 names=top_nacs.index,
@@ -3349,45 +3368,18 @@ def tab_analise_mercado(db, df_jogadores):
         st.caption("Jogadores em situações favoráveis para negociação")
         
         # Critérios de oportunidade
-        oportunidades = []
-        
-        # 1. Jovens promissores com avaliação alta
-        for _, jogador in df_mercado.iterrows():
-            if pd.notna(jogador.get('idade_atual')) and jogador['idade_atual'] < 23:
-                media = calcular_media_jogador(db, jogador['id_jogador'])
-                if media >= 4.0:
-                    oportunidades.append({
-                        'jogador': jogador['nome'],
-                        'tipo': '🌟 Jovem Promissor',
-                        'detalhes': f"{jogador['idade_atual']} anos, Média: {media:.1f}",
-                        'id_jogador': jogador['id_jogador']
-                    })
-        
-        # 2. Contratos vencendo em 6 meses
-        for _, jogador in df_mercado.iterrows():
-            if pd.notna(jogador.get('data_fim_contrato')):
-                dias_restantes = (pd.to_datetime(jogador['data_fim_contrato']) - pd.Timestamp.now()).days
-                if 0 < dias_restantes <= 180:
-                    oportunidades.append({
-                        'jogador': jogador['nome'],
-                        'tipo': '⏰ Contrato Curto',
-                        'detalhes': f"Vence em {dias_restantes} dias",
-                        'id_jogador': jogador['id_jogador']
-                    })
-        
-        # 3. Jogadores livres no mercado
-        for _, jogador in df_mercado.iterrows():
-            if jogador.get('status_contrato') == 'livre':
-                oportunidades.append({
-                    'jogador': jogador['nome'],
-                    'tipo': '🆓 Livre',
-                    'detalhes': f"{jogador.get('posicao', 'N/A')}, {jogador.get('idade_atual', 'N/A')} anos",
-                    'id_jogador': jogador['id_jogador']
-                })
+        with st.expander("⚙️ Critérios"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                idade_jovem = st.number_input("Jovem: idade abaixo de", 16, 30, 23, key="oport_idade")
+            with col2:
+                media_jovem = st.number_input("Jovem: média mínima", 1.0, 5.0, 4.0, step=0.5, key="oport_media")
+            with col3:
+                dias_contrato = st.number_input("Contrato curto: dias", 30, 730, 180, step=30, key="oport_dias")
+        regras = RegrasOportunidade(int(idade_jovem), float(media_jovem), int(dias_contrato))
+        df_oport = oportunidades_mercado(db, df_mercado, regras)
         
-        if len(oportunidades) > 0:
-            df_oport = pd.DataFrame(oportunidades)
-            
+        if len(df_oport) > 0:
             # Mostrar por tipo
             for tipo in df_oport['tipo'].unique():
                 with st.expander(f"{tipo} ({len(df_oport[df_oport['tipo'] == tipo])})", expanded=True):
@@ -3451,30 +3443,29 @@ def comparar_jogadores_busca(db, ids_jogadores, df_jogadores):
     """Compara múltiplos jogadores da busca"""
     st.markdown("### ⚖️ Comparação de Jogadores")
     
-    # Buscar dados dos jogadores
-    dados_comparacao = []
-    
-    for id_jog in ids_jogadores:
-        jogador = df_jogadores[df_jogadores['id_jogador'] == id_jog].iloc[0]
-        avaliacao = db.get_ultima_avaliacao(id_jog)
-        
-        if not avaliacao.empty:
-            dados_comparacao.append({
-                'Nome': jogador['nome'],
-                'Posição': jogador.get('posicao', 'N/A'),
-                'Clube': jogador.get('clube', 'Livre'),
-                'Idade': jogador.get('idade_atual', 'N/A'),
-                'Potencial': avaliacao['nota_potencial'].iloc[0],
-                'Tático': avaliacao['nota_tatico'].iloc[0],
-                'Técnico': avaliacao['nota_tecnico'].iloc[0],
-                'Físico': avaliacao['nota_fisico'].iloc[0],
-                'Mental': avaliacao['nota_mental'].iloc[0],
-                'Média': (avaliacao['nota_tatico'].iloc[0] + avaliacao['nota_tecnico'].iloc[0] +
-                          avaliacao['nota_fisico'].iloc[0] + avaliacao['nota_mental'].iloc[0]) / 4
-            })
-    
-    if len(dados_comparacao) > 0:
-        df_comp = pd.DataFrame(dados_comparacao)
+    # Jogadores selecionados + última avaliação (join com as médias em cache)
+    selecionados = (
+        df_jogadores[df_jogadores['id_jogador'].isin(ids_jogadores)]
+        .drop_duplicates('id_jogador')
+        .set_index('id_jogador')
+        .reindex(ids_jogadores)
+        .dropna(subset=['nome'])
+    )
+    df_comp = selecionados.join(db.get_medias_jogadores(), how='inner')
+    
+    if len(df_comp) > 0:
+        df_comp = pd.DataFrame({
+            'Nome': df_comp['nome'],
+            'Posição': df_comp['posicao'] if 'posicao' in df_comp else 'N/A',
+            'Clube': df_comp['clube'] if 'clube' in df_comp else 'Livre',
+            'Idade': df_comp['idade_atual'] if 'idade_atual' in df_comp else 'N/A',
+            'Potencial': df_comp['nota_potencial'],
+            'Tático': df_comp['nota_tatico'],
+            'Técnico': df_comp['nota_tecnico'],
+            'Físico': df_comp['nota_fisico'],
+            'Mental': df_comp['nota_mental'],
+            'Média': df_comp['media'],
+        }).reset_index(drop=True)
         
         # Tabela
         st.dataframe(df_comp, width='stretch', hide_index=True)
@@ -3509,36 +3500,20 @@ def comparar_jogadores_busca(db, ids_jogadores, df_jogadores):
         st.warning("Jogadores selecionados não possuem avaliações")
 
 
-def calcular_media_jogador(db, id_jogador):
-    """Calcula média de um jogador (helper)"""
-    avaliacao = db.get_ultima_avaliacao(id_jogador)
-    if not avaliacao.empty:
-        return (avaliacao['nota_tatico'].iloc[0] + avaliacao['nota_tecnico'].iloc[0] +
-                avaliacao['nota_fisico'].iloc[0] + avaliacao['nota_mental'].iloc[0]) / 4
-    return 0.0
-
-
 # ========================================
 # FUNÇÃO PRINCIPAL
 # ========================================
 
-@st.cache_data(ttl=600, show_spinner=False)  # ← ADICIONE ESTA LINHA
 def carregar_jogadores(_db):
-    """Carrega jogadores do banco com cache"""
+    """Jogadores do snapshot compartilhado (atualizado por delta, sem st.cache_data)"""
     return _db.get_jogadores_com_vinculos()
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_opcoes_filtros_cached(_db):
-    """Cache das opções de filtros para a sidebar"""
-    df = _db.get_jogadores_com_vinculos()
-    return {
-        'posicoes': sorted(df['posicao'].dropna().unique().tolist()) if 'posicao' in df.columns else [],
-        'clubes': sorted(df['clube'].dropna().unique().tolist()) if 'clube' in df.columns else [],
-        'nacionalidades': sorted(df['nacionalidade'].dropna().unique().tolist()) if 'nacionalidade' in df.columns else [],
-        'ligas': sorted(df['liga_clube'].dropna().unique().tolist()) if 'liga_clube' in df.columns else []
-    }
+    """Opções dos filtros da sidebar (memorizadas por versão do snapshot)"""
+    return _db.get_opcoes_filtros()
 
 
+@depende_de("wishlist")
 @st.cache_data(ttl=300, show_spinner=False)
 def get_ids_wishlist_cached(_db):
     """Cache de IDs da wishlist para lookup O(1)"""
@@ -3546,10 +3521,8 @@ def get_ids_wishlist_cached(_db):
 
 
 def invalidar_caches():
-    """Limpa todos os caches após sincronização"""
-    carregar_jogadores.clear()
-    get_opcoes_filtros_cached.clear()
-    get_ids_wishlist_cached.clear()
+    """Limpa os caches de jogadores/vínculos/wishlist após sincronização"""
+    invalidar("jogadores", "vinculos_clubes", "wishlist")
 
 
 def main():
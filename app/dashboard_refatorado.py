@@ -10,6 +10,7 @@ from sqlalchemy import text
 import plotly.graph_objects as go
 from utils_fotos import get_foto_jogador
 from utils_logos import get_logo_clube, get_logo_liga
+from src.utils.cache_tags import depende_de
 
 # Importar streamlit-shadcn-ui com fallback
 try:
@@ -601,6 +602,7 @@ def tab_ranking_refatorado(db, df_jogadores):
     """
     st.markdown("### 🏆 Ranking de Jogadores por Avaliações")
 
+    @depende_de("avaliacoes", "jogadores", "vinculos_clubes")
     @st.cache_data(ttl=600, show_spinner=False)
     def carregar_avaliacoes(_db):
         """Carrega média das avaliações dos últimos 6 meses por jogador"""
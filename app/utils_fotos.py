@@ -8,6 +8,8 @@ import requests
 from bs4 import BeautifulSoup
 import streamlit as st
 
+from src.utils import http_cache
+
 
 def extrair_id_da_url(tm_value):
     """
@@ -61,7 +63,8 @@ def extrair_url_foto_transfermarkt(tm_id, usar_scraping=True):
         }
 
         try:
-            response = requests.get(url_pagina, headers=headers, timeout=15)
+            # Cache HTTP em disco: revalida com ETag/Last-Modified quando vence
+            response = http_cache.get(url_pagina, headers=headers, timeout=15)
 
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, "html.parser")
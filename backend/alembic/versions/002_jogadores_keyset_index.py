@@ -0,0 +1,31 @@
+"""Composite index for keyset pagination of jogadores
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create (nome, id_jogador) index backing cursor pagination."""
+    op.create_index(
+        'ix_jogadores_nome_id',
+        'jogadores',
+        ['nome', 'id_jogador'],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop keyset pagination index."""
+    op.drop_index('ix_jogadores_nome_id', table_name='jogadores', if_exists=True)
@@ -0,0 +1,50 @@
+"""Trigram search indexes (pg_trgm + unaccent) for jogadores
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create extensions, immutable unaccent wrapper and GIN trigram indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+
+    # unaccent() é STABLE; índices de expressão exigem uma função IMMUTABLE
+    op.execute("""
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT AS
+        $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_jogadores_nome_trgm
+        ON jogadores USING gin (f_unaccent(lower(nome)) gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_jogadores_nacionalidade_trgm
+        ON jogadores USING gin (f_unaccent(lower(nacionalidade)) gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_vinculos_clube_trgm
+        ON vinculos_clubes USING gin (f_unaccent(lower(clube)) gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    """Drop trigram indexes and the unaccent wrapper."""
+    op.execute("DROP INDEX IF EXISTS ix_vinculos_clube_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_jogadores_nacionalidade_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_jogadores_nome_trgm")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -0,0 +1,68 @@
+"""Materialized dashboard aggregates and table version counters
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABELAS_VERSIONADAS = ("jogadores", "vinculos_clubes", "avaliacoes", "wishlist")
+
+
+def upgrade() -> None:
+    """Create versoes_tabelas/dashboard_resumo and statement-level version triggers."""
+    op.create_table(
+        'versoes_tabelas',
+        sa.Column('tabela', sa.String(length=100), nullable=False),
+        sa.Column('versao', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('atualizado_em', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.PrimaryKeyConstraint('tabela')
+    )
+
+    op.create_table(
+        'dashboard_resumo',
+        sa.Column('secao', sa.String(length=50), nullable=False),
+        sa.Column('dados', sa.JSON(), nullable=False),
+        sa.Column('versoes', sa.JSON(), nullable=False),
+        sa.Column('calculado_em', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('secao')
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION incrementar_versao_tabela() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO versoes_tabelas(tabela, versao, atualizado_em)
+            VALUES (TG_TABLE_NAME, 1, now())
+            ON CONFLICT (tabela) DO UPDATE
+            SET versao = versoes_tabelas.versao + 1, atualizado_em = now();
+            RETURN NULL;
+        END;
+        $$
+    """)
+
+    for tabela in TABELAS_VERSIONADAS:
+        op.execute(f"""
+            CREATE TRIGGER {tabela}_versao
+            AFTER INSERT OR UPDATE OR DELETE ON {tabela}
+            FOR EACH STATEMENT EXECUTE FUNCTION incrementar_versao_tabela()
+        """)
+
+
+def downgrade() -> None:
+    """Drop version triggers and aggregate tables."""
+    for tabela in TABELAS_VERSIONADAS:
+        op.execute(f"DROP TRIGGER IF EXISTS {tabela}_versao ON {tabela}")
+    op.execute("DROP FUNCTION IF EXISTS incrementar_versao_tabela()")
+    op.drop_table('dashboard_resumo')
+    op.drop_table('versoes_tabelas')
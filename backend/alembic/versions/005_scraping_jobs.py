@@ -0,0 +1,46 @@
+"""Persistent scraping jobs table
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create scraping_jobs table."""
+    op.create_table(
+        'scraping_jobs',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('tipo', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
+        sa.Column('progress', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('current_step', sa.String(length=255), nullable=True),
+        sa.Column('processed_items', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_items', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('errors', sa.JSON(), nullable=False, server_default='[]'),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('criado_por', sa.String(length=100), nullable=True),
+        sa.Column('worker', sa.String(length=100), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_scraping_jobs_status'), 'scraping_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop scraping_jobs table."""
+    op.drop_index(op.f('ix_scraping_jobs_status'), table_name='scraping_jobs')
+    op.drop_table('scraping_jobs')
@@ -0,0 +1,47 @@
+"""Saved-search result cache and usage counters
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create buscas_resultados, add usage columns and version jogador_tags."""
+    op.create_table(
+        'buscas_resultados',
+        sa.Column('chave', sa.String(length=64), nullable=False),
+        sa.Column('jogadores', sa.JSON(), nullable=False),
+        sa.Column('versoes', sa.JSON(), nullable=False),
+        sa.Column('calculado_em', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('chave')
+    )
+
+    op.add_column('buscas_salvas', sa.Column('total_execucoes', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('buscas_salvas', sa.Column('ultima_execucao', sa.DateTime(timezone=True), nullable=True))
+
+    # Filtro por tags depende de jogador_tags (função criada na migration 004)
+    op.execute("""
+        CREATE TRIGGER jogador_tags_versao
+        AFTER INSERT OR UPDATE OR DELETE ON jogador_tags
+        FOR EACH STATEMENT EXECUTE FUNCTION incrementar_versao_tabela()
+    """)
+
+
+def downgrade() -> None:
+    """Drop the jogador_tags version trigger, usage columns and result cache."""
+    op.execute("DROP TRIGGER IF EXISTS jogador_tags_versao ON jogador_tags")
+    op.drop_column('buscas_salvas', 'ultima_execucao')
+    op.drop_column('buscas_salvas', 'total_execucoes')
+    op.drop_table('buscas_resultados')
@@ -0,0 +1,48 @@
+"""Token version on usuarios (revokes JWTs on deactivation or role change)
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add usuarios.versao_token and bump it when ativo, nivel or senha_hash change."""
+    op.add_column('usuarios', sa.Column('versao_token', sa.Integer(), nullable=False, server_default='0'))
+
+    # Mesmo valor que o ORM grava (versao_token + 1), então as duas regras não se somam
+    op.execute("""
+        CREATE OR REPLACE FUNCTION incrementar_versao_token() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.ativo IS DISTINCT FROM OLD.ativo
+               OR NEW.nivel IS DISTINCT FROM OLD.nivel
+               OR NEW.senha_hash IS DISTINCT FROM OLD.senha_hash THEN
+                NEW.versao_token := OLD.versao_token + 1;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER usuarios_versao_token
+        BEFORE UPDATE ON usuarios
+        FOR EACH ROW EXECUTE FUNCTION incrementar_versao_token()
+    """)
+
+
+def downgrade() -> None:
+    """Drop the token version trigger and column."""
+    op.execute("DROP TRIGGER IF EXISTS usuarios_versao_token ON usuarios")
+    op.execute("DROP FUNCTION IF EXISTS incrementar_versao_token()")
+    op.drop_column('usuarios', 'versao_token')
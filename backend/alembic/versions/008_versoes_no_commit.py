@@ -0,0 +1,122 @@
+"""Table version counters bumped at commit time (short row lock)
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABELAS_VERSIONADAS = ("jogadores", "vinculos_clubes", "avaliacoes", "wishlist", "jogador_tags")
+
+
+def upgrade() -> None:
+    """
+    Move the versoes_tabelas UPSERT from each statement to commit time.
+
+    The statement-level trigger from 004/006 updated the shared row on the
+    first write, so the writing transaction held that row lock until commit
+    (a long sync blocked every API write to the same table). Now:
+
+    - a BEFORE statement trigger only records the table name in a
+      transaction-local setting (no lock; BEFORE so that it also precedes
+      the row triggers under SET CONSTRAINTS ... IMMEDIATE);
+    - a deferred constraint trigger, fired at commit, UPSERTs the rows of
+      every recorded table, in table-name order (no deadlock between two
+      transactions touching the same tables in different order).
+
+    The bump stays inside the writing transaction: readers never see the new
+    version before the data, and the row lock lasts only for the commit.
+    """
+    for tabela in TABELAS_VERSIONADAS:
+        op.execute(f"DROP TRIGGER IF EXISTS {tabela}_versao ON {tabela}")
+    op.execute("DROP FUNCTION IF EXISTS incrementar_versao_tabela()")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION registrar_versao_tabela() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            pendentes text := coalesce(current_setting('versoes.pendentes', true), '');
+        BEGIN
+            IF strpos(',' || pendentes || ',', ',' || TG_TABLE_NAME || ',') = 0 THEN
+                PERFORM set_config('versoes.pendentes',
+                                   concat_ws(',', nullif(pendentes, ''), TG_TABLE_NAME), true);
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """)
+
+    # Dispara uma vez por linha alterada; só a primeira de cada commit grava
+    op.execute("""
+        CREATE OR REPLACE FUNCTION incrementar_versao_tabela() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            pendentes text := coalesce(current_setting('versoes.pendentes', true), '');
+            tabela_alterada text;
+        BEGIN
+            IF pendentes = '' THEN
+                RETURN NULL;
+            END IF;
+            FOR tabela_alterada IN
+                SELECT t FROM unnest(string_to_array(pendentes, ',')) AS t ORDER BY t
+            LOOP
+                INSERT INTO versoes_tabelas(tabela, versao, atualizado_em)
+                VALUES (tabela_alterada, 1, now())
+                ON CONFLICT (tabela) DO UPDATE
+                SET versao = versoes_tabelas.versao + 1, atualizado_em = now();
+            END LOOP;
+            PERFORM set_config('versoes.pendentes', '', true);
+            RETURN NULL;
+        END;
+        $$
+    """)
+
+    for tabela in TABELAS_VERSIONADAS:
+        op.execute(f"""
+            CREATE TRIGGER {tabela}_versao_registro
+            BEFORE INSERT OR UPDATE OR DELETE ON {tabela}
+            FOR EACH STATEMENT EXECUTE FUNCTION registrar_versao_tabela()
+        """)
+        op.execute(f"""
+            CREATE CONSTRAINT TRIGGER {tabela}_versao
+            AFTER INSERT OR UPDATE OR DELETE ON {tabela}
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION incrementar_versao_tabela()
+        """)
+
+
+def downgrade() -> None:
+    """Restore the statement-level UPSERT triggers from 004/006."""
+    for tabela in TABELAS_VERSIONADAS:
+        op.execute(f"DROP TRIGGER IF EXISTS {tabela}_versao ON {tabela}")
+        op.execute(f"DROP TRIGGER IF EXISTS {tabela}_versao_registro ON {tabela}")
+    op.execute("DROP FUNCTION IF EXISTS incrementar_versao_tabela()")
+    op.execute("DROP FUNCTION IF EXISTS registrar_versao_tabela()")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION incrementar_versao_tabela() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO versoes_tabelas(tabela, versao, atualizado_em)
+            VALUES (TG_TABLE_NAME, 1, now())
+            ON CONFLICT (tabela) DO UPDATE
+            SET versao = versoes_tabelas.versao + 1, atualizado_em = now();
+            RETURN NULL;
+        END;
+        $$
+    """)
+    for tabela in TABELAS_VERSIONADAS:
+        op.execute(f"""
+            CREATE TRIGGER {tabela}_versao
+            AFTER INSERT OR UPDATE OR DELETE ON {tabela}
+            FOR EACH STATEMENT EXECUTE FUNCTION incrementar_versao_tabela()
+        """)
@@ -0,0 +1,116 @@
+"""
+Respostas condicionais (ETag / If-None-Match) e Cache-Control nas leituras
+
+O ETag de uma rota é derivado dos contadores de `versoes_tabelas` (mantidos
+por triggers, ver models/dashboard.py) das tabelas que a resposta usa, da
+versão da API e, para dados que dependem da data, do dia atual. Calculá-lo
+custa uma consulta à tabela de versões; se o cliente mandar o mesmo ETag em
+If-None-Match a dependência responde 304 antes de a rota executar a
+consulta principal.
+
+Nas respostas 200 o ETag e o Cache-Control são aplicados pelo
+CabecalhosCacheMiddleware (as rotas rápidas devolvem a Response pronta, sem
+os cabeçalhos de dependências).
+
+Uso:
+    @router.get("", dependencies=[Depends(cache_http("wishlist"))])
+"""
+import hashlib
+from datetime import datetime, timezone
+from typing import Callable, Dict, Sequence
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+
+from ..core.config import settings
+from ..core.database import executar, get_db_replica
+from ..core.security import get_current_user
+from ..models.dashboard import VersaoTabela
+
+# Listagens e detalhes: o navegador guarda a resposta, mas revalida sempre
+REVALIDAR = "private, no-cache"
+# Agregados do dashboard: podem ser reaproveitados por alguns segundos
+AGREGADOS = "private, max-age=30"
+
+# Chave em request.state com os cabeçalhos da resposta 200
+_ESTADO = "cabecalhos_cache"
+
+
+def _versoes(db: Session, tabelas: Sequence[str]) -> Dict[str, int]:
+    return dict(
+        db.query(VersaoTabela.tabela, VersaoTabela.versao)
+        .filter(VersaoTabela.tabela.in_(tabelas))
+    )
+
+
+def calcular_etag(versoes: Dict[str, int], tabelas: Sequence[str], diario: bool = False) -> str:
+    """ETag fraco das versões das tabelas (e do dia, se `diario`)"""
+    chave = settings.APP_VERSION + "|" + ",".join(f"{tabela}:{versoes.get(tabela, 0)}" for tabela in tabelas)
+    if diario:
+        chave += f"|{datetime.now(timezone.utc).date()}"
+    return f'W/"{hashlib.sha1(chave.encode()).hexdigest()[:20]}"'
+
+
+def corresponde(if_none_match: str, etag: str) -> bool:
+    """Comparação fraca do If-None-Match (lista de ETags ou "*")"""
+    if if_none_match.strip() == "*":
+        return True
+    valor = etag.removeprefix("W/")
+    return any(candidato.strip().removeprefix("W/") == valor for candidato in if_none_match.split(","))
+
+
+def cache_http(
+    *tabelas: str,
+    cache_control: str = REVALIDAR,
+    diario: bool = False,
+    banco: Callable = get_db_replica,
+) -> Callable:
+    """
+    Dependency de rota GET com ETag das versões de `tabelas`.
+
+    Args:
+        tabelas: Tabelas cujas escritas mudam a resposta
+        cache_control: Valor do Cache-Control (200 e 304)
+        diario: A resposta também muda na virada do dia
+        banco: Dependency de sessão da rota (mesma sessão, lida do mesmo banco)
+
+    Raises:
+        HTTPException 304: If-None-Match igual ao ETag atual
+    """
+    async def verificar(
+        request: Request,
+        db=Depends(banco),
+        current_user=Depends(get_current_user),
+    ) -> None:
+        versoes = await executar(db, _versoes, tabelas)
+        cabecalhos = {"ETag": calcular_etag(versoes, tabelas, diario), "Cache-Control": cache_control}
+
+        if corresponde(request.headers.get("if-none-match", ""), cabecalhos["ETag"]):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=cabecalhos)
+        setattr(request.state, _ESTADO, cabecalhos)
+
+    return verificar
+
+
+class CabecalhosCacheMiddleware:
+    """Aplica nas respostas 200 o ETag/Cache-Control calculados por cache_http"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def enviar(mensagem):
+            if mensagem["type"] == "http.response.start" and mensagem["status"] == 200:
+                cabecalhos = scope.get("state", {}).get(_ESTADO)
+                if cabecalhos:
+                    headers = MutableHeaders(scope=mensagem)
+                    for nome, valor in cabecalhos.items():
+                        headers[nome] = valor
+            await send(mensagem)
+
+        await self.app(scope, receive, enviar)
@@ -1,7 +1,7 @@
 """
-Dependencies para injeo em endpoints FastAPI
+Dependencies para injeção em endpoints FastAPI
 """
-from typing import Generator, Optional
+from typing import Optional, Tuple
 from fastapi import Depends, HTTPException, status, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -10,6 +10,7 @@ from ..core.database import get_db
 from ..core.security import decode_token, get_current_user
 from ..core.config import settings
 from ..models.usuario import Usuario
+from ..utils.cursor import decode_cursor
 
 
 # Security scheme para Swagger UI
@@ -20,54 +21,54 @@ security = HTTPBearer()
 # DATABASE DEPENDENCY
 # ============================================
 
-def get_database() -> Generator[Session, None, None]:
+def get_database(db: Session = Depends(get_db)) -> Session:
     """
-    Dependency que fornece sesso do banco de dados.
+    Dependency que fornece sessão do banco de dados.
 
     Uso:
         @router.get("/items")
         def read_items(db: Session = Depends(get_database)):
             ...
     """
-    return get_db()
+    return db
 
 
 # ============================================
-# AUTENTICAO
+# AUTENTICAÇÃO
 # ============================================
 
-async def get_current_active_user(
+def get_current_active_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_database)
 ) -> Usuario:
     """
-    Dependency que retorna o usurio autenticado e ativo.
+    Dependency que retorna o usuário autenticado e ativo.
 
-    Validaes:
-    - Token JWT vlido
-    - Usurio existe no banco
-    - Usurio est ativo
+    Validações:
+    - Token JWT válido
+    - Usuário existe no banco
+    - Usuário está ativo
 
     Raises:
-        HTTPException 401: Token invlido ou expirado
-        HTTPException 403: Usurio inativo
+        HTTPException 401: Token inválido ou expirado
+        HTTPException 403: Usuário inativo
 
     Uso:
         @router.get("/protected")
         def protected_route(current_user: Usuario = Depends(get_current_active_user)):
             return {"user": current_user.username}
     """
-    return await get_current_user(credentials, db)
+    return get_current_user(credentials, db)
 
 
 async def get_current_admin_user(
     current_user: Usuario = Depends(get_current_active_user)
 ) -> Usuario:
     """
-    Dependency que verifica se o usurio  admin.
+    Dependency que verifica se o usuário é admin.
 
     Raises:
-        HTTPException 403: Usurio no  admin
+        HTTPException 403: Usuário não é admin
 
     Uso:
         @router.post("/admin-only")
@@ -77,7 +78,7 @@ async def get_current_admin_user(
     if current_user.nivel != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Permisso insuficiente. Apenas administradores.",
+            detail="Permissão insuficiente. Apenas administradores.",
         )
     return current_user
 
@@ -86,10 +87,10 @@ async def get_current_coordenador_or_admin(
     current_user: Usuario = Depends(get_current_active_user)
 ) -> Usuario:
     """
-    Dependency que verifica se o usurio  coordenador ou admin.
+    Dependency que verifica se o usuário é coordenador ou admin.
 
     Raises:
-        HTTPException 403: Usurio no tem permisso
+        HTTPException 403: Usuário não tem permissão
 
     Uso:
         @router.post("/coordenador-route")
@@ -99,22 +100,22 @@ async def get_current_coordenador_or_admin(
     if current_user.nivel not in ["admin", "coordenador"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Permisso insuficiente. Apenas administradores e coordenadores.",
+            detail="Permissão insuficiente. Apenas administradores e coordenadores.",
         )
     return current_user
 
 
 # ============================================
-# PAGINAO
+# PAGINAÇÃO
 # ============================================
 
 class PaginationParams:
     """
-    Dependency para parmetros de paginao.
+    Dependency para parâmetros de paginação.
 
     Query params:
-    - page: Nmero da pgina (1-indexed)
-    - limit: Nmero de items por pgina
+    - page: Número da página (1-indexed)
+    - limit: Número de items por página
 
     Uso:
         @router.get("/items")
@@ -125,12 +126,12 @@ class PaginationParams:
 
     def __init__(
         self,
-        page: int = Query(1, ge=1, description="Nmero da pgina (1-indexed)"),
+        page: int = Query(1, ge=1, description="Número da página (1-indexed)"),
         limit: int = Query(
             settings.DEFAULT_PAGE_SIZE,
             ge=1,
             le=settings.MAX_PAGE_SIZE,
-            description=f"Items por pgina (mx: {settings.MAX_PAGE_SIZE})"
+            description=f"Items por página (máx: {settings.MAX_PAGE_SIZE})"
         )
     ):
         self.page = page
@@ -138,6 +139,33 @@ class PaginationParams:
         self.skip = (page - 1) * limit
 
 
+def cursor_jogadores(
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor retornado em next_cursor (paginação keyset; ignora skip)"
+    )
+) -> Optional[Tuple[str, int]]:
+    """
+    Dependency que decodifica o cursor (nome, id_jogador) das listagens de jogadores.
+
+    Raises:
+        HTTPException 400: Cursor malformado ou adulterado
+    """
+    if not cursor:
+        return None
+    try:
+        nome, id_jogador = decode_cursor(cursor, size=2)
+    except ValueError:
+        nome = id_jogador = None
+    # Tipos errados chegariam à comparação (nome, id_jogador) > (...) no banco
+    if not isinstance(nome, str) or not isinstance(id_jogador, int) or isinstance(id_jogador, bool):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginação inválido"
+        )
+    return nome, id_jogador
+
+
 # ============================================
 # FILTROS
 # ============================================
@@ -148,12 +176,12 @@ class JogadorFilterParams:
 
     Query params:
     - nome: Busca por nome (case-insensitive)
-    - posicao: Filtro por posio
+    - posicao: Filtro por posição
     - clube: Filtro por clube
     - liga: Filtro por liga
     - nacionalidade: Filtro por nacionalidade
-    - idade_min/idade_max: Filtro por faixa etria
-    - media_min: Filtro por mdia mnima
+    - idade_min/idade_max: Filtro por faixa etária
+    - media_min: Filtro por média mínima
 
     Uso:
         @router.get("/jogadores")
@@ -164,13 +192,13 @@ class JogadorFilterParams:
     def __init__(
         self,
         nome: Optional[str] = Query(None, description="Busca por nome"),
-        posicao: Optional[str] = Query(None, description="Filtro por posio (ex: ATA, MEI)"),
+        posicao: Optional[str] = Query(None, description="Filtro por posição (ex: ATA, MEI)"),
         clube: Optional[str] = Query(None, description="Filtro por clube"),
         liga: Optional[str] = Query(None, description="Filtro por liga"),
         nacionalidade: Optional[str] = Query(None, description="Filtro por nacionalidade"),
-        idade_min: Optional[int] = Query(None, ge=14, le=50, description="Idade mnima"),
-        idade_max: Optional[int] = Query(None, ge=14, le=50, description="Idade mxima"),
-        media_min: Optional[float] = Query(None, ge=0.0, le=5.0, description="Mdia geral mnima"),
+        idade_min: Optional[int] = Query(None, ge=14, le=50, description="Idade mínima"),
+        idade_max: Optional[int] = Query(None, ge=14, le=50, description="Idade máxima"),
+        media_min: Optional[float] = Query(None, ge=0.0, le=5.0, description="Média geral mínima"),
     ):
         self.nome = nome
         self.posicao = posicao
@@ -183,7 +211,7 @@ class JogadorFilterParams:
 
 
 # ============================================
-# VALIDAES
+# VALIDAÇÕES
 # ============================================
 
 def validate_jogador_exists(
@@ -194,7 +222,7 @@ def validate_jogador_exists(
     Dependency que valida se um jogador existe.
 
     Raises:
-        HTTPException 404: Jogador no encontrado
+        HTTPException 404: Jogador não encontrado
 
     Uso:
         @router.get("/jogadores/{jogador_id}")
@@ -209,7 +237,7 @@ def validate_jogador_exists(
     if not jogador:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Jogador com ID {jogador_id} no encontrado"
+            detail=f"Jogador com ID {jogador_id} não encontrado"
         )
     return jogador
 
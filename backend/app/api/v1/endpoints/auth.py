@@ -5,12 +5,13 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from ....core.database import get_db
+from ....core.database import executar, get_db
 from ....core.security import (
-    authenticate_user,
+    authenticate_user_async,
+    claims_usuario,
     create_access_token,
     create_refresh_token,
-    hash_password,
+    hash_password_async,
     get_current_user
 )
 from ....models.usuario import Usuario
@@ -19,30 +20,12 @@ from ....schemas.usuario import LoginRequest, Token, UsuarioCreate, UsuarioRespo
 router = APIRouter(prefix="/auth", tags=["Autenticação"])
 
 
-@router.post("/login", response_model=Token)
-def login(credentials: LoginRequest, db: Session = Depends(get_db)):
-    """
-    Login - Autentica usuário e retorna tokens JWT
-    """
-    usuario = authenticate_user(db, credentials.username, credentials.password)
-
-    if not usuario:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Usuário ou senha incorretos",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # Atualizar último acesso
+def _emitir_tokens(db: Session, usuario: Usuario) -> Token:
+    """Atualiza o último acesso e cria os tokens"""
     usuario.ultimo_acesso = datetime.utcnow()
     db.commit()
 
-    # Criar tokens
-    token_data = {
-        "sub": usuario.id,
-        "username": usuario.username,
-        "nivel": usuario.nivel
-    }
+    token_data = claims_usuario(usuario)
     access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data)
 
@@ -53,11 +36,32 @@ def login(credentials: LoginRequest, db: Session = Depends(get_db)):
     )
 
 
-@router.post("/register", response_model=UsuarioResponse, status_code=status.HTTP_201_CREATED)
-def register(usuario_data: UsuarioCreate, db: Session = Depends(get_db)):
+@router.post(
+    "/login",
+    response_model=Token,
+    responses={429: {"description": "Pool de verificação de senhas ocupado (ver Retry-After)"}},
+)
+async def login(credentials: LoginRequest, db: Session = Depends(get_db)):
     """
-    Registra novo usuário
+    Login - Autentica usuário e retorna tokens JWT
+
+    bcrypt roda no pool limitado de hashing (429 quando saturado); as
+    consultas ao banco, no threadpool.
     """
+    usuario = await authenticate_user_async(db, credentials.username, credentials.password)
+
+    if not usuario:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Usuário ou senha incorretos",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return await executar(db, _emitir_tokens, usuario)
+
+
+def _verificar_disponivel(db: Session, usuario_data: UsuarioCreate) -> None:
+    """400 se username ou email já estiverem cadastrados"""
     # Verificar se username já existe
     existing_user = db.query(Usuario).filter(Usuario.username == usuario_data.username).first()
     if existing_user:
@@ -74,8 +78,9 @@ def register(usuario_data: UsuarioCreate, db: Session = Depends(get_db)):
             detail="Email já cadastrado"
         )
 
-    # Criar usuário
-    senha_hash = hash_password(usuario_data.password)
+
+def _criar_usuario(db: Session, usuario_data: UsuarioCreate, senha_hash: str) -> UsuarioResponse:
+    """Grava o usuário com a senha já transformada em hash"""
     db_usuario = Usuario(
         username=usuario_data.username,
         email=usuario_data.email,
@@ -91,6 +96,23 @@ def register(usuario_data: UsuarioCreate, db: Session = Depends(get_db)):
     return UsuarioResponse.model_validate(db_usuario)
 
 
+@router.post(
+    "/register",
+    response_model=UsuarioResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={429: {"description": "Pool de hashing de senhas ocupado (ver Retry-After)"}},
+)
+async def register(usuario_data: UsuarioCreate, db: Session = Depends(get_db)):
+    """
+    Registra novo usuário
+    """
+    await executar(db, _verificar_disponivel, usuario_data)
+
+    # Criar usuário
+    senha_hash = await hash_password_async(usuario_data.password)
+    return await executar(db, _criar_usuario, usuario_data, senha_hash)
+
+
 @router.get("/me", response_model=UsuarioResponse)
 async def get_current_user_info(current_user: Usuario = Depends(get_current_user)):
     """
@@ -2,52 +2,72 @@
 Endpoints de Avaliações
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from ....core.database import get_db
+from ....api.cache_http import cache_http
+from ....core.database import get_db, get_db_leitura
 from ....core.security import get_current_user
 from ....models.usuario import Usuario
-from ....schemas.avaliacao import AvaliacaoCreate, AvaliacaoResponse
+from ....schemas.avaliacao import AvaliacaoCreate, AvaliacaoLoteItem, AvaliacaoResponse
+from ....schemas.lote import MAX_ITENS_LOTE, ResultadoLote
 from ....crud import avaliacao as crud_avaliacao
 from ....crud import jogador as crud_jogador
+from ....crud.lote import resumir
+from ....utils.resposta import RespostaJSON, campos, linhas_para_dicts
 
 router = APIRouter(prefix="/avaliacoes", tags=["Avaliações"])
 
+_CAMPOS_AVALIACAO = campos(AvaliacaoResponse)
+_NOTAS = ("nota_potencial", "nota_tatico", "nota_tecnico", "nota_fisico", "nota_mental")
 
-@router.get("/jogador/{jogador_id}", response_model=List[AvaliacaoResponse])
-def listar_avaliacoes_jogador(
+
+def _linhas_para_avaliacoes(linhas) -> List[dict]:
+    """Dicts no formato de AvaliacaoResponse (notas arredondadas como no schema)"""
+    result = linhas_para_dicts(linhas, _CAMPOS_AVALIACAO)
+    for data in result:
+        for nota in _NOTAS:
+            if data[nota] is not None:
+                data[nota] = round(float(data[nota]), 1)
+    return result
+
+
+@router.get("/jogador/{jogador_id}", response_model=List[AvaliacaoResponse],
+            dependencies=[Depends(cache_http("avaliacoes", "jogadores", banco=get_db_leitura))])
+async def listar_avaliacoes_jogador(
     jogador_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db=Depends(get_db_leitura),
     current_user: Usuario = Depends(get_current_user)
 ):
     """
     Lista todas as avaliações de um jogador específico
     """
     # Verificar se jogador existe
-    jogador = crud_jogador.get_jogador(db, jogador_id)
+    jogador = await crud_jogador.get_jogador_async(db, jogador_id)
     if not jogador:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Jogador não encontrado"
         )
 
-    avaliacoes = crud_avaliacao.get_avaliacoes_by_jogador(db, jogador_id, skip, limit)
-    return [AvaliacaoResponse.model_validate(av) for av in avaliacoes]
+    avaliacoes = await crud_avaliacao.get_avaliacoes_by_jogador_async(db, jogador_id, skip, limit)
+    return RespostaJSON(_linhas_para_avaliacoes(avaliacoes))
 
 
-@router.get("/jogador/{jogador_id}/ultima", response_model=AvaliacaoResponse)
-def buscar_ultima_avaliacao(
+@router.get("/jogador/{jogador_id}/ultima", response_model=AvaliacaoResponse,
+            dependencies=[Depends(cache_http("avaliacoes", banco=get_db_leitura))])
+async def buscar_ultima_avaliacao(
     jogador_id: int,
-    db: Session = Depends(get_db),
+    db=Depends(get_db_leitura),
     current_user: Usuario = Depends(get_current_user)
 ):
     """
     Retorna a última avaliação de um jogador
     """
-    avaliacao = crud_avaliacao.get_ultima_avaliacao(db, jogador_id)
+    avaliacao = await crud_avaliacao.get_ultima_avaliacao_async(db, jogador_id)
     if not avaliacao:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -77,6 +97,31 @@ def criar_avaliacao(
     return AvaliacaoResponse.model_validate(avaliacao)
 
 
+@router.post("/bulk", response_model=ResultadoLote)
+def gravar_avaliacoes_em_lote(
+    itens: List[AvaliacaoLoteItem] = Body(..., min_length=1, max_length=MAX_ITENS_LOTE),
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Grava várias avaliações em uma transação (ex.: o elenco inteiro após um jogo).
+
+    Itens com `id` atualizam a avaliação (todos os campos); os demais são
+    inseridos. Retorna o status de cada item na ordem enviada; itens com
+    erro (jogador ou avaliação inexistente) não impedem os demais.
+    """
+    try:
+        itens_status = crud_avaliacao.gravar_avaliacoes_lote(db, itens)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Conflito de integridade ao gravar o lote; nenhum item foi gravado"
+        )
+    return resumir(itens_status)
+
+
 @router.delete("/{avaliacao_id}", status_code=status.HTTP_204_NO_CONTENT)
 def deletar_avaliacao(
     avaliacao_id: int,
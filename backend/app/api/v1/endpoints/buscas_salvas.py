@@ -0,0 +1,95 @@
+"""
+Endpoints de Buscas Salvas
+"""
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from ....api.deps import cursor_jogadores
+from ....core.database import get_db, get_db_replica
+from ....core.security import get_current_user
+from ....crud import jogador as crud_jogador
+from ....models.busca_salva import BuscaSalva
+from ....models.usuario import Usuario
+from ....schemas.busca_salva import BuscaSalvaCreate, BuscaSalvaResponse
+from ....schemas.jogador import JogadorListResponse
+from ....services import buscas_salvas
+from ....utils.cursor import encode_cursor
+from ....utils.resposta import RespostaJSON
+from .jogadores import linhas_para_jogadores
+
+router = APIRouter(prefix="/buscas-salvas", tags=["Buscas Salvas"])
+
+
+@router.get("", response_model=List[BuscaSalvaResponse])
+def listar_buscas_salvas(
+    db: Session = Depends(get_db_replica),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Lista as buscas salvas (mais recentes primeiro)
+    """
+    buscas = db.query(BuscaSalva).order_by(BuscaSalva.criado_em.desc(), BuscaSalva.id_busca.desc())
+    return [BuscaSalvaResponse.model_validate(busca) for busca in buscas]
+
+
+@router.post("", response_model=BuscaSalvaResponse, status_code=status.HTTP_201_CREATED)
+def criar_busca_salva(
+    busca_data: BuscaSalvaCreate,
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Salva uma busca avançada (filtros gravados na forma canônica)
+    """
+    busca = BuscaSalva(
+        nome_busca=busca_data.nome_busca,
+        filtros=buscas_salvas.filtros_canonicos(busca_data.filtros),
+        criado_por=current_user.username,
+    )
+    db.add(busca)
+    db.commit()
+    db.refresh(busca)
+    return BuscaSalvaResponse.model_validate(busca)
+
+
+@router.get("/{id_busca}/resultados", response_model=JogadorListResponse)
+def resultados_busca_salva(
+    id_busca: int,
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[Tuple[str, int]] = Depends(cursor_jogadores),
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Executa uma busca salva.
+
+    A lista de jogadores fica em cache até a próxima escrita em jogadores,
+    vínculos, avaliações ou tags; as páginas seguintes (via `next_cursor`)
+    só buscam os detalhes dos jogadores da página.
+    """
+    busca = db.get(BuscaSalva, id_busca)
+    if not busca:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Busca salva não encontrada"
+        )
+    try:
+        filtros = buscas_salvas.carregar_filtros(busca.filtros)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Filtros da busca salva são inválidos"
+        )
+
+    if after is None:
+        buscas_salvas.registrar_execucao(db, busca)
+
+    jogadores = buscas_salvas.obter_resultado(db, filtros)
+    pagina, tem_mais = buscas_salvas.paginar_resultado(jogadores, limit, after)
+    rows = crud_jogador.get_jogadores_com_detalhes_por_ids(db, [id_jogador for _, id_jogador in pagina])
+    next_cursor = encode_cursor(*pagina[-1]) if tem_mais else None
+
+    return RespostaJSON({
+        "data": linhas_para_jogadores(rows), "total": len(jogadores), "limit": limit, "next_cursor": next_cursor
+    })
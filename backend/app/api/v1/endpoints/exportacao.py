@@ -0,0 +1,63 @@
+"""
+Endpoints de Exportação (dataset completo em streaming)
+"""
+from datetime import date
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from ....api.deps import JogadorFilterParams
+from ....core.database import get_db_replica
+from ....core.security import get_current_user
+from ....crud import avaliacao as crud_avaliacao
+from ....crud import jogador as crud_jogador
+from ....models.usuario import Usuario
+from ....services.exportacao import resposta_exportacao
+
+router = APIRouter(prefix="/export", tags=["Exportação"])
+
+Formato = Literal["csv", "ndjson", "parquet"]
+
+
+def _exportar(db: Session, query, formato: str, nome: str):
+    try:
+        return resposta_exportacao(db, query, formato, nome)
+    except ImportError:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Exportação em Parquet indisponível: pyarrow não instalado no servidor"
+        )
+
+
+@router.get("/jogadores")
+def exportar_jogadores(
+    formato: Formato = Query("csv", description="csv, ndjson ou parquet"),
+    filtros: JogadorFilterParams = Depends(),
+    db: Session = Depends(get_db_replica),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Exporta todos os jogadores que atendem aos filtros da listagem
+    (uma linha por vínculo, com os mesmos agregados de GET /jogadores).
+
+    O arquivo é gerado em streaming, sem limite de linhas.
+    """
+    query = crud_jogador.consulta_exportacao(db, **vars(filtros))
+    return _exportar(db, query, formato, "jogadores")
+
+
+@router.get("/avaliacoes")
+def exportar_avaliacoes(
+    formato: Formato = Query("csv", description="csv, ndjson ou parquet"),
+    jogador_id: Optional[int] = Query(None, description="Apenas as avaliações deste jogador"),
+    desde: Optional[date] = Query(None, description="Avaliações a partir desta data (carga incremental)"),
+    db: Session = Depends(get_db_replica),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Exporta as avaliações (com o nome do jogador), em ordem de id.
+
+    O arquivo é gerado em streaming, sem limite de linhas.
+    """
+    query = crud_avaliacao.consulta_exportacao(db, jogador_id=jogador_id, desde=desde)
+    return _exportar(db, query, formato, "avaliacoes")
@@ -1,71 +1,138 @@
 """
 Endpoints de Jogadores
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from ....core.database import get_db
+from ....api.cache_http import cache_http
+from ....api.deps import JogadorFilterParams, cursor_jogadores
+from ....core.database import get_db, get_db_leitura, get_db_replica
 from ....core.security import get_current_user
 from ....models.usuario import Usuario
 from ....schemas.jogador import (
+    BuscaAvancadaFiltros,
     JogadorCreate,
+    JogadorLoteItem,
     JogadorUpdate,
     JogadorResponse,
-    JogadorWithDetails
+    JogadorWithDetails,
+    JogadorListResponse,
+    JogadorSearchResult
 )
+from ....schemas.lote import MAX_ITENS_LOTE, ResultadoLote
 from ....crud import jogador as crud_jogador
+from ....crud.lote import resumir
+from ....utils.cursor import encode_cursor
+from ....utils.resposta import RespostaJSON, campos, linhas_para_dicts
 
 router = APIRouter(prefix="/jogadores", tags=["Jogadores"])
 
+# Tabelas lidas pela listagem (versões usadas no ETag)
+TABELAS_LISTAGEM = ("jogadores", "vinculos_clubes", "avaliacoes", "wishlist")
 
-@router.get("", response_model=List[JogadorWithDetails])
-def listar_jogadores(
+
+_CAMPOS_DETALHES = campos(JogadorWithDetails)
+
+
+def linhas_para_jogadores(jogadores_data) -> List[dict]:
+    """
+    Converte as linhas das listagens de crud_jogador em dicts no formato de
+    JogadorWithDetails (caminho rápido, ver utils/resposta)
+    """
+    result = linhas_para_dicts(jogadores_data, _CAMPOS_DETALHES)
+    for data in result:
+        data["em_wishlist"] = bool(data["em_wishlist"])
+        data["total_avaliacoes"] = data["total_avaliacoes"] or 0
+    return result
+
+
+def _montar_pagina(jogadores_data, total, limit: int) -> RespostaJSON:
+    next_cursor = None
+    if len(jogadores_data) == limit:
+        ultimo = jogadores_data[-1]
+        next_cursor = encode_cursor(ultimo.nome, ultimo.id_jogador)
+
+    return RespostaJSON({
+        "data": linhas_para_jogadores(jogadores_data), "total": total, "limit": limit, "next_cursor": next_cursor
+    })
+
+
+@router.get("", response_model=JogadorListResponse,
+            dependencies=[Depends(cache_http(*TABELAS_LISTAGEM, banco=get_db_leitura))])
+async def listar_jogadores(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    nome: Optional[str] = Query(None, description="Filtrar por nome"),
-    nacionalidade: Optional[str] = Query(None, description="Filtrar por nacionalidade"),
-    clube: Optional[str] = Query(None, description="Filtrar por clube"),
-    posicao: Optional[str] = Query(None, description="Filtrar por posição"),
-    db: Session = Depends(get_db),
+    after: Optional[Tuple[str, int]] = Depends(cursor_jogadores),
+    filtros: JogadorFilterParams = Depends(),
+    db=Depends(get_db_leitura),
     current_user: Usuario = Depends(get_current_user)
 ):
     """
     Lista todos os jogadores com filtros opcionais.
-    Retorna dados agregados (última avaliação, vínculo atual, wishlist).
-    """
-    jogadores_data = crud_jogador.get_jogadores_com_detalhes(db, skip=skip, limit=limit)
-
-    # Transformar em JogadorWithDetails
-    result = []
-    for row in jogadores_data:
-        jogador = row[0]  # Objeto Jogador
-        data = {
-            **jogador.__dict__,
-            "clube": row[1],
-            "liga_clube": row[2],
-            "posicao": row[3],
-            "status_contrato": row[4],
-            "data_fim_contrato": row[5],
-            "nota_potencial_media": float(row[6]) if row[6] else None,
-            "total_avaliacoes": row[7] or 0,
-            "em_wishlist": bool(row[8])
-        }
-        result.append(JogadorWithDetails(**data))
+    Retorna dados agregados (última avaliação, vínculo atual, wishlist)
+    e o total de resultados filtrados.
 
-    return result
+    Para páginas profundas, use o `next_cursor` da resposta no parâmetro
+    `cursor`: a busca continua a partir do último (nome, id_jogador) sem OFFSET.
+    """
+    jogadores_data, total = await crud_jogador.get_jogadores_com_detalhes_async(
+        db, skip=skip, limit=limit, after=after, **vars(filtros)
+    )
+
+    return _montar_pagina(jogadores_data, total, limit)
+
+
+@router.get("/search", response_model=List[JogadorSearchResult],
+            dependencies=[Depends(cache_http("jogadores", "vinculos_clubes"))])
+def buscar_jogadores_texto(
+    q: str = Query(..., min_length=2, max_length=100, description="Nome, clube ou nacionalidade"),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db_replica),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Busca textual ranqueada (ignora acentos e maiúsculas).
+    Aceita prefixos ("endr") e, no PostgreSQL, erros de digitação ("endrik").
+    """
+    rows = crud_jogador.search_jogadores(db, q, limit=limit)
+    return [JogadorSearchResult.model_validate(row) for row in rows]
 
 
-@router.get("/{jogador_id}", response_model=JogadorResponse)
-def buscar_jogador(
+@router.post("/busca-avancada", response_model=JogadorListResponse)
+def busca_avancada(
+    filtros: BuscaAvancadaFiltros,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[Tuple[str, int]] = Depends(cursor_jogadores),
+    db: Session = Depends(get_db_replica),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Busca avançada com múltiplos filtros (mesma busca da aba do dashboard).
+
+    Posições, clubes e nacionalidades aceitam listas de valores exatos;
+    `tags_modo` define se o jogador precisa de qualquer uma das tags ou de todas.
+    Todos os filtros, inclusive a média mínima, são aplicados no banco.
+    """
+    jogadores_data, total = crud_jogador.busca_avancada(
+        db, filtros, skip=skip, limit=limit, after=after
+    )
+    return _montar_pagina(jogadores_data, total, limit)
+
+
+@router.get("/{jogador_id}", response_model=JogadorResponse,
+            dependencies=[Depends(cache_http("jogadores", banco=get_db_leitura))])
+async def buscar_jogador(
     jogador_id: int,
-    db: Session = Depends(get_db),
+    db=Depends(get_db_leitura),
     current_user: Usuario = Depends(get_current_user)
 ):
     """
     Busca jogador por ID
     """
-    jogador = crud_jogador.get_jogador(db, jogador_id)
+    jogador = await crud_jogador.get_jogador_async(db, jogador_id)
     if not jogador:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -96,6 +163,31 @@ def criar_jogador(
     return JogadorResponse.model_validate(jogador)
 
 
+@router.post("/bulk", response_model=ResultadoLote)
+def gravar_jogadores_em_lote(
+    itens: List[JogadorLoteItem] = Body(..., min_length=1, max_length=MAX_ITENS_LOTE),
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Cria ou atualiza vários jogadores em uma transação.
+
+    Itens com `id_jogador` atualizam o jogador (todos os campos); sem ele, o
+    `transfermarkt_id` decide entre inserir e atualizar. Retorna o status de
+    cada item na ordem enviada; itens com erro não impedem os demais.
+    """
+    try:
+        itens_status = crud_jogador.gravar_jogadores_lote(db, itens)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Conflito de integridade ao gravar o lote; nenhum item foi gravado"
+        )
+    return resumir(itens_status)
+
+
 @router.put("/{jogador_id}", response_model=JogadorResponse)
 def atualizar_jogador(
     jogador_id: int,
@@ -133,9 +225,9 @@ def deletar_jogador(
     return None
 
 
-@router.get("/stats/total", response_model=dict)
+@router.get("/stats/total", response_model=dict, dependencies=[Depends(cache_http("jogadores"))])
 def estatisticas_jogadores(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_replica),
     current_user: Usuario = Depends(get_current_user)
 ):
     """
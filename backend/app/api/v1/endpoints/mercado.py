@@ -0,0 +1,46 @@
+"""
+Endpoints de Mercado
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from ....api.cache_http import cache_http
+from ....core.database import get_db_replica
+from ....core.security import get_current_user
+from ....models.usuario import Usuario
+from ....schemas.mercado import OportunidadeMercado
+from ....services import mercado
+
+router = APIRouter(prefix="/mercado", tags=["Mercado"])
+
+
+@router.get("/oportunidades", response_model=List[OportunidadeMercado],
+            dependencies=[Depends(cache_http(*mercado.TABELAS_MERCADO, diario=True))])
+def listar_oportunidades(
+    posicao: Optional[str] = Query(None, description="Posição exata"),
+    liga: Optional[str] = Query(None, description="Liga exata"),
+    idade_max: Optional[int] = Query(None, ge=14, le=50, description="Idade máxima"),
+    apenas_prioridade_alta: bool = Query(False, description="Apenas jogadores com prioridade alta na wishlist"),
+    idade_max_jovem: int = Query(23, ge=14, le=50, description="Jovem promissor: idade abaixo deste valor"),
+    media_min_jovem: float = Query(4.0, ge=0, le=5, description="Jovem promissor: média mínima"),
+    dias_contrato: int = Query(180, ge=1, le=3650, description="Contrato curto: dias até o fim"),
+    db: Session = Depends(get_db_replica),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Oportunidades de mercado: jovens promissores, contratos curtos e jogadores livres.
+
+    Um jogador aparece uma vez para cada regra que atende. Mesmas regras da
+    aba "Análise de Mercado" do dashboard.
+    """
+    filtros = mercado.FiltrosMercado(
+        posicao=posicao,
+        liga=liga,
+        idade_max=idade_max,
+        apenas_prioridade_alta=apenas_prioridade_alta,
+        idade_max_jovem=idade_max_jovem,
+        media_min_jovem=media_min_jovem,
+        dias_contrato=dias_contrato,
+    )
+    return mercado.obter_oportunidades(db, filtros)
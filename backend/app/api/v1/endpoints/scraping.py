@@ -1,179 +1,28 @@
 """
 API Endpoints - Scraping
-Web scraping control with BackgroundTasks for async processing
+Controle dos jobs de scraping (executados pelo motor de jobs em services/jobs.py)
 """
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
-from typing import Dict, Any
-import uuid
-from datetime import datetime
 
 from app.api import deps
-from app.core.database import get_database
+from app.core.database import get_db as get_database
+from app.models.scraping_job import ScrapingJob
+from app.services import jobs
+from app.services import transfermarkt  # noqa: F401  (registra os jobs 'fotos' e 'dados')
 
 router = APIRouter()
 
-# In-memory storage for task status (in production, use Redis or database)
-scraping_tasks: Dict[str, Dict[str, Any]] = {}
 
-
-def update_task_status(
-    task_id: str,
-    status: str,
-    progress: int = 0,
-    current_step: str = None,
-    processed_items: int = 0,
-    total_items: int = 0,
-    errors: list = None,
-):
-    """Update task status in memory"""
-    if task_id not in scraping_tasks:
-        scraping_tasks[task_id] = {
-            "task_id": task_id,
-            "started_at": datetime.utcnow().isoformat(),
-        }
-
-    scraping_tasks[task_id].update({
-        "status": status,
-        "progress": progress,
-        "current_step": current_step,
-        "processed_items": processed_items,
-        "total_items": total_items,
-        "errors": errors or [],
-    })
-
-    if status in ["completed", "failed"]:
-        scraping_tasks[task_id]["completed_at"] = datetime.utcnow().isoformat()
-
-
-def scrape_photos_task(task_id: str, db: Session):
-    """
-    Background task for photo scraping
-    Simulates scraping process with progress updates
-    """
-    try:
-        update_task_status(
-            task_id,
-            status="running",
-            progress=0,
-            current_step="Iniciando scraping de fotos...",
-        )
-
-        # TODO: Implement actual scraping logic
-        # Example structure:
-        # 1. Fetch all players without photos
-        # 2. For each player, scrape Transfermarkt
-        # 3. Download and save photo
-        # 4. Update database
-
-        # Simulated progress (replace with real logic)
-        import time
-        total_items = 100
-        update_task_status(
-            task_id,
-            status="running",
-            progress=10,
-            current_step="Buscando jogadores sem fotos...",
-            total_items=total_items,
-        )
-        time.sleep(2)
-
-        for i in range(1, total_items + 1):
-            # Simulate processing
-            time.sleep(0.1)
-            progress = int((i / total_items) * 100)
-            update_task_status(
-                task_id,
-                status="running",
-                progress=progress,
-                current_step=f"Baixando foto {i}/{total_items}...",
-                processed_items=i,
-                total_items=total_items,
-            )
-
-        update_task_status(
-            task_id,
-            status="completed",
-            progress=100,
-            current_step="Scraping concluído!",
-            processed_items=total_items,
-            total_items=total_items,
-        )
-
-    except Exception as e:
-        update_task_status(
-            task_id,
-            status="failed",
-            progress=0,
-            current_step="Erro ao executar scraping",
-            errors=[str(e)],
-        )
-
-
-def scrape_data_task(task_id: str, db: Session):
-    """
-    Background task for data scraping
-    Updates player information from Transfermarkt
-    """
-    try:
-        update_task_status(
-            task_id,
-            status="running",
-            progress=0,
-            current_step="Iniciando scraping de dados...",
-        )
-
-        # TODO: Implement actual data scraping
-        # Example structure:
-        # 1. Fetch all players
-        # 2. For each player, scrape updated data (name, club, age, etc.)
-        # 3. Update database
-
-        import time
-        total_items = 50
-        update_task_status(
-            task_id,
-            status="running",
-            progress=10,
-            current_step="Buscando jogadores...",
-            total_items=total_items,
-        )
-        time.sleep(2)
-
-        for i in range(1, total_items + 1):
-            time.sleep(0.2)
-            progress = int((i / total_items) * 100)
-            update_task_status(
-                task_id,
-                status="running",
-                progress=progress,
-                current_step=f"Atualizando dados {i}/{total_items}...",
-                processed_items=i,
-                total_items=total_items,
-            )
-
-        update_task_status(
-            task_id,
-            status="completed",
-            progress=100,
-            current_step="Scraping de dados concluído!",
-            processed_items=total_items,
-            total_items=total_items,
-        )
-
-    except Exception as e:
-        update_task_status(
-            task_id,
-            status="failed",
-            progress=0,
-            current_step="Erro ao executar scraping",
-            errors=[str(e)],
-        )
+def _get_job_or_404(db: Session, task_id: str) -> ScrapingJob:
+    job = db.get(ScrapingJob, task_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return job
 
 
 @router.post("/photos/start")
-async def start_photo_scraping(
-    background_tasks: BackgroundTasks,
+def start_photo_scraping(
     db: Session = Depends(get_database),
     current_user = Depends(deps.get_current_admin_user),
 ):
@@ -181,25 +30,12 @@ async def start_photo_scraping(
     Start photo scraping task in background
     Requires admin privileges
     """
-    task_id = str(uuid.uuid4())
-
-    # Initialize task
-    scraping_tasks[task_id] = {
-        "task_id": task_id,
-        "status": "pending",
-        "progress": 0,
-        "started_at": datetime.utcnow().isoformat(),
-    }
-
-    # Add background task
-    background_tasks.add_task(scrape_photos_task, task_id, db)
-
-    return {"task_id": task_id}
+    job = jobs.submit_job(db, "fotos", criado_por=current_user.username)
+    return {"task_id": job.id}
 
 
 @router.post("/data/start")
-async def start_data_scraping(
-    background_tasks: BackgroundTasks,
+def start_data_scraping(
     db: Session = Depends(get_database),
     current_user = Depends(deps.get_current_admin_user),
 ):
@@ -207,51 +43,32 @@ async def start_data_scraping(
     Start data scraping task in background
     Requires admin privileges
     """
-    task_id = str(uuid.uuid4())
-
-    scraping_tasks[task_id] = {
-        "task_id": task_id,
-        "status": "pending",
-        "progress": 0,
-        "started_at": datetime.utcnow().isoformat(),
-    }
-
-    background_tasks.add_task(scrape_data_task, task_id, db)
-
-    return {"task_id": task_id}
+    job = jobs.submit_job(db, "dados", criado_por=current_user.username)
+    return {"task_id": job.id}
 
 
 @router.get("/status/{task_id}")
-async def get_scraping_status(
+def get_scraping_status(
     task_id: str,
+    db: Session = Depends(get_database),
     current_user = Depends(deps.get_current_active_user),
 ):
     """
-    Get status of scraping task
+    Get status of scraping task (from any API worker)
     """
-    if task_id not in scraping_tasks:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    return scraping_tasks[task_id]
+    job = jobs.verificar_orfao(db, _get_job_or_404(db, task_id))
+    return jobs.job_to_dict(job)
 
 
 @router.post("/cancel/{task_id}")
-async def cancel_scraping(
+def cancel_scraping(
     task_id: str,
+    db: Session = Depends(get_database),
     current_user = Depends(deps.get_current_admin_user),
 ):
     """
     Cancel scraping task
     Note: This is a soft cancel, task will stop at next checkpoint
     """
-    if task_id not in scraping_tasks:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    update_task_status(
-        task_id,
-        status="cancelled",
-        progress=scraping_tasks[task_id].get("progress", 0),
-        current_step="Cancelado pelo usuário",
-    )
-
-    return {"message": "Task cancelled"}
+    job = jobs.solicitar_cancelamento(db, _get_job_or_404(db, task_id))
+    return {"message": "Task cancelled", "status": job.status}
@@ -8,7 +8,7 @@ from typing import List, Dict, Any
 from pydantic import BaseModel
 
 from app.api import deps
-from app.core.database import get_database
+from app.core.database import get_db as get_database
 
 router = APIRouter()
 
@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from typing import Dict, Any
 
 from app.api import deps
-from app.core.database import get_database
+from app.core.database import get_db as get_database
 
 router = APIRouter()
 
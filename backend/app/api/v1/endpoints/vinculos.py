@@ -0,0 +1,42 @@
+"""
+Endpoints de Vínculos (jogador x clube)
+"""
+from typing import List
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ....core.database import get_db
+from ....core.security import get_current_user
+from ....models.usuario import Usuario
+from ....schemas.lote import MAX_ITENS_LOTE, ResultadoLote
+from ....schemas.vinculo import VinculoClubeLoteItem
+from ....crud import vinculo as crud_vinculo
+from ....crud.lote import resumir
+
+router = APIRouter(prefix="/vinculos", tags=["Vínculos"])
+
+
+@router.post("/bulk", response_model=ResultadoLote)
+def gravar_vinculos_em_lote(
+    itens: List[VinculoClubeLoteItem] = Body(..., min_length=1, max_length=MAX_ITENS_LOTE),
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_user)
+):
+    """
+    Grava vários vínculos em uma transação.
+
+    Itens com `id_vinculo` atualizam o vínculo (todos os campos); os demais
+    são inseridos. Retorna o status de cada item na ordem enviada; itens com
+    erro (jogador ou vínculo inexistente) não impedem os demais.
+    """
+    try:
+        itens_status = crud_vinculo.gravar_vinculos_lote(db, itens)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Conflito de integridade ao gravar o lote; nenhum item foi gravado"
+        )
+    return resumir(itens_status)
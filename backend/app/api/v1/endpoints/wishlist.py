@@ -5,29 +5,34 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from ....core.database import get_db
+from ....api.cache_http import cache_http
+from ....core.database import get_db, get_db_leitura, get_db_replica
 from ....core.security import get_current_user
 from ....models.usuario import Usuario
 from ....schemas.wishlist import WishlistCreate, WishlistResponse
 from ....crud import wishlist as crud_wishlist
 from ....crud import jogador as crud_jogador
+from ....utils.resposta import RespostaJSON, campos, linhas_para_dicts
 
 router = APIRouter(prefix="/wishlist", tags=["Wishlist"])
 
+_CAMPOS_WISHLIST = campos(WishlistResponse)
 
-@router.get("", response_model=List[WishlistResponse])
-def listar_wishlist(
+
+@router.get("", response_model=List[WishlistResponse],
+            dependencies=[Depends(cache_http("wishlist", banco=get_db_leitura))])
+async def listar_wishlist(
     prioridade: Optional[str] = Query(None, regex="^(alta|media|baixa)$"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
-    db: Session = Depends(get_db),
+    db=Depends(get_db_leitura),
     current_user: Usuario = Depends(get_current_user)
 ):
     """
     Lista jogadores na wishlist com filtro opcional por prioridade
     """
-    wishlist_items = crud_wishlist.get_wishlist(db, prioridade, skip, limit)
-    return [WishlistResponse.model_validate(item) for item in wishlist_items]
+    wishlist_items = await crud_wishlist.get_wishlist_async(db, prioridade, skip, limit)
+    return RespostaJSON(linhas_para_dicts(wishlist_items, _CAMPOS_WISHLIST))
 
 
 @router.post("", response_model=WishlistResponse, status_code=status.HTTP_201_CREATED)
@@ -77,10 +82,10 @@ def remover_wishlist(
     return None
 
 
-@router.get("/check/{jogador_id}", response_model=dict)
+@router.get("/check/{jogador_id}", response_model=dict, dependencies=[Depends(cache_http("wishlist"))])
 def verificar_wishlist(
     jogador_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_replica),
     current_user: Usuario = Depends(get_current_user)
 ):
     """
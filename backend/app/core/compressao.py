@@ -0,0 +1,164 @@
+"""
+Compressão das respostas (gzip e, se instalado, brotli)
+
+Middleware ASGI que comprime o corpo conforme o Accept-Encoding do cliente
+(brotli tem preferência quando disponível):
+
+- respostas completas menores que `minimo` bytes vão sem compressão (o
+  cabeçalho gzip e a CPU não compensam);
+- respostas em streaming (StreamingResponse: exportações, NDJSON) são
+  comprimidas pedaço a pedaço, com flush a cada pedaço para o cliente
+  receber os dados à medida que são gerados, sem Content-Length;
+- mídias já comprimidas (fotos dos jogadores, Parquet, zip...) e respostas
+  que já têm Content-Encoding passam intactas.
+
+ETags fracos (api/cache_http.py) continuam válidos entre codificações.
+"""
+import zlib
+from typing import List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional: sem ele, só gzip
+    brotli = None
+
+# Tipos que já chegam comprimidos (prefixos do Content-Type)
+TIPOS_SEM_COMPRESSAO = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/vnd.apache.parquet",
+    "application/octet-stream",
+    "text/event-stream",
+)
+
+
+def _aceitas(accept_encoding: str) -> List[str]:
+    """Codificações aceitas pelo cliente (q > 0)"""
+    aceitas = []
+    for item in accept_encoding.lower().split(","):
+        nome, _, parametros = item.strip().partition(";")
+        q = parametros.strip().removeprefix("q=")
+        try:
+            if parametros and float(q) <= 0:
+                continue
+        except ValueError:
+            continue
+        aceitas.append(nome.strip())
+    return aceitas
+
+
+class _Compressor:
+    """Compressor incremental com a mesma interface para gzip e brotli"""
+
+    def __init__(self, codificacao: str, nivel: int):
+        self.codificacao = codificacao
+        if codificacao == "br":
+            self._br = brotli.Compressor(quality=nivel)
+        else:
+            self._zlib = zlib.compressobj(nivel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def comprimir(self, dados: bytes) -> bytes:
+        """Comprime `dados` e esvazia o buffer (o pedaço pode ser enviado já)"""
+        if self.codificacao == "br":
+            return self._br.process(dados) + self._br.flush()
+        return self._zlib.compress(dados) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finalizar(self, dados: bytes = b"") -> bytes:
+        """Comprime o último pedaço e fecha o stream"""
+        if self.codificacao == "br":
+            return self._br.process(dados) + self._br.finish()
+        return self._zlib.compress(dados) + self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressaoMiddleware:
+    """Comprime respostas HTTP com gzip/brotli acima de um tamanho mínimo"""
+
+    def __init__(
+        self,
+        app,
+        minimo: int = 1024,
+        nivel_gzip: int = 6,
+        usar_brotli: bool = True,
+        nivel_brotli: int = 4,
+    ):
+        self.app = app
+        self.minimo = minimo
+        self.nivel_gzip = nivel_gzip
+        self.usar_brotli = usar_brotli and brotli is not None
+        self.nivel_brotli = nivel_brotli
+
+    def _escolher(self, accept_encoding: str) -> Optional[Tuple[str, int]]:
+        aceitas = _aceitas(accept_encoding)
+        if self.usar_brotli and "br" in aceitas:
+            return "br", self.nivel_brotli
+        if "gzip" in aceitas:
+            return "gzip", self.nivel_gzip
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        escolha = self._escolher(Headers(scope=scope).get("accept-encoding", ""))
+        if escolha is None:
+            await self.app(scope, receive, send)
+            return
+
+        codificacao, nivel = escolha
+        inicio = None  # http.response.start retido até decidir se comprime
+        compressor: Optional[_Compressor] = None
+        intacta = False
+
+        async def enviar(mensagem):
+            nonlocal inicio, compressor, intacta
+
+            if mensagem["type"] == "http.response.start":
+                headers = Headers(raw=mensagem["headers"])
+                tipo = headers.get("content-type", "")
+                intacta = "content-encoding" in headers or tipo.startswith(TIPOS_SEM_COMPRESSAO)
+                if intacta:
+                    await send(mensagem)
+                else:
+                    inicio = mensagem
+                return
+
+            if mensagem["type"] != "http.response.body" or intacta:
+                await send(mensagem)
+                return
+
+            corpo = mensagem.get("body", b"")
+            mais = mensagem.get("more_body", False)
+
+            if compressor is None:
+                if not mais and (not corpo or len(corpo) < self.minimo):
+                    # Resposta completa e pequena (ou sem corpo, ex.: 304): vai como está
+                    intacta = True
+                    await send(inicio)
+                    await send(mensagem)
+                    return
+
+                compressor = _Compressor(codificacao, nivel)
+                headers = MutableHeaders(scope=inicio)
+                headers["Content-Encoding"] = codificacao
+                headers.add_vary_header("Accept-Encoding")
+                if mais:
+                    del headers["Content-Length"]
+                    corpo = compressor.comprimir(corpo)
+                else:
+                    corpo = compressor.finalizar(corpo)
+                    headers["Content-Length"] = str(len(corpo))
+                await send(inicio)
+                await send({"type": "http.response.body", "body": corpo, "more_body": mais})
+                return
+
+            corpo = compressor.comprimir(corpo) if mais else compressor.finalizar(corpo)
+            await send({"type": "http.response.body", "body": corpo, "more_body": mais})
+
+        await self.app(scope, receive, enviar)
@@ -19,12 +19,26 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 15
     DB_MAX_OVERFLOW: int = 5
     DB_POOL_RECYCLE: int = 3600
+    DB_ASYNC: bool = False  # leituras frequentes via AsyncEngine (asyncpg)
+    DATABASE_ASYNC_URL: Optional[str] = None  # padrão: DATABASE_URL com driver asyncpg
+
+    # Réplica de leitura (opcional): listagens, estatísticas e buscas
+    DATABASE_READ_URL: Optional[str] = None
+    DB_READ_MAX_LAG: float = 5.0  # segundos de atraso tolerados antes de voltar ao primário
+    DB_READ_LAG_CHECK_INTERVAL: float = 5.0  # segundos entre medições do atraso
 
     # JWT Authentication
     SECRET_KEY: str = "your-super-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Segundos que um usuário autenticado fica em cache (0 desativa). A invalidação
+    # só alcança o próprio processo: nos demais workers, um usuário desativado ou
+    # com nível alterado continua aceito com o token antigo por até esse tempo.
+    AUTH_CACHE_TTL: int = 5
+    AUTH_CACHE_MAX: int = 1024  # usuários em cache por processo (LRU)
+    HASH_WORKERS: int = 4  # threads dedicadas ao bcrypt (login/registro)
+    HASH_FILA: int = 16  # hashes aguardando além dos workers; acima disso, 429
 
     # CORS
     CORS_ORIGINS: list[str] = [
@@ -34,10 +48,35 @@ class Settings(BaseSettings):
         "http://127.0.0.1:5173",
     ]
 
+    # Compressão das respostas (gzip; brotli se o pacote estiver instalado)
+    COMPRESSAO_ATIVA: bool = True
+    COMPRESSAO_MIN_BYTES: int = 1024  # respostas menores vão sem compressão
+    COMPRESSAO_NIVEL_GZIP: int = 6  # 1 (mais rápido) a 9 (menor)
+    COMPRESSAO_BROTLI: bool = True  # prefere brotli quando o cliente aceita
+    COMPRESSAO_NIVEL_BROTLI: int = 4  # 0 a 11
+
     # Paginação
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 200
 
+    # Busca de jogadores (pg_trgm)
+    SEARCH_SIMILARITY_THRESHOLD: float = 0.3  # word_similarity mínima (0-1)
+
+    # Dashboard executivo
+    DASHBOARD_META_CLUBE: float = 4.0  # média geral alvo exibida no dashboard
+    DASHBOARD_ALERTA_CONTRATO_DIAS: int = 180  # contratos terminando nesse prazo
+    DASHBOARD_IDADE_PROSPECT: int = 23  # prospects = idade abaixo deste valor
+
+    # Buscas salvas (cache de resultados)
+    BUSCAS_PREAQUECER_TOP: int = 20  # buscas mais executadas recalculadas em background
+    BUSCAS_PREAQUECER_INTERVALO: int = 600  # segundos entre pré-aquecimentos (0 desativa)
+
+    # Scraping (jobs em background)
+    SCRAPING_MAX_WORKERS: int = 2  # jobs executando ao mesmo tempo por processo
+    SCRAPING_REQUEST_DELAY: float = 1.0  # segundos entre requisições de um job
+    SCRAPING_PROGRESS_INTERVAL: float = 1.0  # segundos entre gravações de progresso
+    SCRAPING_STALE_AFTER: int = 300  # segundos sem heartbeat para considerar job órfão
+
     # Cache (Redis opcional)
     REDIS_URL: Optional[str] = None
     CACHE_TTL: int = 3600  # 1 hora
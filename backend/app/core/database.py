@@ -1,27 +1,59 @@
 """
 Configuração de Banco de Dados - PostgreSQL
+
+Engine síncrona (psycopg2) para todas as escritas e, com DB_ASYNC=true,
+uma AsyncEngine (asyncpg) para as leituras mais frequentes: os endpoints
+`async def` usam `get_db_leitura` e os variantes `*_async` do CRUD, que
+não bloqueiam o event loop. Com DB_ASYNC=false `get_db_leitura` é o
+mesmo que `get_db_replica` e os variantes `*_async` executam no threadpool.
+
+Réplica de leitura (DATABASE_READ_URL, opcional): `get_db_replica` fornece
+uma SessaoRoteada, que envia as consultas ao pool da réplica e as escritas
+(e tudo o que vier depois delas na mesma sessão) ao primário. Enquanto o
+atraso da réplica passar de DB_READ_MAX_LAG, ou ela não responder, as
+leituras voltam ao primário. Sem réplica, `get_db_replica` é o próprio
+`get_db`.
 """
-from sqlalchemy import create_engine, event
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
 
 from .config import settings
 
-# Engine do PostgreSQL com pool de conexões
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    pool_pre_ping=True,  # Verifica conexões antes de usar
-    echo=settings.DEBUG,  # Log SQL em modo debug
-    connect_args={
-        "sslmode": "require",  # SSL obrigatório (Railway)
-        "options": "-c timezone=utc"
-    }
-)
+
+def criar_engine(url: str) -> Engine:
+    """Engine do PostgreSQL com pool de conexões (SQLite: desenvolvimento/testes)"""
+    if url.startswith("sqlite"):
+        return create_engine(url, echo=settings.DEBUG, connect_args={"check_same_thread": False})
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,  # Verifica conexões antes de usar
+        echo=settings.DEBUG,  # Log SQL em modo debug
+        connect_args={
+            "sslmode": "require",  # SSL obrigatório (Railway)
+            "options": "-c timezone=utc"
+        }
+    )
+
+
+# Engine do primário (todas as escritas)
+engine = criar_engine(settings.DATABASE_URL)
+
+# Engine da réplica de leitura (pool próprio; somente com DATABASE_READ_URL)
+read_engine: Optional[Engine] = criar_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else None
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -30,6 +62,140 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+# ============================================
+# RÉPLICA DE LEITURA
+# ============================================
+
+def medir_atraso(conn: Connection) -> float:
+    """
+    Atraso de replicação em segundos (0 fora de uma réplica PostgreSQL).
+
+    Com todo o WAL recebido já aplicado a réplica está em dia, mesmo que a
+    última transação replicada seja antiga (primário ocioso).
+    """
+    if conn.dialect.name != "postgresql":
+        return 0.0
+    return float(conn.execute(text("""
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        END
+    """)).scalar())
+
+
+class MonitorReplica:
+    """
+    Decide se a réplica pode atender leituras: atraso <= atraso_maximo.
+
+    O atraso é medido no máximo uma vez a cada `intervalo` segundos (por
+    uma única thread; as demais usam o último resultado). Réplica que não
+    responde fica indisponível até a próxima medição.
+    """
+
+    def __init__(self, engine: Engine, atraso_maximo: float, intervalo: float):
+        self.engine = engine
+        self.atraso_maximo = atraso_maximo
+        self.intervalo = intervalo
+        self._disponivel = True
+        self._verificado_em = float("-inf")
+        self._lock = threading.Lock()
+
+    def expirado(self) -> bool:
+        """Se a próxima chamada a disponivel() vai medir o atraso"""
+        return time.monotonic() - self._verificado_em >= self.intervalo
+
+    def disponivel(self) -> bool:
+        if self.expirado() and self._lock.acquire(blocking=False):
+            try:
+                self._disponivel = self._verificar()
+            finally:
+                self._verificado_em = time.monotonic()
+                self._lock.release()
+        return self._disponivel
+
+    def _verificar(self) -> bool:
+        try:
+            with self.engine.connect() as conn:
+                atraso = medir_atraso(conn)
+        except SQLAlchemyError as e:
+            print(f"⚠️  Réplica de leitura indisponível, usando o primário: {e}")
+            return False
+        if atraso > self.atraso_maximo:
+            print(f"⚠️  Réplica {atraso:.1f}s atrasada, usando o primário")
+            return False
+        return True
+
+
+class SessaoRoteada(Session):
+    """
+    Session que lê da réplica e escreve no primário.
+
+    Depois da primeira escrita (flush, INSERT/UPDATE/DELETE ou SELECT ...
+    FOR UPDATE) todas as consultas da sessão vão ao primário, para que a
+    requisição enxergue o que acabou de gravar.
+    """
+
+    def __init__(self, replica: Optional[Engine] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        escrita = self._flushing or (
+            clause is not None
+            and (getattr(clause, "is_dml", False) or getattr(clause, "_for_update_arg", None) is not None)
+        )
+        if escrita:
+            self.replica = None
+        if self.replica is not None:
+            return self.replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+monitor_replica: Optional[MonitorReplica] = None
+if read_engine is not None:
+    monitor_replica = MonitorReplica(read_engine, settings.DB_READ_MAX_LAG, settings.DB_READ_LAG_CHECK_INTERVAL)
+
+SessaoLeitura = sessionmaker(class_=SessaoRoteada, autocommit=False, autoflush=False, bind=engine)
+
+
+def url_async(url: str) -> str:
+    """Troca o driver da URL pelo equivalente assíncrono (asyncpg / aiosqlite)"""
+    esquema, resto = url.split("://", 1)
+    driver = "sqlite+aiosqlite" if esquema.startswith("sqlite") else "postgresql+asyncpg"
+    return f"{driver}://{resto}"
+
+
+def criar_async_engine(url: str) -> AsyncEngine:
+    """AsyncEngine com o mesmo pool e as mesmas opções de conexão da engine síncrona"""
+    if url.startswith("sqlite"):
+        return create_async_engine(url, echo=settings.DEBUG)
+    return create_async_engine(
+        url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        echo=settings.DEBUG,
+        connect_args={
+            "ssl": "require",  # SSL obrigatório (Railway)
+            "server_settings": {"timezone": "utc"},
+        },
+    )
+
+
+# Engine assíncrona (somente com DB_ASYNC=true; exige asyncpg)
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+async_engine_leitura: Optional[AsyncEngine] = None
+if settings.DB_ASYNC:
+    async_engine = criar_async_engine(settings.DATABASE_ASYNC_URL or url_async(settings.DATABASE_URL))
+    if settings.DATABASE_READ_URL:
+        async_engine_leitura = criar_async_engine(url_async(settings.DATABASE_READ_URL))
+    # expire_on_commit=False: objetos seguem legíveis após a sessão (sem lazy load no event loop)
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+
 # Dependency para FastAPI
 def get_db():
     """Dependency que fornece sessão do banco de dados"""
@@ -40,6 +206,53 @@ def get_db():
         db.close()
 
 
+def get_db_roteada():
+    """Dependency que fornece sessão com leituras na réplica (se em dia) e escritas no primário"""
+    db = SessaoLeitura(replica=read_engine if monitor_replica.disponivel() else None)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def replica_disponivel() -> bool:
+    """MonitorReplica.disponivel() sem bloquear o event loop (mede no threadpool)"""
+    if monitor_replica is None:
+        return False
+    if monitor_replica.expirado():
+        return await run_in_threadpool(monitor_replica.disponivel)
+    return monitor_replica.disponivel()
+
+
+async def get_async_db():
+    """Dependency que fornece sessão assíncrona (DB_ASYNC=true), na réplica se em dia"""
+    bind = async_engine
+    if async_engine_leitura is not None and await replica_disponivel():
+        bind = async_engine_leitura
+    async with AsyncSessionLocal(bind=bind) as db:
+        yield db
+
+
+# Dependency das leituras síncronas (listagens, estatísticas, buscas): réplica se configurada
+get_db_replica = get_db_roteada if read_engine is not None else get_db
+
+# Dependency das leituras frequentes: AsyncSession ou Session conforme DB_ASYNC
+get_db_leitura = get_async_db if settings.DB_ASYNC else get_db_replica
+
+
+async def executar(db, funcao: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Executa uma função de CRUD síncrona (primeiro argumento Session) sem
+    bloquear o event loop.
+
+    AsyncSession: run_sync (I/O assíncrono pelo asyncpg, mesmo código de consulta).
+    Session: threadpool do Starlette, como um endpoint `def`.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(funcao, *args, **kwargs)
+    return await run_in_threadpool(funcao, db, *args, **kwargs)
+
+
 # Event listeners para otimização
 @event.listens_for(engine, "connect")
 def receive_connect(dbapi_conn, connection_record):
@@ -1,16 +1,36 @@
 """
 Segurança e Autenticação JWT
+
+O token de acesso leva as claims `ativo`, `nivel` e `ver` (versao_token do
+usuário). get_current_user guarda uma cópia do usuário em um cache TTL+LRU
+por (id, versão): a maioria das requisições não consulta o banco. Quando o
+usuário é desativado ou muda de nível a versão é incrementada, o cache
+daquele usuário é descartado e os tokens antigos passam a ser recusados.
+O descarte vale só para o processo que fez o UPDATE; nos outros workers
+(e para escritas fora da API) a cópia expira em AUTH_CACHE_TTL segundos,
+por isso o TTL é curto.
+
+bcrypt (login e registro) roda em um pool próprio e limitado, fora do
+event loop e do threadpool que atende os demais endpoints: um pico de
+logins não atrasa o resto da API, e com workers e fila ocupados o login
+responde 429 em vez de enfileirar indefinidamente.
 """
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from .config import settings
-from .database import get_db
+from .database import executar, get_db
 from ..models.usuario import Usuario
 
 # Contexto de hashing de senhas (bcrypt)
@@ -30,6 +50,42 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# ============================================
+# BCRYPT EM POOL LIMITADO
+# ============================================
+
+_pool_senhas = ThreadPoolExecutor(max_workers=settings.HASH_WORKERS, thread_name_prefix="bcrypt")
+# Vagas = workers + fila; liberadas quando o hash termina (mesmo se o cliente desistir)
+_vagas_senhas = threading.BoundedSemaphore(settings.HASH_WORKERS + settings.HASH_FILA)
+
+
+async def _no_pool_senhas(funcao, *args):
+    """Executa `funcao` no pool de bcrypt; HTTPException 429 se não houver vaga"""
+    if not _vagas_senhas.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Muitas autenticações simultâneas. Tente novamente em instantes",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        futuro = _pool_senhas.submit(funcao, *args)
+    except BaseException:
+        _vagas_senhas.release()
+        raise
+    futuro.add_done_callback(lambda _: _vagas_senhas.release())
+    return await asyncio.wrap_future(futuro)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password no pool de bcrypt"""
+    return await _no_pool_senhas(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password no pool de bcrypt"""
+    return await _no_pool_senhas(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Cria token JWT de acesso"""
     to_encode = data.copy()
@@ -55,6 +111,73 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+def claims_usuario(usuario: Usuario) -> dict:
+    """Claims dos tokens de um usuário (ativo/nivel/ver dispensam o banco na maioria das requisições)"""
+    return {
+        "sub": str(usuario.id),  # o JWT exige subject em texto
+        "username": usuario.username,
+        "nivel": usuario.nivel,
+        "ativo": usuario.ativo,
+        "ver": usuario.versao_token,
+    }
+
+
+# ============================================
+# CACHE DE USUÁRIOS AUTENTICADOS
+# ============================================
+
+# (id, versao_token) -> (expira_em, cópia do usuário), em ordem de uso (LRU)
+_usuarios: "OrderedDict[Tuple[int, int], Tuple[float, Usuario]]" = OrderedDict()
+_lock_usuarios = threading.Lock()
+
+
+def _copia_usuario(usuario: Usuario) -> Usuario:
+    """Usuario fora de qualquer sessão (sem senha): seguro para compartilhar entre requisições"""
+    return Usuario(**{
+        coluna.key: getattr(usuario, coluna.key)
+        for coluna in Usuario.__table__.columns
+        if coluna.key != "senha_hash"
+    })
+
+
+def _usuario_em_cache(chave: Tuple[int, int]) -> Optional[Usuario]:
+    with _lock_usuarios:
+        item = _usuarios.get(chave)
+        if item is None:
+            return None
+        if item[0] < time.monotonic():
+            del _usuarios[chave]
+            return None
+        _usuarios.move_to_end(chave)
+        return item[1]
+
+
+def _guardar_usuario(chave: Tuple[int, int], usuario: Usuario) -> None:
+    if settings.AUTH_CACHE_TTL <= 0:
+        return
+    with _lock_usuarios:
+        _usuarios[chave] = (time.monotonic() + settings.AUTH_CACHE_TTL, _copia_usuario(usuario))
+        _usuarios.move_to_end(chave)
+        while len(_usuarios) > settings.AUTH_CACHE_MAX:
+            _usuarios.popitem(last=False)
+
+
+def invalidar_usuario(user_id: Optional[int] = None) -> None:
+    """Descarta o usuário do cache (todas as versões); sem id, esvazia o cache"""
+    with _lock_usuarios:
+        if user_id is None:
+            _usuarios.clear()
+            return
+        for chave in [c for c in _usuarios if c[0] == user_id]:
+            del _usuarios[chave]
+
+
+@event.listens_for(Usuario, "after_update")
+def _invalidar_apos_update(mapper, connection, usuario):
+    """Qualquer UPDATE de usuário descarta a cópia em cache deste processo (os demais esperam o TTL)"""
+    invalidar_usuario(usuario.id)
+
+
 def decode_token(token: str) -> dict:
     """Decodifica e valida token JWT"""
     try:
@@ -68,25 +191,42 @@ def decode_token(token: str) -> dict:
         )
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> Usuario:
     """
     Dependency que retorna o usuário autenticado atual.
-    Valida o token JWT e busca o usuário no banco.
+    Valida o token JWT e busca o usuário no cache (id, versão) ou no banco.
+
+    Síncrona de propósito: o FastAPI a executa no threadpool, então a
+    consulta ao banco não bloqueia o event loop dos endpoints `async def`.
     """
     token = credentials.credentials
     payload = decode_token(token)
 
-    user_id: int = payload.get("sub")
-    if user_id is None:
+    try:
+        user_id = int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if payload.get("ativo") is False:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Usuário inativo",
+        )
+
+    # Tokens sem "ver" (emitidos antes da versão) sempre consultam o banco
+    versao = payload.get("ver")
+    if versao is not None:
+        usuario = _usuario_em_cache((user_id, versao))
+        if usuario is not None:
+            return usuario
+
     # Buscar usuário no banco
     usuario = db.query(Usuario).filter(Usuario.id == user_id).first()
     if usuario is None:
@@ -96,12 +236,21 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if versao is not None and usuario.versao_token != versao:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token revogado. Faça login novamente",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     if not usuario.ativo:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Usuário inativo",
         )
 
+    if versao is not None:
+        _guardar_usuario((user_id, versao), usuario)
     return usuario
 
 
@@ -117,9 +266,13 @@ async def get_current_active_admin(
     return current_user
 
 
+def _buscar_por_username(db: Session, username: str) -> Optional[Usuario]:
+    return db.query(Usuario).filter(Usuario.username == username).first()
+
+
 def authenticate_user(db: Session, username: str, password: str) -> Optional[Usuario]:
     """Autentica usuário verificando username e senha"""
-    usuario = db.query(Usuario).filter(Usuario.username == username).first()
+    usuario = _buscar_por_username(db, username)
 
     if not usuario:
         return None
@@ -128,3 +281,16 @@ def authenticate_user(db: Session, username: str, password: str) -> Optional[Usu
         return None
 
     return usuario
+
+
+async def authenticate_user_async(db: Session, username: str, password: str) -> Optional[Usuario]:
+    """authenticate_user para endpoints async: consulta no threadpool, bcrypt no pool limitado"""
+    usuario = await executar(db, _buscar_por_username, username)
+
+    if not usuario:
+        return None
+
+    if not await verify_password_async(password, usuario.senha_hash):
+        return None
+
+    return usuario
@@ -3,11 +3,15 @@ CRUD Operations para Avaliacao
 """
 from typing import Optional, List
 from datetime import date
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
+from ..core.database import executar
 from ..models.avaliacao import Avaliacao
-from ..schemas.avaliacao import AvaliacaoCreate
+from ..models.jogador import Jogador
+from ..schemas.avaliacao import AvaliacaoCreate, AvaliacaoLoteItem
+from .lote import gravar_lote
 
 
 def get_avaliacao(db: Session, avaliacao_id: int) -> Optional[Avaliacao]:
@@ -20,10 +24,10 @@ def get_avaliacoes_by_jogador(
     jogador_id: int,
     skip: int = 0,
     limit: int = 50
-) -> List[Avaliacao]:
-    """Lista avaliações de um jogador (ordenadas por data)"""
+) -> List[Row]:
+    """Lista avaliações de um jogador (ordenadas por data; linhas com as colunas da tabela)"""
     return (
-        db.query(Avaliacao)
+        db.query(*Avaliacao.__table__.columns)
         .filter(Avaliacao.id_jogador == jogador_id)
         .order_by(desc(Avaliacao.data_avaliacao))
         .offset(skip)
@@ -42,6 +46,22 @@ def get_ultima_avaliacao(db: Session, jogador_id: int) -> Optional[Avaliacao]:
     )
 
 
+def consulta_exportacao(db: Session, jogador_id: Optional[int] = None, desde: Optional[date] = None):
+    """
+    Avaliações (todas as colunas + nome do jogador) para exportação em
+    streaming, em ordem de id. Filtros: jogador e data mínima da avaliação.
+    """
+    query = (
+        db.query(*Avaliacao.__table__.columns, Jogador.nome.label("nome_jogador"))
+        .join(Jogador, Jogador.id_jogador == Avaliacao.id_jogador)
+    )
+    if jogador_id is not None:
+        query = query.filter(Avaliacao.id_jogador == jogador_id)
+    if desde is not None:
+        query = query.filter(Avaliacao.data_avaliacao >= desde)
+    return query.order_by(Avaliacao.id)
+
+
 def create_avaliacao(db: Session, avaliacao: AvaliacaoCreate) -> Avaliacao:
     """Cria nova avaliação"""
     db_avaliacao = Avaliacao(**avaliacao.model_dump())
@@ -51,6 +71,15 @@ def create_avaliacao(db: Session, avaliacao: AvaliacaoCreate) -> Avaliacao:
     return db_avaliacao
 
 
+def gravar_avaliacoes_lote(db: Session, itens: List[AvaliacaoLoteItem]) -> List[dict]:
+    """Insere (ou atualiza, com id) um lote de avaliações, sem commit"""
+    return gravar_lote(
+        db, Avaliacao, [item.model_dump() for item in itens],
+        nao_encontrado="Avaliação não encontrada",
+        referencia=("id_jogador", Jogador.id_jogador, "Jogador não encontrado"),
+    )
+
+
 def delete_avaliacao(db: Session, avaliacao_id: int) -> bool:
     """Deleta avaliação"""
     db_avaliacao = get_avaliacao(db, avaliacao_id)
@@ -60,3 +89,15 @@ def delete_avaliacao(db: Session, avaliacao_id: int) -> bool:
     db.delete(db_avaliacao)
     db.commit()
     return True
+
+
+# --- Variantes assíncronas das leituras frequentes (ver core/database.executar) ---
+
+async def get_avaliacoes_by_jogador_async(db, jogador_id: int, skip: int = 0, limit: int = 50) -> List[Row]:
+    """get_avaliacoes_by_jogador sem bloquear o event loop (AsyncSession ou Session)"""
+    return await executar(db, get_avaliacoes_by_jogador, jogador_id, skip, limit)
+
+
+async def get_ultima_avaliacao_async(db, jogador_id: int) -> Optional[Avaliacao]:
+    """get_ultima_avaliacao sem bloquear o event loop (AsyncSession ou Session)"""
+    return await executar(db, get_ultima_avaliacao, jogador_id)
@@ -1,5 +1,5 @@
 """
-CRUD Base genrico usando Repository Pattern
+CRUD Base genérico usando Repository Pattern
 """
 from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
 from pydantic import BaseModel
@@ -15,7 +15,7 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
-    CRUD base genrico com operaes padro:
+    CRUD base genérico com operações padrão:
     - Create
     - Read (get, get_multi)
     - Update
@@ -42,11 +42,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Busca um registro por ID.
 
         Args:
-            db: Sesso do banco
+            db: Sessão do banco
             id: ID do registro
 
         Returns:
-            Instncia do model ou None
+            Instância do model ou None
         """
         return db.query(self.model).filter(self.model.id == id).first()
 
@@ -58,15 +58,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         limit: int = 100
     ) -> List[ModelType]:
         """
-        Busca mltiplos registros com paginao.
+        Busca múltiplos registros com paginação.
 
         Args:
-            db: Sesso do banco
-            skip: Nmero de registros para pular
-            limit: Nmero mximo de registros
+            db: Sessão do banco
+            skip: Número de registros para pular
+            limit: Número máximo de registros
 
         Returns:
-            Lista de instncias do model
+            Lista de instâncias do model
         """
         return db.query(self.model).offset(skip).limit(limit).all()
 
@@ -75,11 +75,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Cria um novo registro.
 
         Args:
-            db: Sesso do banco
-            obj_in: Schema Pydantic com dados de criao
+            db: Sessão do banco
+            obj_in: Schema Pydantic com dados de criação
 
         Returns:
-            Instncia do model criada
+            Instância do model criada
         """
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)
@@ -99,12 +99,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Atualiza um registro existente.
 
         Args:
-            db: Sesso do banco
-            db_obj: Instncia do model a ser atualizada
-            obj_in: Schema Pydantic ou dict com dados de atualizao
+            db: Sessão do banco
+            db_obj: Instância do model a ser atualizada
+            obj_in: Schema Pydantic ou dict com dados de atualização
 
         Returns:
-            Instncia do model atualizada
+            Instância do model atualizada
         """
         obj_data = jsonable_encoder(db_obj)
 
@@ -127,11 +127,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Deleta um registro por ID.
 
         Args:
-            db: Sesso do banco
+            db: Sessão do banco
             id: ID do registro
 
         Returns:
-            Instncia do model deletada
+            Instância do model deletada
         """
         obj = db.query(self.model).get(id)
         db.delete(obj)
@@ -143,10 +143,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Conta total de registros.
 
         Args:
-            db: Sesso do banco
+            db: Sessão do banco
 
         Returns:
-            Nmero total de registros
+            Número total de registros
         """
         return db.query(self.model).count()
 
@@ -155,10 +155,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Verifica se um registro existe.
 
         Args:
-            db: Sesso do banco
+            db: Sessão do banco
             id: ID do registro
 
         Returns:
-            True se existe, False caso contrrio
+            True se existe, False caso contrário
         """
         return db.query(self.model).filter(self.model.id == id).first() is not None
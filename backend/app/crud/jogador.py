@@ -1,15 +1,26 @@
 """
 CRUD Operations para Jogador
 """
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc
+from datetime import date, timedelta
+from typing import Optional, List, Tuple
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy import Float, func, desc, distinct, tuple_, text
 
 from ..models.jogador import Jogador
 from ..models.vinculo import VinculoClube
 from ..models.avaliacao import Avaliacao
 from ..models.wishlist import Wishlist
-from ..schemas.jogador import JogadorCreate, JogadorUpdate
+from ..models.tag import JogadorTag
+from ..models.busca_jogador import SQLITE_FTS_TABLE
+from ..schemas.jogador import BuscaAvancadaFiltros, JogadorCreate, JogadorLoteItem, JogadorUpdate
+from ..core.config import settings
+from ..core.database import executar
+from .lote import gravar_lote
+from ..utils.texto import normalizar_texto
+
+# Filtro "contrato vencendo" da busca avançada: até 12 meses a partir de hoje
+DIAS_CONTRATO_VENCENDO = 365
 
 
 def get_jogador(db: Session, jogador_id: int) -> Optional[Jogador]:
@@ -58,42 +69,371 @@ def get_jogadores(
     return query.order_by(Jogador.nome).offset(skip).limit(limit).all()
 
 
-def get_jogadores_com_detalhes(db: Session, skip: int = 0, limit: int = 100):
+def get_jogadores_com_detalhes(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Tuple[str, int]] = None,
+    nome: Optional[str] = None,
+    posicao: Optional[str] = None,
+    clube: Optional[str] = None,
+    liga: Optional[str] = None,
+    nacionalidade: Optional[str] = None,
+    idade_min: Optional[int] = None,
+    idade_max: Optional[int] = None,
+    media_min: Optional[float] = None,
+) -> Tuple[List[Row], Optional[int]]:
     """
     Retorna jogadores com informações agregadas (última avaliação, vínculo atual)
     Otimizado para evitar N+1 queries
+
+    Uma linha por jogador, com o vínculo atual (menor id_vinculo); os
+    filtros de clube, liga e posição valem para esse vínculo. Todos os
+    filtros são aplicados no banco. No modo offset o total de jogadores
+    filtrados vem na mesma consulta (COUNT(*) OVER ()), evitando um
+    segundo round trip.
+
+    Se `after` (nome, id_jogador) for informado, usa paginação keyset:
+    busca a partir da última linha da página anterior em vez de OFFSET,
+    aproveitando o índice composto ix_jogadores_nome_id. Nesse modo o
+    total não é calculado (retorna None), pois contar exigiria varrer
+    todas as linhas que o cursor evita.
+
+    Returns:
+        (linhas da página, total de linhas que atendem aos filtros)
     """
-    subquery_avaliacao = (
+    query, subquery_avaliacao = _consulta_detalhes(db, com_total=after is None)
+    query = _filtrar_listagem(
+        query, subquery_avaliacao, nome=nome, posicao=posicao, clube=clube, liga=liga,
+        nacionalidade=nacionalidade, idade_min=idade_min, idade_max=idade_max, media_min=media_min,
+    )
+    return _paginar(query, skip, limit, after)
+
+
+def consulta_exportacao(db: Session, **filtros):
+    """
+    Consulta da listagem (mesmos filtros de get_jogadores_com_detalhes), sem
+    paginação e com as colunas de Jogador achatadas, para exportação em
+    streaming (uma linha por vínculo; a listagem traz só o vínculo atual).
+    """
+    query, subquery_avaliacao = _consulta_detalhes(db, com_total=False, todos_vinculos=True)
+    query = _filtrar_listagem(query, subquery_avaliacao, **filtros)
+    return query.order_by(Jogador.nome, Jogador.id_jogador, VinculoClube.id_vinculo)
+
+
+def busca_avancada(
+    db: Session,
+    filtros: BuscaAvancadaFiltros,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Tuple[str, int]] = None,
+) -> Tuple[List[Row], Optional[int]]:
+    """
+    Busca avançada: listas de valores exatos, faixa de idade, média mínima,
+    contrato vencendo e tags ("qualquer" uma ou "todas"), tudo em uma consulta.
+
+    Mesmas colunas e paginação (offset com total ou keyset) de
+    get_jogadores_com_detalhes. Os filtros seguem a aba do dashboard: os de
+    vínculo e a média mínima (última avaliação) viram EXISTS e as tags
+    EXISTS (qualquer) ou GROUP BY/HAVING (todas), sem multiplicar as
+    linhas do resultado.
+    """
+    query, _ = _consulta_detalhes(db, com_total=after is None)
+    query = _filtrar_busca_avancada(db, query, filtros)
+    return _paginar(query, skip, limit, after)
+
+
+def ids_busca_avancada(db: Session, filtros: BuscaAvancadaFiltros) -> List[Tuple[str, int]]:
+    """
+    Todos os (nome, id_jogador) que atendem à busca avançada, sem as colunas
+    de detalhe: base do cache de resultados das buscas salvas.
+    """
+    query = _filtrar_busca_avancada(db, db.query(Jogador.nome, Jogador.id_jogador), filtros)
+    return [tuple(row) for row in query.order_by(Jogador.nome, Jogador.id_jogador)]
+
+
+def get_jogadores_com_detalhes_por_ids(db: Session, ids: List[int]) -> List[Row]:
+    """Linhas de detalhe (mesmas colunas da listagem) de uma página de ids, na ordem dos ids"""
+    if not ids:
+        return []
+    query, _ = _consulta_detalhes(db, com_total=False)
+    posicao = {id_jogador: i for i, id_jogador in enumerate(ids)}
+    rows = query.filter(Jogador.id_jogador.in_(ids)).all()
+    return sorted(rows, key=lambda row: posicao[row.id_jogador])
+
+
+def _filtrar_busca_avancada(db: Session, query, filtros: BuscaAvancadaFiltros):
+    """
+    Aplica os filtros da busca avançada com a mesma semântica da aba do
+    dashboard (src/database/busca_avancada.py): posição, clube e contrato
+    valem para qualquer vínculo do jogador (o mesmo vínculo atende a todos),
+    e a média mínima é a dos 4 pilares da última avaliação (0 se não avaliado).
+    """
+    vinculo = aliased(VinculoClube)
+    condicoes_vinculo = []
+    if filtros.posicoes:
+        condicoes_vinculo.append(vinculo.posicao.in_(filtros.posicoes))
+    if filtros.clubes:
+        condicoes_vinculo.append(vinculo.clube.in_(filtros.clubes))
+    if filtros.contrato_vencendo:
+        limite = date.today() + timedelta(days=DIAS_CONTRATO_VENCENDO)
+        condicoes_vinculo.append(vinculo.data_fim_contrato <= limite)
+    if condicoes_vinculo:
+        query = query.filter(
+            db.query(vinculo)
+            .filter(vinculo.id_jogador == Jogador.id_jogador, *condicoes_vinculo)
+            .exists()
+        )
+
+    if filtros.nacionalidades:
+        query = query.filter(Jogador.nacionalidade.in_(filtros.nacionalidades))
+    if filtros.idade_min is not None:
+        query = query.filter(Jogador.idade_atual >= filtros.idade_min)
+    if filtros.idade_max is not None:
+        query = query.filter(Jogador.idade_atual <= filtros.idade_max)
+    if filtros.media_min:
+        ultima = _subquery_ultima_avaliacao(db)
+        query = query.filter(
+            db.query(ultima.c.id_jogador)
+            .filter(ultima.c.id_jogador == Jogador.id_jogador, ultima.c.ordem == 1)
+            .filter(ultima.c.media >= filtros.media_min)
+            .exists()
+        )
+
+    tags = list(dict.fromkeys(filtros.tags))
+    if tags:
+        if filtros.tags_modo == "todas":
+            com_todas = (
+                db.query(JogadorTag.id_jogador)
+                .filter(JogadorTag.id_tag.in_(tags))
+                .group_by(JogadorTag.id_jogador)
+                .having(func.count(distinct(JogadorTag.id_tag)) == len(tags))
+            )
+            query = query.filter(Jogador.id_jogador.in_(com_todas))
+        else:
+            query = query.filter(
+                db.query(JogadorTag)
+                .filter(JogadorTag.id_jogador == Jogador.id_jogador, JogadorTag.id_tag.in_(tags))
+                .exists()
+            )
+    return query
+
+
+def _filtrar_listagem(
+    query,
+    subquery_avaliacao,
+    nome: Optional[str] = None,
+    posicao: Optional[str] = None,
+    clube: Optional[str] = None,
+    liga: Optional[str] = None,
+    nacionalidade: Optional[str] = None,
+    idade_min: Optional[int] = None,
+    idade_max: Optional[int] = None,
+    media_min: Optional[float] = None,
+):
+    """Filtros da listagem de jogadores (JogadorFilterParams)"""
+    if nome:
+        query = query.filter(Jogador.nome.ilike(f"%{nome}%"))
+    if nacionalidade:
+        query = query.filter(Jogador.nacionalidade.ilike(f"%{nacionalidade}%"))
+    if idade_min is not None:
+        query = query.filter(Jogador.idade_atual >= idade_min)
+    if idade_max is not None:
+        query = query.filter(Jogador.idade_atual <= idade_max)
+    if clube:
+        query = query.filter(VinculoClube.clube.ilike(f"%{clube}%"))
+    if liga:
+        query = query.filter(VinculoClube.liga_clube.ilike(f"%{liga}%"))
+    if posicao:
+        query = query.filter(VinculoClube.posicao.ilike(f"%{posicao}%"))
+    if media_min is not None:
+        query = query.filter(subquery_avaliacao.c.media_geral >= media_min)
+    return query
+
+
+def _subquery_avaliacao(db: Session):
+    """Agregados de avaliação por jogador (média potencial, média geral, total)"""
+    media_pilares = (
+        Avaliacao.nota_tatico + Avaliacao.nota_tecnico
+        + Avaliacao.nota_fisico + Avaliacao.nota_mental
+    ) / 4
+
+    return (
         db.query(
             Avaliacao.id_jogador,
-            func.avg(Avaliacao.nota_potencial).label("nota_potencial_media"),
+            func.avg(Avaliacao.nota_potencial, type_=Float).label("nota_potencial_media"),
+            func.avg(media_pilares, type_=Float).label("media_geral"),
             func.count(Avaliacao.id).label("total_avaliacoes")
         )
         .group_by(Avaliacao.id_jogador)
         .subquery()
     )
 
-    query = (
+
+def _subquery_ultima_avaliacao(db: Session):
+    """Média dos 4 pilares de cada avaliação, numerada da mais recente (ordem = 1)"""
+    return (
         db.query(
-            Jogador,
-            VinculoClube.clube,
-            VinculoClube.liga_clube,
-            VinculoClube.posicao,
-            VinculoClube.status_contrato,
-            VinculoClube.data_fim_contrato,
-            subquery_avaliacao.c.nota_potencial_media,
-            subquery_avaliacao.c.total_avaliacoes,
-            Wishlist.id.isnot(None).label("em_wishlist")
+            Avaliacao.id_jogador,
+            (
+                (Avaliacao.nota_tatico + Avaliacao.nota_tecnico
+                 + Avaliacao.nota_fisico + Avaliacao.nota_mental) / 4
+            ).label("media"),
+            func.row_number().over(
+                partition_by=Avaliacao.id_jogador,
+                order_by=(desc(Avaliacao.data_avaliacao), desc(Avaliacao.id)),
+            ).label("ordem"),
         )
-        .outerjoin(VinculoClube, Jogador.id_jogador == VinculoClube.id_jogador)
-        .outerjoin(subquery_avaliacao, Jogador.id_jogador == subquery_avaliacao.c.id_jogador)
+        .subquery()
+    )
+
+
+def _unir_vinculo_atual(db: Session, query):
+    """
+    LEFT JOIN com o vínculo atual do jogador (o de menor id_vinculo, como em
+    services/mercado.py): uma linha por jogador mesmo com vários vínculos.
+    """
+    vinculo_atual = (
+        db.query(VinculoClube.id_jogador, func.min(VinculoClube.id_vinculo).label("id_vinculo"))
+        .group_by(VinculoClube.id_jogador)
+        .subquery()
+    )
+    return (
+        query.outerjoin(vinculo_atual, vinculo_atual.c.id_jogador == Jogador.id_jogador)
+        .outerjoin(VinculoClube, VinculoClube.id_vinculo == vinculo_atual.c.id_vinculo)
+    )
+
+
+def _consulta_detalhes(db: Session, com_total: bool, todos_vinculos: bool = False):
+    """
+    Consulta base das listagens: jogador, vínculo atual, agregados de
+    avaliação e wishlist. Retorna (query, subquery_avaliacao) para os
+    filtros de média.
+
+    Cada jogador aparece uma vez (o cursor keyset (nome, id_jogador) e o
+    total contam jogadores); `todos_vinculos` traz uma linha por vínculo,
+    só para a exportação, que não pagina.
+
+    As colunas de Jogador vêm achatadas (sem instanciar o modelo): cada linha
+    já tem todos os campos de JogadorWithDetails pelo nome.
+    """
+    subquery_avaliacao = _subquery_avaliacao(db)
+
+    colunas = [
+        *Jogador.__table__.columns,
+        VinculoClube.clube,
+        VinculoClube.liga_clube,
+        VinculoClube.posicao,
+        VinculoClube.status_contrato,
+        VinculoClube.data_fim_contrato,
+        subquery_avaliacao.c.nota_potencial_media,
+        subquery_avaliacao.c.total_avaliacoes,
+        Wishlist.id.isnot(None).label("em_wishlist"),
+        subquery_avaliacao.c.media_geral,
+    ]
+    if com_total:
+        colunas.append(func.count().over().label("total"))
+
+    query = db.query(*colunas)
+    if todos_vinculos:
+        query = query.outerjoin(VinculoClube, Jogador.id_jogador == VinculoClube.id_jogador)
+    else:
+        query = _unir_vinculo_atual(db, query)
+    query = (
+        query.outerjoin(subquery_avaliacao, Jogador.id_jogador == subquery_avaliacao.c.id_jogador)
         .outerjoin(Wishlist, Jogador.id_jogador == Wishlist.id_jogador)
-        .order_by(Jogador.nome)
-        .offset(skip)
-        .limit(limit)
     )
+    return query, subquery_avaliacao
+
 
-    return query.all()
+def _paginar(query, skip: int, limit: int, after: Optional[Tuple[str, int]]):
+    """Ordena por (nome, id_jogador) e pagina por offset (com total) ou keyset"""
+    query = query.order_by(Jogador.nome, Jogador.id_jogador)
+
+    if after is not None:
+        rows = (
+            query.filter(tuple_(Jogador.nome, Jogador.id_jogador) > tuple_(*after))
+            .limit(limit)
+            .all()
+        )
+        return rows, None
+
+    rows = query.offset(skip).limit(limit).all()
+    if rows:
+        return rows, rows[0].total
+
+    # Página além do fim: a janela não traz linhas, então conta à parte
+    total = query.order_by(None).count() if skip else 0
+    return rows, total
+
+
+_SEARCH_SQL_POSTGRES = text("""
+    SELECT * FROM (
+        SELECT DISTINCT ON (j.id_jogador)
+            j.id_jogador, j.nome, j.nacionalidade, j.idade_atual, j.transfermarkt_id,
+            v.clube, v.posicao,
+            GREATEST(
+                word_similarity(:termo, f_unaccent(lower(j.nome))),
+                0.8 * word_similarity(:termo, f_unaccent(lower(coalesce(v.clube, '')))),
+                0.6 * word_similarity(:termo, f_unaccent(lower(coalesce(j.nacionalidade, ''))))
+            ) + CASE WHEN f_unaccent(lower(j.nome)) LIKE :prefixo THEN 0.5 ELSE 0 END AS score
+        FROM jogadores j
+        LEFT JOIN vinculos_clubes v ON v.id_jogador = j.id_jogador
+        WHERE :termo <% f_unaccent(lower(j.nome))
+           OR :termo <% f_unaccent(lower(v.clube))
+           OR :termo <% f_unaccent(lower(j.nacionalidade))
+           OR f_unaccent(lower(j.nome)) LIKE :prefixo
+        ORDER BY j.id_jogador, score DESC
+    ) AS resultados
+    ORDER BY score DESC, nome
+    LIMIT :limit
+""")
+
+_SEARCH_SQL_SQLITE = text(f"""
+    SELECT
+        j.id_jogador, j.nome, j.nacionalidade, j.idade_atual, j.transfermarkt_id,
+        v.clube, v.posicao,
+        -bm25({SQLITE_FTS_TABLE}, 10.0, 5.0, 2.0) AS score
+    FROM {SQLITE_FTS_TABLE}
+    JOIN jogadores j ON j.id_jogador = {SQLITE_FTS_TABLE}.rowid
+    LEFT JOIN vinculos_clubes v ON v.id_vinculo = (
+        SELECT min(id_vinculo) FROM vinculos_clubes WHERE id_jogador = j.id_jogador
+    )
+    WHERE {SQLITE_FTS_TABLE} MATCH :consulta
+    ORDER BY score DESC, j.nome
+    LIMIT :limit
+""")
+
+
+def search_jogadores(db: Session, q: str, limit: int = 20) -> List[Row]:
+    """
+    Busca textual ranqueada por nome, clube e nacionalidade.
+
+    PostgreSQL: similaridade de trigramas (pg_trgm) sobre texto sem acentos,
+    tolerante a erros de digitação, com bônus para prefixos do nome.
+    SQLite: FTS5 com prefixo por termo (sem tolerância a erros), ranqueado por bm25.
+
+    Returns:
+        Linhas com id_jogador, nome, nacionalidade, idade_atual,
+        transfermarkt_id, clube, posicao e score (maior = mais relevante)
+    """
+    termo = normalizar_texto(q)
+    if not termo:
+        return []
+
+    if db.get_bind().dialect.name == "sqlite":
+        tokens = [t for t in termo.replace('"', " ").split(" ") if t]
+        consulta = " ".join(f'"{t}"*' for t in tokens)
+        return db.execute(_SEARCH_SQL_SQLITE, {"consulta": consulta, "limit": limit}).all()
+
+    prefixo = termo.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    db.execute(
+        text("SELECT set_config('pg_trgm.word_similarity_threshold', :limiar, true)"),
+        {"limiar": str(settings.SEARCH_SIMILARITY_THRESHOLD)},
+    )
+    return db.execute(
+        _SEARCH_SQL_POSTGRES, {"termo": termo, "prefixo": prefixo, "limit": limit}
+    ).all()
 
 
 def create_jogador(db: Session, jogador: JogadorCreate) -> Jogador:
@@ -105,6 +445,14 @@ def create_jogador(db: Session, jogador: JogadorCreate) -> Jogador:
     return db_jogador
 
 
+def gravar_jogadores_lote(db: Session, itens: List[JogadorLoteItem]) -> List[dict]:
+    """Upsert de um lote de jogadores (id_jogador ou transfermarkt_id), sem commit"""
+    return gravar_lote(
+        db, Jogador, [item.model_dump() for item in itens],
+        nao_encontrado="Jogador não encontrado", chave_natural="transfermarkt_id",
+    )
+
+
 def update_jogador(db: Session, jogador_id: int, jogador_update: JogadorUpdate) -> Optional[Jogador]:
     """Atualiza jogador existente"""
     db_jogador = get_jogador(db, jogador_id)
@@ -135,3 +483,15 @@ def delete_jogador(db: Session, jogador_id: int) -> bool:
 def count_jogadores(db: Session) -> int:
     """Conta total de jogadores"""
     return db.query(func.count(Jogador.id_jogador)).scalar()
+
+
+# --- Variantes assíncronas das leituras frequentes (ver core/database.executar) ---
+
+async def get_jogador_async(db, jogador_id: int) -> Optional[Jogador]:
+    """get_jogador sem bloquear o event loop (AsyncSession ou Session)"""
+    return await executar(db, get_jogador, jogador_id)
+
+
+async def get_jogadores_com_detalhes_async(db, **kwargs) -> Tuple[List[Row], Optional[int]]:
+    """get_jogadores_com_detalhes sem bloquear o event loop (AsyncSession ou Session)"""
+    return await executar(db, get_jogadores_com_detalhes, **kwargs)
@@ -0,0 +1,167 @@
+"""
+Gravação em lote (upsert) para os endpoints /bulk
+
+Um lote vira poucos comandos, todos na mesma transação (o commit fica com o
+chamador):
+
+- itens com a chave primária atualizam a linha existente e itens com a
+  chave natural (ex.: transfermarkt_id) inserem ou atualizam, por
+  INSERT ... VALUES (...), (...) ON CONFLICT (chave) DO UPDATE, de
+  LOTE_INSERT linhas por comando;
+- os demais são inseridos com um INSERT de várias linhas (insertmanyvalues
+  do SQLAlchemy), com os ids devolvidos na ordem dos itens.
+
+Antes de gravar, duas consultas validam o lote inteiro: ids inexistentes,
+referências a jogadores inexistentes e chaves repetidas viram status
+"erro" no item, sem impedir a gravação dos demais. Os itens com id
+substituem todos os campos da linha (como um PUT).
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+# Linhas por INSERT ... ON CONFLICT
+LOTE_INSERT = 500
+
+
+def _insert_upsert(db: Session, tabela):
+    """INSERT do dialeto (PostgreSQL ou SQLite), que aceita ON CONFLICT"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(tabela)
+    return sqlite.insert(tabela)
+
+
+def _existentes(db: Session, coluna, valores) -> set:
+    valores = {valor for valor in valores if valor is not None}
+    if not valores:
+        return set()
+    return {valor for (valor,) in db.query(coluna).filter(coluna.in_(valores))}
+
+
+def upsert_por_chave(db: Session, modelo, chave: str, linhas: List[Dict[str, Any]]) -> Dict[Any, int]:
+    """
+    Insere ou atualiza as linhas pela coluna única `chave` (sem commit).
+
+    Returns:
+        {valor da chave: id da linha}
+    """
+    tabela = modelo.__table__
+    pk = tabela.primary_key.columns.values()[0]
+    ids: Dict[Any, int] = {}
+    for inicio in range(0, len(linhas), LOTE_INSERT):
+        lote = linhas[inicio:inicio + LOTE_INSERT]
+        stmt = _insert_upsert(db, tabela).values(lote)
+        atualizar = {coluna: stmt.excluded[coluna] for coluna in lote[0] if coluna != chave}
+        if "data_atualizacao" in tabela.c:
+            atualizar["data_atualizacao"] = func.now()
+        stmt = stmt.on_conflict_do_update(index_elements=[tabela.c[chave]], set_=atualizar)
+        ids.update((valor, id_linha) for id_linha, valor in db.execute(stmt.returning(pk, tabela.c[chave])))
+    return ids
+
+
+def inserir(db: Session, modelo, linhas: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insere as linhas (sem commit) e retorna os ids na ordem das linhas.
+
+    No PostgreSQL vira um INSERT ... SELECT FROM (VALUES ...) por lote de
+    linhas, ordenado pela posição; no SQLite (sem como correlacionar o
+    RETURNING) o SQLAlchemy grava uma linha por comando.
+    """
+    if not linhas:
+        return []
+    tabela = modelo.__table__
+    pk = tabela.primary_key.columns.values()[0]
+    stmt = insert(tabela).returning(pk, sort_by_parameter_order=True)
+    return list(db.execute(stmt, linhas).scalars())
+
+
+def gravar_lote(
+    db: Session,
+    modelo,
+    linhas: List[Dict[str, Any]],
+    nao_encontrado: str,
+    chave_natural: Optional[str] = None,
+    referencia: Optional[Tuple[str, Any, str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Grava um lote de linhas (sem commit) e retorna o status de cada uma.
+
+    Args:
+        modelo: Model SQLAlchemy (chave primária de uma coluna)
+        linhas: Campos de cada item; a chave primária, se informada, indica atualização
+        nao_encontrado: Erro para itens cuja chave primária não existe
+        chave_natural: Coluna única usada no upsert dos itens sem chave primária
+        referencia: (coluna, coluna referenciada, erro) verificada antes de gravar
+
+    Returns:
+        Lista de {indice, status, id, erro}, na ordem de `linhas`
+    """
+    pk = modelo.__table__.primary_key.columns.values()[0]
+    resultado: List[Optional[Dict[str, Any]]] = [None] * len(linhas)
+
+    def erro(indice: int, mensagem: str) -> None:
+        resultado[indice] = {"indice": indice, "status": "erro", "id": None, "erro": mensagem}
+
+    if referencia is not None:
+        coluna, referenciada, mensagem = referencia
+        validas = _existentes(db, referenciada, (linha[coluna] for linha in linhas))
+        for indice, linha in enumerate(linhas):
+            if linha[coluna] not in validas:
+                erro(indice, mensagem)
+
+    ids_existentes = _existentes(db, pk, (linha[pk.name] for linha in linhas))
+    por_pk: Dict[Any, int] = {}
+    por_chave: Dict[Any, int] = {}
+    novos: List[int] = []
+    for indice, linha in enumerate(linhas):
+        if resultado[indice] is not None:
+            continue
+        if linha[pk.name] is not None:
+            if linha[pk.name] not in ids_existentes:
+                erro(indice, nao_encontrado)
+            elif linha[pk.name] in por_pk:
+                erro(indice, f"{pk.name} repetido no lote")
+            else:
+                por_pk[linha[pk.name]] = indice
+        elif chave_natural and linha[chave_natural] is not None:
+            if linha[chave_natural] in por_chave:
+                erro(indice, f"{chave_natural} repetido no lote")
+            else:
+                por_chave[linha[chave_natural]] = indice
+        else:
+            novos.append(indice)
+
+    if por_pk:
+        upsert_por_chave(db, modelo, pk.name, [linhas[indice] for indice in por_pk.values()])
+        for id_linha, indice in por_pk.items():
+            resultado[indice] = {"indice": indice, "status": "atualizado", "id": id_linha, "erro": None}
+
+    if por_chave:
+        coluna = modelo.__table__.c[chave_natural]
+        ja_existiam = _existentes(db, coluna, por_chave)
+        sem_pk = [{k: v for k, v in linhas[indice].items() if k != pk.name} for indice in por_chave.values()]
+        ids = upsert_por_chave(db, modelo, chave_natural, sem_pk)
+        for valor, indice in por_chave.items():
+            status = "atualizado" if valor in ja_existiam else "criado"
+            resultado[indice] = {"indice": indice, "status": status, "id": ids[valor], "erro": None}
+
+    sem_pk = [{k: v for k, v in linhas[indice].items() if k != pk.name} for indice in novos]
+    for indice, id_linha in zip(novos, inserir(db, modelo, sem_pk)):
+        resultado[indice] = {"indice": indice, "status": "criado", "id": id_linha, "erro": None}
+
+    return resultado
+
+
+def resumir(itens: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Corpo de ResultadoLote a partir do status dos itens"""
+    contagem = {"criado": 0, "atualizado": 0, "erro": 0}
+    for item in itens:
+        contagem[item["status"]] += 1
+    return {
+        "criados": contagem["criado"],
+        "atualizados": contagem["atualizado"],
+        "erros": contagem["erro"],
+        "itens": itens,
+    }
@@ -0,0 +1,19 @@
+"""
+CRUD Operations para VinculoClube
+"""
+from typing import List
+from sqlalchemy.orm import Session
+
+from ..models.jogador import Jogador
+from ..models.vinculo import VinculoClube
+from ..schemas.vinculo import VinculoClubeLoteItem
+from .lote import gravar_lote
+
+
+def gravar_vinculos_lote(db: Session, itens: List[VinculoClubeLoteItem]) -> List[dict]:
+    """Insere (ou atualiza, com id_vinculo) um lote de vínculos, sem commit"""
+    return gravar_lote(
+        db, VinculoClube, [item.model_dump() for item in itens],
+        nao_encontrado="Vínculo não encontrado",
+        referencia=("id_jogador", Jogador.id_jogador, "Jogador não encontrado"),
+    )
@@ -2,11 +2,11 @@
 CRUD Operations para Wishlist
 """
 from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
 
+from ..core.database import executar
 from ..models.wishlist import Wishlist
-from ..models.jogador import Jogador
-from ..models.vinculo import VinculoClube
 from ..schemas.wishlist import WishlistCreate
 
 
@@ -15,11 +15,9 @@ def get_wishlist(
     prioridade: Optional[str] = None,
     skip: int = 0,
     limit: int = 100
-) -> List[Wishlist]:
-    """Lista jogadores na wishlist (com jogador carregado)"""
-    query = db.query(Wishlist).options(
-        joinedload(Wishlist.jogador).joinedload(Jogador.vinculos)
-    )
+) -> List[Row]:
+    """Lista jogadores na wishlist (linhas com as colunas da tabela, sem instanciar o modelo)"""
+    query = db.query(*Wishlist.__table__.columns)
 
     if prioridade:
         query = query.filter(Wishlist.prioridade == prioridade)
@@ -55,3 +53,15 @@ def delete_wishlist_item(db: Session, jogador_id: int) -> bool:
     db.delete(db_wishlist)
     db.commit()
     return True
+
+
+# --- Variantes assíncronas das leituras frequentes (ver core/database.executar) ---
+
+async def get_wishlist_async(
+    db,
+    prioridade: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> List[Row]:
+    """get_wishlist sem bloquear o event loop (AsyncSession ou Session)"""
+    return await executar(db, get_wishlist, prioridade, skip, limit)
@@ -2,14 +2,21 @@
 Scout Pro API - Backend FastAPI
 Sistema de Scouting de Jogadores de Futebol
 """
+import asyncio
+
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+from sqlalchemy.exc import SQLAlchemyError
 
+from .api.cache_http import CabecalhosCacheMiddleware
+from .core.compressao import CompressaoMiddleware
 from .core.config import settings
-from .core.database import engine, Base
-from .api.v1.endpoints import auth, jogadores, avaliacoes, wishlist, scraping, sync, shadow_teams, stats
+from .core.database import engine, Base, SessionLocal
+from .services import jobs
+from .services.buscas_salvas import pre_aquecer_periodicamente
+from .api.v1.endpoints import auth, jogadores, avaliacoes, wishlist, scraping, sync, shadow_teams, stats, buscas_salvas, mercado, exportacao, vinculos
 
 
 @asynccontextmanager
@@ -25,10 +32,35 @@ async def lifespan(app: FastAPI):
     # NOTA: Em produção, usar Alembic para migrations
     # Base.metadata.create_all(bind=engine)
 
+    # Jobs de scraping interrompidos por um restart anterior
+    db = SessionLocal()
+    try:
+        orfaos = jobs.recuperar_jobs_orfaos(db)
+        if orfaos["reenfileirado"]:
+            print(f"🔁 {orfaos['reenfileirado']} job(s) de scraping pendente(s) reenfileirado(s)")
+        if orfaos["failed"]:
+            print(f"⚠️  {orfaos['failed']} job(s) de scraping órfão(s) marcados como 'failed'")
+    except SQLAlchemyError as e:
+        # Ex.: tabela scraping_jobs ainda não criada; a API sobe mesmo assim
+        db.rollback()
+        print(f"⚠️  Jobs órfãos não verificados (execute 'alembic upgrade head'): {e.__class__.__name__}")
+    finally:
+        db.close()
+
+    # Pré-aquecimento das buscas salvas mais usadas
+    pre_aquecimento = None
+    if settings.BUSCAS_PREAQUECER_INTERVALO > 0:
+        pre_aquecimento = asyncio.create_task(
+            pre_aquecer_periodicamente(settings.BUSCAS_PREAQUECER_INTERVALO)
+        )
+
     yield
 
     # Shutdown
     print("👋 Encerrando Scout Pro API...")
+    if pre_aquecimento is not None:
+        pre_aquecimento.cancel()
+    jobs.shutdown()
     engine.dispose()
 
 
@@ -54,8 +86,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # GET, POST, PUT, DELETE, etc.
     allow_headers=["*"],  # Authorization, Content-Type, etc.
+    expose_headers=["ETag"],
 )
 
+# ETag/Cache-Control das leituras (ver api/cache_http.py)
+app.add_middleware(CabecalhosCacheMiddleware)
+
+# Compressão (gzip/brotli) das respostas acima de COMPRESSAO_MIN_BYTES
+if settings.COMPRESSAO_ATIVA:
+    app.add_middleware(
+        CompressaoMiddleware,
+        minimo=settings.COMPRESSAO_MIN_BYTES,
+        nivel_gzip=settings.COMPRESSAO_NIVEL_GZIP,
+        usar_brotli=settings.COMPRESSAO_BROTLI,
+        nivel_brotli=settings.COMPRESSAO_NIVEL_BROTLI,
+    )
+
 
 # ============================================
 # ROUTERS - Endpoints
@@ -73,6 +119,18 @@ app.include_router(avaliacoes.router, prefix="/api/v1")
 # Wishlist
 app.include_router(wishlist.router, prefix="/api/v1")
 
+# Vínculos
+app.include_router(vinculos.router, prefix="/api/v1")
+
+# Buscas Salvas
+app.include_router(buscas_salvas.router, prefix="/api/v1")
+
+# Mercado
+app.include_router(mercado.router, prefix="/api/v1")
+
+# Exportação
+app.include_router(exportacao.router, prefix="/api/v1")
+
 # Scraping
 app.include_router(scraping.router, prefix="/api/v1/scraping", tags=["Scraping"])
 
@@ -8,9 +8,12 @@ from .tag import Tag, JogadorTag
 from .wishlist import Wishlist
 from .alerta import Alerta
 from .nota_rapida import NotaRapida
-from .busca_salva import BuscaSalva
+from .busca_salva import BuscaSalva, ResultadoBusca
 from .proposta import Proposta
 from .usuario import Usuario
+from .dashboard import VersaoTabela, ResumoDashboard
+from .scraping_job import ScrapingJob
+from . import busca_jogador  # noqa: F401  (registra o índice de busca textual)
 
 __all__ = [
     "Jogador",
@@ -22,6 +25,10 @@ __all__ = [
     "Alerta",
     "NotaRapida",
     "BuscaSalva",
+    "ResultadoBusca",
     "Proposta",
     "Usuario",
+    "VersaoTabela",
+    "ResumoDashboard",
+    "ScrapingJob",
 ]
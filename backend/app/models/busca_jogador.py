@@ -0,0 +1,64 @@
+"""
+Índice de busca textual de jogadores
+
+PostgreSQL: índices GIN pg_trgm sobre f_unaccent(lower(...)), criados pela
+migration 003 (alembic).
+
+SQLite (desenvolvimento/testes): tabela virtual FTS5 `jogadores_fts`
+mantida por triggers, criada junto com Base.metadata.create_all().
+"""
+from sqlalchemy import DDL, event
+
+from ..core.database import Base
+
+SQLITE_FTS_TABLE = "jogadores_fts"
+
+_CLUBES_DO_JOGADOR = (
+    "(SELECT group_concat(clube, ' ') FROM vinculos_clubes WHERE id_jogador = {ref}.id_jogador)"
+)
+
+_SQLITE_CREATE = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        nome, clube, nacionalidade,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS jogadores_fts_ai AFTER INSERT ON jogadores BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, nome, clube, nacionalidade)
+        VALUES (new.id_jogador, new.nome, {_CLUBES_DO_JOGADOR.format(ref='new')}, new.nacionalidade);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS jogadores_fts_au AFTER UPDATE ON jogadores BEGIN
+        DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = old.id_jogador;
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, nome, clube, nacionalidade)
+        VALUES (new.id_jogador, new.nome, {_CLUBES_DO_JOGADOR.format(ref='new')}, new.nacionalidade);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS jogadores_fts_ad AFTER DELETE ON jogadores BEGIN
+        DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = old.id_jogador;
+    END
+    """,
+]
+
+# Vínculos alteram apenas a coluna `clube` do documento do jogador
+for _evento, _ref in (("INSERT", "new"), ("UPDATE", "new"), ("DELETE", "old")):
+    _SQLITE_CREATE.append(f"""
+    CREATE TRIGGER IF NOT EXISTS vinculos_fts_{_evento.lower()} AFTER {_evento} ON vinculos_clubes BEGIN
+        UPDATE {SQLITE_FTS_TABLE}
+        SET clube = {_CLUBES_DO_JOGADOR.format(ref=_ref)}
+        WHERE rowid = {_ref}.id_jogador;
+    END
+    """)
+
+for _ddl in _SQLITE_CREATE:
+    event.listen(Base.metadata, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
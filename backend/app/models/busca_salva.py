@@ -1,7 +1,13 @@
 """
-Modelo BuscaSalva - Filtros salvos pelo usuário
+Modelos BuscaSalva e ResultadoBusca - Filtros salvos pelo usuário
+
+`buscas_resultados` guarda a lista de jogadores (nome, id_jogador) de cada
+conjunto de filtros, identificado pela chave canônica dos filtros (duas
+buscas salvas com os mesmos filtros compartilham o resultado), junto com as
+versões das tabelas usadas no cálculo (ver models/dashboard.py). O resultado
+só é recalculado quando alguma dessas versões muda.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, func
 
 from ..core.database import Base
 
@@ -15,6 +21,21 @@ class BuscaSalva(Base):
     filtros = Column(Text, nullable=False)  # JSON serializado com os filtros
     criado_por = Column(String(100))
     criado_em = Column(DateTime(timezone=True), server_default=func.now())
+    total_execucoes = Column(Integer, nullable=False, default=0)  # usado no pré-aquecimento
+    ultima_execucao = Column(DateTime(timezone=True))
 
     def __repr__(self):
         return f"<BuscaSalva(id={self.id_busca}, nome='{self.nome_busca}')>"
+
+
+class ResultadoBusca(Base):
+    """Resultado pré-calculado de um conjunto de filtros"""
+    __tablename__ = "buscas_resultados"
+
+    chave = Column(String(64), primary_key=True)  # sha256 dos filtros canônicos
+    jogadores = Column(JSON, nullable=False)  # [[nome, id_jogador], ...] na ordem da listagem
+    versoes = Column(JSON, nullable=False)  # {tabela: versao} no momento do cálculo
+    calculado_em = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<ResultadoBusca(chave='{self.chave[:8]}', total={len(self.jogadores)})>"
@@ -0,0 +1,61 @@
+"""
+Modelos VersaoTabela e ResumoDashboard - Camada de agregados materializados
+
+`versoes_tabelas` guarda um contador por tabela, incrementado por triggers
+do banco a cada INSERT/UPDATE/DELETE (inclusive escritas feitas fora da API,
+como o Streamlit e a sincronização com o Google Sheets).
+
+`dashboard_resumo` guarda cada seção do dashboard já calculada, junto com
+as versões das tabelas usadas no cálculo. Uma seção só é recalculada quando
+alguma dessas versões muda (ou, para seções que dependem da data, no dia
+seguinte).
+
+PostgreSQL: triggers das migrations 004/006; desde a 008 o incremento roda
+no commit (trigger adiado), dentro da transação que escreveu: a versão nova
+nunca aparece antes dos dados e a linha fica travada só durante o commit.
+SQLite (desenvolvimento/testes): triggers criados junto com create_all().
+"""
+from sqlalchemy import Column, Integer, String, JSON, DateTime, DDL, event, func
+
+from ..core.database import Base
+
+# Tabelas cujas escritas invalidam agregados (dashboard e buscas salvas)
+TABELAS_VERSIONADAS = ("jogadores", "vinculos_clubes", "avaliacoes", "wishlist", "jogador_tags")
+
+
+class VersaoTabela(Base):
+    """Contador de versões por tabela (mantido por triggers)"""
+    __tablename__ = "versoes_tabelas"
+
+    tabela = Column(String(100), primary_key=True)
+    versao = Column(Integer, nullable=False, default=0)
+    atualizado_em = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<VersaoTabela(tabela='{self.tabela}', versao={self.versao})>"
+
+
+class ResumoDashboard(Base):
+    """Seções pré-calculadas do dashboard executivo"""
+    __tablename__ = "dashboard_resumo"
+
+    secao = Column(String(50), primary_key=True)
+    dados = Column(JSON, nullable=False)
+    versoes = Column(JSON, nullable=False)  # {tabela: versao} no momento do cálculo
+    calculado_em = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<ResumoDashboard(secao='{self.secao}', calculado_em={self.calculado_em})>"
+
+
+for _tabela in TABELAS_VERSIONADAS:
+    for _evento in ("INSERT", "UPDATE", "DELETE"):
+        event.listen(Base.metadata, "after_create", DDL(f"""
+            CREATE TRIGGER IF NOT EXISTS {_tabela}_versao_{_evento.lower()}
+            AFTER {_evento} ON {_tabela} BEGIN
+                INSERT INTO versoes_tabelas(tabela, versao, atualizado_em)
+                VALUES ('{_tabela}', 1, CURRENT_TIMESTAMP)
+                ON CONFLICT(tabela) DO UPDATE
+                SET versao = versao + 1, atualizado_em = CURRENT_TIMESTAMP;
+            END
+        """).execute_if(dialect="sqlite"))
@@ -1,7 +1,7 @@
 """
 Modelo Jogador - Representa um jogador no banco de dados
 """
-from sqlalchemy import Column, Integer, String, DateTime, func
+from sqlalchemy import Column, Integer, String, DateTime, Index, func
 from sqlalchemy.orm import relationship
 
 from ..core.database import Base
@@ -22,6 +22,11 @@ class Jogador(Base):
     data_criacao = Column(DateTime(timezone=True), server_default=func.now())
     data_atualizacao = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Índice composto para paginação keyset (ORDER BY nome, id_jogador)
+    __table_args__ = (
+        Index("ix_jogadores_nome_id", "nome", "id_jogador"),
+    )
+
     # Relacionamentos
     vinculos = relationship("VinculoClube", back_populates="jogador", cascade="all, delete-orphan")
     avaliacoes = relationship("Avaliacao", back_populates="jogador", cascade="all, delete-orphan")
@@ -0,0 +1,30 @@
+"""
+Modelo ScrapingJob - Estado persistente das tarefas de scraping
+"""
+from sqlalchemy import Column, Integer, String, Boolean, JSON, DateTime, func
+
+from ..core.database import Base
+
+
+class ScrapingJob(Base):
+    """Tabela de jobs de scraping (status compartilhado entre workers)"""
+    __tablename__ = "scraping_jobs"
+
+    id = Column(String(36), primary_key=True)  # UUID
+    tipo = Column(String(50), nullable=False)  # 'fotos', 'dados'
+    status = Column(String(20), nullable=False, default="pending", index=True)
+    # 'pending', 'running', 'completed', 'failed', 'cancelled'
+    progress = Column(Integer, nullable=False, default=0)  # 0-100
+    current_step = Column(String(255))
+    processed_items = Column(Integer, nullable=False, default=0)
+    total_items = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON, nullable=False, default=list)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    criado_por = Column(String(100))
+    worker = Column(String(100))  # host:pid do processo que enfileirou/executa o job
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    heartbeat_at = Column(DateTime(timezone=True))
+    completed_at = Column(DateTime(timezone=True))
+
+    def __repr__(self):
+        return f"<ScrapingJob(id='{self.id}', tipo='{self.tipo}', status='{self.status}')>"
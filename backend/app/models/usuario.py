@@ -1,7 +1,12 @@
 """
 Modelo Usuario - Sistema de autenticação
+
+`versao_token` vai no JWT (claim "ver") e é incrementada sempre que o
+usuário é desativado, muda de nível ou troca a senha: tokens emitidos com a
+versão anterior deixam de ser aceitos. PostgreSQL: trigger da migration 007
+(cobre escritas fora da API); ORM: listener before_update abaixo.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, event, func, inspect
 
 from ..core.database import Base
 
@@ -19,6 +24,19 @@ class Usuario(Base):
     ativo = Column(Boolean, default=True)
     data_criacao = Column(DateTime(timezone=True), server_default=func.now())
     ultimo_acesso = Column(DateTime(timezone=True))
+    versao_token = Column(Integer, nullable=False, default=0, server_default="0")
 
     def __repr__(self):
         return f"<Usuario(id={self.id}, username='{self.username}', nivel='{self.nivel}')>"
+
+
+# Alterações que revogam os tokens já emitidos
+CAMPOS_REVOGAM_TOKEN = ("ativo", "nivel", "senha_hash")
+
+
+@event.listens_for(Usuario, "before_update")
+def _incrementar_versao_token(mapper, connection, usuario):
+    """Mesma regra do trigger do PostgreSQL: versão anterior + 1 (no próprio UPDATE)"""
+    estado = inspect(usuario)
+    if any(estado.attrs[campo].history.has_changes() for campo in CAMPOS_REVOGAM_TOKEN):
+        usuario.versao_token = Usuario.versao_token + 1
@@ -4,30 +4,43 @@ Schemas Pydantic - Validação de entrada/saída
 from .jogador import (
     JogadorBase,
     JogadorCreate,
+    JogadorLoteItem,
     JogadorUpdate,
     JogadorResponse,
     JogadorWithDetails,
+    JogadorListResponse,
+    JogadorSearchResult,
+    BuscaAvancadaFiltros,
 )
-from .vinculo import VinculoClubeBase, VinculoClubeCreate, VinculoClubeResponse
-from .avaliacao import AvaliacaoBase, AvaliacaoCreate, AvaliacaoResponse
+from .vinculo import VinculoClubeBase, VinculoClubeCreate, VinculoClubeLoteItem, VinculoClubeResponse
+from .avaliacao import AvaliacaoBase, AvaliacaoCreate, AvaliacaoLoteItem, AvaliacaoResponse
 from .tag import TagBase, TagCreate, TagResponse
 from .wishlist import WishlistBase, WishlistCreate, WishlistResponse
 from .alerta import AlertaBase, AlertaCreate, AlertaResponse
 from .nota_rapida import NotaRapidaBase, NotaRapidaCreate, NotaRapidaResponse
 from .proposta import PropostaBase, PropostaCreate, PropostaResponse
+from .busca_salva import BuscaSalvaCreate, BuscaSalvaResponse
+from .mercado import OportunidadeMercado
+from .lote import MAX_ITENS_LOTE, ResultadoItemLote, ResultadoLote
 from .usuario import UsuarioBase, UsuarioCreate, UsuarioResponse, Token
 
 __all__ = [
     "JogadorBase",
     "JogadorCreate",
+    "JogadorLoteItem",
     "JogadorUpdate",
     "JogadorResponse",
     "JogadorWithDetails",
+    "JogadorListResponse",
+    "JogadorSearchResult",
+    "BuscaAvancadaFiltros",
     "VinculoClubeBase",
     "VinculoClubeCreate",
+    "VinculoClubeLoteItem",
     "VinculoClubeResponse",
     "AvaliacaoBase",
     "AvaliacaoCreate",
+    "AvaliacaoLoteItem",
     "AvaliacaoResponse",
     "TagBase",
     "TagCreate",
@@ -44,6 +57,12 @@ __all__ = [
     "PropostaBase",
     "PropostaCreate",
     "PropostaResponse",
+    "BuscaSalvaCreate",
+    "BuscaSalvaResponse",
+    "OportunidadeMercado",
+    "MAX_ITENS_LOTE",
+    "ResultadoItemLote",
+    "ResultadoLote",
     "UsuarioBase",
     "UsuarioCreate",
     "UsuarioResponse",
@@ -32,6 +32,11 @@ class AvaliacaoCreate(AvaliacaoBase):
     id_jogador: int = Field(..., gt=0)
 
 
+class AvaliacaoLoteItem(AvaliacaoCreate):
+    """Item de /avaliacoes/bulk: com id atualiza a avaliação; sem ele, insere"""
+    id: Optional[int] = Field(None, gt=0)
+
+
 class AvaliacaoResponse(AvaliacaoBase):
     """Schema de resposta para Avaliacao"""
     id: int
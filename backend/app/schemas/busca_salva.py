@@ -0,0 +1,33 @@
+"""
+Schemas Pydantic para Busca Salva
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+from .jogador import BuscaAvancadaFiltros
+
+
+class BuscaSalvaCreate(BaseModel):
+    """Schema para criação de Busca Salva"""
+    nome_busca: str = Field(..., min_length=1, max_length=100)
+    filtros: BuscaAvancadaFiltros
+
+
+class BuscaSalvaResponse(BaseModel):
+    """Schema de resposta para Busca Salva (filtros como gravados)"""
+    id_busca: int
+    nome_busca: str
+    filtros: Dict[str, Any]
+    criado_por: Optional[str] = None
+    criado_em: Optional[datetime] = None
+    total_execucoes: int = 0
+    ultima_execucao: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("filtros", mode="before")
+    @classmethod
+    def _json(cls, valor):
+        return json.loads(valor) if isinstance(valor, str) else valor
@@ -1,8 +1,8 @@
 """
 Schemas Pydantic para Jogador
 """
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -22,6 +22,14 @@ class JogadorCreate(JogadorBase):
     pass
 
 
+class JogadorLoteItem(JogadorCreate):
+    """
+    Item de /jogadores/bulk: com id_jogador atualiza o jogador; sem ele,
+    insere ou atualiza pelo transfermarkt_id (insere se também não houver)
+    """
+    id_jogador: Optional[int] = Field(None, gt=0)
+
+
 class JogadorUpdate(BaseModel):
     """Schema para atualização de Jogador (todos os campos opcionais)"""
     nome: Optional[str] = Field(None, min_length=1, max_length=255)
@@ -48,9 +56,54 @@ class JogadorWithDetails(JogadorResponse):
     liga_clube: Optional[str] = None
     posicao: Optional[str] = None
     status_contrato: Optional[str] = None
-    data_fim_contrato: Optional[str] = None
+    data_fim_contrato: Optional[date] = None
     em_wishlist: bool = False
     nota_potencial_media: Optional[float] = None
+    media_geral: Optional[float] = None
     total_avaliacoes: int = 0
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class JogadorListResponse(BaseModel):
+    """Página da listagem de jogadores"""
+    data: List[JogadorWithDetails]
+    total: Optional[int] = Field(
+        None,
+        description="Total de jogadores que atendem aos filtros (não calculado no modo cursor)"
+    )
+    limit: int
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor da próxima página (None quando não há mais resultados)"
+    )
+
+
+class BuscaAvancadaFiltros(BaseModel):
+    """Filtros da busca avançada (listas comparadas por igualdade exata)"""
+    posicoes: List[str] = Field(default_factory=list)
+    clubes: List[str] = Field(default_factory=list)
+    nacionalidades: List[str] = Field(default_factory=list)
+    idade_min: Optional[int] = Field(None, ge=14, le=50)
+    idade_max: Optional[int] = Field(None, ge=14, le=50)
+    media_min: Optional[float] = Field(None, ge=0, le=5, description="Média mínima dos 4 pilares na última avaliação")
+    contrato_vencendo: bool = Field(False, description="Apenas contratos que vencem nos próximos 12 meses")
+    tags: List[int] = Field(default_factory=list, description="IDs das tags")
+    tags_modo: Literal["qualquer", "todas"] = Field(
+        "qualquer",
+        description="'qualquer': ao menos uma das tags; 'todas': todas as tags"
+    )
+
+
+class JogadorSearchResult(BaseModel):
+    """Resultado da busca textual de jogadores"""
+    id_jogador: int
+    nome: str
+    nacionalidade: Optional[str] = None
+    idade_atual: Optional[int] = None
+    transfermarkt_id: Optional[str] = None
+    clube: Optional[str] = None
+    posicao: Optional[str] = None
+    score: float = Field(..., description="Relevância (maior = mais relevante)")
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,24 @@
+"""
+Schemas Pydantic para gravação em lote (endpoints /bulk)
+"""
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+
+# Itens aceitos por requisição em um endpoint /bulk
+MAX_ITENS_LOTE = 1000
+
+
+class ResultadoItemLote(BaseModel):
+    """Status de um item do lote (na mesma posição do item enviado)"""
+    indice: int
+    status: Literal["criado", "atualizado", "erro"]
+    id: Optional[int] = None
+    erro: Optional[str] = None
+
+
+class ResultadoLote(BaseModel):
+    """Resumo e status por item de uma gravação em lote"""
+    criados: int
+    atualizados: int
+    erros: int
+    itens: List[ResultadoItemLote]
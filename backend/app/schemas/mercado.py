@@ -0,0 +1,17 @@
+"""
+Schemas Pydantic para Mercado
+"""
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class OportunidadeMercado(BaseModel):
+    """Jogador que atende a uma regra de oportunidade"""
+    tipo: Literal["jovem", "contrato", "livre"]
+    id_jogador: int
+    nome: str
+    idade_atual: Optional[int] = None
+    posicao: Optional[str] = None
+    clube: Optional[str] = None
+    media: float = Field(..., description="Média dos 4 pilares na última avaliação (0 se não avaliado)")
+    dias_restantes: Optional[int] = Field(None, description="Dias até o fim do contrato")
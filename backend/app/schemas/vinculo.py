@@ -20,6 +20,11 @@ class VinculoClubeCreate(VinculoClubeBase):
     id_jogador: int = Field(..., gt=0)
 
 
+class VinculoClubeLoteItem(VinculoClubeCreate):
+    """Item de /vinculos/bulk: com id_vinculo atualiza o vínculo; sem ele, insere"""
+    id_vinculo: Optional[int] = Field(None, gt=0)
+
+
 class VinculoClubeResponse(VinculoClubeBase):
     """Schema de resposta para VinculoClube"""
     id_vinculo: int
@@ -0,0 +1,184 @@
+"""
+Motor de buscas salvas
+
+- Os filtros (JSON salvo pelo Streamlit ou pela API) são normalizados em
+  BuscaAvancadaFiltros e reduzidos à mesma forma canônica do Streamlit:
+  valores padrão descartados, listas sem repetição e ordenadas, chaves
+  ordenadas. Filtros equivalentes, salvos em qualquer das duas pontas,
+  compartilham o mesmo resultado.
+- O resultado (lista de (nome, id_jogador)) fica em `buscas_resultados`
+  com as versões das tabelas usadas (mesmo esquema de `dashboard_resumo`,
+  ver services/dashboard.py). Escritas em qualquer uma dessas tabelas,
+  inclusive fora da API, invalidam o resultado.
+- As páginas usam keyset sobre a lista em cache: o cursor é o último
+  (nome, id_jogador) e continua válido mesmo que o resultado seja
+  recalculado entre uma página e outra.
+- `pre_aquecer` recalcula as buscas mais usadas; o lifespan da API chama a
+  cada BUSCAS_PREAQUECER_INTERVALO segundos.
+"""
+import asyncio
+import hashlib
+import json
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..crud import jogador as crud_jogador
+from ..models.busca_salva import BuscaSalva, ResultadoBusca
+from ..models.dashboard import VersaoTabela
+from ..schemas.jogador import BuscaAvancadaFiltros
+
+# Tabelas cujas escritas mudam o resultado de uma busca avançada
+TABELAS_BUSCA = ("jogadores", "vinculos_clubes", "avaliacoes", "jogador_tags")
+
+
+def carregar_filtros(texto: str) -> BuscaAvancadaFiltros:
+    """
+    Converte o JSON salvo em filtros validados.
+
+    O Streamlit grava listas vazias como null; esses campos são descartados.
+
+    Raises:
+        ValueError: JSON inválido ou filtros fora do esquema
+    """
+    dados = json.loads(texto)
+    if not isinstance(dados, dict):
+        raise ValueError("Filtros devem ser um objeto JSON")
+    return BuscaAvancadaFiltros.model_validate(
+        {campo: valor for campo, valor in dados.items() if valor is not None}
+    )
+
+
+def filtros_canonicos(filtros: BuscaAvancadaFiltros) -> str:
+    """
+    JSON canônico dos filtros, idêntico ao do Streamlit
+    (src/database/busca_avancada.py): campos vazios ou no valor padrão
+    descartados, listas ordenadas e sem repetição, chaves ordenadas. As duas
+    pontas gravam em buscas_salvas.filtros e compartilham buscas_resultados.
+    """
+    dados = {}
+    for campo, valor in filtros.model_dump().items():
+        if valor is None or valor == [] or valor is False:
+            continue
+        dados[campo] = sorted(set(valor)) if isinstance(valor, list) else valor
+    if "tags" not in dados or dados.get("tags_modo") == "qualquer":
+        dados.pop("tags_modo", None)  # sem tags o modo não muda o resultado; 'qualquer' é o padrão
+    return json.dumps(dados, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def chave_filtros(filtros: BuscaAvancadaFiltros) -> str:
+    """Chave do resultado em cache (sha256 dos filtros canônicos)"""
+    return hashlib.sha256(filtros_canonicos(filtros).encode("utf-8")).hexdigest()
+
+
+def _versoes(db: Session) -> dict:
+    atuais = {v.tabela: v.versao for v in db.query(VersaoTabela).filter(VersaoTabela.tabela.in_(TABELAS_BUSCA))}
+    return {tabela: atuais.get(tabela, 0) for tabela in TABELAS_BUSCA}
+
+
+def obter_resultado(db: Session, filtros: BuscaAvancadaFiltros) -> List[Tuple[str, int]]:
+    """
+    Lista completa (nome, id_jogador) da busca, recalculada só quando alguma
+    tabela de TABELAS_BUSCA mudou (ou ao virar o dia, no filtro de contrato).
+    """
+    chave = chave_filtros(filtros)
+    versoes = _versoes(db)
+    agora = datetime.now(timezone.utc)
+
+    resultado = db.get(ResultadoBusca, chave)
+    atualizado = (
+        resultado is not None
+        and resultado.versoes == versoes
+        and not (filtros.contrato_vencendo and resultado.calculado_em.date() != agora.date())
+    )
+    if atualizado:
+        return [tuple(item) for item in resultado.jogadores]
+
+    # Ordem do Python (não a collation do banco): o bisect do cursor depende dela
+    jogadores = sorted(crud_jogador.ids_busca_avancada(db, filtros))
+    try:
+        db.merge(ResultadoBusca(
+            chave=chave, jogadores=[list(item) for item in jogadores],
+            versoes=versoes, calculado_em=agora,
+        ))
+        db.commit()
+    except IntegrityError:
+        # Outro worker gravou o mesmo resultado ao mesmo tempo; o valor calculado segue válido
+        db.rollback()
+    return jogadores
+
+
+def registrar_execucao(db: Session, busca: BuscaSalva) -> None:
+    """Contabiliza a execução (define quais buscas são pré-aquecidas)"""
+    busca.total_execucoes = (busca.total_execucoes or 0) + 1
+    busca.ultima_execucao = datetime.now(timezone.utc)
+    db.commit()
+
+
+def paginar_resultado(
+    jogadores: List[Tuple[str, int]],
+    limit: int,
+    after: Optional[Tuple[str, int]] = None,
+) -> Tuple[List[Tuple[str, int]], bool]:
+    """
+    Página seguinte ao cursor (nome, id_jogador).
+
+    Returns:
+        (itens da página, se há itens depois dela)
+    """
+    inicio = bisect_right(jogadores, tuple(after)) if after is not None else 0
+    return jogadores[inicio:inicio + limit], inicio + limit < len(jogadores)
+
+
+def pre_aquecer(db: Session, limite: Optional[int] = None) -> int:
+    """
+    Recalcula (se desatualizados) os resultados das buscas mais executadas.
+
+    Returns:
+        Quantidade de conjuntos de filtros distintos verificados
+    """
+    limite = limite or settings.BUSCAS_PREAQUECER_TOP
+    buscas = (
+        db.query(BuscaSalva)
+        .filter(BuscaSalva.total_execucoes > 0)
+        .order_by(BuscaSalva.total_execucoes.desc(), BuscaSalva.id_busca)
+        .limit(limite)
+        .all()
+    )
+
+    vistas = set()
+    for busca in buscas:
+        try:
+            filtros = carregar_filtros(busca.filtros)
+        except ValueError:
+            continue
+        chave = chave_filtros(filtros)
+        if chave in vistas:
+            continue
+        vistas.add(chave)
+        obter_resultado(db, filtros)
+    return len(vistas)
+
+
+def _pre_aquecer_em_sessao() -> None:
+    db = SessionLocal()
+    try:
+        pre_aquecer(db)
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️  Falha ao pré-aquecer buscas salvas: {e}")
+    finally:
+        db.close()
+
+
+async def pre_aquecer_periodicamente(intervalo: int) -> None:
+    """Loop do lifespan: pré-aquece as buscas mais usadas a cada `intervalo` segundos"""
+    while True:
+        await asyncio.sleep(intervalo)
+        await run_in_threadpool(_pre_aquecer_em_sessao)
@@ -0,0 +1,281 @@
+"""
+Agregados do dashboard executivo
+
+Cada seção é calculada a partir das tabelas de origem e gravada em
+`dashboard_resumo` com as versões dessas tabelas (ver models/dashboard.py).
+A leitura do dashboard compara essas versões com `versoes_tabelas` e só
+recalcula as seções afetadas por escritas desde o último cálculo.
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.avaliacao import Avaliacao
+from ..models.dashboard import ResumoDashboard, VersaoTabela
+from ..models.jogador import Jogador
+from ..models.vinculo import VinculoClube
+from ..models.wishlist import Wishlist
+
+# Quantidade máxima guardada nas seções em lista (o endpoint aplica o limit)
+MAX_ITENS_LISTA = 50
+
+
+class Secao(NamedTuple):
+    """Definição de uma seção materializada"""
+    tabelas: Tuple[str, ...]  # tabelas cujas escritas invalidam a seção
+    diaria: bool  # depende da data atual (recalcula ao virar o dia)
+    calcular: Callable[[Session], Any]
+
+
+def _float(valor) -> Any:
+    """Converte Decimal/None vindos do banco para float arredondado"""
+    if valor is None:
+        return None
+    return round(float(valor), 2)
+
+
+def _iso(valor) -> Any:
+    return valor.isoformat() if isinstance(valor, (date, datetime)) else valor
+
+
+def _media_pilares():
+    return (
+        Avaliacao.nota_tatico + Avaliacao.nota_tecnico
+        + Avaliacao.nota_fisico + Avaliacao.nota_mental
+    ) / 4
+
+
+def _calcular_jogadores(db: Session) -> Dict[str, Any]:
+    """Total de jogadores e crescimento nos últimos 7 dias"""
+    uma_semana = datetime.now(timezone.utc) - timedelta(days=7)
+    total, novos = db.query(
+        func.count(Jogador.id_jogador),
+        func.count(Jogador.id_jogador).filter(Jogador.data_criacao >= uma_semana),
+    ).one()
+
+    anteriores = total - novos
+    crescimento = round(novos / anteriores * 100, 1) if anteriores else 0.0
+    return {"total_jogadores": total, "novos_semana": novos, "crescimento_semanal": crescimento}
+
+
+def _calcular_avaliacoes(db: Session) -> Dict[str, Any]:
+    """Média geral (4 pilares) e médias por dimensão"""
+    row = db.query(
+        func.count(Avaliacao.id),
+        func.avg(_media_pilares()),
+        func.avg(Avaliacao.nota_potencial),
+        func.avg(Avaliacao.nota_tatico),
+        func.avg(Avaliacao.nota_tecnico),
+        func.avg(Avaliacao.nota_fisico),
+        func.avg(Avaliacao.nota_mental),
+    ).one()
+
+    return {
+        "total_avaliacoes": row[0],
+        "media_geral": _float(row[1]),
+        "medias_dimensao": {
+            "potencial": _float(row[2]),
+            "tatico": _float(row[3]),
+            "tecnico": _float(row[4]),
+            "fisico": _float(row[5]),
+            "mental": _float(row[6]),
+        },
+    }
+
+
+def _calcular_contratos(db: Session) -> Dict[str, Any]:
+    """Contratos terminando nos próximos DASHBOARD_ALERTA_CONTRATO_DIAS"""
+    hoje = date.today()
+    limite = hoje + timedelta(days=settings.DASHBOARD_ALERTA_CONTRATO_DIAS)
+    total = (
+        db.query(func.count(VinculoClube.id_vinculo))
+        .filter(VinculoClube.data_fim_contrato.between(hoje, limite))
+        .scalar()
+    )
+    return {"alertas_contrato": total}
+
+
+def _calcular_wishlist(db: Session) -> Dict[str, Any]:
+    return {"wishlist_ativa": db.query(func.count(Wishlist.id)).scalar()}
+
+
+def _calcular_posicoes(db: Session) -> List[Dict[str, Any]]:
+    """Distribuição de jogadores por posição (maior primeiro)"""
+    rows = (
+        db.query(VinculoClube.posicao, func.count(func.distinct(VinculoClube.id_jogador)))
+        .group_by(VinculoClube.posicao)
+        .order_by(func.count(func.distinct(VinculoClube.id_jogador)).desc(), VinculoClube.posicao)
+        .all()
+    )
+    return [{"posicao": posicao, "count": count} for posicao, count in rows]
+
+
+def _calcular_top_prospects(db: Session) -> List[Dict[str, Any]]:
+    """Jogadores abaixo de DASHBOARD_IDADE_PROSPECT anos com maior média geral"""
+    medias = (
+        db.query(Avaliacao.id_jogador, func.avg(_media_pilares()).label("media_geral"))
+        .group_by(Avaliacao.id_jogador)
+        .subquery()
+    )
+    primeiro_vinculo = (
+        db.query(VinculoClube.id_jogador, func.min(VinculoClube.id_vinculo).label("id_vinculo"))
+        .group_by(VinculoClube.id_jogador)
+        .subquery()
+    )
+    rows = (
+        db.query(Jogador, VinculoClube.posicao, VinculoClube.clube, medias.c.media_geral)
+        .join(medias, medias.c.id_jogador == Jogador.id_jogador)
+        .outerjoin(primeiro_vinculo, primeiro_vinculo.c.id_jogador == Jogador.id_jogador)
+        .outerjoin(VinculoClube, VinculoClube.id_vinculo == primeiro_vinculo.c.id_vinculo)
+        .filter(
+            Jogador.idade_atual < settings.DASHBOARD_IDADE_PROSPECT,
+            medias.c.media_geral.isnot(None),
+        )
+        .order_by(medias.c.media_geral.desc(), Jogador.nome)
+        .limit(MAX_ITENS_LISTA)
+        .all()
+    )
+    return [
+        {
+            "id_jogador": jogador.id_jogador,
+            "nome": jogador.nome,
+            "idade_atual": jogador.idade_atual,
+            "posicao": posicao,
+            "clube": clube,
+            "media_geral": _float(media),
+            "transfermarkt_id": jogador.transfermarkt_id,
+        }
+        for jogador, posicao, clube, media in rows
+    ]
+
+
+def _calcular_atividade(db: Session) -> List[Dict[str, Any]]:
+    """Eventos recentes: avaliações, jogadores novos e entradas na wishlist"""
+    eventos = []
+
+    avaliacoes = (
+        db.query(Avaliacao, Jogador.nome)
+        .join(Jogador, Jogador.id_jogador == Avaliacao.id_jogador)
+        .order_by(Avaliacao.data_criacao.desc(), Avaliacao.id.desc())
+        .limit(MAX_ITENS_LISTA)
+        .all()
+    )
+    for avaliacao, nome in avaliacoes:
+        nota = None
+        if None not in (avaliacao.nota_tatico, avaliacao.nota_tecnico,
+                        avaliacao.nota_fisico, avaliacao.nota_mental):
+            nota = _float((avaliacao.nota_tatico + avaliacao.nota_tecnico
+                           + avaliacao.nota_fisico + avaliacao.nota_mental) / 4)
+        eventos.append({
+            "tipo": "avaliacao",
+            "descricao": f"Nova avaliação para {nome}",
+            "usuario": avaliacao.avaliador or "Sistema",
+            "created_at": avaliacao.data_criacao,
+            "metadata": {"jogador_id": avaliacao.id_jogador, "nota_geral": nota},
+        })
+
+    for jogador in (
+        db.query(Jogador)
+        .order_by(Jogador.data_criacao.desc(), Jogador.id_jogador.desc())
+        .limit(MAX_ITENS_LISTA)
+    ):
+        eventos.append({
+            "tipo": "jogador_novo",
+            "descricao": f"Jogador adicionado: {jogador.nome}",
+            "usuario": "Sistema",
+            "created_at": jogador.data_criacao,
+            "metadata": {"jogador_id": jogador.id_jogador},
+        })
+
+    itens_wishlist = (
+        db.query(Wishlist, Jogador.nome)
+        .join(Jogador, Jogador.id_jogador == Wishlist.id_jogador)
+        .order_by(Wishlist.adicionado_em.desc(), Wishlist.id.desc())
+        .limit(MAX_ITENS_LISTA)
+        .all()
+    )
+    for item, nome in itens_wishlist:
+        prioridade = (item.prioridade or "media").capitalize()
+        eventos.append({
+            "tipo": "wishlist_add",
+            "descricao": f"{nome} adicionado à wishlist ({prioridade} prioridade)",
+            "usuario": item.adicionado_por or "Sistema",
+            "created_at": item.adicionado_em,
+            "metadata": {"jogador_id": item.id_jogador, "prioridade": prioridade},
+        })
+
+    eventos.sort(key=lambda e: _iso(e["created_at"]) or "", reverse=True)
+    eventos = eventos[:MAX_ITENS_LISTA]
+    for i, evento in enumerate(eventos, start=1):
+        evento["id"] = i
+        evento["created_at"] = _iso(evento["created_at"])
+    return eventos
+
+
+SECOES: Dict[str, Secao] = {
+    "jogadores": Secao(("jogadores",), True, _calcular_jogadores),
+    "avaliacoes": Secao(("avaliacoes",), False, _calcular_avaliacoes),
+    "contratos": Secao(("vinculos_clubes",), True, _calcular_contratos),
+    "wishlist": Secao(("wishlist",), False, _calcular_wishlist),
+    "posicoes": Secao(("vinculos_clubes",), False, _calcular_posicoes),
+    "top_prospects": Secao(("jogadores", "vinculos_clubes", "avaliacoes"), False, _calcular_top_prospects),
+    "atividade": Secao(("jogadores", "avaliacoes", "wishlist"), False, _calcular_atividade),
+}
+
+
+def tabelas_secoes(nomes: Iterable[str]) -> Tuple[str, ...]:
+    """Tabelas usadas pelas seções (base do ETag das rotas de stats)"""
+    return tuple(dict.fromkeys(tabela for nome in nomes for tabela in SECOES[nome].tabelas))
+
+
+def obter_secoes(db: Session, nomes: Iterable[str]) -> Dict[str, Any]:
+    """
+    Retorna as seções pedidas, recalculando apenas as desatualizadas.
+
+    Em regime normal custa duas consultas a tabelas minúsculas
+    (versoes_tabelas e dashboard_resumo), independente do volume de dados.
+    """
+    nomes = list(nomes)
+    versoes_atuais = {v.tabela: v.versao for v in db.query(VersaoTabela)}
+    resumos = {
+        r.secao: r
+        for r in db.query(ResumoDashboard).filter(ResumoDashboard.secao.in_(nomes))
+    }
+
+    agora = datetime.now(timezone.utc)
+    resultado: Dict[str, Any] = {}
+    recalculadas = []
+
+    for nome in nomes:
+        secao = SECOES[nome]
+        versoes = {tabela: versoes_atuais.get(tabela, 0) for tabela in secao.tabelas}
+        resumo = resumos.get(nome)
+
+        atualizado = (
+            resumo is not None
+            and resumo.versoes == versoes
+            and not (secao.diaria and resumo.calculado_em.date() != agora.date())
+        )
+        if atualizado:
+            resultado[nome] = resumo.dados
+            continue
+
+        resultado[nome] = secao.calcular(db)
+        recalculadas.append(
+            ResumoDashboard(secao=nome, dados=resultado[nome], versoes=versoes, calculado_em=agora)
+        )
+
+    if recalculadas:
+        try:
+            for resumo in recalculadas:
+                db.merge(resumo)
+            db.commit()
+        except IntegrityError:
+            # Outro worker gravou a mesma seção ao mesmo tempo; o valor calculado segue válido
+            db.rollback()
+
+    return resultado
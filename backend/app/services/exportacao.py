@@ -0,0 +1,160 @@
+"""
+Exportação em streaming (CSV, NDJSON e Parquet)
+
+As linhas vêm do banco em lotes de TAMANHO_LOTE por um cursor do lado do
+servidor (yield_per → stream_results; server-side cursor no psycopg2) e
+cada lote é codificado e enviado antes de o próximo ser lido: a memória
+usada não depende do tamanho da tabela. No Parquet cada lote vira um row
+group, e o rodapé é escrito ao final.
+
+O gerador roda no threadpool do Starlette (StreamingResponse com iterador
+síncrono) e fecha a sessão ao terminar, já que as dependências com yield
+são finalizadas antes do envio do corpo.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, List, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric
+from sqlalchemy.orm import Query, Session
+
+# Linhas por lote (e por row group no Parquet)
+TAMANHO_LOTE = 5000
+
+FORMATOS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _lotes(db: Session, query: Query) -> Iterator[Sequence[Any]]:
+    """Lotes de linhas via cursor do servidor; fecha a sessão no fim"""
+    try:
+        resultado = db.execute(query.statement.execution_options(yield_per=TAMANHO_LOTE))
+        yield from resultado.partitions()
+    finally:
+        db.close()
+
+
+def _csv(colunas: List[str], lotes: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+    escritor.writerow(colunas)
+    for lote in lotes:
+        escritor.writerows(lote)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")  # só o cabeçalho (nenhuma linha)
+
+
+def _valor_json(valor: Any) -> Any:
+    if isinstance(valor, (date, datetime)):
+        return valor.isoformat()
+    if isinstance(valor, Decimal):
+        return float(valor)
+    raise TypeError(f"Tipo não serializável: {type(valor).__name__}")
+
+
+def _ndjson(colunas: List[str], lotes: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    for lote in lotes:
+        yield "".join(
+            json.dumps(dict(zip(colunas, linha)), default=_valor_json, ensure_ascii=False) + "\n"
+            for linha in lote
+        ).encode("utf-8")
+
+
+class _Destino:
+    """Arquivo (somente escrita) do ParquetWriter que entrega os bytes a cada row group"""
+
+    closed = False
+
+    def __init__(self):
+        self._partes: List[bytes] = []
+        self._posicao = 0
+
+    def write(self, dados) -> int:
+        self._partes.append(bytes(dados))
+        self._posicao += len(dados)
+        return len(dados)
+
+    def tell(self) -> int:
+        return self._posicao
+
+    def flush(self) -> None:
+        pass
+
+    def drenar(self) -> bytes:
+        dados = b"".join(self._partes)
+        self._partes.clear()
+        return dados
+
+
+def _tipo_arrow(pa, tipo_sql):
+    if isinstance(tipo_sql, Boolean):
+        return pa.bool_()
+    if isinstance(tipo_sql, Integer):
+        return pa.int64()
+    if isinstance(tipo_sql, (Numeric, Float)):
+        return pa.float64()
+    if isinstance(tipo_sql, DateTime):
+        return pa.timestamp("us", tz="UTC") if tipo_sql.timezone else pa.timestamp("us")
+    if isinstance(tipo_sql, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def _parquet(colunas: List[str], tipos_sql: List[Any], lotes: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([pa.field(nome, _tipo_arrow(pa, tipo)) for nome, tipo in zip(colunas, tipos_sql)])
+    conversores = [
+        (lambda v: None if v is None else float(v)) if pa.types.is_floating(campo.type)
+        else (lambda v: None if v is None else str(v)) if pa.types.is_string(campo.type)
+        else (lambda v: v)
+        for campo in schema
+    ]
+
+    destino = _Destino()
+    with pq.ParquetWriter(destino, schema) as escritor:
+        for lote in lotes:
+            dados = [
+                pa.array([converter(linha[i]) for linha in lote], type=campo.type)
+                for i, (campo, converter) in enumerate(zip(schema, conversores))
+            ]
+            escritor.write_table(pa.Table.from_arrays(dados, schema=schema), row_group_size=len(lote))
+            yield destino.drenar()
+    yield destino.drenar()  # rodapé
+
+
+def resposta_exportacao(db: Session, query: Query, formato: str, nome: str) -> StreamingResponse:
+    """
+    StreamingResponse com as linhas de `query` no formato pedido.
+
+    Raises:
+        ImportError: formato parquet sem pyarrow instalado
+    """
+    colunas = [coluna["name"] for coluna in query.column_descriptions]
+    lotes = _lotes(db, query)
+
+    if formato == "parquet":
+        import pyarrow.parquet  # noqa: F401  (falha antes de iniciar a resposta)
+        tipos = [coluna["type"] for coluna in query.column_descriptions]
+        corpo = _parquet(colunas, tipos, lotes)
+    elif formato == "ndjson":
+        corpo = _ndjson(colunas, lotes)
+    else:
+        corpo = _csv(colunas, lotes)
+
+    return StreamingResponse(
+        corpo,
+        media_type=FORMATOS[formato],
+        headers={"Content-Disposition": f'attachment; filename="{nome}_{date.today():%Y%m%d}.{formato}"'},
+    )
@@ -0,0 +1,342 @@
+"""
+Motor de jobs em background (scraping)
+
+- Pool de threads limitado (SCRAPING_MAX_WORKERS) por processo, fora do
+  event loop do FastAPI.
+- Estado persistido na tabela `scraping_jobs`: qualquer worker do uvicorn
+  consulta o status ou pede cancelamento de qualquer job.
+- Cancelamento cooperativo: o handler chama `ctx.checkpoint(...)` a cada
+  item; o checkpoint grava o progresso (no máximo a cada
+  SCRAPING_PROGRESS_INTERVAL segundos) e interrompe o job se o
+  cancelamento foi pedido.
+- Cada job usa a sua própria sessão de banco (nunca a da requisição).
+- Jobs órfãos (processo morto ou reiniciado): no startup e a cada consulta
+  de status, jobs pendentes de um processo que não existe mais voltam para
+  a fila deste processo e jobs em execução viram 'failed'. A existência do
+  processo (host:pid) só é verificável no mesmo host; para outros hosts
+  (ex.: cada deploy no Railway tem um hostname novo) vale o heartbeat, ou a
+  criação do job enquanto não há heartbeat (SCRAPING_STALE_AFTER).
+- Um job só executa depois de reivindicado por um UPDATE condicional
+  (status 'pending' e sem cancelamento): se dois processos o reenfileirarem,
+  só um executa.
+
+Uso:
+    @registrar_job("fotos")
+    def scrape_fotos(ctx: JobContext):
+        for i, item in enumerate(itens, 1):
+            ...
+            ctx.checkpoint(i, len(itens), f"Baixando foto {i}/{len(itens)}...")
+"""
+import os
+import socket
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.scraping_job import ScrapingJob
+
+# Status finais (job não volta a executar)
+STATUS_FINAIS = ("completed", "failed", "cancelled")
+
+# Limite de mensagens de erro guardadas por job
+MAX_ERROS = 100
+
+_handlers: Dict[str, Callable[["JobContext"], None]] = {}
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+_worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobCancelado(Exception):
+    """Levantada no checkpoint quando o cancelamento foi solicitado"""
+
+
+def registrar_job(tipo: str):
+    """Decorator que registra a função executora de um tipo de job"""
+    def decorator(func: Callable[["JobContext"], None]):
+        _handlers[tipo] = func
+        return func
+    return decorator
+
+
+def _agora() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.SCRAPING_MAX_WORKERS,
+                thread_name_prefix="scraping-job",
+            )
+        return _executor
+
+
+def shutdown(wait: bool = False) -> None:
+    """Encerra o pool (chamado no shutdown da aplicação)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait, cancel_futures=True)
+            _executor = None
+
+
+class JobContext:
+    """Contexto entregue ao handler: sessão própria, progresso e cancelamento"""
+
+    def __init__(self, db: Session, job: ScrapingJob):
+        self.db = db
+        self.job = job
+        self.errors: List[str] = list(job.errors or [])
+        self._ultimo_flush = 0.0
+
+    def erro(self, mensagem: str) -> None:
+        """Registra um erro não fatal (ex: foto não encontrada para um jogador)"""
+        if len(self.errors) < MAX_ERROS:
+            self.errors.append(mensagem)
+
+    def checkpoint(self, processed: int, total: int, current_step: Optional[str] = None) -> None:
+        """
+        Atualiza o progresso e verifica cancelamento.
+
+        Grava no banco no máximo a cada SCRAPING_PROGRESS_INTERVAL segundos
+        (e sempre no último item), para não gerar um UPDATE por item.
+
+        Raises:
+            JobCancelado: se o cancelamento foi solicitado
+        """
+        agora = time.monotonic()
+        if processed < total and agora - self._ultimo_flush < settings.SCRAPING_PROGRESS_INTERVAL:
+            return
+        self._ultimo_flush = agora
+
+        self.job.processed_items = processed
+        self.job.total_items = total
+        self.job.progress = int(processed / total * 100) if total else 0
+        self.job.current_step = current_step
+        self.job.errors = list(self.errors)
+        self.job.heartbeat_at = _agora()
+        self.db.commit()
+
+        # commit() expira o objeto: o refresh traz cancel_requested gravado por outro worker
+        self.db.refresh(self.job)
+        if self.job.cancel_requested:
+            raise JobCancelado()
+
+
+def _finalizar(db: Session, job: ScrapingJob, status: str, current_step: str, errors: List[str]) -> None:
+    job.status = status
+    job.current_step = current_step
+    job.errors = errors
+    job.completed_at = _agora()
+    job.heartbeat_at = job.completed_at
+    if status == "completed":
+        job.progress = 100
+    db.commit()
+
+
+def _executar(job_id: str) -> None:
+    """Executa um job no pool (sessão própria, fora da requisição)"""
+    db = SessionLocal()
+    try:
+        # Reivindicação atômica: outro processo (ou um cancelamento) pode ter
+        # mudado o job entre o enfileiramento e agora
+        reivindicado = (
+            db.query(ScrapingJob)
+            .filter(
+                ScrapingJob.id == job_id,
+                ScrapingJob.status == "pending",
+                ScrapingJob.cancel_requested.is_(False),
+            )
+            .update(
+                {"status": "running", "worker": _worker_id, "heartbeat_at": _agora()},
+                synchronize_session=False,
+            )
+        )
+        if not reivindicado:
+            # Pendente com cancelamento pedido termina como cancelado (sem executar)
+            db.query(ScrapingJob).filter(
+                ScrapingJob.id == job_id,
+                ScrapingJob.status == "pending",
+                ScrapingJob.cancel_requested.is_(True),
+            ).update(
+                {"status": "cancelled", "current_step": "Cancelado pelo usuário", "completed_at": _agora()},
+                synchronize_session=False,
+            )
+            db.commit()
+            return
+        db.commit()
+
+        job = db.get(ScrapingJob, job_id)
+        ctx = JobContext(db, job)
+        try:
+            _handlers[job.tipo](ctx)
+        except JobCancelado:
+            _finalizar(db, job, "cancelled", "Cancelado pelo usuário", ctx.errors)
+        except Exception as e:
+            db.rollback()
+            _finalizar(db, job, "failed", "Erro ao executar scraping", ctx.errors + [str(e)])
+        else:
+            _finalizar(db, job, "completed", "Scraping concluído!", ctx.errors)
+    finally:
+        db.close()
+
+
+def submit_job(db: Session, tipo: str, criado_por: Optional[str] = None) -> ScrapingJob:
+    """
+    Cria o job no banco e o enfileira no pool deste processo.
+
+    Raises:
+        ValueError: tipo de job não registrado
+    """
+    if tipo not in _handlers:
+        raise ValueError(f"Tipo de job desconhecido: {tipo}")
+
+    job = ScrapingJob(
+        id=str(uuid.uuid4()),
+        tipo=tipo,
+        status="pending",
+        progress=0,
+        current_step="Aguardando worker livre...",
+        errors=[],
+        criado_por=criado_por,
+        worker=_worker_id,  # fila (pool) deste processo
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    _get_executor().submit(_executar, job.id)
+    return job
+
+
+def solicitar_cancelamento(db: Session, job: ScrapingJob) -> ScrapingJob:
+    """
+    Pede o cancelamento de um job.
+    Jobs pendentes são cancelados na hora; jobs em execução param no próximo checkpoint.
+    """
+    if job.status in STATUS_FINAIS:
+        return job
+
+    job.cancel_requested = True
+    if job.status == "pending":
+        job.status = "cancelled"
+        job.current_step = "Cancelado pelo usuário"
+        job.completed_at = _agora()
+    else:
+        job.current_step = "Cancelamento solicitado..."
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def _worker_vivo(worker: Optional[str], reiniciado: bool) -> Optional[bool]:
+    """
+    Se o processo `worker` (host:pid) existe: True, False ou None (não dá
+    para saber: outro host).
+
+    O próprio host:pid conta como morto logo após o startup (`reiniciado`):
+    num container reiniciado o pid se repete, e o processo novo ainda não
+    recebeu nenhum job.
+    """
+    if not worker:
+        return False if reiniciado else None  # job antigo, sem worker gravado
+    if worker == _worker_id:
+        return not reiniciado
+    host, _, pid = worker.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return None
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:  # existe, mas é de outro usuário
+        return True
+    return True
+
+
+def _parado(job: ScrapingJob) -> bool:
+    """Sem sinal de vida há SCRAPING_STALE_AFTER (heartbeat ou, sem ele, criação)"""
+    ultimo = job.heartbeat_at or job.started_at
+    if ultimo is None:
+        return True
+    if ultimo.tzinfo is None:
+        ultimo = ultimo.replace(tzinfo=timezone.utc)  # SQLite não guarda o fuso
+    return ultimo < _agora() - timedelta(seconds=settings.SCRAPING_STALE_AFTER)
+
+
+def _recuperar(db: Session, job: ScrapingJob, reiniciado: bool = False) -> Optional[str]:
+    """
+    Trata um job órfão: pendente de processo morto (ou, em outro host, parado
+    há SCRAPING_STALE_AFTER) volta para a fila deste processo; em execução
+    nas mesmas condições vira 'failed'.
+
+    Returns:
+        'reenfileirado', 'failed' ou None (job não é órfão)
+    """
+    vivo = _worker_vivo(job.worker, reiniciado)
+    if vivo is True or (vivo is None and not _parado(job)):
+        return None
+
+    if job.status == "pending":
+        job.worker = _worker_id
+        job.heartbeat_at = _agora()  # não é reenfileirado de novo a cada consulta
+        job.current_step = "Reenfileirado (worker reiniciado)"
+        db.commit()
+        _get_executor().submit(_executar, job.id)
+        return "reenfileirado"
+
+    if job.status == "running":
+        _finalizar(db, job, "failed", "Interrompido (worker reiniciado)", list(job.errors or []))
+        return "failed"
+    return None
+
+
+def recuperar_jobs_orfaos(db: Session) -> Dict[str, int]:
+    """
+    Startup: trata todos os jobs pendentes ou em execução deixados por um
+    processo que não existe mais (inclusive o próprio, antes do restart).
+
+    Returns:
+        {'reenfileirado': n, 'failed': n}
+    """
+    contagem = {"reenfileirado": 0, "failed": 0}
+    ativos = db.query(ScrapingJob).filter(ScrapingJob.status.in_(("pending", "running"))).all()
+    for job in ativos:
+        resultado = _recuperar(db, job, reiniciado=True)
+        if resultado:
+            contagem[resultado] += 1
+    return contagem
+
+
+def verificar_orfao(db: Session, job: ScrapingJob) -> ScrapingJob:
+    """Consulta de status: trata o job se ele ficou órfão desde o startup"""
+    if job.status in ("pending", "running") and _recuperar(db, job):
+        db.refresh(job)
+    return job
+
+
+def job_to_dict(job: ScrapingJob) -> Dict:
+    """Formato de status consumido pelo frontend (ScrapingStatus)"""
+    return {
+        "task_id": job.id,
+        "tipo": job.tipo,
+        "status": job.status,
+        "progress": job.progress,
+        "current_step": job.current_step,
+        "processed_items": job.processed_items,
+        "total_items": job.total_items,
+        "errors": job.errors or [],
+        "cancel_requested": job.cancel_requested,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+    }
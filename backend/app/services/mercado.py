@@ -0,0 +1,155 @@
+"""
+Oportunidades de mercado
+
+Mesmas regras e limites padrão da aba "Análise de Mercado" do Streamlit
+(src/analysis/oportunidades.py), avaliadas no banco como expressões
+booleanas de coluna em uma única consulta:
+
+- jovem: idade abaixo de idade_max_jovem e média da última avaliação
+  >= media_min_jovem
+- contrato: contrato termina em 1..dias_contrato dias
+- livre: status_contrato 'livre' (sem diferenciar maiúsculas)
+
+O resultado é memoizado por conjunto de filtros e regras, junto com as
+versões das tabelas usadas (versoes_tabelas) e a data: qualquer escrita
+nessas tabelas, ou a virada do dia, gera um novo cálculo.
+"""
+from collections import OrderedDict
+from datetime import date, timedelta
+from threading import Lock
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import and_, desc, func, or_
+from sqlalchemy.orm import Session
+
+from ..models.avaliacao import Avaliacao
+from ..models.dashboard import VersaoTabela
+from ..models.jogador import Jogador
+from ..models.vinculo import VinculoClube
+from ..models.wishlist import Wishlist
+
+# Ordem de exibição dos tipos
+TIPOS = ("jovem", "contrato", "livre")
+
+# Tabelas cujas escritas mudam as oportunidades
+TABELAS_MERCADO = ("jogadores", "vinculos_clubes", "avaliacoes", "wishlist")
+
+# Conjuntos de filtros memoizados por processo
+MAX_MEMO = 64
+
+
+class FiltrosMercado(NamedTuple):
+    """Filtros da aba e limites das regras (hashable: chave da memoização)"""
+    posicao: Optional[str] = None
+    liga: Optional[str] = None
+    idade_max: Optional[int] = None
+    apenas_prioridade_alta: bool = False
+    idade_max_jovem: int = 23
+    media_min_jovem: float = 4.0
+    dias_contrato: int = 180
+
+
+_memo: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
+_memo_lock = Lock()
+
+
+def _calcular(db: Session, filtros: FiltrosMercado, hoje: date) -> List[Dict[str, Any]]:
+    ultima = (
+        db.query(
+            Avaliacao.id_jogador,
+            (
+                (Avaliacao.nota_tatico + Avaliacao.nota_tecnico
+                 + Avaliacao.nota_fisico + Avaliacao.nota_mental) / 4
+            ).label("media"),
+            func.row_number().over(
+                partition_by=Avaliacao.id_jogador,
+                order_by=(desc(Avaliacao.data_avaliacao), desc(Avaliacao.id)),
+            ).label("ordem"),
+        )
+        .subquery()
+    )
+    primeiro_vinculo = (
+        db.query(VinculoClube.id_jogador, func.min(VinculoClube.id_vinculo).label("id_vinculo"))
+        .group_by(VinculoClube.id_jogador)
+        .subquery()
+    )
+
+    media = func.coalesce(ultima.c.media, 0)
+    regras = {
+        "jovem": and_(
+            Jogador.idade_atual < filtros.idade_max_jovem,
+            media >= filtros.media_min_jovem,
+        ),
+        "contrato": and_(
+            VinculoClube.data_fim_contrato > hoje,
+            VinculoClube.data_fim_contrato <= hoje + timedelta(days=filtros.dias_contrato),
+        ),
+        "livre": func.lower(VinculoClube.status_contrato) == "livre",
+    }
+
+    query = (
+        db.query(
+            Jogador.id_jogador, Jogador.nome, Jogador.idade_atual,
+            VinculoClube.posicao, VinculoClube.clube, VinculoClube.data_fim_contrato,
+            media.label("media"),
+            *(regra.label(nome) for nome, regra in regras.items()),
+        )
+        .outerjoin(primeiro_vinculo, primeiro_vinculo.c.id_jogador == Jogador.id_jogador)
+        .outerjoin(VinculoClube, VinculoClube.id_vinculo == primeiro_vinculo.c.id_vinculo)
+        .outerjoin(ultima, and_(ultima.c.id_jogador == Jogador.id_jogador, ultima.c.ordem == 1))
+        .filter(or_(*regras.values()))
+    )
+
+    if filtros.posicao:
+        query = query.filter(VinculoClube.posicao == filtros.posicao)
+    if filtros.liga:
+        query = query.filter(VinculoClube.liga_clube == filtros.liga)
+    if filtros.idade_max is not None:
+        query = query.filter(Jogador.idade_atual <= filtros.idade_max)
+    if filtros.apenas_prioridade_alta:
+        query = query.filter(
+            db.query(Wishlist)
+            .filter(Wishlist.id_jogador == Jogador.id_jogador, Wishlist.prioridade == "alta")
+            .exists()
+        )
+
+    por_tipo: Dict[str, List[Dict[str, Any]]] = {tipo: [] for tipo in TIPOS}
+    for row in query.order_by(Jogador.nome, Jogador.id_jogador):
+        item = {
+            "id_jogador": row.id_jogador,
+            "nome": row.nome,
+            "idade_atual": row.idade_atual,
+            "posicao": row.posicao,
+            "clube": row.clube,
+            "media": round(float(row.media), 2),
+            "dias_restantes": (row.data_fim_contrato - hoje).days if row.data_fim_contrato else None,
+        }
+        for tipo in TIPOS:
+            if getattr(row, tipo):
+                por_tipo[tipo].append({**item, "tipo": tipo})
+    return [item for tipo in TIPOS for item in por_tipo[tipo]]
+
+
+def obter_oportunidades(db: Session, filtros: FiltrosMercado) -> List[Dict[str, Any]]:
+    """
+    Oportunidades (uma entrada por jogador e regra atendida), agrupadas na
+    ordem de TIPOS e por nome dentro de cada tipo.
+    """
+    hoje = date.today()
+    versoes = dict(
+        db.query(VersaoTabela.tabela, VersaoTabela.versao)
+        .filter(VersaoTabela.tabela.in_(TABELAS_MERCADO))
+    )
+    chave = (filtros, hoje, tuple(versoes.get(tabela, 0) for tabela in TABELAS_MERCADO))
+
+    with _memo_lock:
+        if chave in _memo:
+            _memo.move_to_end(chave)
+            return _memo[chave]
+
+    resultado = _calcular(db, filtros, hoje)
+    with _memo_lock:
+        _memo[chave] = resultado
+        while len(_memo) > MAX_MEMO:
+            _memo.popitem(last=False)
+    return resultado
@@ -0,0 +1,165 @@
+"""
+Scraping do Transfermarkt executado pelo motor de jobs (services/jobs.py)
+
+Os parsers (`extrair_*`) são funções puras sobre o HTML da página de
+perfil; os handlers `fotos` e `dados` fazem as requisições e chamam
+`ctx.checkpoint(...)` a cada jogador (progresso + cancelamento).
+"""
+import os
+import re
+import time
+from typing import Optional
+
+import httpx
+
+from ..core.config import settings
+from ..models.jogador import Jogador
+from .jobs import JobContext, registrar_job
+
+URL_PERFIL = "https://www.transfermarkt.com.br/player/profil/spieler/{tm_id}"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Fotos menores que isso são o placeholder "sem foto" do Transfermarkt
+TAMANHO_MINIMO_FOTO = 1000
+
+_RE_FOTO = re.compile(r"""(?:src|data-src)\s*=\s*["']([^"']*portrait/big/[^"']*?\.jpg)[^"']*["']""")
+_RE_ALTURA = re.compile(r"""itemprop=["']height["'][^>]*>\s*(\d)[,.](\d{2})""")
+_RE_PE = re.compile(
+    r""">\s*(?:P[ée]|Foot)\s*:\s*</span>\s*<span[^>]*>\s*([^<]+?)\s*<""",
+    re.IGNORECASE,
+)
+
+_PES = {
+    "direito": "Direito", "right": "Direito",
+    "esquerdo": "Esquerdo", "left": "Esquerdo",
+    "ambidestro": "Ambidestro", "both": "Ambidestro",
+}
+
+
+def extrair_tm_id(valor: Optional[str]) -> Optional[str]:
+    """
+    Extrai o ID numérico do Transfermarkt de uma URL ou string
+
+    Exemplos:
+    - https://www.transfermarkt.com.br/adriano/profil/spieler/1046580 -> 1046580
+    - 1046580 -> 1046580
+    """
+    if not valor:
+        return None
+    valor = str(valor).strip()
+    match = re.search(r"/spieler/(\d+)", valor)
+    if match:
+        return match.group(1)
+    return valor if valor.isdigit() else None
+
+
+def extrair_url_foto(html: str) -> Optional[str]:
+    """URL da foto grande (portrait/big) sem parâmetros de query"""
+    match = _RE_FOTO.search(html)
+    return match.group(1) if match else None
+
+
+def extrair_altura(html: str) -> Optional[int]:
+    """Altura em cm ("1,85 m" -> 185)"""
+    match = _RE_ALTURA.search(html)
+    return int(match.group(1)) * 100 + int(match.group(2)) if match else None
+
+
+def extrair_pe_dominante(html: str) -> Optional[str]:
+    """Pé dominante normalizado (Direito/Esquerdo/Ambidestro)"""
+    match = _RE_PE.search(html)
+    if not match:
+        return None
+    return _PES.get(match.group(1).strip().lower())
+
+
+def _baixar_perfil(client: httpx.Client, tm_id: str) -> str:
+    response = client.get(URL_PERFIL.format(tm_id=tm_id))
+    response.raise_for_status()
+    return response.text
+
+
+def _jogadores_com_tm(ctx: JobContext):
+    return (
+        ctx.db.query(Jogador.id_jogador, Jogador.nome, Jogador.transfermarkt_id)
+        .filter(Jogador.transfermarkt_id.isnot(None), Jogador.transfermarkt_id != "")
+        .order_by(Jogador.id_jogador)
+        .all()
+    )
+
+
+@registrar_job("fotos")
+def scrape_fotos(ctx: JobContext) -> None:
+    """Baixa a foto de cada jogador com transfermarkt_id que ainda não tem foto"""
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    ctx.checkpoint(0, 0, "Buscando jogadores sem fotos...")
+
+    pendentes = [
+        j for j in _jogadores_com_tm(ctx)
+        if not os.path.exists(os.path.join(settings.UPLOAD_DIR, f"{j.id_jogador}.jpg"))
+    ]
+    total = len(pendentes)
+
+    with httpx.Client(headers=HEADERS, timeout=15, follow_redirects=True) as client:
+        for i, jogador in enumerate(pendentes, start=1):
+            try:
+                tm_id = extrair_tm_id(jogador.transfermarkt_id)
+                if not tm_id:
+                    raise ValueError("ID do Transfermarkt inválido")
+
+                url_foto = extrair_url_foto(_baixar_perfil(client, tm_id))
+                if not url_foto:
+                    raise ValueError("URL da foto não encontrada no HTML")
+
+                response = client.get(url_foto)
+                response.raise_for_status()
+                if len(response.content) <= TAMANHO_MINIMO_FOTO:
+                    raise ValueError("Jogador sem foto no Transfermarkt")
+
+                caminho = os.path.join(settings.UPLOAD_DIR, f"{jogador.id_jogador}.jpg")
+                with open(caminho, "wb") as f:
+                    f.write(response.content)
+            except (httpx.HTTPError, ValueError) as e:
+                ctx.erro(f"{jogador.nome}: {e}")
+
+            ctx.checkpoint(i, total, f"Baixando foto {i}/{total}...")
+            if i < total:
+                time.sleep(settings.SCRAPING_REQUEST_DELAY)
+
+
+@registrar_job("dados")
+def scrape_dados(ctx: JobContext) -> None:
+    """Atualiza altura e pé dominante a partir da página de perfil"""
+    ctx.checkpoint(0, 0, "Buscando jogadores...")
+
+    jogadores = _jogadores_com_tm(ctx)
+    total = len(jogadores)
+
+    with httpx.Client(headers=HEADERS, timeout=15, follow_redirects=True) as client:
+        for i, jogador in enumerate(jogadores, start=1):
+            try:
+                tm_id = extrair_tm_id(jogador.transfermarkt_id)
+                if not tm_id:
+                    raise ValueError("ID do Transfermarkt inválido")
+
+                html = _baixar_perfil(client, tm_id)
+                valores = {
+                    "altura": extrair_altura(html),
+                    "pe_dominante": extrair_pe_dominante(html),
+                }
+                valores = {k: v for k, v in valores.items() if v is not None}
+                if valores:
+                    ctx.db.query(Jogador).filter(
+                        Jogador.id_jogador == jogador.id_jogador
+                    ).update(valores, synchronize_session=False)
+            except (httpx.HTTPError, ValueError) as e:
+                ctx.erro(f"{jogador.nome}: {e}")
+
+            # o checkpoint faz o commit das atualizações pendentes
+            ctx.checkpoint(i, total, f"Atualizando dados {i}/{total}...")
+            if i < total:
+                time.sleep(settings.SCRAPING_REQUEST_DELAY)
@@ -0,0 +1,41 @@
+"""
+Cursores opacos para paginação keyset (seek pagination)
+"""
+import base64
+import json
+from typing import Any, Tuple
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Codifica os valores da última linha de uma página em um token opaco.
+
+    Exemplo:
+        encode_cursor("Neymar", 42)  # -> "WyJOZXltYXIiLDQyXQ"
+    """
+    raw = json.dumps(list(values), ensure_ascii=False, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> Tuple[Any, ...]:
+    """
+    Decodifica um token gerado por encode_cursor.
+
+    Args:
+        token: Cursor recebido do cliente
+        size: Quantidade de valores esperada no cursor
+
+    Raises:
+        ValueError: Cursor malformado ou adulterado
+    """
+    try:
+        padding = "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode((token + padding).encode("ascii"))
+        values = json.loads(raw.decode("utf-8"))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("Cursor inválido") from exc
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Cursor inválido")
+
+    return tuple(values)
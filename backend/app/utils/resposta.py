@@ -0,0 +1,41 @@
+"""
+Caminho rápido de serialização das listagens
+
+As listagens quentes (jogadores, wishlist, avaliações) selecionam colunas
+simples, montam dicts direto das linhas e respondem com RespostaJSON, sem
+instanciar um modelo Pydantic por linha nem revalidar o response_model:
+as linhas vêm do próprio banco e já têm os tipos do schema. O
+response_model continua declarado na rota para a documentação (OpenAPI).
+
+A saída é a mesma do caminho Pydantic (mesmas chaves, na ordem dos campos
+do schema, e os mesmos formatos de data/hora).
+"""
+from decimal import Decimal
+from typing import Any, Iterable, List, Sequence
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def campos(schema: type[BaseModel]) -> tuple:
+    """Nomes dos campos do schema, na ordem em que o Pydantic os serializa"""
+    return tuple(schema.model_fields)
+
+
+def linhas_para_dicts(linhas: Iterable[Any], nomes: Sequence[str]) -> List[dict]:
+    """Dicts {campo: valor} das linhas (Row) com as colunas `nomes`"""
+    return [{nome: linha._mapping[nome] for nome in nomes} for linha in linhas]
+
+
+def _padrao(valor: Any) -> Any:
+    if isinstance(valor, Decimal):
+        return float(valor)
+    raise TypeError(f"Tipo não serializável: {type(valor).__name__}")
+
+
+class RespostaJSON(JSONResponse):
+    """JSONResponse codificada com orjson (datas em ISO 8601, UTC como "Z")"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_padrao, option=orjson.OPT_UTC_Z)
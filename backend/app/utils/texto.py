@@ -0,0 +1,17 @@
+"""
+Normalização de texto para buscas (sem acentos, minúsculas)
+"""
+import re
+import unicodedata
+
+
+def normalizar_texto(texto: str) -> str:
+    """
+    Remove acentos, converte para minúsculas e colapsa espaços.
+
+    Exemplo:
+        normalizar_texto("  Estêvão  Willian ")  # -> "estevao willian"
+    """
+    decomposto = unicodedata.normalize("NFKD", texto or "")
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return re.sub(r"\s+", " ", sem_acentos).strip().lower()
@@ -0,0 +1,127 @@
+"""
+Benchmark de vazão: engine síncrona x AsyncEngine (DB_ASYNC)
+
+Sobe a API duas vezes com uvicorn (DB_ASYNC=false e DB_ASYNC=true) contra
+BENCH_DATABASE_URL e dispara requisições concorrentes às leituras
+frequentes (listagem e detalhe de jogadores, avaliações e wishlist),
+imprimindo requisições/s e latências p50/p95 por nível de concorrência.
+
+Requer PostgreSQL (a API usa as opções de conexão de produção) e asyncpg.
+
+Execute: BENCH_DATABASE_URL=postgresql://... python backend/benchmarks/bench_async.py [--jogadores 5000]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+from common import criar_engine, popular_jogadores, BENCH_DATABASE_URL
+
+from app.core.security import claims_usuario, create_access_token, hash_password
+from app.models import Jogador, Usuario
+
+PORTA = 8765
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def preparar_banco(total: int):
+    """Popula o banco e retorna (token, ids de jogadores para o detalhe)"""
+    engine, SessionLocal = criar_engine()
+    db = SessionLocal()
+    try:
+        popular_jogadores(db, total)
+        usuario = Usuario(username="bench", email="bench@scoutpro.com",
+                          senha_hash=hash_password("bench"), nivel="admin")
+        db.add(usuario)
+        db.commit()
+        ids = [i for (i,) in db.query(Jogador.id_jogador).limit(200)]
+        return create_access_token(claims_usuario(usuario)), ids
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def subir_api(db_async: bool, workers: int) -> subprocess.Popen:
+    """Inicia o uvicorn e espera o /api/health responder"""
+    env = dict(os.environ, DATABASE_URL=BENCH_DATABASE_URL, DB_ASYNC=str(db_async).lower())
+    processo = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORTA),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env,
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{PORTA}/api/health", timeout=1)
+            return processo
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    processo.terminate()
+    raise RuntimeError("API não subiu")
+
+
+async def aquecer(http: httpx.AsyncClient, caminhos) -> None:
+    """Abre conexões e aquece o pool antes da medição"""
+    for caminho in caminhos[:20]:
+        await http.get(caminho)
+
+
+async def disparar(token: str, ids, concorrencia: int, total: int):
+    """Executa `total` requisições com `concorrencia` clientes; retorna (req/s, latências ms)"""
+    caminhos = ["/api/v1/jogadores?limit=50", "/api/v1/wishlist"]
+    for id_jogador in ids:
+        caminhos += [f"/api/v1/jogadores/{id_jogador}", f"/api/v1/avaliacoes/jogador/{id_jogador}"]
+
+    latencias = []
+    fila = iter(range(total))
+
+    async def cliente(http: httpx.AsyncClient):
+        for i in fila:
+            inicio = time.perf_counter()
+            resposta = await http.get(caminhos[i % len(caminhos)])
+            latencias.append((time.perf_counter() - inicio) * 1000)
+            resposta.raise_for_status()
+
+    limites = httpx.Limits(max_connections=concorrencia)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORTA}", limits=limites,
+                                 headers={"Authorization": f"Bearer {token}"}, timeout=60) as http:
+        await aquecer(http, caminhos)
+        inicio = time.perf_counter()
+        await asyncio.gather(*(cliente(http) for _ in range(concorrencia)))
+        duracao = time.perf_counter() - inicio
+
+    latencias.sort()
+    return total / duracao, latencias
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jogadores", type=int, default=5000)
+    parser.add_argument("--requisicoes", type=int, default=2000)
+    parser.add_argument("--concorrencia", type=int, nargs="+", default=[1, 10, 50, 100])
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"📥 Populando {args.jogadores} jogadores em {BENCH_DATABASE_URL.split('@')[-1]}...")
+    token, ids = preparar_banco(args.jogadores)
+
+    for db_async in (False, True):
+        print(f"\n⚙️  DB_ASYNC={str(db_async).lower()}")
+        processo = subir_api(db_async, args.workers)
+        try:
+            for concorrencia in args.concorrencia:
+                vazao, latencias = asyncio.run(disparar(token, ids, concorrencia, args.requisicoes))
+                print(f"  concorrência {concorrencia:>4}: {vazao:8.1f} req/s  "
+                      f"p50={statistics.median(latencias):8.2f} ms  "
+                      f"p95={latencias[int(len(latencias) * 0.95) - 1]:8.2f} ms")
+        finally:
+            processo.terminate()
+            processo.wait()
+
+
+if __name__ == "__main__":
+    main()
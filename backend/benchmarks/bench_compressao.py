@@ -0,0 +1,83 @@
+"""
+Benchmark de compressão: bytes enviados e latência p95 das listagens principais
+
+Chama a API em processo (TestClient, sem rede) com Accept-Encoding
+identity, gzip e br (se o pacote brotli estiver instalado) e imprime, por
+rota, o tamanho do corpo enviado, a latência p50/p95 no servidor e uma
+estimativa do p95 somando a transferência em um link móvel (--banda-kbps).
+
+Execute: python backend/benchmarks/bench_compressao.py [--jogadores 2000] [--banda-kbps 1600]
+"""
+import argparse
+
+from common import criar_engine, medir, popular_jogadores
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_active_user
+from app.core.compressao import brotli
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.main import app
+from app.models import Jogador, Usuario
+
+CODIFICACOES = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jogadores", type=int, default=2000)
+    parser.add_argument("--repeticoes", type=int, default=50)
+    parser.add_argument("--banda-kbps", type=int, default=1600, help="Banda do link móvel simulado")
+    args = parser.parse_args()
+
+    engine, SessionLocal = criar_engine()
+    db = SessionLocal()
+    print(f"📥 Populando {args.jogadores} jogadores...")
+    popular_jogadores(db, args.jogadores)
+    id_jogador = db.query(Jogador.id_jogador).join(Jogador.avaliacoes).first()[0]
+    db.close()
+
+    def _get_db():
+        sessao = SessionLocal()
+        try:
+            yield sessao
+        finally:
+            sessao.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    usuario = Usuario(id=1, username="bench", nivel="admin", ativo=True)
+    app.dependency_overrides[get_current_user] = lambda: usuario
+    app.dependency_overrides[get_current_active_user] = lambda: usuario
+
+    rotas = [
+        "/api/v1/jogadores?limit=200",
+        "/api/v1/wishlist?limit=200",
+        f"/api/v1/avaliacoes/jogador/{id_jogador}",
+        "/api/v1/stats/dashboard",
+        "/api/v1/export/jogadores?formato=ndjson",
+    ]
+    cliente = TestClient(app)  # sem o lifespan (jobs e pré-aquecimento)
+    try:
+        for rota in rotas:
+            print(f"\n🌐 {rota}")
+            for codificacao in CODIFICACOES:
+                cabecalhos = {"Accept-Encoding": codificacao}
+
+                def requisitar():
+                    with cliente.stream("GET", rota, headers=cabecalhos) as resposta:
+                        resposta.raise_for_status()
+                        return b"".join(resposta.iter_raw())
+
+                tamanho = len(requisitar())
+                tempos = medir(requisitar, args.repeticoes)
+                transferencia = tamanho * 8 / (args.banda_kbps * 1000) * 1000
+                print(f"  {codificacao:<9} {tamanho / 1024:10.1f} KiB  p50={tempos['p50']:8.2f} ms  "
+                      f"p95={tempos['p95']:8.2f} ms  p95+rede≈{tempos['p95'] + transferencia:9.1f} ms")
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
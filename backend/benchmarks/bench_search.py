@@ -0,0 +1,44 @@
+"""
+Benchmark de latência da busca de jogadores
+
+Compara a busca indexada (FTS5 no SQLite / pg_trgm no PostgreSQL) com o
+filtro ILIKE '%termo%' usado pela listagem.
+
+Execute: python backend/benchmarks/bench_search.py [--jogadores 40000]
+"""
+import argparse
+
+from common import criar_engine, popular_jogadores, medir, imprimir, BENCH_DATABASE_URL
+
+from app.crud import jogador as crud_jogador
+
+TERMOS = ["sil", "estevao", "palmeiras", "goncalves roque", "brasil"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jogadores", type=int, default=40000)
+    parser.add_argument("--repeticoes", type=int, default=50)
+    args = parser.parse_args()
+
+    engine, SessionLocal = criar_engine()
+    db = SessionLocal()
+    try:
+        print(f"📥 Populando {args.jogadores} jogadores em {BENCH_DATABASE_URL.split('@')[-1]}...")
+        popular_jogadores(db, args.jogadores)
+
+        for termo in TERMOS:
+            print(f"\n🔎 Termo: '{termo}'")
+            imprimir("search_jogadores (índice)", medir(
+                lambda: crud_jogador.search_jogadores(db, termo, limit=20), args.repeticoes
+            ))
+            imprimir("get_jogadores (ILIKE)", medir(
+                lambda: crud_jogador.get_jogadores(db, nome=termo, limit=20), args.repeticoes
+            ))
+    finally:
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark de serialização das listagens: modelo Pydantic por linha x caminho rápido
+
+Mede uma página de 200 jogadores (e as avaliações correspondentes) da
+consulta até os bytes do corpo da resposta:
+
+- antes: entidades ORM → JogadorWithDetails/AvaliacaoResponse por linha →
+  validação do response_model pelo FastAPI → JSONResponse
+- depois: colunas simples → dicts → RespostaJSON (orjson), sem validação
+
+Execute: python backend/benchmarks/bench_serializacao.py [--jogadores 2000]
+"""
+import argparse
+import asyncio
+import warnings
+from typing import List
+
+from common import criar_engine, imprimir, medir, popular_jogadores
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api.v1.endpoints.avaliacoes import _linhas_para_avaliacoes
+from app.api.v1.endpoints.jogadores import linhas_para_jogadores
+from app.crud import jogador as crud_jogador
+from app.models import Avaliacao, Jogador
+from app.schemas.avaliacao import AvaliacaoResponse
+from app.schemas.jogador import JogadorListResponse, JogadorWithDetails
+from app.utils.resposta import RespostaJSON
+
+LINHAS = 200
+
+
+def _responder(campo, conteudo) -> bytes:
+    """Mesmo caminho do FastAPI para rotas com response_model"""
+    validado = asyncio.run(serialize_response(field=campo, response_content=conteudo, is_coroutine=True))
+    return JSONResponse(validado).body
+
+
+def jogadores_antes(db, campo) -> bytes:
+    query, _ = crud_jogador._consulta_detalhes(db, com_total=True)
+    detalhes = [coluna["expr"] for coluna in query.column_descriptions[len(Jogador.__table__.columns):]]
+    rows = query.with_entities(Jogador, *detalhes).order_by(Jogador.nome, Jogador.id_jogador).limit(LINHAS).all()
+    data = [
+        JogadorWithDetails(
+            **row[0].__dict__, clube=row[1], liga_clube=row[2], posicao=row[3], status_contrato=row[4],
+            data_fim_contrato=row[5], nota_potencial_media=row[6], total_avaliacoes=row[7] or 0,
+            em_wishlist=bool(row[8]), media_geral=row[9],
+        )
+        for row in rows
+    ]
+    return _responder(campo, JogadorListResponse(data=data, total=rows[0].total, limit=LINHAS))
+
+
+def jogadores_depois(db) -> bytes:
+    rows, total = crud_jogador.get_jogadores_com_detalhes(db, limit=LINHAS)
+    return RespostaJSON({"data": linhas_para_jogadores(rows), "total": total, "limit": LINHAS,
+                         "next_cursor": None}).body
+
+
+def avaliacoes_antes(db, campo) -> bytes:
+    avaliacoes = db.query(Avaliacao).order_by(Avaliacao.id).limit(LINHAS).all()
+    return _responder(campo, [AvaliacaoResponse.model_validate(av) for av in avaliacoes])
+
+
+def avaliacoes_depois(db) -> bytes:
+    linhas = db.query(*Avaliacao.__table__.columns).order_by(Avaliacao.id).limit(LINHAS).all()
+    return RespostaJSON(_linhas_para_avaliacoes(linhas)).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jogadores", type=int, default=2000)
+    parser.add_argument("--repeticoes", type=int, default=100)
+    args = parser.parse_args()
+    # As notas (Decimal no schema) viram float no validador: ruído do caminho antigo
+    warnings.filterwarnings("ignore", message="Pydantic serializer warnings")
+
+    engine, SessionLocal = criar_engine()
+    db = SessionLocal()
+    try:
+        print(f"📥 Populando {args.jogadores} jogadores...")
+        popular_jogadores(db, args.jogadores)
+        campo_jogadores = create_response_field(name="resposta", type_=JogadorListResponse)
+        campo_avaliacoes = create_response_field(name="resposta", type_=List[AvaliacaoResponse])
+
+        print(f"\n⏱️  Página de {LINHAS} linhas (consulta + serialização)")
+        imprimir("jogadores: Pydantic por linha", medir(lambda: jogadores_antes(db, campo_jogadores), args.repeticoes))
+        imprimir("jogadores: dicts + orjson", medir(lambda: jogadores_depois(db), args.repeticoes))
+        imprimir("avaliações: Pydantic por linha", medir(lambda: avaliacoes_antes(db, campo_avaliacoes), args.repeticoes))
+        imprimir("avaliações: dicts + orjson", medir(lambda: avaliacoes_depois(db), args.repeticoes))
+    finally:
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
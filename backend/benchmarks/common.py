@@ -0,0 +1,95 @@
+"""
+Utilitários compartilhados pelos benchmarks do backend
+
+Por padrão os benchmarks usam um SQLite temporário. Para medir contra o
+PostgreSQL real, defina BENCH_DATABASE_URL (o banco será populado e
+limpo ao final; não aponte para produção).
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict
+
+# Adicionar o diretório do backend ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL", "sqlite:///./bench.db")
+os.environ.setdefault("DATABASE_URL", BENCH_DATABASE_URL)
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.models import Jogador, VinculoClube, Avaliacao, Wishlist  # noqa: E402
+
+NOMES = ["João", "Pedro", "Lucas", "Gabriel", "Matheus", "Estêvão", "Vitor", "André", "Luís", "Caio"]
+SOBRENOMES = ["Silva", "Santos", "Oliveira", "Souza", "Pereira", "Gonçalves", "Araújo", "Roque", "Neves", "Lima"]
+CLUBES = ["Palmeiras", "Flamengo", "São Paulo", "Grêmio", "Benfica", "Porto", "Lille", "Real Madrid"]
+PAISES = ["Brasil", "Portugal", "França", "Argentina", "Uruguai", "Colômbia"]
+POSICOES = ["GOL", "ZAG", "LE", "LD", "VOL", "MC", "MA", "AE", "AD", "ATA"]
+
+
+def criar_engine():
+    """Cria engine e sessões para o banco de benchmark (schema recriado do zero)"""
+    connect_args = {"check_same_thread": False} if BENCH_DATABASE_URL.startswith("sqlite") else {}
+    engine = create_engine(BENCH_DATABASE_URL, connect_args=connect_args)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine, autoflush=False)
+
+
+def popular_jogadores(db: Session, total: int, seed: int = 42) -> None:
+    """Insere `total` jogadores com vínculo, avaliações e ~5% na wishlist"""
+    rnd = random.Random(seed)
+    for i in range(total):
+        jogador = Jogador(
+            nome=f"{rnd.choice(NOMES)} {rnd.choice(SOBRENOMES)} {i}",
+            nacionalidade=rnd.choice(PAISES),
+            idade_atual=rnd.randint(16, 34),
+            transfermarkt_id=str(100000 + i),
+        )
+        jogador.vinculos.append(VinculoClube(
+            clube=rnd.choice(CLUBES),
+            liga_clube="Liga",
+            posicao=rnd.choice(POSICOES),
+            data_fim_contrato=date.today() + timedelta(days=rnd.randint(0, 1500)),
+            status_contrato="Ativo",
+        ))
+        for _ in range(rnd.randint(0, 3)):
+            nota = round(rnd.uniform(2.0, 5.0), 1)
+            jogador.avaliacoes.append(Avaliacao(
+                data_avaliacao=date.today() - timedelta(days=rnd.randint(0, 365)),
+                nota_potencial=nota, nota_tatico=nota, nota_tecnico=nota,
+                nota_fisico=nota, nota_mental=nota,
+            ))
+        if rnd.random() < 0.05:
+            jogador.wishlist = Wishlist(prioridade="media")
+        db.add(jogador)
+        if i % 1000 == 999:
+            db.flush()
+    db.commit()
+
+
+def medir(fn: Callable[[], object], repeticoes: int = 50) -> Dict[str, float]:
+    """Executa `fn` repetidas vezes e retorna latências p50/p95/máx em ms"""
+    fn()  # aquecimento
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        fn()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    return {
+        "p50": statistics.median(tempos),
+        "p95": tempos[int(len(tempos) * 0.95) - 1],
+        "max": tempos[-1],
+    }
+
+
+def imprimir(titulo: str, resultado: Dict[str, float]) -> None:
+    """Imprime uma linha de resultado formatada"""
+    print(f"  {titulo:<40} p50={resultado['p50']:8.2f} ms  p95={resultado['p95']:8.2f} ms  "
+          f"max={resultado['max']:8.2f} ms")
@@ -1,15 +1,21 @@
 """
 Configuração global de testes Pytest
 """
+import os
 import pytest
 from typing import Generator
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from app.core.database import Base, get_db
-from app.main import app
 
 # URL de banco de testes (use in-memory SQLite para testes rápidos)
 SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test.db"
+os.environ.setdefault("DATABASE_URL", SQLALCHEMY_TEST_DATABASE_URL)
+
+from app.core.database import Base, get_db
+from app.core.security import get_current_user
+from app.api.deps import get_current_active_user
+from app.models.usuario import Usuario
+from app.main import app
 
 engine = create_engine(
     SQLALCHEMY_TEST_DATABASE_URL,
@@ -49,6 +55,19 @@ def override_get_db(db_session: Session):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def override_auth():
+    """
+    Fixture que autentica todas as requisições com um usuário admin fictício.
+    """
+    usuario = Usuario(id=1, username="admin", email="admin@scoutpro.com", nivel="admin", ativo=True)
+    app.dependency_overrides[get_current_user] = lambda: usuario
+    app.dependency_overrides[get_current_active_user] = lambda: usuario
+    yield usuario
+    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_active_user, None)
+
+
 @pytest.fixture(scope="session")
 def test_client():
     """
@@ -0,0 +1,85 @@
+"""
+Testes do caminho assíncrono de leitura (AsyncSession)
+"""
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.core.database import criar_async_engine, get_db, url_async
+from app.crud import jogador as crud_jogador
+from app.main import app
+from app.models.avaliacao import Avaliacao
+from app.models.jogador import Jogador
+from app.models.vinculo import VinculoClube
+from app.models.wishlist import Wishlist
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from tests.conftest import SQLALCHEMY_TEST_DATABASE_URL
+
+
+@pytest.fixture
+def jogadores(db_session):
+    for nome in ["Endrick", "Estêvão", "Vitor Roque"]:
+        jogador = Jogador(nome=nome, idade_atual=18)
+        jogador.vinculos.append(VinculoClube(clube="Palmeiras", posicao="ATA"))
+        jogador.avaliacoes.append(Avaliacao(
+            data_avaliacao=date(2026, 1, 1), nota_tatico=4.0, nota_tecnico=4.0, nota_fisico=4.0, nota_mental=4.0
+        ))
+        db_session.add(jogador)
+    db_session.flush()
+    db_session.add(Wishlist(id_jogador=jogador.id_jogador, prioridade="alta"))
+    db_session.commit()
+
+
+@pytest.fixture
+def override_get_db_async():
+    """Sobrescreve get_db (= get_db_leitura com DB_ASYNC=false) por uma AsyncSession"""
+    async def _get_test_db_async():
+        engine = criar_async_engine(url_async(SQLALCHEMY_TEST_DATABASE_URL))
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                yield db
+        finally:
+            await engine.dispose()
+
+    app.dependency_overrides[get_db] = _get_test_db_async
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_url_async():
+    assert url_async("postgresql://u:s@host:5432/scout") == "postgresql+asyncpg://u:s@host:5432/scout"
+    assert url_async("postgresql+psycopg2://u:s@host/scout") == "postgresql+asyncpg://u:s@host/scout"
+    assert url_async("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+
+def test_crud_async_igual_ao_sincrono(db_session, jogadores):
+    async def consultar():
+        engine = criar_async_engine(url_async(SQLALCHEMY_TEST_DATABASE_URL))
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                return await crud_jogador.get_jogadores_com_detalhes_async(db, limit=2)
+        finally:
+            await engine.dispose()
+
+    linhas, total = asyncio.run(consultar())
+    linhas_sync, total_sync = crud_jogador.get_jogadores_com_detalhes(db_session, limit=2)
+
+    assert [tuple(linha) for linha in linhas] == [tuple(linha) for linha in linhas_sync]
+    assert total == total_sync == 3
+    assert [linha.nome for linha in linhas] == ["Endrick", "Estêvão"]
+
+
+def test_endpoints_de_leitura_com_async_session(test_client, db_session, jogadores,
+                                                 override_get_db_async, override_auth):
+    lista = test_client.get("/api/v1/jogadores?limit=2")
+    assert lista.status_code == 200
+    assert lista.json()["total"] == 3
+    id_jogador = lista.json()["data"][0]["id_jogador"]
+
+    assert test_client.get(f"/api/v1/jogadores/{id_jogador}").json()["nome"] == "Endrick"
+    assert len(test_client.get(f"/api/v1/avaliacoes/jogador/{id_jogador}").json()) == 1
+    assert test_client.get(f"/api/v1/avaliacoes/jogador/{id_jogador}/ultima").status_code == 200
+    assert [w["prioridade"] for w in test_client.get("/api/v1/wishlist").json()] == ["alta"]
+    assert test_client.get("/api/v1/jogadores/999").status_code == 404
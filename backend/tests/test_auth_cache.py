@@ -0,0 +1,129 @@
+"""
+Testes do cache de usuários autenticados (get_current_user)
+"""
+import pytest
+from sqlalchemy import event, text
+
+from app.core import security
+from app.core.security import create_access_token, hash_password, invalidar_usuario
+from app.models.usuario import Usuario
+
+
+@pytest.fixture(autouse=True)
+def cache_vazio():
+    invalidar_usuario()
+    yield
+    invalidar_usuario()
+
+
+@pytest.fixture
+def usuario(db_session):
+    usuario = Usuario(username="maria", email="maria@scoutpro.com", senha_hash=hash_password("segredo"), nivel="scout")
+    db_session.add(usuario)
+    db_session.commit()
+    return usuario
+
+
+@pytest.fixture
+def consultas_usuarios(db_session):
+    comandos = []
+    engine = db_session.get_bind()
+
+    def _registrar(conn, cursor, statement, *args):
+        if "FROM usuarios" in statement:
+            comandos.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _registrar)
+    yield comandos
+    event.remove(engine, "before_cursor_execute", _registrar)
+
+
+def _token(test_client):
+    response = test_client.post("/api/v1/auth/login", json={"username": "maria", "password": "segredo"})
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_claims_no_token(test_client, override_get_db, usuario):
+    headers = _token(test_client)
+    payload = security.decode_token(headers["Authorization"].split()[1])
+
+    assert (payload["ativo"], payload["nivel"], payload["ver"]) == (True, "scout", 0)
+
+
+def test_requisicoes_seguintes_sem_consulta(test_client, override_get_db, usuario, consultas_usuarios):
+    headers = _token(test_client)
+    consultas_usuarios.clear()
+
+    for _ in range(3):
+        response = test_client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["username"] == "maria"
+
+    assert len(consultas_usuarios) == 1
+
+
+def test_desativar_revoga_token(test_client, override_get_db, db_session, usuario):
+    headers = _token(test_client)
+    assert test_client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    usuario.ativo = False
+    db_session.commit()
+    assert usuario.versao_token == 1
+
+    response = test_client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 401
+    assert "revogado" in response.json()["detail"]
+
+
+def test_mudanca_de_nivel_revoga_token(test_client, override_get_db, db_session, usuario):
+    headers = _token(test_client)
+    test_client.get("/api/v1/auth/me", headers=headers)
+
+    usuario.nivel = "admin"
+    db_session.commit()
+
+    assert test_client.get("/api/v1/auth/me", headers=headers).status_code == 401
+    novo = _token(test_client)
+    assert test_client.get("/api/v1/auth/me", headers=novo).json()["nivel"] == "admin"
+
+
+def test_ultimo_acesso_nao_revoga(test_client, override_get_db, usuario):
+    headers = _token(test_client)
+    _token(test_client)  # novo login atualiza ultimo_acesso
+
+    assert test_client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+
+def test_claim_inativo_recusado_sem_banco(test_client, override_get_db, usuario, consultas_usuarios):
+    token = create_access_token({"sub": str(usuario.id), "ativo": False, "ver": 0})
+    consultas_usuarios.clear()
+    response = test_client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 403
+    assert consultas_usuarios == []
+
+
+def test_revogacao_em_outro_worker_vale_apos_ttl(test_client, override_get_db, db_session, usuario):
+    """Sem o after_update deste processo (outro worker), o token antigo só vale até o TTL"""
+    headers = _token(test_client)
+    assert test_client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    # UPDATE por SQL puro: não passa pelo listener, como uma escrita de outro processo
+    db_session.execute(text("UPDATE usuarios SET ativo = 0, versao_token = versao_token + 1 WHERE id = :id"),
+                       {"id": usuario.id})
+    db_session.commit()
+    assert test_client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    for chave, (_, copia) in list(security._usuarios.items()):
+        security._usuarios[chave] = (0.0, copia)  # TTL vencido
+    assert test_client.get("/api/v1/auth/me", headers=headers).status_code == 401
+
+
+def test_cache_lru_limitado(monkeypatch):
+    monkeypatch.setattr(security.settings, "AUTH_CACHE_MAX", 2)
+    for i in range(3):
+        security._guardar_usuario((i, 0), Usuario(id=i, username=f"u{i}", email=f"u{i}@x", ativo=True))
+
+    assert security._usuario_em_cache((0, 0)) is None
+    assert security._usuario_em_cache((2, 0)).username == "u2"
@@ -0,0 +1,50 @@
+"""
+Testes do pool limitado de bcrypt (login e registro)
+"""
+import threading
+
+import pytest
+
+from app.core import security
+from app.core.security import hash_password
+from app.models.usuario import Usuario
+
+
+@pytest.fixture
+def usuario(db_session):
+    db_session.add(Usuario(username="maria", email="maria@scoutpro.com", senha_hash=hash_password("segredo")))
+    db_session.commit()
+
+
+def test_login_e_registro_pelo_pool(test_client, override_get_db, usuario):
+    response = test_client.post("/api/v1/auth/login", json={"username": "maria", "password": "segredo"})
+    assert response.status_code == 200
+
+    errada = test_client.post("/api/v1/auth/login", json={"username": "maria", "password": "errada"})
+    assert errada.status_code == 401
+
+    novo = test_client.post("/api/v1/auth/register", json={
+        "username": "joao", "email": "joao@scoutpro.com", "password": "segredo123", "nivel": "scout",
+    })
+    assert novo.status_code == 201
+    assert test_client.post(
+        "/api/v1/auth/login", json={"username": "joao", "password": "segredo123"}
+    ).status_code == 200
+
+
+def test_pool_saturado_responde_429(test_client, override_get_db, usuario, monkeypatch):
+    monkeypatch.setattr(security, "_vagas_senhas", threading.BoundedSemaphore(1))
+    security._vagas_senhas.acquire()  # única vaga ocupada
+
+    response = test_client.post("/api/v1/auth/login", json={"username": "maria", "password": "segredo"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_vaga_liberada_apos_hash(test_client, override_get_db, usuario, monkeypatch):
+    monkeypatch.setattr(security, "_vagas_senhas", threading.BoundedSemaphore(1))
+
+    for _ in range(2):
+        response = test_client.post("/api/v1/auth/login", json={"username": "maria", "password": "segredo"})
+        assert response.status_code == 200
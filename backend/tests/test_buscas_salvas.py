@@ -0,0 +1,131 @@
+"""
+Testes das buscas salvas (chave canônica, cache de resultados e paginação)
+"""
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from app.crud import jogador as crud_jogador
+from app.models.avaliacao import Avaliacao
+from app.models.busca_salva import BuscaSalva, ResultadoBusca
+from app.models.jogador import Jogador
+from app.models.vinculo import VinculoClube
+from app.schemas.jogador import BuscaAvancadaFiltros
+from app.services import buscas_salvas
+
+
+@pytest.fixture
+def busca(db_session):
+    """Cinco atacantes (um com nome repetido) e uma busca salva pelo Streamlit"""
+    for nome in ["Endrick", "Vitor Roque", "Ana", "Endrick", "Yan"]:
+        jogador = Jogador(nome=nome, idade_atual=19)
+        jogador.vinculos.append(VinculoClube(clube="Palmeiras", posicao="ATA"))
+        db_session.add(jogador)
+    db_session.add(Jogador(nome="Leny Yoro", idade_atual=19))
+
+    # Formato gravado pelo Streamlit: listas vazias como null
+    filtros = {"posicoes": ["ATA"], "clubes": None, "idade_min": 18, "tags": None, "contrato_vencendo": False}
+    salva = BuscaSalva(nome_busca="Atacantes", filtros=json.dumps(filtros))
+    db_session.add(salva)
+    db_session.commit()
+    return salva
+
+
+@pytest.fixture
+def contar_calculos(monkeypatch):
+    chamadas = []
+    original = crud_jogador.ids_busca_avancada
+
+    def contar(db, filtros):
+        chamadas.append(filtros)
+        return original(db, filtros)
+
+    monkeypatch.setattr(crud_jogador, "ids_busca_avancada", contar)
+    return chamadas
+
+
+def test_chave_canonica():
+    a = BuscaAvancadaFiltros(posicoes=["ZAG", "ATA", "ATA"], tags_modo="todas")
+    b = BuscaAvancadaFiltros(posicoes=["ATA", "ZAG"])
+
+    assert buscas_salvas.chave_filtros(a) == buscas_salvas.chave_filtros(b)
+    assert buscas_salvas.chave_filtros(b) != buscas_salvas.chave_filtros(BuscaAvancadaFiltros(posicoes=["ATA"]))
+
+
+def test_forma_canonica_igual_a_do_streamlit():
+    """API e Streamlit gravam o mesmo texto em buscas_salvas.filtros (mesma chave de cache)"""
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+    from src.database.busca_avancada import filtros_canonicos as canonicos_streamlit
+
+    formularios = [
+        # Formulário do Streamlit: listas vazias como None, checkbox e modo sempre presentes
+        {"posicoes": ["ATA", "MC", "ATA"], "clubes": None, "nacionalidades": None, "idade_min": 18,
+         "idade_max": 35, "media_min": 3.0, "contrato_vencendo": False, "tags": None, "tags_modo": "todas"},
+        {"posicoes": None, "clubes": ["PSG"], "nacionalidades": ["Brasil"], "idade_min": 18,
+         "idade_max": 25, "media_min": 4.5, "contrato_vencendo": True, "tags": [2, 1], "tags_modo": "qualquer"},
+        {"tags": [3], "tags_modo": "todas"},
+        {},
+    ]
+    for formulario in formularios:
+        api = buscas_salvas.filtros_canonicos(buscas_salvas.carregar_filtros(json.dumps(formulario)))
+        assert api == canonicos_streamlit(formulario)
+
+    assert buscas_salvas.filtros_canonicos(BuscaAvancadaFiltros()) == "{}"
+
+
+def test_resultados_cursor_percorre_todos(test_client, db_session, override_get_db, override_auth, busca):
+    vistos = []
+    params = {"limit": 2}
+    while True:
+        response = test_client.get(f"/api/v1/buscas-salvas/{busca.id_busca}/resultados", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 5
+        vistos.extend((j["nome"], j["id_jogador"]) for j in body["data"])
+        if not body["next_cursor"]:
+            break
+        params = {"limit": 2, "cursor": body["next_cursor"]}
+
+    esperado = sorted((j.nome, j.id_jogador) for j in db_session.query(Jogador) if j.nome != "Leny Yoro")
+    assert vistos == esperado
+
+    db_session.refresh(busca)
+    assert busca.total_execucoes == 1  # páginas seguintes não contam como nova execução
+
+
+def test_resultado_invalidado_por_escrita(db_session, busca, contar_calculos):
+    filtros = buscas_salvas.carregar_filtros(busca.filtros)
+    filtros.media_min = 3.0
+
+    assert buscas_salvas.obter_resultado(db_session, filtros) == []
+    assert buscas_salvas.obter_resultado(db_session, filtros) == []
+    assert len(contar_calculos) == 1
+
+    yan = db_session.query(Jogador).filter_by(nome="Yan").one()
+    db_session.add(Avaliacao(
+        id_jogador=yan.id_jogador, data_avaliacao=date(2026, 1, 1),
+        nota_tatico=4, nota_tecnico=4, nota_fisico=4, nota_mental=4,
+    ))
+    db_session.commit()
+
+    assert buscas_salvas.obter_resultado(db_session, filtros) == [("Yan", yan.id_jogador)]
+    assert len(contar_calculos) == 2
+
+
+def test_pre_aquecer_buscas_mais_usadas(db_session, busca, contar_calculos):
+    db_session.add(BuscaSalva(nome_busca="Nunca usada", filtros=json.dumps({"posicoes": ["ZAG"]})))
+    buscas_salvas.registrar_execucao(db_session, busca)
+
+    assert buscas_salvas.pre_aquecer(db_session) == 1
+    assert db_session.query(ResultadoBusca).count() == 1
+
+    buscas_salvas.obter_resultado(db_session, buscas_salvas.carregar_filtros(busca.filtros))
+    assert len(contar_calculos) == 1
+
+
+def test_resultados_busca_inexistente(test_client, override_get_db, override_auth, busca):
+    response = test_client.get("/api/v1/buscas-salvas/999/resultados")
+    assert response.status_code == 404
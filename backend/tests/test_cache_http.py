@@ -0,0 +1,86 @@
+"""
+Testes de ETag / If-None-Match e Cache-Control nas leituras
+"""
+import pytest
+
+from app.api.cache_http import AGREGADOS, REVALIDAR, corresponde
+from app.crud import wishlist as crud_wishlist
+from app.models.jogador import Jogador
+from app.models.wishlist import Wishlist
+
+
+@pytest.fixture
+def jogador(db_session):
+    jogador = Jogador(nome="Estêvão")
+    jogador.wishlist = Wishlist(prioridade="alta")
+    db_session.add(jogador)
+    db_session.commit()
+    return jogador
+
+
+@pytest.mark.parametrize("if_none_match,esperado", [
+    ('W/"abc"', True),
+    ('"abc"', True),
+    ('W/"xyz", W/"abc"', True),
+    ("*", True),
+    ('W/"xyz"', False),
+    ("", False),
+])
+def test_corresponde(if_none_match, esperado):
+    assert corresponde(if_none_match, 'W/"abc"') is esperado
+
+
+def test_wishlist_responde_304_sem_consultar(test_client, override_get_db, override_auth, jogador, monkeypatch):
+    primeira = test_client.get("/api/v1/wishlist")
+    etag = primeira.headers["ETag"]
+    assert primeira.status_code == 200
+    assert etag.startswith('W/"')
+    assert primeira.headers["Cache-Control"] == REVALIDAR
+
+    def _nao_consultar(*args, **kwargs):
+        raise AssertionError("a consulta principal não deveria rodar")
+
+    monkeypatch.setattr(crud_wishlist, "get_wishlist", _nao_consultar)
+    segunda = test_client.get("/api/v1/wishlist", headers={"If-None-Match": etag})
+
+    assert segunda.status_code == 304
+    assert segunda.content == b""
+    assert segunda.headers["ETag"] == etag
+
+
+def test_escrita_muda_o_etag(test_client, db_session, override_get_db, override_auth, jogador):
+    etag = test_client.get("/api/v1/wishlist").headers["ETag"]
+
+    jogador.wishlist.prioridade = "baixa"
+    db_session.commit()
+    resposta = test_client.get("/api/v1/wishlist", headers={"If-None-Match": etag})
+
+    assert resposta.status_code == 200
+    assert resposta.headers["ETag"] != etag
+    assert resposta.json()[0]["prioridade"] == "baixa"
+
+    # Escritas em outras tabelas não invalidam a wishlist
+    db_session.add(Jogador(nome="Outro"))
+    db_session.commit()
+    assert test_client.get("/api/v1/wishlist", headers={"If-None-Match": resposta.headers["ETag"]}).status_code == 304
+
+
+def test_etag_da_listagem_e_do_detalhe(test_client, override_get_db, override_auth, jogador):
+    for caminho in ("/api/v1/jogadores", f"/api/v1/jogadores/{jogador.id_jogador}",
+                    f"/api/v1/avaliacoes/jogador/{jogador.id_jogador}"):
+        etag = test_client.get(caminho).headers["ETag"]
+        assert test_client.get(caminho, headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_stats_com_cache_curto(test_client, override_get_db, override_auth, jogador):
+    resposta = test_client.get("/api/v1/stats/dashboard")
+
+    assert resposta.status_code == 200
+    assert resposta.headers["Cache-Control"] == AGREGADOS
+    assert test_client.get(
+        "/api/v1/stats/dashboard", headers={"If-None-Match": resposta.headers["ETag"]}
+    ).status_code == 304
+
+
+def test_sem_autenticacao_nao_responde_304(test_client, override_get_db, jogador):
+    assert test_client.get("/api/v1/wishlist", headers={"If-None-Match": "*"}).status_code in (401, 403)
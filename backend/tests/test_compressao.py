@@ -0,0 +1,107 @@
+"""
+Testes do middleware de compressão (gzip/brotli)
+"""
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compressao import CompressaoMiddleware, _aceitas
+from app.models.jogador import Jogador
+
+GRANDE = "Estêvão Willian " * 200
+
+
+@pytest.fixture
+def cliente():
+    """App mínima com o middleware, para observar os bytes enviados"""
+    app = FastAPI()
+    app.add_middleware(CompressaoMiddleware, minimo=500, usar_brotli=False)
+
+    @app.get("/texto/{tamanho}")
+    def texto(tamanho: int):
+        return PlainTextResponse("x" * tamanho)
+
+    @app.get("/foto")
+    def foto():
+        return Response(b"\xff\xd8" + b"\x00" * 4000, media_type="image/jpeg")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((f"linha {i}\n" * 50 for i in range(5)), media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+
+def _bruto(cliente, caminho, accept_encoding="gzip"):
+    """Resposta sem a descompressão automática do cliente HTTP"""
+    with cliente.stream("GET", caminho, headers={"Accept-Encoding": accept_encoding}) as resposta:
+        return resposta, b"".join(resposta.iter_raw())
+
+
+@pytest.mark.parametrize("cabecalho,esperado", [
+    ("gzip, deflate, br", ["gzip", "deflate", "br"]),
+    ("br;q=0, gzip;q=0.8", ["gzip"]),
+    ("identity", ["identity"]),
+    ("", [""]),
+])
+def test_aceitas(cabecalho, esperado):
+    assert _aceitas(cabecalho) == esperado
+
+
+def test_comprime_acima_do_minimo(cliente):
+    resposta, corpo = _bruto(cliente, "/texto/5000")
+
+    assert resposta.headers["Content-Encoding"] == "gzip"
+    assert resposta.headers["Vary"] == "Accept-Encoding"
+    assert int(resposta.headers["Content-Length"]) == len(corpo) < 5000
+    assert gzip.decompress(corpo) == b"x" * 5000
+
+
+def test_resposta_pequena_ou_sem_gzip_vai_intacta(cliente):
+    resposta, corpo = _bruto(cliente, "/texto/100")
+    assert "Content-Encoding" not in resposta.headers
+    assert corpo == b"x" * 100
+
+    resposta, corpo = _bruto(cliente, "/texto/5000", accept_encoding="identity")
+    assert "Content-Encoding" not in resposta.headers
+    assert len(corpo) == 5000
+
+
+def test_midia_ja_comprimida_nao_e_recomprimida(cliente):
+    resposta, corpo = _bruto(cliente, "/foto")
+
+    assert "Content-Encoding" not in resposta.headers
+    assert corpo.startswith(b"\xff\xd8") and len(corpo) == 4002
+
+
+def test_streaming_comprimido_em_pedacos(cliente):
+    resposta, corpo = _bruto(cliente, "/stream")
+
+    assert resposta.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in resposta.headers
+    assert gzip.decompress(corpo).decode() == "".join(f"linha {i}\n" * 50 for i in range(5))
+
+
+def test_brotli_quando_instalado():
+    brotli = pytest.importorskip("brotli")
+    app = FastAPI()
+    app.add_middleware(CompressaoMiddleware, minimo=10)
+    app.get("/")(lambda: PlainTextResponse(GRANDE))
+
+    with TestClient(app).stream("GET", "/", headers={"Accept-Encoding": "gzip, br"}) as resposta:
+        assert resposta.headers["Content-Encoding"] == "br"
+        assert brotli.decompress(b"".join(resposta.iter_raw())).decode() == GRANDE
+
+
+def test_listagem_de_jogadores_comprimida(test_client, db_session, override_get_db, override_auth):
+    db_session.add_all([Jogador(nome=f"Jogador {i}", nacionalidade="Brasil") for i in range(30)])
+    db_session.commit()
+
+    resposta = test_client.get("/api/v1/jogadores", headers={"Accept-Encoding": "gzip"})
+
+    assert resposta.status_code == 200
+    assert resposta.headers["Content-Encoding"] == "gzip"
+    assert len(resposta.json()["data"]) == 30
@@ -0,0 +1,72 @@
+"""
+Testes da exportação em streaming (/export)
+"""
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+
+from app.models.avaliacao import Avaliacao
+from app.models.jogador import Jogador
+from app.models.vinculo import VinculoClube
+from app.services import exportacao
+
+
+@pytest.fixture
+def dados(db_session):
+    for i, (nome, clube) in enumerate([("Endrick", "Palmeiras"), ("Estêvão", "Palmeiras"), ("Vitor Roque", "Barcelona")]):
+        jogador = Jogador(nome=nome, idade_atual=18 + i, nacionalidade="Brasil")
+        jogador.vinculos.append(VinculoClube(clube=clube, posicao="ATA"))
+        jogador.avaliacoes.append(Avaliacao(
+            data_avaliacao=date(2026, 1, 1 + i), nota_potencial=4.5,
+            nota_tatico=4.0, nota_tecnico=4.0, nota_fisico=4.0, nota_mental=4.0,
+        ))
+        db_session.add(jogador)
+    db_session.commit()
+
+
+def test_exporta_jogadores_csv_com_filtros(test_client, override_get_db, override_auth, dados):
+    response = test_client.get("/api/v1/export/jogadores?clube=palmeiras")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+    linhas = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(l["nome"], l["clube"], l["total_avaliacoes"]) for l in linhas] == [
+        ("Endrick", "Palmeiras", "1"), ("Estêvão", "Palmeiras", "1"),
+    ]
+
+
+def test_exporta_avaliacoes_ndjson(test_client, override_get_db, override_auth, dados):
+    response = test_client.get("/api/v1/export/avaliacoes?formato=ndjson&desde=2026-01-02")
+
+    assert response.status_code == 200
+    linhas = [json.loads(linha) for linha in response.text.splitlines()]
+    assert [(l["nome_jogador"], l["data_avaliacao"]) for l in linhas] == [
+        ("Estêvão", "2026-01-02"), ("Vitor Roque", "2026-01-03"),
+    ]
+    assert linhas[0]["nota_potencial"] == 4.5
+
+
+def test_exporta_parquet_em_row_groups(test_client, override_get_db, override_auth, dados, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(exportacao, "TAMANHO_LOTE", 2)
+
+    response = test_client.get("/api/v1/export/jogadores?formato=parquet")
+
+    assert response.status_code == 200
+    arquivo = pq.ParquetFile(io.BytesIO(response.content))
+    assert arquivo.metadata.num_row_groups == 2
+    tabela = arquivo.read()
+    assert tabela.column("nome").to_pylist() == ["Endrick", "Estêvão", "Vitor Roque"]
+    assert tabela.column("media_geral").to_pylist() == [4.0, 4.0, 4.0]
+
+
+def test_exportacao_vazia(test_client, override_get_db, override_auth, db_session):
+    response = test_client.get("/api/v1/export/avaliacoes")
+
+    assert response.status_code == 200
+    assert response.text.strip().startswith("id,id_jogador,data_avaliacao")
+    assert len(response.text.strip().splitlines()) == 1
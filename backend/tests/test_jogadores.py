@@ -0,0 +1,229 @@
+"""
+Testes da listagem de jogadores (paginação por offset e por cursor)
+"""
+import pytest
+
+from app.models.jogador import Jogador
+from app.utils.cursor import encode_cursor, decode_cursor
+
+
+@pytest.fixture
+def jogadores(db_session):
+    """Cria jogadores com nomes repetidos para exercitar o desempate por id"""
+    nomes = ["Bruno", "Ana", "Carlos", "Ana", "Diego", "Bruno", "Eduardo"]
+    objs = [Jogador(nome=nome) for nome in nomes]
+    db_session.add_all(objs)
+    db_session.commit()
+    return objs
+
+
+def test_cursor_roundtrip():
+    """Cursor preserva nome (com acentos) e id"""
+    token = encode_cursor("João Neves", 126)
+    assert decode_cursor(token, size=2) == ("João Neves", 126)
+
+
+@pytest.mark.parametrize("token", ["%%%", "bm90LWpzb24", encode_cursor("so-nome")])
+def test_cursor_invalido(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token, size=2)
+
+
+def test_listar_jogadores_cursor_percorre_todos(test_client, override_get_db, override_auth, jogadores):
+    """Seguindo next_cursor obtém-se todos os jogadores, sem repetição, na ordem (nome, id)"""
+    vistos = []
+    params = {"limit": 3}
+    while True:
+        response = test_client.get("/api/v1/jogadores", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        vistos.extend((j["nome"], j["id_jogador"]) for j in body["data"])
+        if not body["next_cursor"]:
+            break
+        params = {"limit": 3, "cursor": body["next_cursor"]}
+
+    esperado = sorted((j.nome, j.id_jogador) for j in jogadores)
+    assert vistos == esperado
+
+
+def test_listar_jogadores_varios_vinculos(test_client, db_session, override_get_db, override_auth):
+    """Jogador com dois vínculos aparece uma vez (vínculo atual) e o total conta jogadores"""
+    from app.models.vinculo import VinculoClube
+
+    ana, bia, caio = (Jogador(nome=nome) for nome in ("Ana", "Bia", "Caio"))
+    db_session.add_all([ana, bia, caio])
+    db_session.flush()
+    db_session.add_all([
+        VinculoClube(id_jogador=bia.id_jogador, clube="Santos", posicao="ATA"),
+        VinculoClube(id_jogador=bia.id_jogador, clube="Emprestimo", posicao="ATA"),
+    ])
+    db_session.commit()
+
+    pagina = test_client.get("/api/v1/jogadores", params={"limit": 2}).json()
+    assert pagina["total"] == 3
+    assert [(j["nome"], j["clube"]) for j in pagina["data"]] == [("Ana", None), ("Bia", "Santos")]
+
+    resto = test_client.get("/api/v1/jogadores", params={"limit": 2, "cursor": pagina["next_cursor"]}).json()
+    assert [j["nome"] for j in resto["data"]] == ["Caio"]
+
+
+@pytest.mark.parametrize("cursor", [
+    "%%%",
+    encode_cursor(1, "x"),
+    encode_cursor(None, 2),
+    encode_cursor("Ana", True),
+    encode_cursor("Ana", 2.5),
+])
+def test_listar_jogadores_cursor_invalido(test_client, override_get_db, override_auth, cursor):
+    """Cursor malformado ou com tipos adulterados é 400, não 500 no banco"""
+    response = test_client.get("/api/v1/jogadores", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+@pytest.fixture
+def jogadores_com_vinculo(db_session):
+    """Jogadores com vínculo e avaliações para exercitar os filtros"""
+    from datetime import date
+    from app.models.avaliacao import Avaliacao
+    from app.models.vinculo import VinculoClube
+
+    dados = [
+        ("Endrick", 17, "Brasil", "Real Madrid", "La Liga", "ATA", 4.5),
+        ("Vitor Roque", 19, "Brasil", "Palmeiras", "Brasileirão", "ATA", 3.5),
+        ("João Neves", 19, "Portugal", "PSG", "Ligue 1", "MC", 4.0),
+        ("Leny Yoro", 18, "França", "Man United", "Premier League", "ZAG", None),
+    ]
+    for nome, idade, nacionalidade, clube, liga, posicao, media in dados:
+        jogador = Jogador(nome=nome, idade_atual=idade, nacionalidade=nacionalidade)
+        jogador.vinculos.append(VinculoClube(clube=clube, liga_clube=liga, posicao=posicao))
+        if media is not None:
+            jogador.avaliacoes.append(Avaliacao(
+                data_avaliacao=date(2026, 1, 1),
+                nota_tatico=media, nota_tecnico=media, nota_fisico=media, nota_mental=media,
+            ))
+        db_session.add(jogador)
+    db_session.commit()
+
+
+@pytest.mark.parametrize("params, esperados", [
+    ({"posicao": "ATA"}, ["Endrick", "Vitor Roque"]),
+    ({"nacionalidade": "brasil", "idade_max": 18}, ["Endrick"]),
+    ({"liga": "liga"}, ["Endrick"]),
+    ({"clube": "ps"}, ["João Neves"]),
+    ({"idade_min": 18, "idade_max": 19}, ["João Neves", "Leny Yoro", "Vitor Roque"]),
+    ({"media_min": 4.0}, ["Endrick", "João Neves"]),
+    ({"nome": "o", "media_min": 3.0}, ["João Neves", "Vitor Roque"]),
+])
+def test_listar_jogadores_filtros(test_client, override_get_db, override_auth, jogadores_com_vinculo,
+                                  params, esperados):
+    """Filtros são aplicados no banco e o total reflete o resultado filtrado"""
+    response = test_client.get("/api/v1/jogadores", params=params)
+    assert response.status_code == 200
+    body = response.json()
+    assert [j["nome"] for j in body["data"]] == esperados
+    assert body["total"] == len(esperados)
+
+
+def test_listar_jogadores_total_independe_da_pagina(test_client, override_get_db, override_auth,
+                                                   jogadores_com_vinculo):
+    response = test_client.get("/api/v1/jogadores", params={"limit": 1, "skip": 1})
+    body = response.json()
+    assert len(body["data"]) == 1
+    assert body["total"] == 4
+
+    response = test_client.get("/api/v1/jogadores", params={"limit": 1, "skip": 10})
+    assert response.json()["total"] == 4
+
+
+@pytest.mark.parametrize("q, primeiro", [
+    ("endr", "Endrick"),
+    ("JOAO", "João Neves"),
+    ("palmeiras", "Vitor Roque"),
+    ("franca", "Leny Yoro"),
+])
+def test_search_jogadores(test_client, override_get_db, override_auth, jogadores_com_vinculo, q, primeiro):
+    """Busca ignora acentos/maiúsculas e aceita prefixos de nome, clube e nacionalidade"""
+    response = test_client.get("/api/v1/jogadores/search", params={"q": q})
+    assert response.status_code == 200
+    resultados = response.json()
+    assert resultados[0]["nome"] == primeiro
+    assert all(r["score"] > 0 for r in resultados)
+
+
+def test_search_jogadores_reflete_atualizacoes(test_client, db_session, override_get_db, override_auth,
+                                               jogadores_com_vinculo):
+    """Índice FTS acompanha alterações em jogadores e vínculos"""
+    endrick = db_session.query(Jogador).filter(Jogador.nome == "Endrick").one()
+    endrick.vinculos[0].clube = "Lyon"
+    db_session.commit()
+
+    nomes = [r["nome"] for r in test_client.get("/api/v1/jogadores/search", params={"q": "lyon"}).json()]
+    assert nomes == ["Endrick"]
+
+    db_session.delete(endrick)
+    db_session.commit()
+    assert test_client.get("/api/v1/jogadores/search", params={"q": "endrick"}).json() == []
+
+
+@pytest.fixture
+def jogadores_com_tags(db_session, jogadores_com_vinculo):
+    """Endrick: tags 1 e 2; Vitor Roque: tag 1; João Neves: tag 2"""
+    from app.models.tag import Tag, JogadorTag
+
+    db_session.add_all([Tag(id_tag=1, nome="Promessa"), Tag(id_tag=2, nome="Titular")])
+    ids = {j.nome: j.id_jogador for j in db_session.query(Jogador)}
+    for nome, id_tag in [("Endrick", 1), ("Endrick", 2), ("Vitor Roque", 1), ("João Neves", 2)]:
+        db_session.add(JogadorTag(id_jogador=ids[nome], id_tag=id_tag))
+    db_session.commit()
+
+
+@pytest.mark.parametrize("filtros, esperados", [
+    ({"posicoes": ["ATA", "ZAG"]}, ["Endrick", "Leny Yoro", "Vitor Roque"]),
+    ({"clubes": ["PSG"], "nacionalidades": ["Portugal"]}, ["João Neves"]),
+    ({"tags": [1, 2]}, ["Endrick", "João Neves", "Vitor Roque"]),
+    ({"tags": [1, 2], "tags_modo": "todas"}, ["Endrick"]),
+    ({"tags": [1], "media_min": 4.0}, ["Endrick"]),
+    ({"idade_min": 18, "media_min": 3.5}, ["João Neves", "Vitor Roque"]),
+])
+def test_busca_avancada(test_client, override_get_db, override_auth, jogadores_com_tags,
+                        filtros, esperados):
+    """Todos os filtros no banco, sem duplicar jogadores com várias tags"""
+    response = test_client.post("/api/v1/jogadores/busca-avancada", json=filtros)
+    assert response.status_code == 200
+    body = response.json()
+    assert [j["nome"] for j in body["data"]] == esperados
+    assert body["total"] == len(esperados)
+
+
+def test_busca_avancada_mesma_semantica_do_dashboard(test_client, db_session, override_get_db, override_auth):
+    """Média mínima pela última avaliação; clube em qualquer vínculo do jogador"""
+    from datetime import date
+    from app.models.avaliacao import Avaliacao
+    from app.models.vinculo import VinculoClube
+
+    caiu, subiu = Jogador(nome="Caiu"), Jogador(nome="Subiu")
+    db_session.add_all([caiu, subiu])
+    db_session.flush()
+    for jogador, notas in [(caiu, (5, 2)), (subiu, (2, 4))]:
+        for dia, nota in enumerate(notas, 1):
+            db_session.add(Avaliacao(
+                id_jogador=jogador.id_jogador, data_avaliacao=date(2025, 1, dia),
+                nota_tatico=nota, nota_tecnico=nota, nota_fisico=nota, nota_mental=nota,
+            ))
+    db_session.add_all([
+        VinculoClube(id_jogador=caiu.id_jogador, clube="Santos", posicao="ATA"),
+        VinculoClube(id_jogador=caiu.id_jogador, clube="Emprestimo", posicao="MC"),
+    ])
+    db_session.commit()
+
+    def nomes(filtros):
+        return [j["nome"] for j in test_client.post("/api/v1/jogadores/busca-avancada", json=filtros).json()["data"]]
+
+    assert nomes({"media_min": 3.5}) == ["Subiu"]
+    assert nomes({"clubes": ["Emprestimo"]}) == ["Caiu"]
+    assert nomes({"clubes": ["Emprestimo"], "posicoes": ["ATA"]}) == []
+
+
+def test_busca_avancada_tags_modo_invalido(test_client, override_get_db, override_auth):
+    response = test_client.post("/api/v1/jogadores/busca-avancada", json={"tags_modo": "nenhuma"})
+    assert response.status_code == 422
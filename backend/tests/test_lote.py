@@ -0,0 +1,107 @@
+"""
+Testes dos endpoints de gravação em lote (/bulk)
+"""
+from datetime import date
+
+import pytest
+
+from app.models.avaliacao import Avaliacao
+from app.models.jogador import Jogador
+from app.models.vinculo import VinculoClube
+
+
+@pytest.fixture
+def elenco(db_session):
+    jogadores = [Jogador(nome=f"Jogador {i}", transfermarkt_id=str(1000 + i)) for i in range(3)]
+    db_session.add_all(jogadores)
+    db_session.commit()
+    return jogadores
+
+
+def test_jogadores_upsert_por_transfermarkt_id(test_client, db_session, override_get_db, override_auth, elenco):
+    response = test_client.post("/api/v1/jogadores/bulk", json=[
+        {"nome": "Renomeado", "transfermarkt_id": "1000", "idade_atual": 19},
+        {"nome": "Novo com TM", "transfermarkt_id": "2000"},
+        {"nome": "Novo sem TM"},
+        {"nome": "Por id", "id_jogador": elenco[1].id_jogador},
+        {"nome": "Id inexistente", "id_jogador": 999},
+        {"nome": "TM repetido", "transfermarkt_id": "2000"},
+    ])
+
+    assert response.status_code == 200
+    corpo = response.json()
+    assert [item["status"] for item in corpo["itens"]] == [
+        "atualizado", "criado", "criado", "atualizado", "erro", "erro"
+    ]
+    assert (corpo["criados"], corpo["atualizados"], corpo["erros"]) == (2, 2, 2)
+    assert corpo["itens"][0]["id"] == elenco[0].id_jogador
+    assert corpo["itens"][4]["erro"] == "Jogador não encontrado"
+
+    db_session.expire_all()
+    assert db_session.get(Jogador, elenco[0].id_jogador).nome == "Renomeado"
+    assert db_session.get(Jogador, elenco[1].id_jogador).nome == "Por id"
+    assert db_session.get(Jogador, corpo["itens"][2]["id"]).nome == "Novo sem TM"
+    assert db_session.query(Jogador).count() == 5
+
+
+def test_avaliacoes_do_elenco_em_uma_requisicao(test_client, db_session, override_get_db, override_auth, elenco):
+    itens = [
+        {"id_jogador": jogador.id_jogador, "data_avaliacao": "2026-10-12", "nota_potencial": 4.26,
+         "nota_tatico": 4, "nota_tecnico": 3.5, "nota_fisico": 4, "nota_mental": 4.5, "avaliador": "Caio"}
+        for jogador in elenco
+    ] + [{"id_jogador": 999, "data_avaliacao": "2026-10-12"}]
+
+    response = test_client.post("/api/v1/avaliacoes/bulk", json=itens)
+
+    assert response.status_code == 200
+    corpo = response.json()
+    assert [item["status"] for item in corpo["itens"]] == ["criado", "criado", "criado", "erro"]
+
+    avaliacoes = db_session.query(Avaliacao).order_by(Avaliacao.id).all()
+    assert [av.id for av in avaliacoes] == [item["id"] for item in corpo["itens"][:3]]
+    assert [av.id_jogador for av in avaliacoes] == [jogador.id_jogador for jogador in elenco]
+    assert float(avaliacoes[0].nota_potencial) == 4.3
+
+    # Reenvio com id: atualiza em vez de duplicar
+    response = test_client.post("/api/v1/avaliacoes/bulk", json=[
+        {**itens[0], "id": avaliacoes[0].id, "nota_mental": 2, "observacoes": "Revisada"}
+    ])
+    assert response.json()["itens"][0]["status"] == "atualizado"
+    db_session.expire_all()
+    assert db_session.query(Avaliacao).count() == 3
+    assert db_session.get(Avaliacao, avaliacoes[0].id).observacoes == "Revisada"
+
+
+def test_vinculos_bulk(test_client, db_session, override_get_db, override_auth, elenco):
+    vinculo = VinculoClube(id_jogador=elenco[0].id_jogador, clube="Santos", posicao="ATA")
+    db_session.add(vinculo)
+    db_session.commit()
+
+    response = test_client.post("/api/v1/vinculos/bulk", json=[
+        {"id_vinculo": vinculo.id_vinculo, "id_jogador": elenco[0].id_jogador, "clube": "Palmeiras",
+         "posicao": "ATA", "data_fim_contrato": "2027-12-31"},
+        {"id_jogador": elenco[1].id_jogador, "clube": "Flamengo", "posicao": "MC"},
+    ])
+
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()["itens"]] == ["atualizado", "criado"]
+    db_session.expire_all()
+    assert db_session.get(VinculoClube, vinculo.id_vinculo).data_fim_contrato == date(2027, 12, 31)
+    assert db_session.query(VinculoClube).count() == 2
+
+
+def test_conflito_desfaz_o_lote(test_client, db_session, override_get_db, override_auth, elenco):
+    # Atualização por id para um transfermarkt_id de outro jogador viola a unicidade
+    response = test_client.post("/api/v1/jogadores/bulk", json=[
+        {"nome": "Novo"},
+        {"nome": "Conflito", "id_jogador": elenco[0].id_jogador, "transfermarkt_id": "1001"},
+    ])
+
+    assert response.status_code == 409
+    assert db_session.query(Jogador).count() == 3
+
+
+def test_lote_vazio_ou_grande_demais(test_client, override_get_db, override_auth):
+    assert test_client.post("/api/v1/vinculos/bulk", json=[]).status_code == 422
+    itens = [{"id_jogador": 1, "posicao": "ATA"}] * 1001
+    assert test_client.post("/api/v1/vinculos/bulk", json=itens).status_code == 422
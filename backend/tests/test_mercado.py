@@ -0,0 +1,67 @@
+"""
+Testes das oportunidades de mercado
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.avaliacao import Avaliacao
+from app.models.jogador import Jogador
+from app.models.vinculo import VinculoClube
+
+
+@pytest.fixture
+def mercado(db_session):
+    hoje = date.today()
+    dados = [
+        # nome, idade, fim de contrato, status, notas (da mais antiga para a mais recente)
+        ("Endrick", 18, hoje + timedelta(days=90), "Vigente", [3.0, 4.5]),
+        ("Vitor Roque", 19, hoje + timedelta(days=900), "Vigente", [4.5, 3.0]),
+        ("Veterano", 34, None, "Livre", []),
+        ("Vencido", 25, hoje - timedelta(days=10), "Vencido", []),
+    ]
+    for nome, idade, fim, status_contrato, notas in dados:
+        jogador = Jogador(nome=nome, idade_atual=idade)
+        jogador.vinculos.append(VinculoClube(
+            clube="Clube", posicao="ATA", data_fim_contrato=fim, status_contrato=status_contrato
+        ))
+        for dias, nota in enumerate(notas):
+            jogador.avaliacoes.append(Avaliacao(
+                data_avaliacao=date(2026, 1, 1) + timedelta(days=dias),
+                nota_tatico=nota, nota_tecnico=nota, nota_fisico=nota, nota_mental=nota,
+            ))
+        db_session.add(jogador)
+    db_session.commit()
+
+
+def test_oportunidades(test_client, override_get_db, override_auth, mercado):
+    response = test_client.get("/api/v1/mercado/oportunidades")
+    assert response.status_code == 200
+    body = response.json()
+
+    assert [(o["tipo"], o["nome"]) for o in body] == [
+        ("jovem", "Endrick"),  # última avaliação 4.5 (Vitor Roque caiu para 3.0)
+        ("contrato", "Endrick"),
+        ("livre", "Veterano"),
+    ]
+    assert body[1]["dias_restantes"] == 90
+
+
+def test_oportunidades_regras_configuraveis(test_client, override_get_db, override_auth, mercado):
+    params = {"media_min_jovem": 3.0, "dias_contrato": 30, "idade_max": 30}
+    response = test_client.get("/api/v1/mercado/oportunidades", params=params)
+
+    assert [(o["tipo"], o["nome"]) for o in response.json()] == [
+        ("jovem", "Endrick"),
+        ("jovem", "Vitor Roque"),
+    ]
+
+
+def test_oportunidades_recalcula_apos_escrita(test_client, db_session, override_get_db, override_auth, mercado):
+    assert len(test_client.get("/api/v1/mercado/oportunidades").json()) == 3
+
+    veterano = db_session.query(VinculoClube).filter_by(status_contrato="Livre").one()
+    veterano.status_contrato = "Vigente"
+    db_session.commit()
+
+    assert len(test_client.get("/api/v1/mercado/oportunidades").json()) == 2
@@ -0,0 +1,100 @@
+"""
+Testes do roteamento de leituras para a réplica (dois bancos SQLite)
+"""
+import pytest
+from sqlalchemy import create_engine, func
+
+from app.core import database
+from app.core.database import Base, MonitorReplica, SessaoLeitura, get_db
+from app.main import app
+from app.models.dashboard import ResumoDashboard
+from app.models.jogador import Jogador
+
+
+def _engine(caminho):
+    engine = create_engine(f"sqlite:///{caminho}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def bancos(tmp_path):
+    """Primário e réplica com conteúdos diferentes para saber quem respondeu"""
+    primario, replica = _engine(tmp_path / "primario.db"), _engine(tmp_path / "replica.db")
+    with SessaoLeitura(bind=primario) as db:
+        db.add(Jogador(nome="No primário"))
+        db.commit()
+    with SessaoLeitura(bind=replica) as db:
+        db.add_all([Jogador(nome="Na réplica"), Jogador(nome="Também na réplica")])
+        db.commit()
+    yield primario, replica
+    primario.dispose()
+    replica.dispose()
+
+
+def _nomes(db):
+    return sorted(nome for (nome,) in db.query(Jogador.nome))
+
+
+def test_leituras_na_replica_escritas_no_primario(bancos):
+    primario, replica = bancos
+    with SessaoLeitura(bind=primario, replica=replica) as db:
+        assert _nomes(db) == ["Na réplica", "Também na réplica"]
+
+        db.add(Jogador(nome="Novo"))
+        db.commit()
+
+        # Depois de escrever, a sessão lê do primário (enxerga a própria escrita)
+        assert _nomes(db) == ["No primário", "Novo"]
+
+    with SessaoLeitura(bind=replica) as db:
+        assert db.query(func.count(Jogador.id_jogador)).scalar() == 2
+
+
+def test_sem_replica_usa_o_primario(bancos):
+    primario, _ = bancos
+    with SessaoLeitura(bind=primario, replica=None) as db:
+        assert _nomes(db) == ["No primário"]
+
+
+def test_monitor_volta_ao_primario_com_atraso(bancos, monkeypatch):
+    _, replica = bancos
+    atraso = {"segundos": 0.0}
+    monkeypatch.setattr(database, "medir_atraso", lambda conn: atraso["segundos"])
+
+    monitor = MonitorReplica(replica, atraso_maximo=5, intervalo=0)
+    assert monitor.disponivel() is True
+
+    atraso["segundos"] = 30.0
+    assert monitor.disponivel() is False
+
+    # Dentro do intervalo o último resultado é reaproveitado
+    monitor.intervalo = 3600
+    atraso["segundos"] = 0.0
+    assert monitor.disponivel() is False
+
+
+def test_monitor_replica_fora_do_ar(tmp_path):
+    inacessivel = create_engine(f"sqlite:///{tmp_path / 'nao-existe' / 'replica.db'}")
+    assert MonitorReplica(inacessivel, atraso_maximo=5, intervalo=0).disponivel() is False
+
+
+def test_dashboard_calculado_na_replica_gravado_no_primario(test_client, override_auth, bancos):
+    primario, replica = bancos
+
+    def _get_db_roteada():
+        with SessaoLeitura(bind=primario, replica=replica) as db:
+            yield db
+
+    app.dependency_overrides[get_db] = _get_db_roteada
+    try:
+        response = test_client.get("/api/v1/stats/dashboard")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 200
+    assert response.json()["total_jogadores"] == 2  # dados da réplica
+    with SessaoLeitura(bind=primario) as db:
+        assert db.query(ResumoDashboard).count() == 5
+    with SessaoLeitura(bind=replica) as db:
+        assert db.query(ResumoDashboard).count() == 0
@@ -0,0 +1,75 @@
+"""
+Testes do caminho rápido de serialização (RespostaJSON + dicts das linhas)
+"""
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel
+
+from app.models.avaliacao import Avaliacao
+from app.models.jogador import Jogador
+from app.models.vinculo import VinculoClube
+from app.models.wishlist import Wishlist
+from app.schemas.avaliacao import AvaliacaoResponse
+from app.schemas.jogador import JogadorWithDetails
+from app.schemas.wishlist import WishlistResponse
+from app.utils.resposta import RespostaJSON
+
+
+@pytest.fixture
+def jogador(db_session):
+    jogador = Jogador(nome="Estêvão", nacionalidade="Brasil", idade_atual=18)
+    jogador.vinculos.append(VinculoClube(clube="Palmeiras", posicao="AD", data_fim_contrato=date(2027, 6, 30)))
+    jogador.avaliacoes.extend([
+        Avaliacao(data_avaliacao=date(2026, 1, 1), nota_potencial=4.5, nota_tatico=3.8,
+                  nota_tecnico=4.6, nota_fisico=3.2, nota_mental=4.1, avaliador="Caio"),
+        Avaliacao(data_avaliacao=date(2026, 3, 1), nota_tatico=4.0, observacoes="Evoluiu"),
+    ])
+    jogador.wishlist = Wishlist(prioridade="alta", observacao="Monitorar")
+    db_session.add(jogador)
+    db_session.commit()
+    return jogador
+
+
+class _Momento(BaseModel):
+    momento: datetime
+
+
+def test_resposta_json_igual_ao_pydantic():
+    momento = datetime(2026, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    corpo = json.loads(RespostaJSON({"momento": momento, "nota": Decimal("4.5")}).body)
+
+    assert corpo["momento"] == _Momento(momento=momento).model_dump(mode="json")["momento"]
+    assert corpo["nota"] == 4.5
+
+
+def test_listagem_de_jogadores_igual_ao_schema(test_client, override_get_db, override_auth, jogador):
+    response = test_client.get("/api/v1/jogadores")
+
+    assert response.status_code == 200
+    (item,) = response.json()["data"]
+    assert item == JogadorWithDetails.model_validate(item).model_dump(mode="json")
+    assert list(item) == list(JogadorWithDetails.model_fields)
+    assert item["em_wishlist"] is True
+    assert item["total_avaliacoes"] == 2
+    assert item["data_fim_contrato"] == "2027-06-30"
+
+
+def test_avaliacoes_iguais_ao_caminho_pydantic(test_client, db_session, override_get_db, override_auth, jogador):
+    response = test_client.get(f"/api/v1/avaliacoes/jogador/{jogador.id_jogador}")
+
+    avaliacoes = (
+        db_session.query(Avaliacao).filter(Avaliacao.id_jogador == jogador.id_jogador)
+        .order_by(Avaliacao.data_avaliacao.desc())
+    )
+    assert response.status_code == 200
+    assert response.json() == [AvaliacaoResponse.model_validate(av).model_dump(mode="json") for av in avaliacoes]
+
+
+def test_wishlist_igual_ao_caminho_pydantic(test_client, db_session, override_get_db, override_auth, jogador):
+    response = test_client.get("/api/v1/wishlist")
+
+    assert response.status_code == 200
+    assert response.json() == [WishlistResponse.model_validate(jogador.wishlist).model_dump(mode="json")]
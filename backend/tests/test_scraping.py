@@ -0,0 +1,270 @@
+"""
+Testes do motor de jobs de scraping e dos parsers do Transfermarkt
+"""
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.models.scraping_job import ScrapingJob
+from app.services import jobs, transfermarkt
+from tests.conftest import TestingSessionLocal
+
+# Liberado pelo teste para o job fake terminar
+liberar = threading.Event()
+
+
+@jobs.registrar_job("teste")
+def _job_teste(ctx: jobs.JobContext):
+    total = 5
+    for i in range(1, total + 1):
+        liberar.wait(timeout=5)
+        if i == 2:
+            ctx.erro("item 2 sem foto")
+        ctx.checkpoint(i, total, f"Item {i}/{total}")
+        time.sleep(0.02)
+
+
+execucoes = []
+
+
+@jobs.registrar_job("teste_contagem")
+def _job_contagem(ctx: jobs.JobContext):
+    execucoes.append(ctx.job.id)
+    liberar.wait(timeout=5)
+
+
+@jobs.registrar_job("teste_falha")
+def _job_falha(ctx: jobs.JobContext):
+    raise RuntimeError("Transfermarkt fora do ar")
+
+
+@pytest.fixture
+def motor(db_session, override_get_db, override_auth, monkeypatch):
+    """Jobs usando o banco de testes, com progresso gravado a cada item"""
+    monkeypatch.setattr(jobs, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(settings, "SCRAPING_PROGRESS_INTERVAL", 0)
+    liberar.clear()
+    yield
+    liberar.set()
+    jobs.shutdown(wait=True)
+
+
+def _aguardar_status(client, db_session, task_id, status, timeout=5.0):
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        db_session.expire_all()  # o job é atualizado pela sessão do worker
+        dados = client.get(f"/api/v1/scraping/status/{task_id}").json()
+        if dados["status"] == status:
+            return dados
+        time.sleep(0.02)
+    raise AssertionError(f"Job não chegou em '{status}': {dados}")
+
+
+def test_job_completo_persiste_status(test_client, db_session, motor):
+    liberar.set()
+    job = jobs.submit_job(db_session, "teste", criado_por="admin")
+
+    dados = _aguardar_status(test_client, db_session, job.id, "completed")
+
+    assert dados["progress"] == 100
+    assert dados["processed_items"] == dados["total_items"] == 5
+    assert dados["errors"] == ["item 2 sem foto"]
+    assert dados["completed_at"] is not None
+
+
+def test_job_com_erro_fica_failed(test_client, db_session, motor):
+    job = jobs.submit_job(db_session, "teste_falha")
+
+    dados = _aguardar_status(test_client, db_session, job.id, "failed")
+
+    assert dados["errors"] == ["Transfermarkt fora do ar"]
+
+
+def test_cancelamento_cooperativo(test_client, db_session, motor):
+    job = jobs.submit_job(db_session, "teste")
+    _aguardar_status(test_client, db_session, job.id, "running")
+
+    response = test_client.post(f"/api/v1/scraping/cancel/{job.id}")
+    assert response.status_code == 200
+    liberar.set()
+
+    dados = _aguardar_status(test_client, db_session, job.id, "cancelled")
+    assert dados["processed_items"] < 5
+    assert dados["cancel_requested"] is True
+
+
+def test_cancelar_job_pendente(test_client, db_session, motor, monkeypatch):
+    # Sem worker livre: o job fica pendente e é cancelado na hora
+    monkeypatch.setattr(jobs, "_get_executor", lambda: type("Pool", (), {"submit": lambda *a: None})())
+    job = jobs.submit_job(db_session, "teste")
+
+    response = test_client.post(f"/api/v1/scraping/cancel/{job.id}")
+
+    assert response.json()["status"] == "cancelled"
+    assert db_session.get(ScrapingJob, job.id).status == "cancelled"
+
+
+def test_status_inexistente(test_client, motor):
+    response = test_client.get("/api/v1/scraping/status/nao-existe")
+    assert response.status_code == 404
+
+
+def test_endpoint_start_cria_job(test_client, db_session, motor, monkeypatch):
+    monkeypatch.setattr(jobs, "_get_executor", lambda: type("Pool", (), {"submit": lambda *a: None})())
+
+    response = test_client.post("/api/v1/scraping/photos/start")
+
+    assert response.status_code == 200
+    job = db_session.get(ScrapingJob, response.json()["task_id"])
+    assert (job.tipo, job.status, job.criado_por) == ("fotos", "pending", "admin")
+
+
+def _job_orfao(db_session, status, worker, heartbeat_ha=0, tipo="teste"):
+    job = ScrapingJob(
+        id=f"{status}-{worker}-{heartbeat_ha}", tipo=tipo, status=status, errors=[], worker=worker,
+        heartbeat_at=jobs._agora() - timedelta(seconds=heartbeat_ha),
+    )
+    db_session.add(job)
+    db_session.commit()
+    return job
+
+
+def _pid_encerrado():
+    processo = subprocess.Popen([sys.executable, "-c", "pass"])
+    processo.wait()
+    return processo.pid
+
+
+def test_recuperar_jobs_orfaos_no_startup(db_session, motor):
+    """Após um restart (mesmo host:pid), pendentes voltam à fila e os em execução falham"""
+    liberar.set()
+    outro_host = "outro-host:1"
+    pendente = _job_orfao(db_session, "pending", jobs._worker_id)
+    rodando = _job_orfao(db_session, "running", jobs._worker_id)
+    remoto_ativo = _job_orfao(db_session, "running", outro_host)
+    remoto_parado = _job_orfao(db_session, "running", outro_host, heartbeat_ha=settings.SCRAPING_STALE_AFTER + 1)
+
+    assert jobs.recuperar_jobs_orfaos(db_session) == {"reenfileirado": 1, "failed": 2}
+
+    jobs.shutdown(wait=True)
+    db_session.expire_all()
+    assert db_session.get(ScrapingJob, pendente.id).status == "completed"
+    assert db_session.get(ScrapingJob, rodando.id).status == "failed"
+    assert db_session.get(ScrapingJob, remoto_ativo.id).status == "running"
+    assert db_session.get(ScrapingJob, remoto_parado.id).status == "failed"
+
+
+def test_status_de_job_de_processo_encerrado(test_client, db_session, motor):
+    job = _job_orfao(db_session, "running", f"{socket.gethostname()}:{_pid_encerrado()}")
+
+    dados = test_client.get(f"/api/v1/scraping/status/{job.id}").json()
+
+    assert dados["status"] == "failed"
+
+
+def test_status_de_job_em_execucao_neste_processo(test_client, db_session, motor):
+    # Processo vivo: heartbeat antigo não basta para marcar o job como órfão
+    job = _job_orfao(db_session, "running", jobs._worker_id, heartbeat_ha=settings.SCRAPING_STALE_AFTER + 1)
+
+    assert test_client.get(f"/api/v1/scraping/status/{job.id}").json()["status"] == "running"
+
+
+def test_pendente_de_outro_host_parado_e_reenfileirado(db_session, motor):
+    """Deploy com hostname novo: pendente sem sinal de vida há SCRAPING_STALE_AFTER volta à fila"""
+    liberar.set()
+    parado = ScrapingJob(
+        id="parado", tipo="teste", status="pending", errors=[], worker="deploy-antigo:7",
+        started_at=jobs._agora() - timedelta(seconds=settings.SCRAPING_STALE_AFTER + 1),
+    )
+    recente = ScrapingJob(id="recente", tipo="teste", status="pending", errors=[], worker="outro-host:7")
+    db_session.add_all([parado, recente])
+    db_session.commit()
+
+    assert jobs.recuperar_jobs_orfaos(db_session) == {"reenfileirado": 1, "failed": 0}
+
+    jobs.shutdown(wait=True)
+    db_session.expire_all()
+    assert db_session.get(ScrapingJob, "parado").status == "completed"
+    assert db_session.get(ScrapingJob, "recente").status == "pending"
+
+
+def test_job_reenfileirado_por_dois_processos_executa_uma_vez(db_session, motor, monkeypatch):
+    """Dois workers do uvicorn recuperam o mesmo pendente: só um reivindica o job"""
+    execucoes.clear()
+    enfileirados = []
+    monkeypatch.setattr(jobs, "_get_executor", lambda: type("Pool", (), {"submit": lambda self, *a: enfileirados.append(a)})())
+    job = _job_orfao(db_session, "pending", jobs._worker_id, tipo="teste_contagem")
+    jobs.recuperar_jobs_orfaos(db_session)
+    jobs.recuperar_jobs_orfaos(db_session)
+    assert len(enfileirados) == 2
+
+    threads = [threading.Thread(target=funcao, args=args) for funcao, *args in enfileirados]
+    for thread in threads:
+        thread.start()
+    liberar.set()
+    for thread in threads:
+        thread.join()
+
+    assert execucoes == [job.id]
+    db_session.expire_all()
+    assert db_session.get(ScrapingJob, job.id).status == "completed"
+
+
+def test_job_com_cancelamento_pedido_nao_e_reivindicado(db_session, motor):
+    execucoes.clear()
+    job = _job_orfao(db_session, "pending", jobs._worker_id, tipo="teste_contagem")
+    job.cancel_requested = True
+    db_session.commit()
+
+    jobs._executar(job.id)
+
+    assert execucoes == []
+    db_session.expire_all()
+    assert db_session.get(ScrapingJob, job.id).status == "cancelled"
+
+
+# ============================================
+# PARSERS
+# ============================================
+
+HTML_PERFIL = """
+<div class="data-header__profile-container">
+  <img src="https://img.a.transfermarkt.technology/portrait/big/68290-1692601435.jpg?lm=1"
+       title="Jogador" class="data-header__profile-image">
+</div>
+<li class="data-header__label">Altura:
+  <span itemprop="height" class="data-header__content">1,85&nbsp;m</span>
+</li>
+<span class="info-table__content info-table__content--regular">Pé:</span>
+<span class="info-table__content info-table__content--bold">esquerdo</span>
+"""
+
+
+def test_extrair_dados_do_perfil():
+    assert transfermarkt.extrair_url_foto(HTML_PERFIL) == (
+        "https://img.a.transfermarkt.technology/portrait/big/68290-1692601435.jpg"
+    )
+    assert transfermarkt.extrair_altura(HTML_PERFIL) == 185
+    assert transfermarkt.extrair_pe_dominante(HTML_PERFIL) == "Esquerdo"
+
+
+def test_extrair_dados_ausentes():
+    assert transfermarkt.extrair_url_foto("<html></html>") is None
+    assert transfermarkt.extrair_altura("<html></html>") is None
+    assert transfermarkt.extrair_pe_dominante("<html></html>") is None
+
+
+@pytest.mark.parametrize("valor,esperado", [
+    ("https://www.transfermarkt.com.br/adriano/profil/spieler/1046580", "1046580"),
+    ("1046580", "1046580"),
+    ("", None),
+    ("sem-id", None),
+])
+def test_extrair_tm_id(valor, esperado):
+    assert transfermarkt.extrair_tm_id(valor) == esperado
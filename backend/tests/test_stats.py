@@ -0,0 +1,87 @@
+"""
+Testes do dashboard executivo (agregados materializados)
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.avaliacao import Avaliacao
+from app.models.dashboard import ResumoDashboard
+from app.models.jogador import Jogador
+from app.models.vinculo import VinculoClube
+from app.models.wishlist import Wishlist
+
+
+def _avaliacao(nota):
+    return Avaliacao(
+        data_avaliacao=date.today(), avaliador="Maria",
+        nota_potencial=nota, nota_tatico=nota, nota_tecnico=nota, nota_fisico=nota, nota_mental=nota,
+    )
+
+
+@pytest.fixture
+def elenco(db_session):
+    endrick = Jogador(nome="Endrick", idade_atual=18, transfermarkt_id="846653")
+    endrick.vinculos.append(VinculoClube(
+        clube="Real Madrid", posicao="ATA", data_fim_contrato=date.today() + timedelta(days=90)
+    ))
+    endrick.avaliacoes.append(_avaliacao(4.5))
+    endrick.wishlist = Wishlist(prioridade="alta", adicionado_por="Maria")
+
+    veterano = Jogador(nome="Veterano", idade_atual=33)
+    veterano.vinculos.append(VinculoClube(
+        clube="Santos", posicao="ZAG", data_fim_contrato=date.today() + timedelta(days=900)
+    ))
+    veterano.avaliacoes.append(_avaliacao(3.5))
+
+    db_session.add_all([endrick, veterano])
+    db_session.commit()
+    return endrick, veterano
+
+
+def test_dashboard_kpis(test_client, override_get_db, override_auth, elenco):
+    response = test_client.get("/api/v1/stats/dashboard")
+    assert response.status_code == 200
+    kpis = response.json()
+    assert kpis["total_jogadores"] == 2
+    assert kpis["media_geral"] == 4.0
+    assert kpis["medias_dimensao"]["tatico"] == 4.0
+    assert kpis["alertas_contrato"] == 1
+    assert kpis["wishlist_ativa"] == 1
+    assert {"posicao": "ATA", "count": 1} in kpis["distribuicao_posicao"]
+
+
+def test_dashboard_recalcula_apenas_secoes_afetadas(test_client, db_session, override_get_db, override_auth,
+                                                    elenco):
+    test_client.get("/api/v1/stats/dashboard")
+    calculado = {r.secao: r.calculado_em for r in db_session.query(ResumoDashboard)}
+
+    # Sem escritas: nada é recalculado
+    test_client.get("/api/v1/stats/dashboard")
+    db_session.expire_all()
+    assert {r.secao: r.calculado_em for r in db_session.query(ResumoDashboard)} == calculado
+
+    # Nova avaliação: só a seção de avaliações muda
+    _, veterano = elenco
+    veterano.avaliacoes.append(_avaliacao(1.0))
+    db_session.commit()
+
+    kpis = test_client.get("/api/v1/stats/dashboard").json()
+    assert kpis["media_geral"] == 3.0
+
+    db_session.expire_all()
+    recalculadas = {
+        r.secao for r in db_session.query(ResumoDashboard) if r.calculado_em != calculado[r.secao]
+    }
+    assert recalculadas == {"avaliacoes"}
+
+
+def test_top_prospects_e_atividade(test_client, override_get_db, override_auth, elenco):
+    prospects = test_client.get("/api/v1/stats/top-prospects").json()
+    assert [p["nome"] for p in prospects] == ["Endrick"]
+    assert prospects[0]["clube"] == "Real Madrid"
+    assert prospects[0]["media_geral"] == 4.5
+
+    feed = test_client.get("/api/v1/stats/activity-feed", params={"limit": 10}).json()
+    assert {e["tipo"] for e in feed} == {"avaliacao", "jogador_novo", "wishlist_add"}
+    assert [e["id"] for e in feed] == list(range(1, len(feed) + 1))
@@ -4,6 +4,8 @@ Suporta SQLite (desenvolvimento) e PostgreSQL (produção/Railway)"""
 import os
 import json
 import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
@@ -14,28 +16,14 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
 
+from src.database.busca_avancada import filtros_canonicos, montar_busca_avancada
+from src.utils.cache_tags import depende_de, invalidar
+
 load_dotenv()
 
 # --- FUNÇÕES DE CACHE (Fora da Classe para evitar erros de Hash) ---
 
-@st.cache_data(ttl=3600, show_spinner=False)
-def _cached_buscar_todos_jogadores(_engine):
-    """Cache de 1 hora para todos os jogadores"""
-    query = """
-    SELECT 
-        j.id_jogador, j.nome, j.nacionalidade, j.ano_nascimento, j.idade_atual, 
-        j.altura, j.pe_dominante, j.transfermarkt_id,
-        v.clube, v.liga_clube, v.posicao, v.data_fim_contrato, v.status_contrato
-    FROM jogadores j
-    LEFT JOIN vinculos_clubes v ON j.id_jogador = v.id_jogador
-    ORDER BY j.nome
-    """
-    try:
-        return pd.read_sql(text(query), _engine)
-    except Exception as e:
-        print(f"❌ Erro ao buscar jogadores: {e}")
-        return pd.DataFrame()
-
+@depende_de("avaliacoes")
 @st.cache_data(ttl=600, show_spinner=False)
 def _cached_buscar_avaliacoes(_engine, id_jogador: int):
     """Cache de 10 minutos para avaliações"""
@@ -53,6 +41,64 @@ def _cached_buscar_avaliacoes(_engine, id_jogador: int):
         print(f"❌ Erro ao buscar avaliações: {e}")
         return pd.DataFrame()
 
+COLUNAS_NOTAS = ['nota_potencial', 'nota_tatico', 'nota_tecnico', 'nota_fisico', 'nota_mental']
+
+@depende_de("jogadores", "vinculos_clubes", "avaliacoes", "jogador_tags")
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_busca_avancada(_engine, filtros_json: str):
+    """Cache da busca avançada pela forma canônica dos filtros (buscas salvas repetidas)"""
+    sql, params = montar_busca_avancada(json.loads(filtros_json))
+    with _engine.connect() as conn:
+        res = conn.execute(text(sql), params)
+        df = pd.DataFrame(res.fetchall(), columns=list(res.keys()))
+    # DECIMAL no PostgreSQL chega como Decimal
+    df['media_geral'] = pd.to_numeric(df['media_geral']).astype(float)
+    return df
+
+@depende_de("avaliacoes")
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_medias_jogadores(_engine):
+    """
+    Última avaliação e médias de TODOS os jogadores em uma consulta (window functions)
+
+    media: média dos 4 pilares da última avaliação
+    media_recente: média das 3 últimas avaliações
+    media_historica: média de todas as avaliações
+    """
+    query = """
+    SELECT
+        id_jogador, data_avaliacao AS data_ultima_avaliacao,
+        nota_potencial, nota_tatico, nota_tecnico, nota_fisico, nota_mental,
+        media_recente, media_historica, total_avaliacoes
+    FROM (
+        SELECT
+            a.*,
+            ROW_NUMBER() OVER w AS ordem,
+            AVG((nota_tatico + nota_tecnico + nota_fisico + nota_mental) / 4.0)
+                OVER (w ROWS BETWEEN CURRENT ROW AND 2 FOLLOWING) AS media_recente,
+            AVG((nota_tatico + nota_tecnico + nota_fisico + nota_mental) / 4.0)
+                OVER (PARTITION BY id_jogador) AS media_historica,
+            COUNT(*) OVER (PARTITION BY id_jogador) AS total_avaliacoes
+        FROM avaliacoes a
+        WINDOW w AS (PARTITION BY id_jogador ORDER BY data_avaliacao DESC, id DESC)
+    ) ultimas
+    WHERE ordem = 1
+    """
+    colunas = ['data_ultima_avaliacao', *COLUNAS_NOTAS, 'media', 'media_recente',
+               'media_historica', 'total_avaliacoes']
+    try:
+        df = pd.read_sql(text(query), _engine, index_col='id_jogador')
+    except Exception as e:
+        print(f"❌ Erro ao buscar médias: {e}")
+        return pd.DataFrame(columns=colunas, index=pd.Index([], name='id_jogador'))
+
+    # DECIMAL do PostgreSQL chega como Decimal
+    numericas = COLUNAS_NOTAS + ['media_recente', 'media_historica']
+    df[numericas] = df[numericas].astype(float)
+    df['media'] = df[['nota_tatico', 'nota_tecnico', 'nota_fisico', 'nota_mental']].sum(axis=1, min_count=4) / 4
+    return df[colunas]
+
+@depende_de("wishlist")
 @st.cache_data(ttl=300, show_spinner=False)
 def _cached_get_ids_wishlist(_engine):
     """Cache de 5 minutos - retorna SET com IDs da wishlist para lookup rápido"""
@@ -64,6 +110,7 @@ def _cached_get_ids_wishlist(_engine):
         print(f"❌ Erro ao buscar IDs wishlist: {e}")
         return set()
 
+@depende_de("alertas", "jogadores", "vinculos_clubes")
 @st.cache_data(ttl=600, show_spinner=False)
 def _cached_buscar_alertas(_engine):
     query = """
@@ -81,6 +128,7 @@ def _cached_buscar_alertas(_engine):
     except Exception:
         return pd.DataFrame()
 
+@depende_de("tags")
 @st.cache_data(ttl=300, show_spinner=False)
 def _cached_get_all_tags(_engine):
     try:
@@ -88,6 +136,7 @@ def _cached_get_all_tags(_engine):
     except Exception:
         return pd.DataFrame()
 
+@depende_de("wishlist", "jogadores", "vinculos_clubes")
 @st.cache_data(ttl=300, show_spinner=False)
 def _cached_get_wishlist(_engine, prioridade=None):
     if prioridade:
@@ -123,6 +172,186 @@ def _cached_get_wishlist(_engine, prioridade=None):
     except Exception:
         return pd.DataFrame()
 
+# --- SNAPSHOT COMPARTILHADO DE JOGADORES (um por processo) ---
+
+class SnapshotJogadores:
+    """
+    Tabela jogadores ⋈ vinculos_clubes em memória, compartilhada por todas as sessões
+
+    - Carga completa na primeira leitura; depois, a cada `intervalo`
+      segundos, busca apenas os jogadores com data_atualizacao (do jogador
+      ou do vínculo) acima da marca d'água e substitui as linhas deles
+    - Jogadores removidos são detectados pelo COUNT(*) de jogadores; se o
+      número de vínculos ainda divergir (vínculo incluído ou removido sem
+      alterar data_atualizacao), recarrega tudo
+    - Recarga completa a cada `recarga_completa` segundos, para alterações
+      que não passam pela data_atualizacao (ex.: scripts de manutenção)
+    - Colunas de texto repetitivo viram category; inteiros viram Int64
+    - clear() (chamado por invalidar("jogadores"/"vinculos_clubes")) só
+      antecipa a próxima verificação; os dados não são descartados
+
+    Leitores recebem uma cópia rasa: o DataFrame interno nunca é alterado,
+    a atualização monta um novo e troca a referência.
+    """
+
+    COLUNAS = ['id_jogador', 'nome', 'nacionalidade', 'ano_nascimento', 'idade_atual',
+               'altura', 'pe_dominante', 'transfermarkt_id',
+               'clube', 'liga_clube', 'posicao', 'data_fim_contrato', 'status_contrato']
+    CATEGORICAS = ['nacionalidade', 'pe_dominante', 'clube', 'liga_clube', 'posicao', 'status_contrato']
+    INTEIRAS = ['ano_nascimento', 'idade_atual', 'altura']
+
+    QUERY = """
+    SELECT
+        j.id_jogador, j.nome, j.nacionalidade, j.ano_nascimento, j.idade_atual,
+        j.altura, j.pe_dominante, j.transfermarkt_id,
+        v.clube, v.liga_clube, v.posicao, v.data_fim_contrato, v.status_contrato,
+        j.data_atualizacao AS atualizado_jogador, v.data_atualizacao AS atualizado_vinculo
+    FROM jogadores j
+    LEFT JOIN vinculos_clubes v ON j.id_jogador = v.id_jogador
+    """
+
+    # Jogadores com jogador ou vínculo alterado depois da marca
+    FILTRO_DELTA = """
+    WHERE j.id_jogador IN (
+        SELECT id_jogador FROM jogadores WHERE data_atualizacao > :marca
+        UNION
+        SELECT id_jogador FROM vinculos_clubes WHERE data_atualizacao > :marca
+    )
+    """
+
+    # Jogadores e vínculos (de jogadores existentes) no banco
+    CONTAGEM = """
+    SELECT
+        (SELECT COUNT(*) FROM jogadores) AS total,
+        (SELECT COUNT(*) FROM vinculos_clubes
+         WHERE id_jogador IN (SELECT id_jogador FROM jogadores)) AS vinculos
+    """
+
+    def __init__(self, engine, db_type, intervalo=30, margem=60, recarga_completa=3600):
+        """
+        Args:
+            intervalo: segundos entre verificações de alterações
+            margem: segundos de sobreposição na marca d'água (transações que
+                gravaram com timestamp anterior ao commit)
+            recarga_completa: segundos entre recargas completas
+        """
+        self.engine = engine
+        self.db_type = db_type
+        self.intervalo = intervalo
+        self.margem = timedelta(seconds=margem)
+        self.recarga_completa = recarga_completa
+        self.versao = 0
+        self._df = None
+        self._marca = None
+        self._proxima_verificacao = 0.0
+        self._proxima_recarga = 0.0
+        self._opcoes = (None, None)  # (versao, opções de filtro)
+        self._lock = threading.Lock()
+
+    # ---------- leitura ----------
+
+    def obter(self):
+        """DataFrame atual (verifica alterações se o intervalo venceu)"""
+        with self._lock:
+            if time.monotonic() >= self._proxima_verificacao:
+                try:
+                    if self._df is None or time.monotonic() >= self._proxima_recarga:
+                        self._carregar_tudo()
+                    else:
+                        self._atualizar_delta()
+                    self._proxima_verificacao = time.monotonic() + self.intervalo
+                except Exception as e:
+                    print(f"❌ Erro ao atualizar snapshot de jogadores: {e}")
+            df = self._df
+
+        if df is None:
+            return pd.DataFrame(columns=self.COLUNAS)
+        return df.copy(deep=False)
+
+    def opcoes_filtros(self):
+        """Valores distintos para os filtros da sidebar (recalculados só quando o snapshot muda)"""
+        df = self.obter()
+        versao, opcoes = self._opcoes
+        if versao != self.versao or opcoes is None:
+            opcoes = {
+                chave: sorted(df[coluna].dropna().unique().tolist())
+                for chave, coluna in (('posicoes', 'posicao'), ('clubes', 'clube'),
+                                      ('nacionalidades', 'nacionalidade'), ('ligas', 'liga_clube'))
+            }
+            self._opcoes = (self.versao, opcoes)
+        return opcoes
+
+    def clear(self):
+        """Força a verificação de alterações na próxima leitura"""
+        self._proxima_verificacao = 0.0
+
+    # ---------- atualização ----------
+
+    def _consultar(self, sql, params=None):
+        with self.engine.connect() as conn:
+            resultado = conn.execute(text(sql), params or {})
+            return pd.DataFrame(resultado.fetchall(), columns=list(resultado.keys()))
+
+    def _param_marca(self):
+        marca = (self._marca - self.margem).to_pydatetime()
+        # SQLite guarda CURRENT_TIMESTAMP como texto 'YYYY-MM-DD HH:MM:SS'
+        return marca.strftime('%Y-%m-%d %H:%M:%S') if self.db_type == 'sqlite' else marca
+
+    def _carregar_tudo(self):
+        novo = self._consultar(self.QUERY)
+        self._publicar(novo)
+        self._proxima_recarga = time.monotonic() + self.recarga_completa
+
+    def _atualizar_delta(self):
+        if self._marca is None:
+            delta = self._consultar(self.QUERY)
+            base = self._df.iloc[0:0]
+        else:
+            delta = self._consultar(self.QUERY + self.FILTRO_DELTA, {'marca': self._param_marca()})
+            base = self._df[~self._df['id_jogador'].isin(delta['id_jogador'])]
+
+        contagem = self._consultar(self.CONTAGEM).iloc[0]
+        total, vinculos = int(contagem['total']), int(contagem['vinculos'])
+        if delta.empty and base['id_jogador'].nunique() == total and self._vinculos(base) == vinculos:
+            return
+
+        if base['id_jogador'].nunique() + delta['id_jogador'].nunique() != total:
+            # Houve remoção: mantém só os jogadores que ainda existem
+            ids = self._consultar("SELECT id_jogador FROM jogadores")['id_jogador']
+            base = base[base['id_jogador'].isin(ids)]
+
+        if self._vinculos(base) + self._vinculos(delta) != vinculos:
+            # Vínculo incluído/removido sem data_atualizacao nova: o delta não vê
+            self._carregar_tudo()
+            return
+
+        self._publicar(delta, base)
+
+    @staticmethod
+    def _vinculos(df):
+        """Linhas com vínculo (posicao é NOT NULL em vinculos_clubes; sem vínculo o LEFT JOIN traz NULL)"""
+        return int(df['posicao'].notna().sum())
+
+    def _publicar(self, novos, base=None):
+        """Tipa as linhas novas, junta com a base e troca o DataFrame publicado"""
+        atualizados = pd.concat(
+            [pd.to_datetime(novos[c], errors='coerce') for c in ('atualizado_jogador', 'atualizado_vinculo')]
+        ).max() if not novos.empty else pd.NaT
+        if pd.notna(atualizados) and (self._marca is None or atualizados > self._marca):
+            self._marca = atualizados
+
+        novos = novos.drop(columns=['atualizado_jogador', 'atualizado_vinculo'])
+        df = novos if base is None else pd.concat([base, novos], ignore_index=True)
+        for coluna in self.INTEIRAS:
+            df[coluna] = pd.to_numeric(df[coluna], errors='coerce').astype('Int64')
+        for coluna in self.CATEGORICAS:
+            df[coluna] = df[coluna].astype('object').astype('category')
+        df['id_jogador'] = df['id_jogador'].astype('int64')
+
+        self._df = df.sort_values('nome', kind='stable', ignore_index=True)
+        self.versao += 1
+
+
 # --- CLASSE PRINCIPAL ---
 
 class ScoutingDatabase:
@@ -182,6 +411,12 @@ class ScoutingDatabase:
         
         self.criar_tabelas()
 
+        # Snapshot de jogadores do processo (o ScoutingDatabase é um st.cache_resource)
+        self.snapshot_jogadores = depende_de("jogadores", "vinculos_clubes")(SnapshotJogadores(
+            self.engine, self.db_type,
+            intervalo=int(os.getenv('SNAPSHOT_JOGADORES_INTERVALO', '30')),
+        ))
+
     def _safe_int(self, value):
         if isinstance(value, (np.int64, np.int32, np.int16)):
             return int(value)
@@ -310,8 +545,12 @@ class ScoutingDatabase:
     # --- MÉTODOS QUE USAM CACHE ---
 
     def buscar_todos_jogadores(self):
-        """Interface pública - usa cache externo"""
-        return _cached_buscar_todos_jogadores(self.engine)
+        """Interface pública - snapshot em memória compartilhado pelas sessões"""
+        return self.snapshot_jogadores.obter()
+
+    def get_opcoes_filtros(self):
+        """Posições, clubes, nacionalidades e ligas distintas (a partir do snapshot)"""
+        return self.snapshot_jogadores.opcoes_filtros()
 
     def buscar_avaliacoes_jogador(self, id_jogador):
         """Interface pública - usa cache externo"""
@@ -329,6 +568,23 @@ class ScoutingDatabase:
     def get_ids_wishlist(self):
         return _cached_get_ids_wishlist(self.engine)
 
+    # --- BUSCA AVANÇADA ---
+
+    def busca_avancada(self, filtros: dict) -> pd.DataFrame:
+        """
+        Busca avançada com todos os filtros aplicados no banco (uma consulta)
+
+        Inclui média mínima (última avaliação) e tags em modo 'qualquer' ou
+        'todas' (filtros['tags_modo']). Retorna a coluna media_geral.
+        Filtros equivalentes compartilham o cache até a próxima escrita em
+        jogadores, vínculos, avaliações ou tags.
+        """
+        try:
+            return _cached_busca_avancada(self.engine, filtros_canonicos(filtros)).copy()
+        except Exception as e:
+            print(f"❌ Erro na busca avançada: {e}")
+            return pd.DataFrame()
+
     # --- MÉTODOS DE BUSCAS SALVAS ---
 
     def get_buscas_salvas(self, criado_por=None):
@@ -358,7 +614,7 @@ class ScoutingDatabase:
     def salvar_busca(self, nome_busca: str, filtros: dict, criado_por: str = None) -> bool:
         """Salva uma busca personalizada"""
         try:
-            filtros_json = json.dumps(filtros)
+            filtros_json = filtros_canonicos(filtros)
             
             with self.engine.connect() as conn:
                 conn.execute(text("""
@@ -403,6 +659,13 @@ class ScoutingDatabase:
             print(f"❌ Erro ao carregar filtros: {e}")
             return None
 
+    def executar_busca_salva(self, id_busca: int) -> pd.DataFrame:
+        """Executa uma busca salva (resultado em cache enquanto as tabelas não mudam)"""
+        filtros = self.carregar_filtros_busca(id_busca)
+        if filtros is None:
+            return pd.DataFrame()
+        return self.busca_avancada(filtros)
+
     # --- MÉTODOS DE ESCRITA (sem cache) ---
 
     def inserir_vinculo(self, id_jogador: int, dados_vinculo: dict) -> bool:
@@ -490,7 +753,7 @@ class ScoutingDatabase:
                     VALUES (:id, :data, :pot, :tac, :tec, :fis, :men, :obs, :ava)
                 """), params)
                 conn.commit()
-            st.cache_data.clear()
+            invalidar("avaliacoes")
             return True
         except Exception as e:
             print(f"❌ Erro ao inserir avaliação: {e}")
@@ -508,7 +771,7 @@ class ScoutingDatabase:
                     conn.execute(text("INSERT INTO wishlist (id_jogador, prioridade, observacao, adicionado_por) VALUES (:id, :p, :o, :user)"),
                                  {'id': id_jogador, 'p': prioridade, 'o': observacao, 'user': adicionado_por})
                 conn.commit()
-            st.cache_data.clear()
+            invalidar("wishlist")
             return True
         except Exception:
             return False
@@ -518,7 +781,7 @@ class ScoutingDatabase:
             with self.engine.connect() as conn:
                 conn.execute(text("DELETE FROM wishlist WHERE id_jogador = :id"), {'id': self._safe_int(id_jogador)})
                 conn.commit()
-            st.cache_data.clear()
+            invalidar("wishlist")
             return True
         except Exception:
             return False
@@ -567,6 +830,15 @@ class ScoutingDatabase:
         df = self.buscar_avaliacoes_jogador(id_jogador)
         return df.head(1) if not df.empty else pd.DataFrame()
 
+    def get_medias_jogadores(self):
+        """
+        Última avaliação e médias de todos os jogadores (DataFrame indexado por id_jogador)
+
+        Uma consulta para a tela inteira: use com .map/.join em vez de chamar
+        get_ultima_avaliacao jogador a jogador.
+        """
+        return _cached_medias_jogadores(self.engine)
+
     def salvar_avaliacao(self, **kwargs):
         id_jogador = kwargs.pop('id_jogador', None)
         return self.inserir_avaliacao(id_jogador, kwargs) if id_jogador else False
@@ -605,33 +877,36 @@ class ScoutingDatabase:
         - ativo: mais de 365 dias restantes
         """
         try:
-            with self.engine.connect() as conn:
-                if self.db_type == 'postgresql':
-                    query = text("""
-                        UPDATE vinculos_clubes
-                        SET status_contrato = CASE
-                            WHEN data_fim_contrato IS NULL THEN 'livre'
-                            WHEN data_fim_contrato < CURRENT_DATE THEN 'vencido'
-                            WHEN data_fim_contrato <= CURRENT_DATE + INTERVAL '180 days' THEN 'ultimos_6_meses'
-                            WHEN data_fim_contrato <= CURRENT_DATE + INTERVAL '365 days' THEN 'ultimo_ano'
-                            ELSE 'ativo'
-                        END
-                    """)
-                else:
-                    query = text("""
-                        UPDATE vinculos_clubes
-                        SET status_contrato = CASE
-                            WHEN data_fim_contrato IS NULL THEN 'livre'
-                            WHEN date(data_fim_contrato) < date('now') THEN 'vencido'
-                            WHEN date(data_fim_contrato) <= date('now', '+180 days') THEN 'ultimos_6_meses'
-                            WHEN date(data_fim_contrato) <= date('now', '+365 days') THEN 'ultimo_ano'
-                            ELSE 'ativo'
-                        END
-                    """)
+            if self.db_type == 'postgresql':
+                novo_status = """CASE
+                    WHEN data_fim_contrato IS NULL THEN 'livre'
+                    WHEN data_fim_contrato < CURRENT_DATE THEN 'vencido'
+                    WHEN data_fim_contrato <= CURRENT_DATE + INTERVAL '180 days' THEN 'ultimos_6_meses'
+                    WHEN data_fim_contrato <= CURRENT_DATE + INTERVAL '365 days' THEN 'ultimo_ano'
+                    ELSE 'ativo'
+                END"""
+                diferente = 'IS DISTINCT FROM'
+            else:
+                novo_status = """CASE
+                    WHEN data_fim_contrato IS NULL THEN 'livre'
+                    WHEN date(data_fim_contrato) < date('now') THEN 'vencido'
+                    WHEN date(data_fim_contrato) <= date('now', '+180 days') THEN 'ultimos_6_meses'
+                    WHEN date(data_fim_contrato) <= date('now', '+365 days') THEN 'ultimo_ano'
+                    ELSE 'ativo'
+                END"""
+                diferente = 'IS NOT'
+
+            # Só as linhas que mudaram ganham data_atualizacao nova (delta do snapshot)
+            query = text(f"""
+                UPDATE vinculos_clubes
+                SET status_contrato = {novo_status}, data_atualizacao = CURRENT_TIMESTAMP
+                WHERE status_contrato {diferente} ({novo_status})
+            """)
 
+            with self.engine.connect() as conn:
                 conn.execute(query)
                 conn.commit()
-                st.cache_data.clear()  # Limpar cache para refletir mudanças
+                invalidar("vinculos_clubes")  # Só os caches que leem status_contrato
                 return True
         except Exception as e:
             print(f"❌ Erro ao atualizar status dos contratos: {e}")
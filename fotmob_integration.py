@@ -20,6 +20,8 @@ from typing import Optional, Dict, List, Any
 from datetime import datetime
 import streamlit as st
 
+from src.utils import http_cache
+
 
 class FotMobAPI:
     """Cliente para API não-oficial do FotMob"""
@@ -75,7 +77,7 @@ class FotMobAPI:
         try:
             # Endpoint de busca do FotMob
             url = f"{self.BASE_URL}/searchapi/{nome}"
-            response = self.session.get(url, timeout=10)
+            response = http_cache.get(url, session=self.session, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -103,7 +105,7 @@ class FotMobAPI:
         """
         try:
             url = f"{self.BASE_URL}/playerData?id={player_id}"
-            response = self.session.get(url, timeout=10)
+            response = http_cache.get(url, session=self.session, timeout=10)
 
             if response.status_code != 200:
                 return None
@@ -5,12 +5,52 @@ Sincronização com Google Sheets usando credenciais de variável de ambiente
 
 import os
 import json
+import hashlib
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
-from datetime import datetime
 import pandas as pd
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, text, bindparam
+from sqlalchemy.dialects import postgresql, sqlite
 from database import ScoutingDatabase
-import re
+from src.sync.normalizacao import ESCALA_SYNC, normalizar_planilha, registros
+from src.sync.schema_incremental import schema_incremental_pronto
+
+# Tabelas usadas pelo modo incremental (apenas as colunas escritas pela sincronização)
+_metadata = MetaData()
+
+TABELA_JOGADORES = Table(
+    'jogadores', _metadata,
+    Column('id_jogador', Integer, primary_key=True),
+    Column('nome', String),
+    Column('nacionalidade', String),
+    Column('ano_nascimento', Integer),
+    Column('idade_atual', Integer),
+    Column('altura', Integer),
+    Column('pe_dominante', String),
+    Column('transfermarkt_id', String),
+    Column('hash_planilha', String),
+    Column('data_atualizacao', DateTime),
+)
+
+TABELA_VINCULOS = Table(
+    'vinculos_clubes', _metadata,
+    Column('id_vinculo', Integer, primary_key=True),
+    Column('id_jogador', Integer),
+    Column('clube', String),
+    Column('liga_clube', String),
+    Column('posicao', String),
+    Column('data_fim_contrato', String),  # 'YYYY-MM-DD' (já normalizada)
+    Column('status_contrato', String),
+    Column('data_atualizacao', DateTime),
+)
+
+# Linhas por INSERT multi-VALUES (limite de parâmetros do SQLite/PostgreSQL)
+TAMANHO_LOTE = 500
+
+# Colunas normalizadas (src/sync/normalizacao.py) gravadas em cada tabela
+CAMPOS_JOGADOR = ('nome', 'nacionalidade', 'ano_nascimento', 'idade_atual',
+                  'altura', 'pe_dominante', 'transfermarkt_id')
+CAMPOS_VINCULO = ('clube', 'liga_clube', 'posicao', 'data_fim_contrato', 'status_contrato')
 
 class GoogleSheetsSync:
     def __init__(self):
@@ -102,9 +142,15 @@ class GoogleSheetsSync:
             print(f"❌ Erro ao ler planilha: {e}")
             return pd.DataFrame()
     
-    def sincronizar_para_banco(self, sheet_url=None, limpar_antes=False):
+    def sincronizar_para_banco(self, sheet_url=None, limpar_antes=False, incremental=True):
         """
         Sincroniza dados da planilha para o banco de dados
+
+        Args:
+            sheet_url: URL da planilha (padrão: GOOGLE_SHEET_URL)
+            limpar_antes: apaga todos os dados antes de importar
+            incremental: aplica apenas as linhas alteradas desde a última
+                sincronização (hash por linha), em uma única transação
         """
         print("\n" + "="*60)
         print("🔄 SINCRONIZAÇÃO: Google Sheets → Banco de Dados")
@@ -126,43 +172,30 @@ class GoogleSheetsSync:
             print("\n🧹 Limpando dados existentes...")
             self.db.limpar_dados()
         
-        # Importar dados
+        if incremental:
+            with self.db.engine.connect() as conn:
+                pronto = schema_incremental_pronto(conn)
+            if pronto:
+                return self._sincronizar_incremental(df)
+            print("⚠️ Banco sem hash_planilha/índice único em transfermarkt_id: usando o modo linha a linha.")
+            print("   Execute scripts/maintenance/preparar_sync_incremental.py para ativar o modo incremental.")
+        
+        return self._sincronizar_linha_a_linha(df)
+    
+    def _sincronizar_linha_a_linha(self, df):
+        """Insere/atualiza jogador e vínculo linha a linha (modo completo)"""
         print(f"\n📥 Importando {len(df)} jogadores...")
         
+        linhas, rejeitados = self._linhas_normalizadas(df)
         sucesso = 0
-        erros = 0
+        erros = int(rejeitados['descartada'].sum()) if not rejeitados.empty else 0
         
-        for idx, row in df.iterrows():
+        for idx, (linha, dados_jogador, dados_vinculo) in enumerate(linhas):
             try:
-                # Extrai ID do Transfermarkt para usar como chave única
-                tm_id = self._extrair_tm_id(row.get('TM', ''))
-
-                # Preparar dados do jogador
-                dados_jogador = {
-                    'nome': str(row.get('Nome', '')).strip(),
-                    'nacionalidade': str(row.get('Nacionalidade', '')).strip() or None,
-                    'ano_nascimento': self._converter_int(row.get('Ano')),
-                    'idade_atual': self._converter_int(row.get('Idade')),
-                    'altura': self._converter_altura(row.get('Altura')),
-                    'pe_dominante': str(row.get('Pé dominante', '')).strip() or None,
-                    'transfermarkt_id': tm_id
-                }
-                
                 # Inserir jogador (Agora usa o ID do TM para verificar duplicidade)
                 id_jogador = self.db.inserir_jogador(dados_jogador)
                 
                 if id_jogador:
-                    # Preparar dados do vínculo
-                    dados_vinculo = {
-                        'clube': str(row.get('Clube', '')).strip() or None,
-                        'liga_clube': str(row.get('Liga do Clube', '')).strip() or None,
-                        'posicao': str(row.get('Posição', '')).strip(),
-                        'data_fim_contrato': self._converter_data(row.get('Fim de Contrato')),
-                        'status_contrato': self._calcular_status_contrato(
-                            row.get('Fim de Contrato')
-                        )
-                    }
-                    
                     # Inserir vínculo
                     self.db.inserir_vinculo(id_jogador, dados_vinculo)
                     
@@ -172,10 +205,10 @@ class GoogleSheetsSync:
                 
                 # Progresso
                 if (idx + 1) % 50 == 0:
-                    print(f"   Processados: {idx + 1}/{len(df)}")
+                    print(f"   Processados: {idx + 1}/{len(linhas)}")
                 
             except Exception as e:
-                print(f"⚠️ Erro na linha {idx + 1}: {e}")
+                print(f"⚠️ Erro na linha {linha}: {e}")
                 erros += 1
         
         print(f"\n✅ Importação concluída!")
@@ -185,94 +218,184 @@ class GoogleSheetsSync:
         
         return True
     
-    def _converter_int(self, valor):
-        """Converte valor para int, retorna None se inválido"""
-        try:
-            if pd.isna(valor) or valor == '':
-                return None
-            return int(float(valor))
-        except:
-            return None
+    def _linhas_normalizadas(self, df):
+        """
+        Normaliza a planilha inteira de uma vez (src/sync/normalizacao.py)
+        
+        Returns:
+            (linhas, rejeitados): linhas = [(nº da linha, dados_jogador, dados_vinculo)]
+        """
+        resultado = normalizar_planilha(df, escala=ESCALA_SYNC)
+        
+        if not resultado.rejeitados.empty:
+            print(f"⚠️ {len(resultado.rejeitados)} problema(s) na planilha:")
+            for r in resultado.rejeitados.itertuples():
+                acao = "linha ignorada" if r.descartada else "valor ignorado"
+                print(f"   Linha {r.linha} ({r.coluna}={r.valor!r}): {r.motivo} - {acao}")
+        
+        linhas = []
+        for r in registros(resultado.validos):
+            dados_jogador = {campo: r[campo] for campo in CAMPOS_JOGADOR}
+            dados_vinculo = {campo: r[campo] for campo in CAMPOS_VINCULO}
+            dados_vinculo['posicao'] = dados_vinculo['posicao'] or ''
+            linhas.append((r['linha'], dados_jogador, dados_vinculo))
+        
+        return linhas, resultado.rejeitados
     
-    def _converter_altura(self, valor):
-        """Converte altura para cm"""
-        try:
-            if pd.isna(valor) or valor == '':
-                return None
-            
-            altura = float(valor)
-            
-            # Se está em metros (< 3), converte para cm
-            if altura < 3:
-                return int(altura * 100)
-            
-            return int(altura)
-        except:
-            return None
+    @staticmethod
+    def _hash_linha(dados_jogador, dados_vinculo):
+        """
+        Hash do conteúdo normalizado da linha
+        
+        status_contrato fica de fora: muda com a data de hoje, não com a planilha
+        (é recalculado por atualizar_status_contratos).
+        """
+        conteudo = {
+            **dados_jogador,
+            **{k: v for k, v in dados_vinculo.items() if k != 'status_contrato'},
+        }
+        serializado = json.dumps(conteudo, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(serializado.encode('utf-8')).hexdigest()
     
-    def _extrair_tm_id(self, valor):
-        """Extrai ID do Transfermarkt de URL ou retorna o próprio valor"""
-        if pd.isna(valor) or valor == '':
-            return None
+    def _insert(self, tabela):
+        dialeto = postgresql if self.db.db_type == 'postgresql' else sqlite
+        return dialeto.insert(tabela)
+    
+    def _sincronizar_incremental(self, df):
+        """
+        Aplica apenas as linhas cujo hash mudou, em uma única transação
         
-        valor_str = str(valor).strip()
+        Round trips (independente do tamanho da planilha, por lote de 500):
+        1 SELECT dos jogadores existentes, 1 INSERT ... ON CONFLICT
+        (transfermarkt_id) DO UPDATE, 1 SELECT dos vínculos atuais e
+        1 upsert (ON CONFLICT (id_vinculo)) + 1 INSERT dos vínculos.
         
-        # Se é uma URL do Transfermarkt
-        # Padrão comum: .../nome-do-jogador/profil/spieler/123456
-        match = re.search(r"spieler/(\d+)", valor_str)
-        if match:
-            return match.group(1)
+        Requer o schema de src/sync/schema_incremental.py.
+        """
+        print(f"\n📥 Comparando {len(df)} linhas com o banco (modo incremental)...")
         
-        # Se é apenas dígitos, assume que é o ID
-        if valor_str.isdigit():
-            return valor_str
-            
-        return valor_str
-    
-    def _converter_data(self, valor):
-        """Converte data para formato YYYY-MM-DD"""
-        if pd.isna(valor) or valor == '':
-            return None
+        # 1. Normalizar (vetorizado) e calcular hash de cada linha
+        normalizadas, rejeitados = self._linhas_normalizadas(df)
+        erros = int(rejeitados['descartada'].sum()) if not rejeitados.empty else 0
+        por_chave = {}
+        for _, dados_jogador, dados_vinculo in normalizadas:
+            dados_jogador['hash_planilha'] = self._hash_linha(dados_jogador, dados_vinculo)
+            # Linha repetida na planilha: vale a última, como no modo linha a linha
+            por_chave[dados_jogador['transfermarkt_id'] or dados_jogador['nome']] = (dados_jogador, dados_vinculo)
+        linhas = list(por_chave.values())
         
-        try:
-            # Tenta vários formatos comuns
-            formatos = ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']
+        with self.db.engine.begin() as conn:
+            # 2. Estado atual (uma consulta)
+            existentes = conn.execute(text(
+                "SELECT id_jogador, nome, transfermarkt_id, hash_planilha FROM jogadores"
+            )).fetchall()
+            por_tm = {r.transfermarkt_id: r for r in existentes if r.transfermarkt_id}
+            por_nome = {r.nome: r for r in existentes}
             
-            for formato in formatos:
-                try:
-                    data = datetime.strptime(str(valor), formato)
-                    return data.strftime('%Y-%m-%d')
-                except:
-                    continue
+            com_tm, sem_tm = [], []
+            backfill_tm = []  # jogadores achados pelo nome que ganharam TM na planilha
+            inalterados = 0
             
-            return None
-        except:
-            return None
-    
-    def _calcular_status_contrato(self, data_fim):
-        """Calcula status do contrato baseado na data de término"""
-        if not data_fim:
-            return 'Desconhecido'
-        
-        try:
-            data_fim_dt = datetime.strptime(
-                self._converter_data(data_fim) or '', 
-                '%Y-%m-%d'
-            )
-            hoje = datetime.now()
+            for dados_jogador, dados_vinculo in linhas:
+                tm_id = dados_jogador['transfermarkt_id']
+                atual = por_tm.get(tm_id) if tm_id else None
+                if atual is None:
+                    atual = por_nome.get(dados_jogador['nome'])
+                    if atual is not None and tm_id and atual.transfermarkt_id in (None, ''):
+                        backfill_tm.append({'id': atual.id_jogador, 'tm': tm_id})
+                
+                if atual is not None and atual.hash_planilha == dados_jogador['hash_planilha']:
+                    inalterados += 1
+                    continue
+                
+                if tm_id:
+                    com_tm.append((dados_jogador, dados_vinculo))
+                else:
+                    sem_tm.append((atual.id_jogador if atual is not None else None, dados_jogador, dados_vinculo))
             
-            if data_fim_dt < hoje:
-                return 'Vencido'
+            print(f"   Inalteradas: {inalterados} | Alteradas/novas: {len(com_tm) + len(sem_tm)}")
             
-            dias_restantes = (data_fim_dt - hoje).days
+            # 3. Jogadores existentes só pelo nome recebem o TM antes do upsert
+            if backfill_tm:
+                conn.execute(
+                    text("UPDATE jogadores SET transfermarkt_id = :tm WHERE id_jogador = :id"),
+                    backfill_tm,
+                )
             
-            if dias_restantes <= 180:
-                return 'Vencendo em breve'
+            # 4. Upsert em lote pelo transfermarkt_id
+            vinculos = {}
+            for inicio in range(0, len(com_tm), TAMANHO_LOTE):
+                lote = com_tm[inicio:inicio + TAMANHO_LOTE]
+                stmt = self._insert(TABELA_JOGADORES).values([j for j, _ in lote])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['transfermarkt_id'],
+                    set_={
+                        col: stmt.excluded[col]
+                        for col in ('nome', 'nacionalidade', 'ano_nascimento', 'idade_atual',
+                                    'altura', 'pe_dominante', 'hash_planilha')
+                    } | {'data_atualizacao': text('CURRENT_TIMESTAMP')},
+                ).returning(TABELA_JOGADORES.c.id_jogador, TABELA_JOGADORES.c.transfermarkt_id)
+                
+                ids = {tm: id_jogador for id_jogador, tm in conn.execute(stmt)}
+                for dados_jogador, dados_vinculo in lote:
+                    vinculos[ids[dados_jogador['transfermarkt_id']]] = dados_vinculo
             
-            return 'Vigente'
+            # 5. Linhas sem TM (chave pelo nome)
+            for id_jogador, dados_jogador, dados_vinculo in sem_tm:
+                if id_jogador:
+                    conn.execute(text("""
+                        UPDATE jogadores SET nome=:nome, nacionalidade=:nacionalidade, ano_nascimento=:ano_nascimento,
+                        idade_atual=:idade_atual, altura=:altura, pe_dominante=:pe_dominante,
+                        hash_planilha=:hash_planilha, data_atualizacao=CURRENT_TIMESTAMP
+                        WHERE id_jogador=:id
+                    """), {**dados_jogador, 'id': id_jogador})
+                else:
+                    id_jogador = conn.execute(
+                        self._insert(TABELA_JOGADORES).values(dados_jogador)
+                        .returning(TABELA_JOGADORES.c.id_jogador)
+                    ).scalar_one()
+                vinculos[id_jogador] = dados_vinculo
             
-        except:
-            return 'Desconhecido'
+            # 6. Vínculos: a planilha é a fonte do vínculo atual do jogador (o de
+            #    menor id_vinculo), atualizado no lugar; os demais vínculos ficam intactos
+            ids_alterados = list(vinculos)
+            for inicio in range(0, len(ids_alterados), TAMANHO_LOTE):
+                lote = ids_alterados[inicio:inicio + TAMANHO_LOTE]
+                atuais = dict(conn.execute(
+                    text("""
+                        SELECT id_jogador, MIN(id_vinculo) FROM vinculos_clubes
+                        WHERE id_jogador IN :ids GROUP BY id_jogador
+                    """).bindparams(bindparam('ids', expanding=True)),
+                    {'ids': lote},
+                ).fetchall())
+                
+                existentes = [
+                    {**vinculos[id_jogador], 'id_jogador': id_jogador, 'id_vinculo': atuais[id_jogador]}
+                    for id_jogador in lote if id_jogador in atuais
+                ]
+                if existentes:
+                    stmt = self._insert(TABELA_VINCULOS).values(existentes)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=['id_vinculo'],
+                        set_={col: stmt.excluded[col] for col in CAMPOS_VINCULO}
+                        | {'data_atualizacao': text('CURRENT_TIMESTAMP')},
+                    )
+                    conn.execute(stmt)
+                
+                novos = [
+                    {**vinculos[id_jogador], 'id_jogador': id_jogador}
+                    for id_jogador in lote if id_jogador not in atuais
+                ]
+                if novos:
+                    conn.execute(self._insert(TABELA_VINCULOS).values(novos))
+        
+        print(f"\n✅ Sincronização incremental concluída!")
+        print(f"   Aplicadas: {len(vinculos)}")
+        print(f"   Inalteradas: {inalterados}")
+        print(f"   Erros: {erros}")
+        print("="*60)
+        
+        return True
 
 def main():
     """Função principal para teste/execução manual"""
@@ -295,9 +418,10 @@ def main():
     
     # Menu
     print("\nOpções:")
-    print("1 - Sincronizar (manter dados existentes)")
+    print("1 - Sincronizar (manter dados existentes, só linhas alteradas)")
     print("2 - Sincronizar (limpar banco antes)")
     print("3 - Apenas ler planilha (sem importar)")
+    print("4 - Sincronizar linha a linha (modo completo)")
     
     opcao = input("\nEscolha uma opção: ").strip()
     
@@ -307,6 +431,8 @@ def main():
         confirma = input("⚠️ Isso vai limpar todos os dados! Confirma? (sim/não): ")
         if confirma.lower() in ['sim', 's']:
             sync.sincronizar_para_banco(sheet_url, limpar_antes=True)
+    elif opcao == '4':
+        sync.sincronizar_para_banco(sheet_url, limpar_antes=False, incremental=False)
     elif opcao == '3':
         sync.conectar_planilha(sheet_url)
         df = sync.ler_dados_planilha()
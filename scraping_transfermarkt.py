@@ -12,6 +12,8 @@ from typing import Optional, Dict
 import psycopg2
 import os
 
+from src.scraping.checkpoint import STATUS_FALHA, STATUS_SUCESSO, CheckpointScraping
+
 
 class TransfermarktScraper:
     """Scraper para buscar dados do Transfermarkt"""
@@ -35,7 +37,8 @@ class TransfermarktScraper:
             transfermarkt_id: ID do jogador no Transfermarkt
         
         Returns:
-            Dict com informações do agente ou None
+            Dict com informações do agente (campos None se a página não lista
+            empresário) ou None em erro de requisição/página não reconhecida
         """
         try:
             # URL do perfil do jogador
@@ -78,20 +81,20 @@ class TransfermarktScraper:
                                 agente_info['agente_empresa'] = empresa_span.get_text(strip=True)
             
             # Busca também na área de detalhes do perfil
+            info_elements = soup.find_all('span', {'class': 'info-table__content'})
+            if not info_table and not info_elements:
+                # Nenhuma das estruturas do perfil: erro de parse, não "sem agente"
+                print(f"Página do Transfermarkt ID {transfermarkt_id} não reconhecida")
+                return None
             if not agente_info['agente_nome']:
                 # Alternativa: busca em outras estruturas HTML
-                info_elements = soup.find_all('span', {'class': 'info-table__content'})
                 for i, elem in enumerate(info_elements):
                     if 'Empresário' in elem.get_text():
                         # Próximo elemento pode conter o nome
                         if i + 1 < len(info_elements):
                             agente_info['agente_nome'] = info_elements[i + 1].get_text(strip=True)
             
-            # Se encontrou informações, retorna
-            if agente_info['agente_nome']:
-                return agente_info
-            
-            return None
+            return agente_info
             
         except requests.exceptions.RequestException as e:
             print(f"Erro ao buscar dados do Transfermarkt ID {transfermarkt_id}: {e}")
@@ -140,30 +143,94 @@ class TransfermarktScraper:
             cursor.close()
             conn.close()
     
-    def atualizar_todos_agentes(self, limite: Optional[int] = None):
+    def marcar_agente_verificado(self, jogador_id: int) -> bool:
+        """
+        Registra que o perfil foi consultado e não lista empresário
+        (só agente_atualizado_em; os dados de agente já gravados ficam)
+        
+        Returns:
+            True se atualizado com sucesso
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(
+                "UPDATE jogadores SET agente_atualizado_em = CURRENT_TIMESTAMP WHERE id_jogador = %s",
+                (jogador_id,)
+            )
+            conn.commit()
+            return True
+            
+        except Exception as e:
+            conn.rollback()
+            print(f"Erro ao atualizar banco: {e}")
+            return False
+        finally:
+            cursor.close()
+            conn.close()
+    
+    def atualizar_todos_agentes(self, limite: Optional[int] = None, retomar: bool = True,
+                                apenas_desatualizados_dias: Optional[int] = None):
         """
         Atualiza informações de agentes para todos os jogadores
         
+        O resultado de cada jogador é gravado em checkpoint (tarefa 'agentes');
+        uma execução interrompida (crash, deploy) é retomada de onde parou.
+        
         Args:
             limite: Número máximo de jogadores a atualizar (None = todos)
+            retomar: Continua a execução interrompida (False = recomeça do zero)
+            apenas_desatualizados_dias: Em vez de só jogadores sem agente, busca
+                todos cujo agente não foi atualizado nos últimos N dias
         """
         conn = self.get_connection()
         cursor = conn.cursor()
+        checkpoint_conn = self.get_connection()
         
         try:
-            # Busca jogadores que têm Transfermarkt ID mas não têm agente
-            query = """
-                SELECT id_jogador, nome, transfermarkt_id 
-                FROM jogadores 
-                WHERE transfermarkt_id IS NOT NULL 
-                AND (agente_nome IS NULL OR agente_nome = '')
-                ORDER BY id_jogador
-            """
+            # Checkpoint antes da consulta: quem já foi processado na execução
+            # interrompida sai no próprio SELECT, antes do LIMIT (senão uma
+            # retomada com limite buscaria sempre os mesmos jogadores)
+            checkpoint = CheckpointScraping(checkpoint_conn, "agentes")
+            ja_processados = checkpoint.iniciar(retomar=retomar)
+            if ja_processados:
+                print(f"\n♻️ Retomando execução anterior: {len(ja_processados)} jogadores já processados")
+            
+            if apenas_desatualizados_dias:
+                # Jogadores nunca atualizados ou atualizados há mais de N dias
+                query = """
+                    SELECT id_jogador, nome, transfermarkt_id 
+                    FROM jogadores 
+                    WHERE transfermarkt_id IS NOT NULL 
+                    AND (agente_atualizado_em IS NULL
+                         OR agente_atualizado_em < NOW() - make_interval(days => %s))
+                    AND NOT EXISTS (
+                        SELECT 1 FROM scraping_checkpoint c
+                        WHERE c.tarefa = %s AND c.id_jogador = jogadores.id_jogador
+                    )
+                    ORDER BY id_jogador
+                """
+                params = (int(apenas_desatualizados_dias), checkpoint.tarefa)
+            else:
+                # Busca jogadores que têm Transfermarkt ID mas não têm agente
+                query = """
+                    SELECT id_jogador, nome, transfermarkt_id 
+                    FROM jogadores 
+                    WHERE transfermarkt_id IS NOT NULL 
+                    AND (agente_nome IS NULL OR agente_nome = '')
+                    AND NOT EXISTS (
+                        SELECT 1 FROM scraping_checkpoint c
+                        WHERE c.tarefa = %s AND c.id_jogador = jogadores.id_jogador
+                    )
+                    ORDER BY id_jogador
+                """
+                params = (checkpoint.tarefa,)
             
             if limite:
-                query += f" LIMIT {limite}"
+                query += f" LIMIT {int(limite)}"
             
-            cursor.execute(query)
+            cursor.execute(query, params)
             jogadores = cursor.fetchall()
             
             print(f"\n🔍 Iniciando scraping de {len(jogadores)} jogadores...")
@@ -184,16 +251,28 @@ class TransfermarktScraper:
                         if agente_info['agente_empresa']:
                             print(f"   Empresa: {agente_info['agente_empresa']}")
                         sucessos += 1
+                        checkpoint.registrar(jogador_id, STATUS_SUCESSO)
                     else:
                         print(f"❌ Erro ao salvar no banco")
                         erros += 1
-                else:
+                        checkpoint.registrar(jogador_id, STATUS_FALHA, "Erro ao salvar no banco")
+                elif agente_info is not None:
+                    # Perfil lido sem empresário: marca a consulta para o modo
+                    # apenas_desatualizados_dias não buscar de novo na próxima execução
                     print(f"⚠️ Agente não encontrado")
+                    self.marcar_agente_verificado(jogador_id)
                     erros += 1
+                    checkpoint.registrar(jogador_id, STATUS_FALHA, "Agente não encontrado")
+                else:
+                    print(f"❌ Erro ao consultar o Transfermarkt")
+                    erros += 1
+                    checkpoint.registrar(jogador_id, STATUS_FALHA, "Erro ao consultar o Transfermarkt")
                 
                 # Delay para não sobrecarregar o servidor
                 time.sleep(random.uniform(2, 4))
             
+            checkpoint.concluir()
+            
             print(f"\n" + "="*50)
             print(f"✅ Concluído!")
             print(f"Sucessos: {sucessos}")
@@ -205,6 +284,7 @@ class TransfermarktScraper:
         finally:
             cursor.close()
             conn.close()
+            checkpoint_conn.close()
     
     def buscar_agente_especifico(self, nome_jogador: str) -> Optional[Dict]:
         """
@@ -250,6 +330,8 @@ class TransfermarktScraper:
                     print(f"   Empresa: {agente_info['agente_empresa']}")
                 return agente_info
             else:
+                if agente_info is not None:
+                    self.marcar_agente_verificado(jogador_id)
                 print(f"⚠️ Agente não encontrado para {nome}")
                 return None
                 
@@ -310,9 +392,10 @@ if __name__ == "__main__":
         print("1. Atualizar todos os jogadores")
         print("2. Atualizar primeiros N jogadores")
         print("3. Buscar jogador específico")
+        print("4. Atualizar agentes desatualizados há mais de N dias")
         print("="*50)
         
-        opcao = input("\nEscolha uma opção (1-3): ")
+        opcao = input("\nEscolha uma opção (1-4): ")
         
         if opcao == "1":
             confirma = input("⚠️ Isso pode levar muito tempo. Confirma? (s/n): ")
@@ -326,3 +409,7 @@ if __name__ == "__main__":
         elif opcao == "3":
             nome = input("Nome do jogador: ")
             scraper.buscar_agente_especifico(nome)
+        
+        elif opcao == "4":
+            dias = int(input("Dias: "))
+            scraper.atualizar_todos_agentes(apenas_desatualizados_dias=dias)
@@ -8,6 +8,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.config import Config
 from src.sync.google_sheets_sync import GoogleSheetsSyncer
 
 
@@ -36,8 +37,13 @@ def processar_importacao():
         syncer.db.limpar_dados()
         print("✅ Dados limpos!")
 
-    # Executar sincronização completa
-    sucesso = syncer.sincronizar_banco(baixar_fotos=False)
+    # Executar sincronização completa (linhas rejeitadas vão para um CSV de revisão,
+    # fora do controle de versão: ver .gitignore)
+    Config.DATA_DIR.mkdir(parents=True, exist_ok=True)
+    sucesso = syncer.sincronizar_banco(
+        baixar_fotos=False,
+        rejeitados_csv=Config.DATA_DIR / "rejeitados_importacao.csv",
+    )
 
     if sucesso:
         print("\n" + "=" * 60)
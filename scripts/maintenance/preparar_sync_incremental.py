@@ -0,0 +1,35 @@
+"""
+Prepara o banco para a sincronização incremental do Google Sheets
+
+Migração avulsa (executar uma vez por banco): cria jogadores.hash_planilha,
+limpa transfermarkt_id vazio ou repetido e cria o índice único usado pelo
+ON CONFLICT. Detalhes em src/sync/schema_incremental.py.
+
+Executar: python scripts/maintenance/preparar_sync_incremental.py
+"""
+
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database import ScoutingDatabase
+from src.sync.schema_incremental import preparar_schema_incremental
+
+
+def main():
+    print("🔵 Conectando ao banco de dados...")
+    db = ScoutingDatabase()
+
+    removidos = preparar_schema_incremental(db.engine)
+
+    if removidos:
+        print(f"⚠️ {len(removidos)} jogador(es) com transfermarkt_id repetido ficaram sem o id:")
+        for id_jogador, tm_id in removidos:
+            print(f"   id_jogador={id_jogador} (TM {tm_id})")
+    print("✅ Banco pronto para a sincronização incremental.")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,8 +35,13 @@ ON jogadores(nacionalidade);
 CREATE INDEX IF NOT EXISTS idx_jogadores_idade 
 ON jogadores(idade_atual);
 
+-- Índice composto para paginação keyset (ORDER BY nome, id_jogador)
+CREATE INDEX IF NOT EXISTS ix_jogadores_nome_id 
+ON jogadores(nome, id_jogador);
+
 COMMENT ON INDEX idx_jogadores_nome IS 'Acelera busca por nome do jogador';
 COMMENT ON INDEX idx_jogadores_transfermarkt IS 'Acelera lookup de Transfermarkt ID';
+COMMENT ON INDEX ix_jogadores_nome_id IS 'Paginação por cursor em GET /api/v1/jogadores';
 
 -- ============================================
 -- 2. ÍNDICES NA TABELA VINCULOS_CLUBES
@@ -0,0 +1,92 @@
+"""
+Oportunidades de mercado - regras vetorizadas
+
+Cada regra é uma expressão booleana sobre colunas do snapshot de jogadores
+(database.SnapshotJogadores) já unido às médias em lote
+(ScoutingDatabase.get_medias_jogadores), em vez de iterrows com uma
+consulta de média e um pd.to_datetime por jogador.
+
+Regras (limites em RegrasOportunidade):
+- jovem: idade abaixo de idade_max_jovem e média >= media_min_jovem
+- contrato: contrato termina em 1..dias_contrato dias
+- livre: status_contrato 'livre' (sem diferenciar maiúsculas)
+
+A API (backend/app/services/mercado.py) aplica as mesmas regras e limites
+padrão em SQL.
+
+Uso:
+    marcados = marcar_oportunidades(df_mercado, db.get_medias_jogadores()["media"])
+    df_oport = listar_oportunidades(marcados)  # id_jogador, jogador, tipo, detalhes
+"""
+
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+TIPOS = {
+    "jovem": "🌟 Jovem Promissor",
+    "contrato": "⏰ Contrato Curto",
+    "livre": "🆓 Livre",
+}
+
+
+class RegrasOportunidade(NamedTuple):
+    """Limites das regras (hashable: entra na chave de memoização)"""
+    idade_max_jovem: int = 23  # jovem = idade abaixo deste valor
+    media_min_jovem: float = 4.0
+    dias_contrato: int = 180
+
+
+def marcar_oportunidades(
+    df: pd.DataFrame,
+    medias: pd.Series,
+    regras: RegrasOportunidade = RegrasOportunidade(),
+    hoje: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    Acrescenta media, dias_restantes e uma coluna booleana por regra (TIPOS)
+
+    Args:
+        df: jogadores (id_jogador, nome, idade_atual, posicao,
+            data_fim_contrato, status_contrato)
+        medias: média por id_jogador (índice); sem avaliação = 0
+        regras: limites das regras
+        hoje: data de referência (padrão: agora)
+    """
+    hoje = pd.Timestamp.now().normalize() if hoje is None else pd.Timestamp(hoje)
+    out = df.copy()
+
+    out["media"] = out["id_jogador"].map(medias).astype(float).fillna(0.0)
+    fim = pd.to_datetime(out["data_fim_contrato"], errors="coerce")
+    out["dias_restantes"] = (fim - hoje).dt.days.astype("Int64")
+    idade = out["idade_atual"].astype("Float64")
+
+    out["jovem"] = ((idade < regras.idade_max_jovem) & (out["media"] >= regras.media_min_jovem)).fillna(False).astype(bool)
+    out["contrato"] = out["dias_restantes"].between(1, regras.dias_contrato).fillna(False).astype(bool)
+    out["livre"] = out["status_contrato"].astype("string").str.lower().eq("livre").fillna(False).astype(bool)
+    return out
+
+
+def listar_oportunidades(marcados: pd.DataFrame) -> pd.DataFrame:
+    """
+    Uma linha por (jogador, regra atendida), na ordem de TIPOS
+
+    Colunas: id_jogador, jogador, tipo, detalhes
+    """
+    idade = marcados["idade_atual"].astype("string").fillna("N/A")
+    detalhes = {
+        "jovem": idade + " anos, Média: " + marcados["media"].map("{:.1f}".format),
+        "contrato": "Vence em " + marcados["dias_restantes"].astype("string") + " dias",
+        "livre": marcados["posicao"].astype("string").fillna("N/A") + ", " + idade + " anos",
+    }
+
+    partes = []
+    for regra, tipo in TIPOS.items():
+        mascara = marcados[regra]
+        partes.append(pd.DataFrame({
+            "id_jogador": marcados.loc[mascara, "id_jogador"],
+            "jogador": marcados.loc[mascara, "nome"],
+            "tipo": tipo,
+            "detalhes": detalhes[regra][mascara],
+        }))
+    return pd.concat(partes, ignore_index=True)
@@ -33,6 +33,12 @@ class Config:
     TM_MAX_RETRIES = int(os.getenv("TM_MAX_RETRIES", "3"))
     TM_BASE_URL = "https://www.transfermarkt.com.br"
 
+    # Cache HTTP em disco (Transfermarkt / FotMob)
+    HTTP_CACHE_DIR = DATA_DIR / os.getenv("HTTP_CACHE_DIR", "http_cache")
+    HTTP_CACHE_MAX_MB = int(os.getenv("HTTP_CACHE_MAX_MB", "200"))
+    HTTP_CACHE_TTL = int(os.getenv("HTTP_CACHE_TTL", "86400"))  # sem max-age do servidor
+    HTTP_CACHE_OFFLINE = os.getenv("HTTP_CACHE_OFFLINE", "false").lower() == "true"
+
     # Notificações
     EMAIL_ENABLED = os.getenv("EMAIL_ENABLED", "false").lower() == "true"
     EMAIL_USER = os.getenv("EMAIL_USER")
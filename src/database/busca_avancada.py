@@ -0,0 +1,154 @@
+"""
+Busca Avançada - montagem da consulta única (todos os filtros no banco)
+
+A média mínima é aplicada sobre uma subconsulta com a última avaliação de
+cada jogador (ROW_NUMBER), e as tags aceitam dois modos:
+- 'qualquer': jogador com pelo menos uma das tags (padrão, comportamento antigo)
+- 'todas': jogador com todas as tags selecionadas
+
+Parâmetros nomeados (:nome), aceitos tanto por sqlite3 quanto por
+sqlalchemy.text(), então a mesma consulta serve ao banco SQLite legado
+(database_antigo_sqlite.py) e ao database.py (SQLite/PostgreSQL).
+
+Uso:
+    sql, params = montar_busca_avancada(filtros)
+    df = pd.read_sql_query(sql, conn, params=params)
+"""
+
+import json
+from datetime import date, timedelta
+from typing import Optional, Tuple
+
+# Filtro "contrato vencendo": até 12 meses a partir de hoje
+DIAS_CONTRATO_VENCENDO = 365
+
+TAGS_QUALQUER = "qualquer"
+TAGS_TODAS = "todas"
+
+
+def _lista(params, prefixo, valores):
+    """Placeholders :prefixo0, :prefixo1... para um IN (...)"""
+    nomes = []
+    for i, valor in enumerate(valores):
+        params[f"{prefixo}{i}"] = valor
+        nomes.append(f":{prefixo}{i}")
+    return ", ".join(nomes)
+
+
+def filtros_canonicos(filtros: dict) -> str:
+    """
+    JSON canônico dos filtros: campos vazios descartados, listas ordenadas
+    e sem repetição, chaves ordenadas. Filtros equivalentes geram o mesmo
+    texto (chave de cache e forma gravada nas buscas salvas).
+    """
+    dados = {}
+    for campo, valor in filtros.items():
+        if valor is None or valor == [] or valor is False:
+            continue
+        dados[campo] = sorted(set(valor)) if isinstance(valor, (list, tuple)) else valor
+    if "tags" not in dados:
+        dados.pop("tags_modo", None)  # sem tags o modo não muda o resultado
+    elif dados.get("tags_modo") == TAGS_QUALQUER:
+        del dados["tags_modo"]
+    return json.dumps(dados, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def montar_busca_avancada(
+    filtros: dict,
+    tabela_vinculos: str = "vinculos_clubes",
+    id_avaliacao: str = "id",
+    hoje: Optional[date] = None,
+) -> Tuple[str, dict]:
+    """
+    Monta a consulta da busca avançada
+
+    Args:
+        filtros: {
+            'posicoes': [...], 'clubes': [...], 'nacionalidades': [...],
+            'idade_min': 18, 'idade_max': 25, 'media_min': 3.5,
+            'contrato_vencendo': True,
+            'tags': [1, 2], 'tags_modo': 'qualquer' | 'todas'
+        }
+        tabela_vinculos: 'vinculos_clubes' (database.py) ou 'vinculos' (legado)
+        id_avaliacao: chave de avaliacoes usada para desempatar avaliações do mesmo dia
+
+    Returns:
+        (sql, params). Colunas: j.*, clube, posicao, liga_clube,
+        data_fim_contrato, status_contrato e media_geral (média dos 4 pilares
+        da última avaliação, 0 se não avaliado), ordenado por nome.
+    """
+    params = {}
+    condicoes = []
+
+    if filtros.get("posicoes"):
+        condicoes.append(f"v.posicao IN ({_lista(params, 'pos', filtros['posicoes'])})")
+
+    if filtros.get("nacionalidades"):
+        condicoes.append(f"j.nacionalidade IN ({_lista(params, 'nac', filtros['nacionalidades'])})")
+
+    if filtros.get("clubes"):
+        condicoes.append(f"v.clube IN ({_lista(params, 'clube', filtros['clubes'])})")
+
+    if filtros.get("idade_min"):
+        condicoes.append("j.idade_atual >= :idade_min")
+        params["idade_min"] = filtros["idade_min"]
+
+    if filtros.get("idade_max"):
+        condicoes.append("j.idade_atual <= :idade_max")
+        params["idade_max"] = filtros["idade_max"]
+
+    if filtros.get("contrato_vencendo"):
+        # Data calculada aqui: mesma comparação no SQLite (texto ISO) e no PostgreSQL
+        limite = (hoje or date.today()) + timedelta(days=DIAS_CONTRATO_VENCENDO)
+        condicoes.append("v.data_fim_contrato <= :limite_contrato")
+        params["limite_contrato"] = limite.isoformat()
+
+    if filtros.get("media_min"):
+        condicoes.append("COALESCE(m.media_geral, 0) >= :media_min")
+        params["media_min"] = filtros["media_min"]
+
+    tags = list(dict.fromkeys(filtros.get("tags") or []))
+    if tags:
+        placeholders = _lista(params, "tag", tags)
+        if filtros.get("tags_modo", TAGS_QUALQUER) == TAGS_TODAS:
+            condicoes.append(f"""j.id_jogador IN (
+                SELECT id_jogador FROM jogador_tags
+                WHERE id_tag IN ({placeholders})
+                GROUP BY id_jogador
+                HAVING COUNT(DISTINCT id_tag) = :total_tags
+            )""")
+            params["total_tags"] = len(tags)
+        else:
+            condicoes.append(f"""EXISTS (
+                SELECT 1 FROM jogador_tags jt
+                WHERE jt.id_jogador = j.id_jogador AND jt.id_tag IN ({placeholders})
+            )""")
+
+    where = " AND ".join(condicoes) if condicoes else "1=1"
+
+    sql = f"""
+    SELECT
+        j.*,
+        v.clube,
+        v.posicao,
+        v.liga_clube,
+        v.data_fim_contrato,
+        v.status_contrato,
+        COALESCE(m.media_geral, 0) AS media_geral
+    FROM jogadores j
+    LEFT JOIN {tabela_vinculos} v ON j.id_jogador = v.id_jogador
+    LEFT JOIN (
+        SELECT id_jogador,
+               (nota_tatico + nota_tecnico + nota_fisico + nota_mental) / 4.0 AS media_geral
+        FROM (
+            SELECT a.*, ROW_NUMBER() OVER (
+                PARTITION BY id_jogador ORDER BY data_avaliacao DESC, {id_avaliacao} DESC
+            ) AS ordem
+            FROM avaliacoes a
+        ) ultimas
+        WHERE ordem = 1
+    ) m ON m.id_jogador = j.id_jogador
+    WHERE {where}
+    ORDER BY j.nome
+    """
+    return sql, params
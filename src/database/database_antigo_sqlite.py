@@ -6,12 +6,14 @@ Gerencia conexões com SQLite e integração segura com Google Sheets
 import json
 import os
 import sqlite3
-from datetime import datetime
 
 import gspread
 import pandas as pd
 import streamlit as st
 
+from src.database.busca_avancada import montar_busca_avancada
+from src.sync.normalizacao import ESCALA_LEGADO, normalizar_planilha, registros
+
 
 class ScoutingDatabase:
     def __init__(self, db_path="scouting.db"):
@@ -498,163 +500,72 @@ class ScoutingDatabase:
         conn.commit()
         conn.close()
 
-    def importar_dados_planilha(self, df):
-        """Importa dados do DataFrame da planilha para o banco"""
+    def importar_dados_planilha(self, df, rejeitados_csv=None):
+        """
+        Importa dados do DataFrame da planilha para o banco
+
+        A conversão de tipos é feita de uma vez por normalizar_planilha;
+        linhas sem ID/Nome e células inválidas vão para o relatório de
+        rejeitados (gravado em rejeitados_csv, se informado).
+        """
         print(f"\n💾 Importando {len(df)} jogadores para o banco de dados...")
 
+        resultado = normalizar_planilha(df, escala=ESCALA_LEGADO, exigir_id=True)
+        rejeitados = resultado.rejeitados
+        linhas_ignoradas = int(rejeitados["descartada"].sum()) if not rejeitados.empty else 0
+
+        if rejeitados_csv and not rejeitados.empty:
+            rejeitados.to_csv(rejeitados_csv, index=False)
+            print(f"   • Rejeitados salvos em {rejeitados_csv}")
+
         sucesso = 0
         erros = 0
-        linhas_ignoradas = 0
 
-        for idx, row in df.iterrows():
+        for indice, jogador in zip(resultado.validos.index, registros(resultado.validos)):
             try:
-                # Validar ID (campo obrigatório)
-                id_str = str(row.get("ID", "")).strip()
-                if not id_str or id_str == "" or id_str == "nan":
-                    linhas_ignoradas += 1
-                    continue
-
-                try:
-                    id_jogador = int(float(id_str))
-                except (ValueError, TypeError):
-                    linhas_ignoradas += 1
-                    continue
-
-                # Validar nome (campo obrigatório)
-                nome = str(row.get("Nome", "")).strip()
-                if not nome or nome == "" or nome == "nan":
-                    linhas_ignoradas += 1
-                    continue
-
-                # Extrair dados do jogador com tratamento de valores vazios
-                nacionalidade = (
-                    str(row.get("Nacionalidade", ""))
-                    if pd.notna(row.get("Nacionalidade"))
-                    else ""
-                )
-
-                # Ano de nascimento
-                ano_nascimento = None
-                try:
-                    ano_str = str(row.get("Ano", "")).strip()
-                    if ano_str and ano_str != "nan" and ano_str != "":
-                        ano_nascimento = int(float(ano_str))
-                except (ValueError, TypeError):
-                    pass
-
-                # Idade atual
-                idade_atual = None
-                try:
-                    idade_str = str(row.get("Idade", "")).strip()
-                    if idade_str and idade_str != "nan" and idade_str != "":
-                        idade_atual = int(float(idade_str))
-                except (ValueError, TypeError):
-                    pass
-
-                # Altura
-                altura = None
-                try:
-                    altura_str = str(row.get("Altura", "")).strip()
-                    if altura_str and altura_str != "nan" and altura_str != "":
-                        altura_float = float(altura_str)
-                        if altura_float < 3:
-                            altura = int(altura_float * 100)  # 1.75 -> 175
-                        else:
-                            altura = int(altura_float)
-                except (ValueError, TypeError):
-                    pass
-
-                pe_dominante = str(row.get("Pé", "")) if pd.notna(row.get("Pé")) else ""
-                transfermarkt_id = (
-                    str(row.get("TM", "")) if pd.notna(row.get("TM")) else None
-                )
+                id_jogador = jogador["id_planilha"]
 
-                # Inserir jogador
                 self.inserir_jogador(
                     id_jogador=id_jogador,
-                    nome=nome,
-                    nacionalidade=nacionalidade,
-                    ano_nascimento=ano_nascimento,
-                    idade_atual=idade_atual,
-                    altura=altura,
-                    pe_dominante=pe_dominante,
-                    transfermarkt_id=transfermarkt_id,
-                )
-
-                # Extrair dados do vínculo
-                clube = str(row.get("Clube", "")) if pd.notna(row.get("Clube")) else ""
-                liga_clube = (
-                    str(row.get("Liga do Clube", ""))
-                    if pd.notna(row.get("Liga do Clube"))
-                    else ""
-                )
-                posicao = (
-                    str(row.get("Posição", "")) if pd.notna(row.get("Posição")) else ""
-                )
-                fim_contrato = (
-                    str(row.get("Fim de contrato", ""))
-                    if pd.notna(row.get("Fim de contrato"))
-                    else ""
+                    nome=jogador["nome"],
+                    nacionalidade=jogador["nacionalidade"] or "",
+                    ano_nascimento=jogador["ano_nascimento"],
+                    idade_atual=jogador["idade_atual"],
+                    altura=jogador["altura"],
+                    pe_dominante=jogador["pe_dominante"] or "",
+                    transfermarkt_id=jogador["transfermarkt_id"],
                 )
 
-                status_contrato = self._determinar_status_contrato(fim_contrato)
+                status_contrato = jogador["status_contrato"]
 
                 # Inserir vínculo
-                if clube and posicao:
+                if jogador["clube"] and jogador["posicao"]:
                     self.inserir_vinculo(
                         id_jogador=id_jogador,
-                        clube=clube,
-                        liga_clube=liga_clube,
-                        posicao=posicao,
-                        data_fim_contrato=fim_contrato,
+                        clube=jogador["clube"],
+                        liga_clube=jogador["liga_clube"] or "",
+                        posicao=jogador["posicao"],
+                        data_fim_contrato=jogador["data_fim_contrato"] or "",
                         status_contrato=status_contrato,
                     )
 
-                self._criar_alertas_automaticos(id_jogador, row, status_contrato)
+                self._criar_alertas_automaticos(id_jogador, df.loc[indice], status_contrato)
 
                 sucesso += 1
 
             except Exception as e:
                 erros += 1
-                nome_erro = row.get("Nome", "desconhecido")
-                print(f"❌ Erro ao importar jogador {nome_erro}: {str(e)}")
+                print(f"❌ Erro ao importar jogador {jogador['nome']} (linha {jogador['linha']}): {str(e)}")
 
         print(f"\n✅ Importação concluída!")
         print(f"   • Sucessos: {sucesso}")
         print(f"   • Erros: {erros}")
-        print(f"   • Linhas vazias ignoradas: {linhas_ignoradas}")
+        print(f"   • Linhas ignoradas (sem ID/Nome): {linhas_ignoradas}")
+        if len(rejeitados) > linhas_ignoradas:
+            print(f"   • Valores inválidos descartados: {len(rejeitados) - linhas_ignoradas}")
 
         return sucesso > 0
 
-    def _determinar_status_contrato(self, fim_contrato_str):
-        """Determina o status do contrato baseado na data de fim"""
-        try:
-            if (
-                not fim_contrato_str
-                or fim_contrato_str == ""
-                or fim_contrato_str == "nan"
-            ):
-                return "indefinido"
-
-            from dateutil import parser
-
-            fim_contrato = parser.parse(fim_contrato_str)
-            hoje = datetime.now()
-
-            diferenca = fim_contrato - hoje
-
-            if diferenca.days < 0:
-                return "expirado"
-            elif diferenca.days <= 180:  # 6 meses
-                return "ultimos_6_meses"
-            elif diferenca.days <= 365:  # 1 ano
-                return "ultimo_ano"
-            else:
-                return "ativo"
-
-        except Exception:
-            return "indefinido"
-
     def _criar_alertas_automaticos(self, id_jogador, row, status_contrato):
         """Cria alertas automáticos baseados nos dados do jogador"""
 
@@ -1028,82 +939,17 @@ class ScoutingDatabase:
             'media_min': 3.5,
             'contrato_vencendo': True,
             'clubes': ['Flamengo', 'Palmeiras'],
-            'tags': [1, 2, 3]  # IDs das tags
+            'tags': [1, 2, 3],  # IDs das tags
+            'tags_modo': 'qualquer'  # ou 'todas'
         }
+
+        Todos os filtros (inclusive média mínima) são aplicados no banco.
         """
         conn = self.connect()
-        
-        query = """
-        SELECT DISTINCT
-            j.*,
-            v.clube,
-            v.posicao,
-            v.liga_clube,
-            v.data_fim_contrato,
-            v.status_contrato
-        FROM jogadores j
-        LEFT JOIN vinculos_clubes v ON j.id_jogador = v.id_jogador
-        LEFT JOIN jogador_tags jt ON j.id_jogador = jt.id_jogador
-        WHERE 1=1
-        """
-        
-        params = {}
-        
-        # Filtro de posições
-        if filtros.get('posicoes'):
-            placeholders = ','.join([f':pos{i}' for i in range(len(filtros['posicoes']))])
-            query += f" AND v.posicao IN ({placeholders})"
-            for i, pos in enumerate(filtros['posicoes']):
-                params[f'pos{i}'] = pos
-        
-        # Filtro de nacionalidades
-        if filtros.get('nacionalidades'):
-            placeholders = ','.join([f':nac{i}' for i in range(len(filtros['nacionalidades']))])
-            query += f" AND j.nacionalidade IN ({placeholders})"
-            for i, nac in enumerate(filtros['nacionalidades']):
-                params[f'nac{i}'] = nac
-        
-        # Filtro de idade
-        if filtros.get('idade_min'):
-            query += " AND j.idade_atual >= :idade_min"
-            params['idade_min'] = filtros['idade_min']
-        
-        if filtros.get('idade_max'):
-            query += " AND j.idade_atual <= :idade_max"
-            params['idade_max'] = filtros['idade_max']
-        
-        # Filtro de clubes
-        if filtros.get('clubes'):
-            placeholders = ','.join([f':clube{i}' for i in range(len(filtros['clubes']))])
-            query += f" AND v.clube IN ({placeholders})"
-            for i, clube in enumerate(filtros['clubes']):
-                params[f'clube{i}'] = clube
-        
-        # Filtro de contrato vencendo
-        if filtros.get('contrato_vencendo'):
-            query += " AND v.data_fim_contrato <= CURRENT_DATE + INTERVAL '12 months'"
-        
-        # Filtro de tags
-        if filtros.get('tags'):
-            placeholders = ','.join([f':tag{i}' for i in range(len(filtros['tags']))])
-            query += f" AND jt.id_tag IN ({placeholders})"
-            for i, tag in enumerate(filtros['tags']):
-                params[f'tag{i}'] = tag
-        
-        query += " ORDER BY j.nome"
-        
-        df = pd.read_sql_query(query, conn, params=params if params else None)
-        
-        # Filtro de média (precisa calcular)
-        if filtros.get('media_min'):
-            # Adicionar coluna de média
-            medias = []
-            for _, jogador in df.iterrows():
-                media = self.calcular_media_jogador(jogador['id_jogador'])
-                medias.append(media)
-            df['media_geral'] = medias
-            df = df[df['media_geral'] >= filtros['media_min']]
-        
+        sql, params = montar_busca_avancada(
+            filtros, tabela_vinculos="vinculos", id_avaliacao="id_avaliacao"
+        )
+        df = pd.read_sql_query(sql, conn, params=params)
         conn.close()
         return df
     
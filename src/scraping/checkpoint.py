@@ -0,0 +1,174 @@
+"""
+Checkpoint de execuções longas de scraping
+
+Grava no próprio banco (SQLite ou PostgreSQL) o resultado de cada jogador
+processado, para que uma execução interrompida (crash, deploy, Ctrl+C)
+seja retomada de onde parou em vez de recomeçar do jogador #1.
+
+Tabelas:
+- scraping_execucoes: uma linha por tarefa ('fotos', 'agentes'), com o
+  último id_jogador processado e se a execução terminou
+- scraping_checkpoint: resultado por jogador (status + motivo do erro)
+
+Uso:
+    checkpoint = CheckpointScraping(db.connect(), "fotos")
+    ja_processados = checkpoint.iniciar()        # ids a pular (retomada)
+    ...
+    checkpoint.registrar(id_jogador, "sucesso")
+    checkpoint.registrar(id_jogador, "falha", "Status 404")
+    ...
+    checkpoint.concluir()
+"""
+
+import sqlite3
+
+STATUS_SUCESSO = "sucesso"
+STATUS_FALHA = "falha"
+
+_CREATE_EXECUCOES = """
+    CREATE TABLE IF NOT EXISTS scraping_execucoes (
+        tarefa VARCHAR(50) PRIMARY KEY,
+        iniciado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        concluido_em TIMESTAMP,
+        ultimo_id_jogador INTEGER
+    )
+"""
+
+_CREATE_CHECKPOINT = """
+    CREATE TABLE IF NOT EXISTS scraping_checkpoint (
+        tarefa VARCHAR(50) NOT NULL,
+        id_jogador INTEGER NOT NULL,
+        status VARCHAR(20) NOT NULL,
+        motivo TEXT,
+        processado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (tarefa, id_jogador)
+    )
+"""
+
+
+class CheckpointScraping:
+    """
+    Checkpoint por jogador de uma tarefa de scraping
+
+    Args:
+        conn: conexão DB-API (sqlite3 ou psycopg2); o checkpoint faz commit
+            a cada registro, então use uma conexão dedicada
+        tarefa: nome da tarefa ('fotos', 'agentes', ...)
+    """
+
+    def __init__(self, conn, tarefa):
+        self.conn = conn
+        self.tarefa = tarefa
+        # sqlite3 usa '?', psycopg2 usa '%s'
+        self._ph = "?" if isinstance(conn, sqlite3.Connection) else "%s"
+
+    def _sql(self, query):
+        return query.replace("?", self._ph)
+
+    def _executar(self, query, params=()):
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(self._sql(query), params)
+            return cursor.fetchall() if cursor.description else None
+        finally:
+            cursor.close()
+
+    def iniciar(self, retomar=True):
+        """
+        Abre (ou retoma) a execução da tarefa
+
+        Args:
+            retomar: se False, descarta o checkpoint de uma execução interrompida
+
+        Returns:
+            set de id_jogador já processados na execução em andamento
+            (vazio quando começa uma execução nova)
+        """
+        self._executar(_CREATE_EXECUCOES)
+        self._executar(_CREATE_CHECKPOINT)
+
+        linha = self._executar(
+            "SELECT concluido_em FROM scraping_execucoes WHERE tarefa = ?", (self.tarefa,)
+        )
+        em_andamento = bool(linha) and linha[0][0] is None
+
+        if em_andamento and retomar:
+            processados = {
+                row[0]
+                for row in self._executar(
+                    "SELECT id_jogador FROM scraping_checkpoint WHERE tarefa = ?", (self.tarefa,)
+                )
+            }
+            self.conn.commit()
+            return processados
+
+        # Execução nova: limpa os resultados da anterior
+        self._executar("DELETE FROM scraping_checkpoint WHERE tarefa = ?", (self.tarefa,))
+        self._executar(
+            """
+            INSERT INTO scraping_execucoes (tarefa, iniciado_em, atualizado_em, concluido_em, ultimo_id_jogador)
+            VALUES (?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, NULL, NULL)
+            ON CONFLICT (tarefa) DO UPDATE SET
+                iniciado_em = CURRENT_TIMESTAMP,
+                atualizado_em = CURRENT_TIMESTAMP,
+                concluido_em = NULL,
+                ultimo_id_jogador = NULL
+            """,
+            (self.tarefa,),
+        )
+        self.conn.commit()
+        return set()
+
+    def registrar(self, id_jogador, status, motivo=None):
+        """Grava o resultado de um jogador (commit imediato)"""
+        id_jogador = int(id_jogador)
+        self._executar(
+            """
+            INSERT INTO scraping_checkpoint (tarefa, id_jogador, status, motivo, processado_em)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT (tarefa, id_jogador) DO UPDATE SET
+                status = excluded.status,
+                motivo = excluded.motivo,
+                processado_em = excluded.processado_em
+            """,
+            (self.tarefa, id_jogador, status, motivo),
+        )
+        self._executar(
+            """
+            UPDATE scraping_execucoes
+            SET ultimo_id_jogador = ?, atualizado_em = CURRENT_TIMESTAMP
+            WHERE tarefa = ?
+            """,
+            (id_jogador, self.tarefa),
+        )
+        self.conn.commit()
+
+    def concluir(self):
+        """Marca a execução como terminada (a próxima começa do zero)"""
+        self._executar(
+            "UPDATE scraping_execucoes SET concluido_em = CURRENT_TIMESTAMP WHERE tarefa = ?",
+            (self.tarefa,),
+        )
+        self.conn.commit()
+
+    def resumo(self):
+        """Contagem por status e motivos de falha da execução atual"""
+        contagem = {
+            status: total
+            for status, total in self._executar(
+                "SELECT status, COUNT(*) FROM scraping_checkpoint WHERE tarefa = ? GROUP BY status",
+                (self.tarefa,),
+            )
+        }
+        motivos = {
+            motivo: total
+            for motivo, total in self._executar(
+                """
+                SELECT motivo, COUNT(*) FROM scraping_checkpoint
+                WHERE tarefa = ? AND status = ? GROUP BY motivo
+                """,
+                (self.tarefa, STATUS_FALHA),
+            )
+        }
+        return {"status": contagem, "motivos": motivos}
@@ -0,0 +1,147 @@
+"""
+HTTP assíncrono para scraping educado
+
+- TokenBucket: limita a taxa de requisições (com pequena rajada) e pode ser pausado
+- LimitadorPorHost: um bucket por host (página e CDN de imagens têm limites separados)
+- requisitar_com_retry: GET com retry e backoff exponencial em 429/5xx e erros de rede;
+  um 429 (ou Retry-After) pausa o host inteiro, não só a tarefa que o recebeu
+"""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import httpx
+
+# Status que indicam sobrecarga/erro temporário do servidor
+STATUS_RETRY = {429, 500, 502, 503, 504}
+
+# Teto de espera entre tentativas (segundos)
+BACKOFF_MAXIMO = 60.0
+
+
+class TokenBucket:
+    """
+    Token bucket assíncrono
+
+    Args:
+        taxa: tokens repostos por segundo (requisições/s em regime)
+        capacidade: tamanho máximo da rajada
+    """
+
+    def __init__(self, taxa, capacidade=1):
+        if taxa <= 0:
+            raise ValueError("taxa deve ser positiva")
+        self.taxa = taxa
+        self.capacidade = capacidade
+        self.tokens = float(capacidade)
+        self.ultimo = time.monotonic()
+        self.pausado_ate = 0.0
+        self._lock = asyncio.Lock()
+
+    def _repor(self):
+        agora = time.monotonic()
+        self.tokens = min(self.capacidade, self.tokens + (agora - self.ultimo) * self.taxa)
+        self.ultimo = agora
+
+    def pausar(self, segundos):
+        """Suspende a entrega de tokens por `segundos` (não encurta uma pausa maior)"""
+        self.pausado_ate = max(self.pausado_ate, time.monotonic() + segundos)
+
+    async def adquirir(self):
+        """Aguarda até haver um token disponível (e o host não estar pausado) e o consome"""
+        # O lock mantém a ordem de chegada: quem espera não perde a vez
+        async with self._lock:
+            while True:
+                # A pausa pode ter sido pedida enquanto esperávamos o token
+                pausa = self.pausado_ate - time.monotonic()
+                if pausa > 0:
+                    await asyncio.sleep(pausa)
+                    continue
+                self._repor()
+                if self.tokens >= 1:
+                    break
+                await asyncio.sleep((1 - self.tokens) / self.taxa)
+            self.tokens -= 1
+
+
+class LimitadorPorHost:
+    """Um TokenBucket por host, criado sob demanda"""
+
+    def __init__(self, taxa, capacidade=1):
+        self.taxa = taxa
+        self.capacidade = capacidade
+        self._buckets = {}
+
+    def bucket(self, url):
+        host = urlsplit(str(url)).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.taxa, self.capacidade)
+        return self._buckets[host]
+
+    async def adquirir(self, url):
+        await self.bucket(url).adquirir()
+
+    def pausar(self, url, segundos):
+        self.bucket(url).pausar(segundos)
+
+
+def _retry_after(response):
+    """Segundos pedidos pelo header Retry-After (número ou data HTTP)"""
+    valor = response.headers.get("Retry-After")
+    if not valor:
+        return None
+    try:
+        return max(0.0, float(valor))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(valor).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def calcular_backoff(tentativa, base=1.0):
+    """Backoff exponencial com jitter: base * 2^tentativa (+ até 25%)"""
+    espera = base * (2 ** tentativa)
+    return min(BACKOFF_MAXIMO, espera + random.uniform(0, espera * 0.25))
+
+
+async def requisitar_com_retry(client, url, limitador, tentativas=4, backoff_base=1.0):
+    """
+    GET respeitando o limite do host, com retry em 429/5xx e erros de rede
+
+    Returns:
+        httpx.Response da última tentativa (pode ser um 429/5xx se esgotou as tentativas)
+
+    Raises:
+        httpx.TransportError: se todas as tentativas falharam por erro de rede
+    """
+    for tentativa in range(tentativas):
+        await limitador.adquirir(url)
+        ultima = tentativa == tentativas - 1
+
+        try:
+            response = await client.get(url)
+        except httpx.TransportError:
+            if ultima:
+                raise
+            await asyncio.sleep(calcular_backoff(tentativa, backoff_base))
+            continue
+
+        if response.status_code not in STATUS_RETRY or ultima:
+            return response
+
+        retry_after = _retry_after(response)
+        espera = min(BACKOFF_MAXIMO, retry_after if retry_after is not None
+                     else calcular_backoff(tentativa, backoff_base))
+        if response.status_code == 429 or retry_after is not None:
+            # O limite é do host: as outras tarefas também esperam (o próximo
+            # adquirir() desta tarefa aguarda a pausa)
+            limitador.pausar(url, espera)
+        else:
+            await asyncio.sleep(espera)
+
+    return response
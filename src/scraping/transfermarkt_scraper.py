@@ -3,15 +3,35 @@ Baixar Fotos do Transfermarkt - Versão com Scraping
 Busca a URL correta da foto na página do jogador
 """
 
+import asyncio
 import os
 import re
 import time
 
+import httpx
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
 from src.database.database_antigo_sqlite import ScoutingDatabase
+from src.scraping.checkpoint import STATUS_FALHA, STATUS_SUCESSO, CheckpointScraping
+from src.scraping.http_async import LimitadorPorHost, requisitar_com_retry
+
+URL_PAGINA = "https://www.transfermarkt.com.br/player/profil/spieler/{tm_id}"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Fotos menores que isso são o placeholder "sem foto"
+TAMANHO_MINIMO_FOTO = 1000
+
+# Jogadores processados ao mesmo tempo
+CONCORRENCIA_PADRAO = 8
+
+# Requisições por segundo para cada host (página e CDN de imagens contam separado);
+# 1 a cada 2s, o mesmo ritmo do script sequencial antigo (delay=2.0)
+TAXA_POR_HOST_PADRAO = 0.5
 
 
 def extrair_id_da_url(tm_value):
@@ -39,49 +59,56 @@ def extrair_id_da_url(tm_value):
     return None
 
 
+def extrair_url_foto_do_html(html):
+    """
+    Extrai a URL da foto grande (portrait/big) do HTML da página do jogador
+
+    Função pura (sem rede): testável com HTML salvo.
+
+    Returns:
+        URL sem parâmetros de query, ou None se não encontrada
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Procurar pela tag img com a foto do jogador
+    # Padrão: <img src='https://img.a.transfermarkt.technology/portrait/big/68290-1692601435.jpg?lm=1' ...>
+
+    # Método 1: Buscar no modal da foto
+    modal_img = soup.find("img", {"src": re.compile(r"portrait/big/.*\.jpg")})
+    if modal_img and modal_img.get("src"):
+        # Remover parâmetros de query (?lm=1)
+        return modal_img["src"].split("?")[0]
+
+    # Método 2: Buscar em data-src
+    modal_img = soup.find("img", {"data-src": re.compile(r"portrait/big/.*\.jpg")})
+    if modal_img and modal_img.get("data-src"):
+        return modal_img["data-src"].split("?")[0]
+
+    # Método 3: Buscar qualquer img com portrait/big
+    for img in soup.find_all("img"):
+        src = img.get("src", "") or img.get("data-src", "")
+        if "portrait/big" in src and ".jpg" in src:
+            return src.split("?")[0]
+
+    return None
+
+
 def extrair_url_foto_da_pagina(tm_id):
     """
     Acessa a página do jogador e extrai a URL completa da foto
     """
-    url_pagina = f"https://www.transfermarkt.com.br/player/profil/spieler/{tm_id}"
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+    url_pagina = URL_PAGINA.format(tm_id=tm_id)
 
     try:
-        response = requests.get(url_pagina, headers=headers, timeout=15)
+        response = requests.get(url_pagina, headers=HEADERS, timeout=15)
 
         if response.status_code != 200:
             return None, f"Status {response.status_code}"
 
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # Procurar pela tag img com a foto do jogador
-        # Padrão: <img src='https://img.a.transfermarkt.technology/portrait/big/68290-1692601435.jpg?lm=1' ...>
-
-        # Método 1: Buscar no modal da foto
-        modal_img = soup.find("img", {"src": re.compile(r"portrait/big/.*\.jpg")})
-        if modal_img and modal_img.get("src"):
-            url_foto = modal_img["src"]
-            # Remover parâmetros de query (?lm=1)
-            url_foto = url_foto.split("?")[0]
+        url_foto = extrair_url_foto_do_html(response.content)
+        if url_foto:
             return url_foto, "OK"
 
-        # Método 2: Buscar em data-src
-        modal_img = soup.find("img", {"data-src": re.compile(r"portrait/big/.*\.jpg")})
-        if modal_img and modal_img.get("data-src"):
-            url_foto = modal_img["data-src"]
-            url_foto = url_foto.split("?")[0]
-            return url_foto, "OK"
-
-        # Método 3: Buscar qualquer img com portrait/big
-        for img in soup.find_all("img"):
-            src = img.get("src", "") or img.get("data-src", "")
-            if "portrait/big" in src and ".jpg" in src:
-                url_foto = src.split("?")[0]
-                return url_foto, "OK"
-
         return None, "URL não encontrada no HTML"
 
     except requests.Timeout:
@@ -108,13 +135,9 @@ def baixar_foto_com_scraping(tm_value, id_jogador, nome_jogador):
 
     # Baixar a foto
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
+        response = requests.get(url_foto, headers=HEADERS, timeout=10)
 
-        response = requests.get(url_foto, headers=headers, timeout=10)
-
-        if response.status_code == 200 and len(response.content) > 1000:
+        if response.status_code == 200 and len(response.content) > TAMANHO_MINIMO_FOTO:
             foto_path = f"fotos/{id_jogador}.jpg"
             with open(foto_path, "wb") as f:
                 f.write(response.content)
@@ -126,10 +149,144 @@ def baixar_foto_com_scraping(tm_value, id_jogador, nome_jogador):
         return False, str(e)
 
 
-def baixar_todas_fotos_scraping(delay=2.0, max_jogadores=None):
+async def _baixar_foto_async(client, limitador, semaforo, tm_value, id_jogador, pasta, tentativas):
+    """Versão assíncrona de baixar_foto_com_scraping (página + foto)"""
+    tm_id = extrair_id_da_url(tm_value)
+    if not tm_id:
+        return False, "ID inválido"
+
+    async with semaforo:
+        try:
+            response = await requisitar_com_retry(
+                client, URL_PAGINA.format(tm_id=tm_id), limitador, tentativas
+            )
+            if response.status_code != 200:
+                return False, f"Status {response.status_code}"
+
+            url_foto = extrair_url_foto_do_html(response.text)
+            if not url_foto:
+                return False, "URL não encontrada no HTML"
+
+            response = await requisitar_com_retry(client, url_foto, limitador, tentativas)
+            if response.status_code != 200 or len(response.content) <= TAMANHO_MINIMO_FOTO:
+                return False, f"Status {response.status_code}"
+
+        except httpx.TimeoutException:
+            return False, "Timeout"
+        except httpx.HTTPError as e:
+            return False, str(e) or type(e).__name__
+
+    with open(os.path.join(pasta, f"{id_jogador}.jpg"), "wb") as f:
+        f.write(response.content)
+    return True, "OK"
+
+
+async def baixar_fotos_async(
+    jogadores,
+    pasta="fotos",
+    concorrencia=CONCORRENCIA_PADRAO,
+    taxa_por_host=TAXA_POR_HOST_PADRAO,
+    tentativas=4,
+    transport=None,
+    ao_concluir=None,
+):
+    """
+    Baixa as fotos de vários jogadores em paralelo
+
+    A concorrência limita quantos jogadores estão em andamento; o ritmo de
+    requisições a cada host é limitado por um token bucket (taxa_por_host
+    req/s), então a educação com o Transfermarkt não depende da concorrência.
+
+    Args:
+        jogadores: iterável de (id_jogador, nome, transfermarkt_id)
+        pasta: destino das fotos ({id_jogador}.jpg)
+        concorrencia: jogadores processados ao mesmo tempo
+        taxa_por_host: requisições por segundo para cada host
+        tentativas: tentativas por requisição (retry em 429/5xx)
+        transport: transport httpx alternativo (testes/servidor stub)
+        ao_concluir: callback(idx, total, id_jogador, nome, sucesso, motivo)
+
+    Returns:
+        dict {'sucessos', 'falhas', 'erros': {motivo: quantidade}}
+    """
+    jogadores = list(jogadores)
+    total = len(jogadores)
+    os.makedirs(pasta, exist_ok=True)
+
+    limitador = LimitadorPorHost(taxa_por_host)
+    semaforo = asyncio.Semaphore(concorrencia)
+    resumo = {"sucessos": 0, "falhas": 0, "erros": {}}
+
+    async with httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=15,
+        follow_redirects=True,
+        transport=transport,
+        limits=httpx.Limits(max_connections=concorrencia),
+    ) as client:
+
+        async def processar(id_jogador, nome, tm_value):
+            sucesso, motivo = await _baixar_foto_async(
+                client, limitador, semaforo, tm_value, id_jogador, pasta, tentativas
+            )
+            return id_jogador, nome, sucesso, motivo
+
+        tarefas = [processar(*jogador) for jogador in jogadores]
+        for idx, tarefa in enumerate(asyncio.as_completed(tarefas), 1):
+            id_jogador, nome, sucesso, motivo = await tarefa
+
+            if sucesso:
+                resumo["sucessos"] += 1
+            else:
+                resumo["falhas"] += 1
+                resumo["erros"][motivo] = resumo["erros"].get(motivo, 0) + 1
+
+            if ao_concluir:
+                ao_concluir(idx, total, id_jogador, nome, sucesso, motivo)
+
+    return resumo
+
+
+def fotos_recentes(ids_jogadores, pasta, dias):
+    """
+    IDs cuja foto em {pasta}/{id_jogador}.jpg foi salva há menos de `dias` dias
+    """
+    limite = time.time() - dias * 86400
+    recentes = set()
+    for id_jogador in ids_jogadores:
+        caminho = os.path.join(pasta, f"{id_jogador}.jpg")
+        if os.path.exists(caminho) and os.path.getmtime(caminho) >= limite:
+            recentes.add(id_jogador)
+    return recentes
+
+
+def baixar_todas_fotos_scraping(
+    delay=None,
+    max_jogadores=None,
+    concorrencia=CONCORRENCIA_PADRAO,
+    taxa_por_host=TAXA_POR_HOST_PADRAO,
+    retomar=True,
+    apenas_desatualizados_dias=None,
+):
     """
     Baixa fotos de todos os jogadores usando scraping
+
+    O resultado de cada jogador é gravado em checkpoint (tarefa 'fotos');
+    uma execução interrompida é retomada de onde parou.
+
+    Args:
+        delay: compatibilidade - intervalo mínimo (s) entre requisições ao
+            mesmo host; se informado, substitui taxa_por_host (1/delay)
+        max_jogadores: limita a quantidade de jogadores
+        concorrencia: jogadores processados ao mesmo tempo
+        taxa_por_host: requisições por segundo para cada host
+        retomar: continua a execução interrompida (False = recomeça do zero)
+        apenas_desatualizados_dias: pula jogadores com foto baixada há menos
+            de N dias
     """
+    if delay:
+        taxa_por_host = 1 / delay
+
     print("\n" + "=" * 60)
     print("📸 DOWNLOAD DE FOTOS - MÉTODO SCRAPING")
     print("=" * 60)
@@ -146,16 +303,39 @@ def baixar_todas_fotos_scraping(delay=2.0, max_jogadores=None):
     SELECT id_jogador, nome, transfermarkt_id 
     FROM jogadores 
     WHERE transfermarkt_id IS NOT NULL AND transfermarkt_id != ''
+    ORDER BY id_jogador
     """
 
-    if max_jogadores:
-        query += f" LIMIT {max_jogadores}"
-
     jogadores = pd.read_sql_query(query, conn)
-    conn.close()
+
+    # Checkpoint: pula quem já foi processado na execução interrompida
+    checkpoint = CheckpointScraping(conn, "fotos")
+    ja_processados = checkpoint.iniciar(retomar=retomar)
+    if ja_processados:
+        print(f"\n♻️  Retomando execução anterior: {len(ja_processados)} jogadores já processados")
+
+    pular = set(ja_processados)
+    if apenas_desatualizados_dias:
+        recentes = fotos_recentes(jogadores["id_jogador"], "fotos", apenas_desatualizados_dias)
+        print(f"⏭️  {len(recentes)} fotos atualizadas nos últimos {apenas_desatualizados_dias} dias")
+        pular |= recentes
+
+    if pular:
+        jogadores = jogadores[~jogadores["id_jogador"].isin(pular)]
+
+    # Limite só depois de pular os já processados: aplicado no SELECT, uma
+    # retomada buscaria sempre os mesmos jogadores e não avançaria
+    if max_jogadores:
+        jogadores = jogadores.head(int(max_jogadores))
 
     total = len(jogadores)
 
+    if total == 0 and pular:
+        print("\n✅ Nada a fazer: todos os jogadores já foram processados/atualizados.\n")
+        checkpoint.concluir()
+        conn.close()
+        return
+
     if total == 0:
         print("\n❌ Nenhum jogador com Transfermarkt ID encontrado!")
         print("\n💡 SOLUÇÃO:")
@@ -164,48 +344,52 @@ def baixar_todas_fotos_scraping(delay=2.0, max_jogadores=None):
         print("   3. Preencha com IDs do Transfermarkt")
         print("   4. Execute: python import_data.py")
         print("   5. Execute este script novamente\n")
+        checkpoint.concluir()
+        conn.close()
         return
 
+    # 2 requisições por jogador (página + foto), em hosts diferentes
     print(f"\n📊 {total} jogadores com Transfermarkt ID")
-    print(f"⏱️  Delay entre requisições: {delay}s")
-    print(f"⏱️  Tempo estimado: {int(total * delay / 60)} minutos")
+    print(f"⚡ Concorrência: {concorrencia} jogadores")
+    print(f"⏱️  Limite por host: {taxa_por_host:.2f} req/s")
+    print(f"⏱️  Tempo estimado: {max(1, int(total / taxa_por_host / 60))} minutos")
     print(f"\n⚠️  IMPORTANTE:")
     print(f"   - Este método faz scraping das páginas")
-    print(f"   - É mais lento mas mais confiável")
-    print(f"   - Respeita rate limiting do site")
+    print(f"   - Requisições em paralelo, limitadas por host")
+    print(f"   - Respeita rate limiting do site (retry com backoff em 429/5xx)")
 
     resposta = input("\nPressione ENTER para começar (ou Ctrl+C para cancelar)...")
 
-    sucessos = 0
-    falhas = 0
-    erros = {}
-
     print("\n🔄 Baixando fotos...\n")
 
-    for idx, (_, jogador) in enumerate(jogadores.iterrows(), 1):
-        id_jog = jogador["id_jogador"]
-        nome = jogador["nome"]
-        tm_value = jogador["transfermarkt_id"]
-
-        # Extrair ID para exibição
-        tm_id = extrair_id_da_url(tm_value)
-        tm_display = tm_id if tm_id else tm_value
-
-        print(f"[{idx}/{total}] {nome} (TM: {tm_display})...", end=" ", flush=True)
-
-        sucesso, motivo = baixar_foto_com_scraping(tm_value, id_jog, nome)
+    def ao_concluir(idx, total, id_jogador, nome, sucesso, motivo):
+        status = "✅" if sucesso else f"❌ ({motivo})"
+        print(f"[{idx}/{total}] {nome}... {status}", flush=True)
+        checkpoint.registrar(
+            id_jogador,
+            STATUS_SUCESSO if sucesso else STATUS_FALHA,
+            None if sucesso else motivo,
+        )
 
-        if sucesso:
-            print("✅")
-            sucessos += 1
-        else:
-            print(f"❌ ({motivo})")
-            falhas += 1
-            erros[motivo] = erros.get(motivo, 0) + 1
-
-        # Delay para não sobrecarregar
-        if idx < total:
-            time.sleep(delay)
+    inicio = time.monotonic()
+    try:
+        resumo = asyncio.run(
+            baixar_fotos_async(
+                jogadores[["id_jogador", "nome", "transfermarkt_id"]].itertuples(index=False),
+                pasta="fotos",
+                concorrencia=concorrencia,
+                taxa_por_host=taxa_por_host,
+                ao_concluir=ao_concluir,
+            )
+        )
+        checkpoint.concluir()
+    finally:
+        conn.close()
+    duracao = time.monotonic() - inicio
+
+    sucessos = resumo["sucessos"]
+    falhas = resumo["falhas"]
+    erros = resumo["erros"]
 
     # Resumo
     print("\n" + "=" * 60)
@@ -213,6 +397,7 @@ def baixar_todas_fotos_scraping(delay=2.0, max_jogadores=None):
     print("=" * 60)
     print(f"✅ Sucessos: {sucessos}/{total} ({sucessos / total * 100:.1f}%)")
     print(f"❌ Falhas: {falhas}/{total} ({falhas / total * 100:.1f}%)")
+    print(f"⏱️  Duração: {duracao / 60:.1f} minutos")
 
     if erros:
         print("\n❌ Motivos das falhas:")
@@ -290,8 +475,8 @@ def menu_principal():
     print("2 - Testar com outro jogador (digite o TM ID ou URL)")
     print("3 - Baixar primeiras 5 fotos (teste rápido)")
     print("4 - Baixar primeiras 20 fotos (teste médio)")
-    print("5 - Baixar TODAS as fotos (modo lento - 2s delay)")
-    print("6 - Baixar TODAS as fotos (modo normal - 1.5s delay)")
+    print("5 - Baixar TODAS as fotos (modo lento - 1 req a cada 4s por host)")
+    print("6 - Baixar TODAS as fotos (modo normal - 1 req a cada 2s por host)")
     print("0 - Sair")
     print("=" * 60)
 
@@ -306,16 +491,16 @@ def menu_principal():
             testar_um_jogador(tm_input)
 
     elif opcao == "3":
-        baixar_todas_fotos_scraping(delay=2.0, max_jogadores=5)
+        baixar_todas_fotos_scraping(max_jogadores=5)
 
     elif opcao == "4":
-        baixar_todas_fotos_scraping(delay=2.0, max_jogadores=20)
+        baixar_todas_fotos_scraping(max_jogadores=20)
 
     elif opcao == "5":
-        baixar_todas_fotos_scraping(delay=2.0)
+        baixar_todas_fotos_scraping(delay=4.0)
 
     elif opcao == "6":
-        baixar_todas_fotos_scraping(delay=1.5)
+        baixar_todas_fotos_scraping()
 
     elif opcao == "0":
         print("\n👋 Até logo!\n")
@@ -169,12 +169,14 @@ class GoogleSheetsSyncer:
 
         print(f"\n📊 Resultado: {sucessos} fotos baixadas, {erros} erros")
 
-    def sincronizar_banco(self, baixar_fotos=True):
+    def sincronizar_banco(self, baixar_fotos=True, rejeitados_csv=None):
         """
         Atualiza banco de dados com dados da planilha
 
         Args:
             baixar_fotos: Se True, baixa fotos do Transfermarkt
+            rejeitados_csv: caminho para salvar as linhas/células rejeitadas
+                pela normalização (opcional)
 
         Returns:
             True se sincronização foi bem sucedida
@@ -196,7 +198,7 @@ class GoogleSheetsSyncer:
 
         # Importar para banco (usa função que já existe)
         print("\n💾 Atualizando banco de dados...")
-        self.db.importar_dados_planilha(df)
+        self.db.importar_dados_planilha(df, rejeitados_csv=rejeitados_csv)
 
         # Recriar alertas automáticos
         print("\n🚨 Gerando alertas...")
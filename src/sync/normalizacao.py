@@ -0,0 +1,251 @@
+"""
+Normalização vetorizada das linhas da planilha de jogadores
+
+Converte o DataFrame cru do Google Sheets (get_all_records) em colunas
+tipadas de uma só vez, com acessores .str/regex do pandas e to_datetime
+por formato, em vez de converter célula por célula dentro do loop de
+importação.
+
+Usado por:
+- google_sheets_sync_railway.py (GoogleSheetsSync)
+- src/database/database_antigo_sqlite.py (importar_dados_planilha, chamado
+  por src/sync/google_sheets_sync.py e scripts/import_data.py)
+
+Uso:
+    resultado = normalizar_planilha(df, escala=ESCALA_SYNC)
+    for registro in registros(resultado.validos):
+        ...
+    resultado.rejeitados  # linha, coluna, valor, motivo, descartada
+"""
+
+from datetime import date
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from dateutil import parser
+
+# Cabeçalhos aceitos para cada coluna normalizada (primeiro encontrado vale)
+ALIASES = {
+    "id_planilha": ("ID",),
+    "nome": ("Nome",),
+    "nacionalidade": ("Nacionalidade",),
+    "ano_nascimento": ("Ano",),
+    "idade_atual": ("Idade",),
+    "altura": ("Altura",),
+    "pe_dominante": ("Pé dominante", "Pé"),
+    "transfermarkt_id": ("TM",),
+    "clube": ("Clube",),
+    "liga_clube": ("Liga do Clube",),
+    "posicao": ("Posição",),
+    "data_fim_contrato": ("Fim de Contrato", "Fim de contrato"),
+}
+
+COLUNAS_TEXTO = ("nome", "nacionalidade", "pe_dominante", "clube", "liga_clube", "posicao")
+COLUNAS_INTEIRAS = ("id_planilha", "ano_nascimento", "idade_atual")
+
+# Formatos de data da planilha, na ordem de preferência (os demais valores
+# passam pelo dateutil, mais lento)
+FORMATOS_DATA = ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y")
+
+# Valores que a planilha usa para "vazio"
+_VAZIOS = {"", "nan", "none", "null", "-"}
+
+# Primeira linha de dados na planilha (linha 1 = cabeçalho)
+_PRIMEIRA_LINHA = 2
+
+
+class EscalaStatus(NamedTuple):
+    """Rótulos de status de contrato por faixa de dias restantes"""
+    sem_data: str
+    vencido: str
+    faixas: Tuple[Tuple[int, str], ...]  # (dias_max, rótulo), em ordem crescente
+    vigente: str
+
+
+# google_sheets_sync_railway.py
+ESCALA_SYNC = EscalaStatus(
+    sem_data="Desconhecido",
+    vencido="Vencido",
+    faixas=((180, "Vencendo em breve"),),
+    vigente="Vigente",
+)
+
+# database_antigo_sqlite.py
+ESCALA_LEGADO = EscalaStatus(
+    sem_data="indefinido",
+    vencido="expirado",
+    faixas=((180, "ultimos_6_meses"), (365, "ultimo_ano")),
+    vigente="ativo",
+)
+
+
+class ResultadoNormalizacao(NamedTuple):
+    validos: pd.DataFrame  # colunas tipadas + 'linha' e 'status_contrato'
+    rejeitados: pd.DataFrame  # linha, coluna, valor, motivo, descartada
+
+
+def _coluna(df: pd.DataFrame, nome: str) -> pd.Series:
+    for alias in ALIASES[nome]:
+        if alias in df.columns:
+            return df[alias]
+    return pd.Series(pd.NA, index=df.index, dtype="object")
+
+
+def _texto(serie: pd.Series) -> pd.Series:
+    """Texto limpo; vazios viram <NA>"""
+    texto = serie.astype("string").str.strip()
+    return texto.mask(texto.str.lower().isin(_VAZIOS))
+
+
+def _numero(texto: pd.Series) -> pd.Series:
+    """Número a partir do texto limpo (aceita vírgula decimal)"""
+    return pd.to_numeric(texto.str.replace(",", ".", regex=False), errors="coerce")
+
+
+def _data_livre(valor: str):
+    """Data em formato livre (dateutil, dia primeiro); NaT se não reconhecida"""
+    try:
+        return pd.Timestamp(parser.parse(valor, dayfirst=True))
+    except (ValueError, OverflowError, pd.errors.OutOfBoundsDatetime):
+        return pd.NaT
+
+
+def _datas(texto: pd.Series) -> pd.Series:
+    """
+    Tenta cada formato só nas células ainda não convertidas; o que sobrar
+    vai para o dateutil (como o importador legado fazia), um valor distinto
+    por vez
+    """
+    datas = pd.Series(pd.NaT, index=texto.index, dtype="datetime64[ns]")
+    for formato in FORMATOS_DATA:
+        faltando = datas.isna() & texto.notna()
+        if not faltando.any():
+            return datas
+        datas[faltando] = pd.to_datetime(
+            texto[faltando], format=formato, errors="coerce", cache=True
+        )
+
+    faltando = datas.isna() & texto.notna()
+    if faltando.any():
+        livres = {valor: _data_livre(valor) for valor in texto[faltando].unique()}
+        datas[faltando] = pd.to_datetime(texto[faltando].map(livres))
+    return datas
+
+
+def calcular_status_contrato(datas: pd.Series, escala: EscalaStatus, hoje: Optional[date] = None) -> pd.Series:
+    """Status do contrato a partir da data de término (vetorizado)"""
+    hoje = pd.Timestamp(hoje or date.today())
+    dias = (datas - hoje).dt.days
+
+    condicoes = [datas.isna(), dias < 0]
+    rotulos = [escala.sem_data, escala.vencido]
+    for dias_max, rotulo in escala.faixas:
+        condicoes.append(dias <= dias_max)
+        rotulos.append(rotulo)
+
+    return pd.Series(
+        np.select(condicoes, rotulos, default=escala.vigente),
+        index=datas.index,
+        dtype="object",
+    )
+
+
+def normalizar_planilha(
+    df: pd.DataFrame,
+    escala: EscalaStatus = ESCALA_SYNC,
+    exigir_id: bool = False,
+    hoje: Optional[date] = None,
+) -> ResultadoNormalizacao:
+    """
+    Normaliza o DataFrame da planilha em uma passada
+
+    Args:
+        df: DataFrame cru (cabeçalhos da planilha)
+        escala: rótulos de status_contrato
+        exigir_id: descarta linhas sem coluna ID numérica (importação legada)
+        hoje: data de referência do status (padrão: hoje)
+
+    Returns:
+        ResultadoNormalizacao(validos, rejeitados). Células inválidas viram
+        nulas e aparecem em `rejeitados` com descartada=False; linhas sem
+        nome (ou sem ID, se exigido) saem de `validos` com descartada=True.
+    """
+    brutos = {nome: _coluna(df, nome) for nome in ALIASES}
+    textos = {nome: _texto(serie) for nome, serie in brutos.items()}
+
+    out = pd.DataFrame(index=df.index)
+    out["linha"] = np.arange(_PRIMEIRA_LINHA, _PRIMEIRA_LINHA + len(df))
+
+    for nome in COLUNAS_TEXTO:
+        out[nome] = textos[nome]
+
+    for nome in COLUNAS_INTEIRAS:
+        out[nome] = _numero(textos[nome]).round().astype("Int64")
+
+    # Altura: metros (< 3) viram centímetros
+    altura = _numero(textos["altura"])
+    out["altura"] = altura.where(altura >= 3, altura * 100).round().astype("Int64")
+
+    # Transfermarkt: ID numérico da URL (.../spieler/123), senão o próprio valor
+    tm = textos["transfermarkt_id"]
+    out["transfermarkt_id"] = tm.str.extract(r"spieler/(\d+)", expand=False).fillna(tm)
+
+    datas = _datas(textos["data_fim_contrato"])
+    out["data_fim_contrato"] = datas
+    out["status_contrato"] = calcular_status_contrato(datas, escala, hoje)
+
+    # ---------- rejeições ----------
+    problemas = []
+
+    def registrar(mascara, coluna, motivo, descartada):
+        if mascara.any():
+            problemas.append(pd.DataFrame({
+                "linha": out.loc[mascara, "linha"],
+                "coluna": coluna,
+                "valor": brutos[coluna][mascara].astype("string"),
+                "motivo": motivo,
+                "descartada": descartada,
+            }))
+
+    descartar = out["nome"].isna()
+    registrar(descartar, "nome", "Nome vazio", True)
+
+    if exigir_id:
+        sem_id = out["id_planilha"].isna() & ~descartar
+        registrar(sem_id, "id_planilha", "ID ausente ou não numérico", True)
+        descartar |= sem_id
+
+    for nome in COLUNAS_INTEIRAS + ("altura",):
+        if nome == "id_planilha" and exigir_id:
+            continue
+        invalido = textos[nome].notna() & out[nome].isna() & ~descartar
+        registrar(invalido, nome, "Valor numérico inválido", False)
+
+    invalido = textos["data_fim_contrato"].notna() & datas.isna() & ~descartar
+    registrar(invalido, "data_fim_contrato", "Data inválida", False)
+
+    colunas_rejeitados = ["linha", "coluna", "valor", "motivo", "descartada"]
+    rejeitados = (
+        pd.concat(problemas, ignore_index=True).sort_values(["linha", "coluna"], ignore_index=True)
+        if problemas
+        else pd.DataFrame(columns=colunas_rejeitados)
+    )
+
+    return ResultadoNormalizacao(out[~descartar], rejeitados)
+
+
+def registros(validos: pd.DataFrame, formato_data: str = "%Y-%m-%d"):
+    """
+    Linhas normalizadas como dicts com tipos Python (None no lugar de <NA>/NaT)
+
+    A data de fim de contrato sai como texto (formato_data), como o banco espera.
+    """
+    saida = validos.copy()
+    saida["data_fim_contrato"] = saida["data_fim_contrato"].dt.strftime(formato_data)
+    saida = saida.astype(object).where(saida.notna(), None)
+    for registro in saida.to_dict("records"):
+        yield {
+            chave: int(valor) if isinstance(valor, np.integer) else valor
+            for chave, valor in registro.items()
+        }
@@ -0,0 +1,82 @@
+"""
+Schema do modo incremental da sincronização com o Google Sheets
+
+O modo incremental (google_sheets_sync_railway.py) precisa de:
+- coluna jogadores.hash_planilha (hash da última linha aplicada);
+- índice único em jogadores.transfermarkt_id (alvo do ON CONFLICT).
+
+O schema do Streamlit (database.py) não tem nenhum dos dois, e bancos
+antigos podem ter transfermarkt_id repetido ou vazio, o que impede o
+índice. Por isso a preparação é uma migração avulsa, executada uma vez
+(scripts/maintenance/preparar_sync_incremental.py), e não parte da
+transação de cada sincronização: enquanto ela não roda, a sincronização
+usa o modo linha a linha.
+
+Uso:
+    with engine.connect() as conn:
+        if not schema_incremental_pronto(conn): ...
+    preparar_schema_incremental(engine)
+"""
+
+from typing import List, Tuple
+
+from sqlalchemy import inspect, text
+
+INDICE_TRANSFERMARKT = "ix_jogadores_transfermarkt_id"
+
+
+def schema_incremental_pronto(conn) -> bool:
+    """True se hash_planilha e o índice único em transfermarkt_id já existem"""
+    inspetor = inspect(conn)
+    colunas = {c["name"] for c in inspetor.get_columns("jogadores")}
+    if "hash_planilha" not in colunas:
+        return False
+    unicos = [i["column_names"] for i in inspetor.get_indexes("jogadores") if i.get("unique")]
+    unicos += [u["column_names"] for u in inspetor.get_unique_constraints("jogadores")]
+    return ["transfermarkt_id"] in unicos
+
+
+def preparar_schema_incremental(engine) -> List[Tuple[int, str]]:
+    """
+    Cria hash_planilha e o índice único em transfermarkt_id (idempotente)
+
+    Antes do índice, transfermarkt_id vazio vira NULL e, em ids repetidos,
+    só o jogador de menor id_jogador mantém o id (os demais ficam com NULL
+    e voltam a ser casados pelo nome na próxima sincronização). Nenhuma
+    linha é apagada.
+
+    Returns:
+        [(id_jogador, transfermarkt_id)] que perderam o id por duplicidade
+    """
+    with engine.begin() as conn:
+        colunas = {c["name"] for c in inspect(conn).get_columns("jogadores")}
+        if "hash_planilha" not in colunas:
+            conn.execute(text("ALTER TABLE jogadores ADD COLUMN hash_planilha VARCHAR(64)"))
+
+        conn.execute(text(
+            "UPDATE jogadores SET transfermarkt_id = NULL WHERE TRIM(transfermarkt_id) = ''"
+        ))
+        duplicados = """
+            FROM jogadores
+            WHERE transfermarkt_id IS NOT NULL
+              AND id_jogador > (
+                  SELECT MIN(j2.id_jogador) FROM jogadores j2
+                  WHERE j2.transfermarkt_id = jogadores.transfermarkt_id
+              )
+        """
+        removidos = [tuple(r) for r in conn.execute(text(f"SELECT id_jogador, transfermarkt_id {duplicados}"))]
+        if removidos:
+            conn.execute(text(
+                f"UPDATE jogadores SET transfermarkt_id = NULL WHERE id_jogador IN (SELECT id_jogador {duplicados})"
+            ))
+
+        # Um índice não único com o mesmo nome impediria o CREATE ... IF NOT EXISTS
+        indices = {i["name"]: i for i in inspect(conn).get_indexes("jogadores")}
+        existente = indices.get(INDICE_TRANSFERMARKT)
+        if existente is not None and not existente.get("unique"):
+            conn.execute(text(f"DROP INDEX {INDICE_TRANSFERMARKT}"))
+        # Mesmo nome do índice criado pela migration do backend (não duplica no PostgreSQL)
+        conn.execute(text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {INDICE_TRANSFERMARKT} ON jogadores (transfermarkt_id)"
+        ))
+    return removidos
@@ -0,0 +1,96 @@
+"""
+Gravação de auditoria em lote (fora do caminho da requisição)
+
+Eventos de auditoria (ex.: log_acessos no login) são acumulados em memória
+e gravados por uma thread de fundo, em lotes: quando o buffer chega a
+`tamanho_lote` ou a cada `intervalo` segundos. Um pico de logins vira
+poucos INSERTs de várias linhas em vez de uma transação por login.
+
+Se a gravação falhar o lote volta para o buffer e é tentado de novo no
+próximo ciclo; acima de `max_pendentes` os eventos mais antigos são
+descartados (auditoria não pode derrubar o login). Ao encerrar o processo
+o buffer é gravado (atexit).
+
+Uso:
+    gravador = GravadorEmLote(gravar_acessos)  # gravar_acessos(lista de registros)
+    gravador.registrar((usuario_id, "login", datetime.now()))
+"""
+
+import atexit
+import threading
+from collections import deque
+from typing import Callable, List, Sequence
+
+
+class GravadorEmLote:
+    """Buffer thread-safe com descarga periódica em lotes"""
+
+    def __init__(
+        self,
+        gravar: Callable[[List[Sequence]], None],
+        tamanho_lote: int = 100,
+        intervalo: float = 2.0,
+        max_pendentes: int = 10000,
+    ):
+        self.gravar = gravar
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self.descartados = 0
+
+        self._pendentes = deque(maxlen=max_pendentes)
+        self._lock = threading.Lock()  # protege _pendentes
+        self._lock_gravacao = threading.Lock()  # uma descarga por vez
+        self._acordar = threading.Event()
+        self._parar = threading.Event()
+        self._thread = None
+
+    def registrar(self, registro: Sequence) -> None:
+        """Enfileira um registro (não acessa o banco)"""
+        with self._lock:
+            if len(self._pendentes) == self._pendentes.maxlen:
+                self.descartados += 1
+            self._pendentes.append(registro)
+            cheio = len(self._pendentes) >= self.tamanho_lote
+            if self._thread is None:
+                self._iniciar()
+        if cheio:
+            self._acordar.set()
+
+    def descarregar(self) -> int:
+        """Grava tudo o que está pendente; retorna quantos registros foram gravados"""
+        with self._lock_gravacao:
+            gravados = 0
+            while True:
+                with self._lock:
+                    lote = [self._pendentes.popleft() for _ in range(min(self.tamanho_lote, len(self._pendentes)))]
+                if not lote:
+                    return gravados
+                try:
+                    self.gravar(lote)
+                except Exception as e:
+                    print(f"⚠️ Auditoria: falha ao gravar {len(lote)} registro(s), nova tentativa no próximo ciclo: {e}")
+                    with self._lock:
+                        espaco = self._pendentes.maxlen - len(self._pendentes)
+                        self.descartados += max(0, len(lote) - espaco)
+                        self._pendentes.extendleft(reversed(lote[-espaco:] if espaco else []))
+                    return gravados
+                gravados += len(lote)
+
+    def fechar(self) -> None:
+        """Para a thread de fundo e grava o que restou"""
+        self._parar.set()
+        self._acordar.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.intervalo + 5)
+        self.descarregar()
+
+    def _iniciar(self) -> None:
+        self._thread = threading.Thread(target=self._executar, name="gravador-auditoria", daemon=True)
+        self._thread.start()
+        atexit.register(self.fechar)
+
+    def _executar(self) -> None:
+        while not self._parar.is_set():
+            self._acordar.wait(self.intervalo)
+            self._acordar.clear()
+            self.descarregar()
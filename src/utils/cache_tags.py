@@ -0,0 +1,61 @@
+"""
+Invalidação de cache por tabela (tags) para funções @st.cache_data
+
+Cada loader declara as tabelas de que depende; cada escrita invalida só
+essas tabelas, em vez de st.cache_data.clear() (que zera todos os caches
+de todos os usuários, inclusive fotos e o snapshot de jogadores).
+
+Uso:
+    from src.utils.cache_tags import depende_de, invalidar
+
+    @depende_de("wishlist")
+    @st.cache_data(ttl=300, show_spinner=False)
+    def _cached_get_ids_wishlist(_engine):
+        ...
+
+    # depois de escrever na tabela
+    invalidar("wishlist")
+"""
+
+import threading
+from collections import defaultdict
+
+# tabela -> {nome qualificado: função cacheada}
+_registro = defaultdict(dict)
+_lock = threading.Lock()
+
+
+def depende_de(*tabelas):
+    """
+    Registra a função cacheada (já decorada com st.cache_data) nas tabelas
+
+    Funções definidas dentro de outras (recriadas a cada rerun) são
+    registradas uma vez só: a chave é o nome qualificado, e todas as
+    instâncias compartilham o mesmo cache no Streamlit. Qualquer outro
+    objeto com .clear() (ex.: SnapshotJogadores) é registrado por instância.
+    """
+    def decorator(funcao):
+        if hasattr(funcao, "__qualname__"):
+            chave = f"{funcao.__module__}.{funcao.__qualname__}"
+        else:
+            chave = id(funcao)
+        with _lock:
+            for tabela in tabelas:
+                _registro[tabela][chave] = funcao
+        return funcao
+    return decorator
+
+
+def funcoes_de(*tabelas):
+    """Funções cacheadas que dependem de alguma das tabelas"""
+    with _lock:
+        encontradas = {}
+        for tabela in tabelas:
+            encontradas.update(_registro.get(tabela, {}))
+    return list(encontradas.values())
+
+
+def invalidar(*tabelas):
+    """Limpa apenas os caches que dependem das tabelas informadas"""
+    for funcao in funcoes_de(*tabelas):
+        funcao.clear()
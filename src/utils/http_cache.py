@@ -0,0 +1,293 @@
+"""
+Cache HTTP em disco compartilhado (Transfermarkt / FotMob)
+
+- Chave: URL (sha256)
+- Respeita Cache-Control (max-age, no-store, no-cache); sem max-age usa o
+  TTL padrão (Config.HTTP_CACHE_TTL)
+- Entradas vencidas são revalidadas com If-None-Match / If-Modified-Since;
+  um 304 renova a entrada sem baixar o corpo de novo
+- Erro de rede com entrada vencida: devolve a cópia antiga (stale-if-error)
+- Limite de tamanho total com remoção LRU (última leitura); a pasta só é
+  varrida quando a estimativa do tamanho passa do limite ou a cada
+  EVICT_A_CADA gravações (acerta a estimativa com outros processos)
+- Modo offline (HTTP_CACHE_OFFLINE=true): só lê do disco, útil para usar
+  páginas salvas como fixtures de teste
+
+Uso:
+    from src.utils import http_cache
+
+    response = http_cache.get(url, headers=headers, timeout=15)
+    if response.status_code == 200:
+        soup = BeautifulSoup(response.content, "html.parser")
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+from src.config import Config
+
+_RE_MAX_AGE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+# Gravações entre duas varreduras completas da pasta
+EVICT_A_CADA = 100
+
+
+class RespostaCache:
+    """Resposta com a interface usada pelos scrapers (status_code, content, text, json)"""
+
+    def __init__(self, url, status_code, content, headers, from_cache=False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HTTPCache:
+    """
+    Cache HTTP em disco
+
+    Args:
+        diretorio: pasta das entradas ({sha256}.json + {sha256}.body)
+        max_bytes: tamanho máximo dos corpos armazenados
+        ttl_padrao: validade (s) quando o servidor não informa max-age
+        offline: nunca acessa a rede
+    """
+
+    def __init__(self, diretorio, max_bytes, ttl_padrao=86400, offline=False):
+        self.diretorio = Path(diretorio)
+        self.max_bytes = max_bytes
+        self.ttl_padrao = ttl_padrao
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._total_estimado = None  # bytes dos corpos; None = ainda não varrido
+        self._gravacoes = 0
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+
+    # ---------- armazenamento ----------
+
+    def _caminhos(self, url):
+        chave = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.diretorio / f"{chave}.json", self.diretorio / f"{chave}.body"
+
+    def _ler(self, url):
+        meta_path, body_path = self._caminhos(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            content = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None, None
+        if meta.get("url") != url:
+            return None, None
+        return meta, content
+
+    def _gravar_arquivo(self, path, dados):
+        # Escrita atômica: leitores nunca veem arquivo pela metade
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(dados)
+        os.replace(tmp, path)
+
+    def _gravar(self, url, meta, content=None):
+        meta_path, body_path = self._caminhos(url)
+        if content is not None:
+            if self._total_estimado is not None:
+                try:
+                    self._total_estimado -= body_path.stat().st_size  # corpo substituído
+                except OSError:
+                    pass
+                self._total_estimado += len(content)
+            self._gravar_arquivo(body_path, content)
+        self._gravar_arquivo(meta_path, json.dumps(meta).encode("utf-8"))
+        self._tocar(url)
+
+    def _tocar(self, url):
+        """Marca a entrada como usada agora (ordem LRU)"""
+        _, body_path = self._caminhos(url)
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+    def _remover(self, body_path):
+        for path in (body_path, body_path.with_suffix(".json")):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def tamanho_total(self):
+        return sum(p.stat().st_size for p in self.diretorio.glob("*.body"))
+
+    def _talvez_evict(self):
+        """Varre a pasta só se a estimativa passou do limite ou a cada EVICT_A_CADA gravações"""
+        self._gravacoes += 1
+        if (
+            self._total_estimado is None
+            or self._total_estimado > self.max_bytes
+            or self._gravacoes >= EVICT_A_CADA
+        ):
+            self._evict()
+
+    def _evict(self):
+        """Remove as entradas menos usadas até caber em max_bytes"""
+        self._gravacoes = 0
+        entradas = []
+        total = 0
+        for body_path in self.diretorio.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            entradas.append((stat.st_mtime, stat.st_size, body_path))
+            total += stat.st_size
+
+        if total > self.max_bytes:
+            for _, tamanho, body_path in sorted(entradas, key=lambda e: e[0]):
+                self._remover(body_path)
+                total -= tamanho
+                if total <= self.max_bytes:
+                    break
+        self._total_estimado = total
+
+    def limpar(self):
+        for body_path in self.diretorio.glob("*.body"):
+            self._remover(body_path)
+        self._total_estimado = 0
+
+    # ---------- política HTTP ----------
+
+    def _validade(self, headers):
+        """
+        Segundos de validade segundo Cache-Control
+
+        Returns:
+            None se a resposta não pode ser armazenada (no-store)
+        """
+        cache_control = headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return None
+        if "no-cache" in cache_control:
+            return 0
+        match = _RE_MAX_AGE.search(cache_control)
+        if match:
+            return int(match.group(1))
+        return self.ttl_padrao
+
+    def _meta(self, url, status_code, headers):
+        validade = self._validade(headers)
+        if validade is None:
+            return None
+        return {
+            "url": url,
+            "status_code": status_code,
+            "content_type": headers.get("Content-Type"),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "armazenado_em": time.time(),
+            "expira_em": time.time() + validade,
+        }
+
+    @staticmethod
+    def _resposta_cache(meta, content):
+        headers = {"Content-Type": meta.get("content_type") or ""}
+        return RespostaCache(meta["url"], meta["status_code"], content, headers, from_cache=True)
+
+    def get(self, url, session=None, headers=None, timeout=10, ttl=None):
+        """
+        GET com cache
+
+        Args:
+            url: URL (chave do cache)
+            session: requests.Session opcional (headers/cookies da sessão)
+            headers: headers extras da requisição
+            timeout: timeout da requisição
+            ttl: validade (s) forçada, ignorando Cache-Control
+
+        Returns:
+            RespostaCache (status 504 se offline e a URL não está em cache)
+        """
+        meta, content = self._ler(url)
+
+        if meta is not None and (self.offline or time.time() < meta["expira_em"]):
+            self._tocar(url)
+            return self._resposta_cache(meta, content)
+
+        if self.offline:
+            return RespostaCache(url, 504, b"", {})
+
+        headers_req = dict(headers or {})
+        if meta is not None:
+            if meta.get("etag"):
+                headers_req["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers_req["If-Modified-Since"] = meta["last_modified"]
+
+        cliente = session or requests
+        try:
+            response = cliente.get(url, headers=headers_req, timeout=timeout)
+        except requests.RequestException:
+            if meta is not None:
+                return self._resposta_cache(meta, content)
+            raise
+
+        if response.status_code == 304 and meta is not None:
+            # Conteúdo não mudou: só renova a validade (e validadores novos, se vierem)
+            novo = self._meta(url, meta["status_code"], response.headers) or meta
+            novo["etag"] = novo.get("etag") or meta.get("etag")
+            novo["last_modified"] = novo.get("last_modified") or meta.get("last_modified")
+            novo["content_type"] = meta.get("content_type")
+            if ttl is not None:
+                novo["expira_em"] = time.time() + ttl
+            with self._lock:
+                self._gravar(url, novo)
+            return self._resposta_cache(novo, content)
+
+        resposta = RespostaCache(url, response.status_code, response.content, response.headers)
+
+        if response.status_code == 200:
+            novo = self._meta(url, 200, response.headers)
+            if novo is not None and len(response.content) <= self.max_bytes:
+                if ttl is not None:
+                    novo["expira_em"] = time.time() + ttl
+                with self._lock:
+                    self._gravar(url, novo, response.content)
+                    self._talvez_evict()
+
+        return resposta
+
+
+_cache_padrao = None
+_cache_padrao_lock = threading.Lock()
+
+
+def cache_padrao():
+    """Instância compartilhada configurada por Config (HTTP_CACHE_*)"""
+    global _cache_padrao
+    with _cache_padrao_lock:
+        if _cache_padrao is None:
+            _cache_padrao = HTTPCache(
+                Config.HTTP_CACHE_DIR,
+                max_bytes=Config.HTTP_CACHE_MAX_MB * 1024 * 1024,
+                ttl_padrao=Config.HTTP_CACHE_TTL,
+                offline=Config.HTTP_CACHE_OFFLINE,
+            )
+        return _cache_padrao
+
+
+def get(url, session=None, headers=None, timeout=10, ttl=None):
+    """Atalho para cache_padrao().get(...)"""
+    return cache_padrao().get(url, session=session, headers=headers, timeout=timeout, ttl=ttl)
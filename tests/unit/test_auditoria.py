@@ -0,0 +1,68 @@
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.auditoria import GravadorEmLote
+
+
+def test_grava_em_lotes_ao_descarregar():
+    lotes = []
+    gravador = GravadorEmLote(lotes.append, tamanho_lote=3, intervalo=60)
+    for i in range(7):
+        gravador.registrar((i, "login"))
+
+    assert gravador.descarregar() == 7
+    assert [len(lote) for lote in lotes] == [3, 3, 1]
+    assert [r[0] for lote in lotes for r in lote] == list(range(7))
+    gravador.fechar()
+
+
+def test_lote_cheio_acorda_a_thread():
+    gravado = threading.Event()
+    lotes = []
+
+    def gravar(lote):
+        lotes.append(lote)
+        gravado.set()
+
+    gravador = GravadorEmLote(gravar, tamanho_lote=2, intervalo=60)
+    gravador.registrar((1, "login"))
+    gravador.registrar((2, "login"))
+
+    assert gravado.wait(5)
+    assert lotes == [[(1, "login"), (2, "login")]]
+    gravador.fechar()
+
+
+def test_falha_mantem_registros_para_nova_tentativa():
+    lotes = []
+    falhar = [True]
+
+    def gravar(lote):
+        if falhar[0]:
+            raise RuntimeError("banco fora do ar")
+        lotes.append(lote)
+
+    gravador = GravadorEmLote(gravar, tamanho_lote=10, intervalo=60)
+    gravador.registrar((1, "login"))
+    gravador.registrar((2, "login"))
+
+    assert gravador.descarregar() == 0
+    falhar[0] = False
+    assert gravador.descarregar() == 2
+    assert lotes == [[(1, "login"), (2, "login")]]
+    gravador.fechar()
+
+
+def test_buffer_limitado_descarta_os_mais_antigos():
+    lotes = []
+    gravador = GravadorEmLote(lotes.append, tamanho_lote=100, intervalo=60, max_pendentes=3)
+    for i in range(5):
+        gravador.registrar((i, "login"))
+
+    gravador.fechar()
+
+    assert gravador.descartados == 2
+    assert lotes == [[(2, "login"), (3, "login"), (4, "login")]]
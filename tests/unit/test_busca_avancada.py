@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.database.busca_avancada import filtros_canonicos
+from src.utils.cache_tags import invalidar
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """ScoutingDatabase em SQLite temporário com avaliações e tags"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    from database import ScoutingDatabase
+
+    db = ScoutingDatabase()
+    jogadores = [
+        (1, "Ana", 20, "Zagueiro", "2099-01-01", [(3.0, "2025-01-01"), (4.5, "2026-01-01")], [1, 2]),
+        (2, "Bia", 22, "Zagueiro", "2000-01-01", [(3.0, "2026-01-01")], [1]),
+        (3, "Caio", 30, "Meia", "2000-01-01", [], [2]),
+    ]
+    with db.engine.begin() as conn:
+        conn.execute(text("INSERT INTO tags (id_tag, nome) VALUES (1, 'Promessa'), (2, 'Titular')"))
+        for id_jogador, nome, idade, posicao, fim, notas, tags in jogadores:
+            conn.execute(text(
+                "INSERT INTO jogadores (id_jogador, nome, idade_atual) VALUES (:id, :nome, :idade)"
+            ), {"id": id_jogador, "nome": nome, "idade": idade})
+            conn.execute(text(
+                "INSERT INTO vinculos_clubes (id_jogador, clube, posicao, data_fim_contrato) "
+                "VALUES (:id, 'Santos', :posicao, :fim)"
+            ), {"id": id_jogador, "posicao": posicao, "fim": fim})
+            for nota, data in notas:
+                conn.execute(text(
+                    "INSERT INTO avaliacoes (id_jogador, data_avaliacao, nota_tatico, nota_tecnico, "
+                    "nota_fisico, nota_mental) VALUES (:id, :data, :n, :n, :n, :n)"
+                ), {"id": id_jogador, "data": data, "n": nota})
+            for id_tag in tags:
+                conn.execute(text("INSERT INTO jogador_tags (id_jogador, id_tag) VALUES (:id, :tag)"),
+                             {"id": id_jogador, "tag": id_tag})
+    invalidar("jogadores")  # cache da busca é por processo, não por banco
+    yield db
+    db.fechar_conexao()
+
+
+@pytest.mark.parametrize("filtros, esperados", [
+    ({}, ["Ana", "Bia", "Caio"]),
+    ({"tags": [1, 2]}, ["Ana", "Bia", "Caio"]),
+    ({"tags": [1, 2], "tags_modo": "todas"}, ["Ana"]),
+    ({"media_min": 4.0}, ["Ana"]),  # última avaliação, não a média histórica
+    ({"posicoes": ["Zagueiro"], "contrato_vencendo": True}, ["Bia"]),
+    ({"idade_min": 21, "tags": [2]}, ["Caio"]),
+])
+def test_busca_avancada(db, filtros, esperados):
+    df = db.busca_avancada(filtros)
+
+    assert list(df["nome"]) == esperados
+    assert "media_geral" in df.columns
+
+
+def test_media_geral_da_ultima_avaliacao(db):
+    df = db.busca_avancada({})
+
+    assert dict(zip(df["nome"], df["media_geral"])) == {"Ana": 4.5, "Bia": 3.0, "Caio": 0.0}
+
+
+def test_filtros_canonicos():
+    assert filtros_canonicos({"posicoes": ["Meia", "Zagueiro", "Meia"], "clubes": None, "tags_modo": "todas"}) == \
+        filtros_canonicos({"posicoes": ["Zagueiro", "Meia"], "contrato_vencendo": False})
+
+
+def test_busca_salva_usa_cache_ate_escrita(db):
+    assert db.salvar_busca("Zagueiros", {"posicoes": ["Zagueiro"], "tags": None})
+    with db.engine.connect() as conn:
+        id_busca = conn.execute(text("SELECT id_busca FROM buscas_salvas")).scalar()
+
+    assert list(db.executar_busca_salva(id_busca)["nome"]) == ["Ana", "Bia"]
+    with db.engine.begin() as conn:
+        conn.execute(text("UPDATE vinculos_clubes SET posicao = 'Meia' WHERE id_jogador = 1"))
+    assert list(db.executar_busca_salva(id_busca)["nome"]) == ["Ana", "Bia"]  # em cache
+
+    invalidar("vinculos_clubes")
+    assert list(db.executar_busca_salva(id_busca)["nome"]) == ["Bia"]
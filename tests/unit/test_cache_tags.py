@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.cache_tags import depende_de, funcoes_de, invalidar
+
+chamadas = []
+
+
+@depende_de("teste_jogadores", "teste_vinculos")
+@st.cache_data
+def _carregar_jogadores():
+    chamadas.append("jogadores")
+    return len(chamadas)
+
+
+@depende_de("teste_wishlist")
+@st.cache_data
+def _carregar_wishlist():
+    chamadas.append("wishlist")
+    return len(chamadas)
+
+
+def test_invalida_apenas_dependentes():
+    chamadas.clear()
+    invalidar("teste_jogadores", "teste_wishlist")
+    _carregar_jogadores()
+    _carregar_wishlist()
+
+    invalidar("teste_wishlist")
+    _carregar_jogadores()
+    _carregar_wishlist()
+
+    assert chamadas == ["jogadores", "wishlist", "wishlist"]
+
+    invalidar("teste_vinculos")
+    _carregar_jogadores()
+    _carregar_wishlist()
+
+    assert chamadas == ["jogadores", "wishlist", "wishlist", "jogadores"]
+
+
+def test_funcao_aninhada_registrada_uma_vez():
+    for _ in range(3):
+        @depende_de("teste_avaliacoes")
+        @st.cache_data
+        def carregar():
+            return 1
+
+    assert len(funcoes_de("teste_avaliacoes")) == 1
@@ -0,0 +1,111 @@
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.scraping.checkpoint import STATUS_FALHA, STATUS_SUCESSO, CheckpointScraping
+from src.scraping import transfermarkt_scraper
+from src.scraping.transfermarkt_scraper import fotos_recentes
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "checkpoint.db")
+    yield conn
+    conn.close()
+
+
+def test_execucao_nova_comeca_vazia(conn):
+    assert CheckpointScraping(conn, "fotos").iniciar() == set()
+
+
+def test_retoma_execucao_interrompida(conn):
+    checkpoint = CheckpointScraping(conn, "fotos")
+    checkpoint.iniciar()
+    checkpoint.registrar(1, STATUS_SUCESSO)
+    checkpoint.registrar(2, STATUS_FALHA, "Status 404")
+    # ... processo cai antes de concluir()
+
+    retomado = CheckpointScraping(conn, "fotos")
+    assert retomado.iniciar() == {1, 2}
+    assert conn.execute(
+        "SELECT ultimo_id_jogador FROM scraping_execucoes WHERE tarefa = 'fotos'"
+    ).fetchone() == (2,)
+    assert retomado.resumo() == {
+        "status": {STATUS_SUCESSO: 1, STATUS_FALHA: 1},
+        "motivos": {"Status 404": 1},
+    }
+
+
+def test_execucao_concluida_recomeca(conn):
+    checkpoint = CheckpointScraping(conn, "fotos")
+    checkpoint.iniciar()
+    checkpoint.registrar(1, STATUS_SUCESSO)
+    checkpoint.concluir()
+
+    assert CheckpointScraping(conn, "fotos").iniciar() == set()
+
+
+def test_retomar_false_descarta_checkpoint(conn):
+    checkpoint = CheckpointScraping(conn, "fotos")
+    checkpoint.iniciar()
+    checkpoint.registrar(1, STATUS_SUCESSO)
+
+    assert CheckpointScraping(conn, "fotos").iniciar(retomar=False) == set()
+
+
+def test_tarefas_independentes(conn):
+    fotos = CheckpointScraping(conn, "fotos")
+    fotos.iniciar()
+    fotos.registrar(1, STATUS_SUCESSO)
+
+    agentes = CheckpointScraping(conn, "agentes")
+    assert agentes.iniciar() == set()
+    assert CheckpointScraping(conn, "fotos").iniciar() == {1}
+
+
+def test_fotos_recentes(tmp_path):
+    (tmp_path / "1.jpg").write_bytes(b"x")
+    antiga = tmp_path / "2.jpg"
+    antiga.write_bytes(b"x")
+    dez_dias = time.time() - 10 * 86400
+    os.utime(antiga, (dez_dias, dez_dias))
+
+    assert fotos_recentes([1, 2, 3], str(tmp_path), dias=7) == {1}
+
+
+def test_retomada_com_limite_avanca(tmp_path, monkeypatch):
+    """max_jogadores vale depois de pular os já processados (a retomada não repete os mesmos)"""
+    caminho = tmp_path / "scouting.db"
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("CREATE TABLE jogadores (id_jogador INTEGER PRIMARY KEY, nome TEXT, transfermarkt_id TEXT)")
+        conn.executemany("INSERT INTO jogadores VALUES (?, ?, ?)", [(i, f"J{i}", str(i)) for i in range(1, 6)])
+
+    class Banco:
+        def connect(self):
+            return sqlite3.connect(caminho)
+
+    lotes = []
+
+    async def baixar(jogadores, ao_concluir, **kwargs):
+        jogadores = list(jogadores)
+        lotes.append([j.id_jogador for j in jogadores])
+        for idx, j in enumerate(jogadores[:1], 1):  # cai depois do primeiro
+            ao_concluir(idx, len(jogadores), j.id_jogador, j.nome, True, None)
+        raise KeyboardInterrupt
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(transfermarkt_scraper, "ScoutingDatabase", Banco)
+    monkeypatch.setattr(transfermarkt_scraper, "baixar_fotos_async", baixar)
+    monkeypatch.setattr("builtins.input", lambda *args: "")
+
+    for _ in range(2):
+        with pytest.raises(KeyboardInterrupt):
+            transfermarkt_scraper.baixar_todas_fotos_scraping(max_jogadores=2)
+
+    assert lotes == [[1, 2], [2, 3]]
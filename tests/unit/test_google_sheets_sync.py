@@ -0,0 +1,174 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from sqlalchemy import event, text
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from google_sheets_sync_railway import GoogleSheetsSync
+from src.sync.schema_incremental import preparar_schema_incremental, schema_incremental_pronto
+
+
+def _planilha(n=20):
+    return pd.DataFrame([
+        {
+            "Nome": f"Jogador {i}",
+            "Nacionalidade": "Brasil",
+            "Ano": 2000 + i % 5,
+            "Idade": 20 + i % 5,
+            "Altura": "1.8" if i % 2 else 182,
+            "Pé dominante": "Direito",
+            "TM": f"https://www.transfermarkt.com.br/x/profil/spieler/{1000 + i}",
+            "Clube": "Santos",
+            "Liga do Clube": "Série A",
+            "Posição": "Meia",
+            "Fim de Contrato": "31/12/2030",
+        }
+        for i in range(n)
+    ])
+
+
+@pytest.fixture
+def sync_sem_preparo(tmp_path, monkeypatch):
+    """GoogleSheetsSync com banco SQLite temporário e planilha em memória"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    from database import ScoutingDatabase
+
+    sync = GoogleSheetsSync.__new__(GoogleSheetsSync)
+    sync.db = ScoutingDatabase()
+    sync.planilha_df = _planilha()
+    sync.conectar_planilha = lambda sheet_url=None: True
+    sync.ler_dados_planilha = lambda: sync.planilha_df.copy()
+
+    sync.comandos = []
+    event.listen(
+        sync.db.engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: sync.comandos.append(statement),
+    )
+    yield sync
+    sync.db.fechar_conexao()
+
+
+@pytest.fixture
+def sync(sync_sem_preparo):
+    """Banco já preparado para o modo incremental (migração avulsa aplicada)"""
+    preparar_schema_incremental(sync_sem_preparo.db.engine)
+    sync_sem_preparo.comandos.clear()
+    return sync_sem_preparo
+
+
+def _contar(sync, tabela):
+    with sync.db.engine.connect() as conn:
+        return conn.execute(text(f"SELECT COUNT(*) FROM {tabela}")).scalar()
+
+
+def test_primeira_sincronizacao_insere_em_lote(sync):
+    assert sync.sincronizar_para_banco() is True
+
+    assert _contar(sync, "jogadores") == 20
+    assert _contar(sync, "vinculos_clubes") == 20
+    # verificação do schema + SELECT + upsert + SELECT/INSERT de vínculos, não 5 comandos por linha
+    assert len(sync.comandos) < 15
+
+
+def test_linhas_inalteradas_nao_sao_reaplicadas(sync):
+    sync.sincronizar_para_banco()
+    sync.comandos.clear()
+
+    sync.sincronizar_para_banco()
+
+    assert not any("INSERT" in c or "UPDATE" in c or "DELETE" in c for c in sync.comandos)
+
+
+def test_apenas_linha_alterada_e_aplicada(sync):
+    sync.sincronizar_para_banco()
+    with sync.db.engine.connect() as conn:
+        ids_antes = dict(conn.execute(text("SELECT transfermarkt_id, id_jogador FROM jogadores")).fetchall())
+
+    sync.planilha_df.loc[3, "Clube"] = "Flamengo"
+    sync.planilha_df.loc[3, "Altura"] = 190
+    sync.comandos.clear()
+    sync.sincronizar_para_banco()
+
+    with sync.db.engine.connect() as conn:
+        jogador = conn.execute(text(
+            "SELECT j.id_jogador, j.altura, v.clube FROM jogadores j "
+            "JOIN vinculos_clubes v ON v.id_jogador = j.id_jogador WHERE j.transfermarkt_id = '1003'"
+        )).one()
+        ids_depois = dict(conn.execute(text("SELECT transfermarkt_id, id_jogador FROM jogadores")).fetchall())
+
+    assert (jogador.altura, jogador.clube) == (190, "Flamengo")
+    assert ids_depois == ids_antes  # ON CONFLICT atualiza, não duplica
+    assert _contar(sync, "vinculos_clubes") == 20
+    upserts = [c for c in sync.comandos if c.lstrip().startswith("INSERT INTO jogadores")]
+    assert len(upserts) == 1
+
+
+def test_jogador_antigo_sem_tm_recebe_tm_pelo_nome(sync):
+    with sync.db.engine.begin() as conn:
+        conn.execute(text("INSERT INTO jogadores (nome) VALUES ('Jogador 0')"))
+
+    sync.sincronizar_para_banco()
+
+    with sync.db.engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT transfermarkt_id FROM jogadores WHERE nome = 'Jogador 0'"
+        )).fetchall()
+    assert rows == [("1000",)]
+
+
+def test_modo_completo_continua_disponivel(sync):
+    assert sync.sincronizar_para_banco(incremental=False) is True
+    assert _contar(sync, "jogadores") == 20
+
+
+def test_vinculo_atualizado_no_lugar(sync):
+    sync.sincronizar_para_banco()
+    with sync.db.engine.begin() as conn:
+        id_jogador, id_vinculo = conn.execute(text(
+            "SELECT j.id_jogador, v.id_vinculo FROM jogadores j "
+            "JOIN vinculos_clubes v ON v.id_jogador = j.id_jogador WHERE j.transfermarkt_id = '1003'"
+        )).one()
+        conn.execute(text(
+            "INSERT INTO vinculos_clubes (id_jogador, clube, posicao) VALUES (:id, 'Seleção', 'Meia')"
+        ), {"id": id_jogador})
+
+    sync.planilha_df.loc[3, "Clube"] = "Flamengo"
+    sync.sincronizar_para_banco()
+
+    with sync.db.engine.connect() as conn:
+        vinculos = conn.execute(text(
+            "SELECT id_vinculo, clube FROM vinculos_clubes WHERE id_jogador = :id ORDER BY id_vinculo"
+        ), {"id": id_jogador}).fetchall()
+    assert [tuple(v) for v in vinculos][0] == (id_vinculo, "Flamengo")
+    assert [v.clube for v in vinculos] == ["Flamengo", "Seleção"]
+
+
+def test_sem_preparo_usa_modo_linha_a_linha(sync_sem_preparo):
+    with sync_sem_preparo.db.engine.begin() as conn:
+        conn.execute(text("INSERT INTO jogadores (nome, transfermarkt_id) VALUES ('A', '1'), ('B', '1')"))
+
+    assert sync_sem_preparo.sincronizar_para_banco() is True
+
+    assert _contar(sync_sem_preparo, "jogadores") == 22
+    assert not any("ON CONFLICT" in c for c in sync_sem_preparo.comandos)
+
+
+def test_preparo_limpa_transfermarkt_id_repetido_ou_vazio(sync_sem_preparo):
+    engine = sync_sem_preparo.db.engine
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO jogadores (nome, transfermarkt_id) VALUES ('A', '1'), ('B', '1'), ('C', ''), ('D', '')"
+        ))
+
+    removidos = preparar_schema_incremental(engine)
+
+    with engine.connect() as conn:
+        assert schema_incremental_pronto(conn)
+        ids = conn.execute(text("SELECT nome, transfermarkt_id FROM jogadores ORDER BY nome")).fetchall()
+    assert [tuple(r) for r in ids] == [("A", "1"), ("B", None), ("C", None), ("D", None)]
+    assert [tm for _, tm in removidos] == ["1"]
+    assert preparar_schema_incremental(engine) == []  # idempotente
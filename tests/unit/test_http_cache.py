@@ -0,0 +1,156 @@
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.http_cache import HTTPCache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Servidor stub: /etag, /max-age, /no-store, /grande/<n>"""
+
+    requisicoes = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        _Handler.requisicoes.append((self.path, self.headers.get("If-None-Match")))
+
+        if self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._responder(b"<html>perfil</html>", {"ETag": '"v1"', "Cache-Control": "no-cache"})
+        elif self.path == "/max-age":
+            self._responder(b"{}", {"Cache-Control": "max-age=60", "Content-Type": "application/json"})
+        elif self.path == "/no-store":
+            self._responder(b"segredo", {"Cache-Control": "no-store"})
+        elif self.path.startswith("/grande/"):
+            self._responder(b"x" * 400, {"Cache-Control": "max-age=60"})
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def _responder(self, corpo, headers):
+        self.send_response(200)
+        for nome, valor in headers.items():
+            self.send_header(nome, valor)
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    _Handler.requisicoes.clear()
+    return HTTPCache(tmp_path / "cache", max_bytes=1000, ttl_padrao=3600)
+
+
+def test_max_age_serve_do_disco(servidor, cache):
+    primeira = cache.get(f"{servidor}/max-age")
+    segunda = cache.get(f"{servidor}/max-age")
+
+    assert primeira.from_cache is False
+    assert segunda.from_cache is True
+    assert segunda.json() == {}
+    assert len(_Handler.requisicoes) == 1
+
+
+def test_revalida_com_etag(servidor, cache):
+    # no-cache: armazena, mas revalida a cada uso
+    assert cache.get(f"{servidor}/etag").text == "<html>perfil</html>"
+    revalidada = cache.get(f"{servidor}/etag")
+
+    assert revalidada.status_code == 200
+    assert revalidada.from_cache is True
+    assert revalidada.content == b"<html>perfil</html>"
+    assert _Handler.requisicoes == [("/etag", None), ("/etag", '"v1"')]
+
+
+def test_no_store_nao_armazena(servidor, cache):
+    cache.get(f"{servidor}/no-store")
+    cache.get(f"{servidor}/no-store")
+
+    assert len(_Handler.requisicoes) == 2
+    assert cache.tamanho_total() == 0
+
+
+def test_erro_nao_armazena(servidor, cache):
+    assert cache.get(f"{servidor}/inexistente").status_code == 404
+    assert cache.tamanho_total() == 0
+
+
+def test_evict_lru(servidor, cache):
+    # 400 bytes cada, limite 1000: a terceira entrada remove a menos usada
+    cache.get(f"{servidor}/grande/1")
+    time.sleep(0.02)
+    cache.get(f"{servidor}/grande/2")
+    time.sleep(0.02)
+    cache.get(f"{servidor}/grande/1")  # hit: /1 passa a ser a mais recente
+    time.sleep(0.02)
+    cache.get(f"{servidor}/grande/3")
+
+    assert cache.tamanho_total() <= 1000
+    _Handler.requisicoes.clear()
+    assert cache.get(f"{servidor}/grande/1").from_cache is True
+    assert cache.get(f"{servidor}/grande/2").from_cache is False
+
+
+def test_evict_so_varre_quando_necessario(servidor, cache, monkeypatch):
+    """A pasta é varrida na primeira gravação e quando a estimativa passa do limite"""
+    varreduras = []
+    evict = cache._evict
+    monkeypatch.setattr(cache, "_evict", lambda: (varreduras.append(1), evict()))
+
+    cache.get(f"{servidor}/grande/1")
+    cache.get(f"{servidor}/grande/2")  # 800 bytes: dentro do limite, sem varrer
+    assert len(varreduras) == 1
+
+    cache.get(f"{servidor}/grande/3")  # 1200 estimados: varre e remove a mais antiga
+    assert len(varreduras) == 2
+    assert cache.tamanho_total() == cache._total_estimado == 800
+
+
+def test_stale_if_error(servidor, cache):
+    class SessaoForaDoAr:
+        def get(self, *args, **kwargs):
+            raise requests.ConnectionError("fora do ar")
+
+    url = f"{servidor}/etag"
+    cache.get(url)
+
+    # Entrada vencida + erro de rede: devolve a cópia antiga
+    assert cache.get(url, session=SessaoForaDoAr()).text == "<html>perfil</html>"
+
+    # Sem cópia em disco o erro é propagado
+    with pytest.raises(requests.ConnectionError):
+        cache.get(f"{servidor}/max-age", session=SessaoForaDoAr())
+
+
+def test_modo_offline_usa_paginas_salvas(servidor, cache):
+    url = f"{servidor}/etag"
+    cache.get(url)
+
+    offline = HTTPCache(cache.diretorio, max_bytes=1000, offline=True)
+    _Handler.requisicoes.clear()
+
+    assert offline.get(url).text == "<html>perfil</html>"
+    assert offline.get(f"{servidor}/max-age").status_code == 504
+    assert _Handler.requisicoes == []
@@ -0,0 +1,89 @@
+import sys
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.sync.normalizacao import ESCALA_LEGADO, ESCALA_SYNC, normalizar_planilha, registros
+
+HOJE = date(2026, 1, 1)
+
+
+def _planilha():
+    return pd.DataFrame([
+        {"ID": "10", "Nome": " Ana ", "Ano": 2004, "Idade": "21", "Altura": "1.15",
+         "TM": "https://www.transfermarkt.com.br/x/profil/spieler/123", "Fim de Contrato": "30/06/2026"},
+        {"ID": 11.0, "Nome": "Bia", "Ano": "", "Idade": "abc", "Altura": 182,
+         "TM": "456", "Fim de Contrato": "2027-12-31"},
+        {"ID": "", "Nome": "", "Ano": "", "Idade": "", "Altura": "",
+         "TM": "", "Fim de Contrato": ""},
+        {"ID": "x", "Nome": "Caio", "Ano": "2001", "Idade": "", "Altura": "1,8",
+         "TM": "", "Fim de Contrato": "31/02/2026"},
+        {"ID": "13", "Nome": "Davi", "Ano": "", "Idade": "", "Altura": "",
+         "TM": "", "Fim de Contrato": "15-03-2025"},
+    ])
+
+
+def test_converte_colunas_em_uma_passada():
+    validos = list(registros(normalizar_planilha(_planilha(), hoje=HOJE).validos))
+
+    ana, bia, caio, davi = validos
+    assert (ana["nome"], ana["altura"], ana["transfermarkt_id"]) == ("Ana", 115, "123")
+    assert (ana["ano_nascimento"], ana["idade_atual"], ana["id_planilha"]) == (2004, 21, 10)
+    assert ana["data_fim_contrato"] == "2026-06-30"
+    assert (bia["altura"], bia["transfermarkt_id"], bia["ano_nascimento"]) == (182, "456", None)
+    assert caio["altura"] == 180
+    assert davi["data_fim_contrato"] == "2025-03-15"
+    assert [v["linha"] for v in validos] == [2, 3, 5, 6]
+
+
+def test_status_por_escala():
+    df = _planilha()
+    sync = normalizar_planilha(df, escala=ESCALA_SYNC, hoje=HOJE).validos
+    legado = normalizar_planilha(df, escala=ESCALA_LEGADO, hoje=HOJE).validos
+
+    assert list(sync["status_contrato"]) == ["Vencendo em breve", "Vigente", "Desconhecido", "Vencido"]
+    assert list(legado["status_contrato"]) == ["ultimos_6_meses", "ativo", "indefinido", "expirado"]
+
+
+def test_rejeitados_com_linha_e_motivo():
+    rejeitados = normalizar_planilha(_planilha(), hoje=HOJE).rejeitados
+
+    assert list(rejeitados.itertuples(index=False, name=None)) == [
+        (3, "idade_atual", "abc", "Valor numérico inválido", False),
+        (4, "nome", "", "Nome vazio", True),
+        (5, "data_fim_contrato", "31/02/2026", "Data inválida", False),
+        (5, "id_planilha", "x", "Valor numérico inválido", False),
+    ]
+
+
+def test_exigir_id_descarta_linha():
+    resultado = normalizar_planilha(_planilha(), exigir_id=True, hoje=HOJE)
+
+    assert list(resultado.validos["nome"]) == ["Ana", "Bia", "Davi"]
+    descartadas = resultado.rejeitados[resultado.rejeitados["descartada"]]
+    assert list(descartadas["linha"]) == [4, 5]
+
+
+def test_aceita_cabecalhos_do_sincronizador_legado():
+    df = pd.DataFrame([{"Nome": "Ana", "Pé": "Canhoto", "Fim de contrato": "01/01/2030"}])
+
+    (ana,) = registros(normalizar_planilha(df, hoje=HOJE).validos)
+
+    assert (ana["pe_dominante"], ana["data_fim_contrato"]) == ("Canhoto", "2030-01-01")
+
+
+def test_datas_em_outros_formatos_via_dateutil():
+    df = pd.DataFrame([
+        {"Nome": "Ana", "Fim de contrato": "30.06.2027"},
+        {"Nome": "Bia", "Fim de contrato": "June 30, 2027"},
+        {"Nome": "Caio", "Fim de contrato": "em negociação"},
+    ])
+
+    resultado = normalizar_planilha(df, escala=ESCALA_LEGADO, hoje=HOJE)
+
+    assert [r["data_fim_contrato"] for r in registros(resultado.validos)] == ["2027-06-30", "2027-06-30", None]
+    assert list(resultado.validos["status_contrato"]) == ["ativo", "ativo", "indefinido"]
+    assert list(resultado.rejeitados["valor"]) == ["em negociação"]
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.analysis.oportunidades import RegrasOportunidade, listar_oportunidades, marcar_oportunidades
+
+HOJE = pd.Timestamp("2026-10-17")
+
+
+def _jogadores():
+    return pd.DataFrame({
+        "id_jogador": [1, 2, 3, 4],
+        "nome": ["Ana", "Bia", "Caio", "Duda"],
+        "idade_atual": pd.array([20, 30, None, 22], dtype="Int64"),
+        "posicao": pd.Categorical(["ATA", None, "ZAG", "MC"]),
+        "data_fim_contrato": ["2026-12-01", None, "2020-01-01", "2026-11-01"],
+        "status_contrato": pd.Categorical(["Vigente", "Livre", None, "livre"]),
+    })
+
+
+def test_regras_vetorizadas():
+    marcados = marcar_oportunidades(_jogadores(), pd.Series({1: 4.5, 4: 3.0}), hoje=HOJE)
+
+    assert list(marcados["jovem"]) == [True, False, False, False]
+    assert list(marcados["contrato"]) == [True, False, False, True]  # contrato vencido não conta
+    assert list(marcados["livre"]) == [False, True, False, True]
+
+
+def test_regras_configuraveis():
+    regras = RegrasOportunidade(idade_max_jovem=25, media_min_jovem=3.0, dias_contrato=30)
+    marcados = marcar_oportunidades(_jogadores(), pd.Series({1: 4.5, 4: 3.0}), regras, hoje=HOJE)
+
+    assert list(marcados["jovem"]) == [True, False, False, True]
+    assert list(marcados["contrato"]) == [False, False, False, True]
+
+
+def test_listar_oportunidades():
+    marcados = marcar_oportunidades(_jogadores(), pd.Series({1: 4.5}), hoje=HOJE)
+    df = listar_oportunidades(marcados)
+
+    assert list(zip(df["jogador"], df["detalhes"])) == [
+        ("Ana", "20 anos, Média: 4.5"),
+        ("Ana", "Vence em 45 dias"),
+        ("Duda", "Vence em 15 dias"),
+        ("Bia", "N/A, 30 anos"),
+        ("Duda", "MC, 22 anos"),
+    ]
@@ -0,0 +1,123 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, text
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """ScoutingDatabase em SQLite temporário com 3 jogadores"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    from database import ScoutingDatabase
+
+    db = ScoutingDatabase()
+    with db.engine.begin() as conn:
+        for i, (nome, clube) in enumerate([("Ana", "Santos"), ("Bia", "Santos"), ("Caio", "Grêmio")], 1):
+            conn.execute(text(
+                "INSERT INTO jogadores (id_jogador, nome, idade_atual) VALUES (:id, :nome, :idade)"
+            ), {"id": i, "nome": nome, "idade": 20 + i})
+            conn.execute(text(
+                "INSERT INTO vinculos_clubes (id_jogador, clube, posicao, data_fim_contrato) "
+                "VALUES (:id, :clube, 'Meia', '2020-01-01')"
+            ), {"id": i, "clube": clube})
+
+    db.comandos = []
+    event.listen(
+        db.engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: db.comandos.append(statement),
+    )
+    yield db
+    db.fechar_conexao()
+
+
+def test_carga_inicial_tipada(db):
+    df = db.buscar_todos_jogadores()
+
+    assert list(df["nome"]) == ["Ana", "Bia", "Caio"]
+    assert df["clube"].dtype == "category"
+    assert df["idade_atual"].dtype == "Int64"
+    assert db.get_opcoes_filtros()["clubes"] == ["Grêmio", "Santos"]
+
+
+def test_leituras_no_intervalo_nao_consultam_o_banco(db):
+    db.buscar_todos_jogadores()
+    db.comandos.clear()
+
+    db.buscar_todos_jogadores()
+    db.get_opcoes_filtros()
+
+    assert db.comandos == []
+
+
+def test_atualizacao_por_delta(db):
+    db.buscar_todos_jogadores()
+    with db.engine.begin() as conn:
+        conn.execute(text(
+            "UPDATE vinculos_clubes SET clube = 'Flamengo', data_atualizacao = datetime('now', '+1 hour') "
+            "WHERE id_jogador = 2"
+        ))
+        conn.execute(text("DELETE FROM vinculos_clubes WHERE id_jogador = 3"))
+        conn.execute(text("DELETE FROM jogadores WHERE id_jogador = 3"))
+    db.comandos.clear()
+
+    from src.utils.cache_tags import invalidar
+    invalidar("vinculos_clubes")
+    df = db.buscar_todos_jogadores()
+
+    assert dict(zip(df["nome"], df["clube"])) == {"Ana": "Santos", "Bia": "Flamengo"}
+    assert db.get_opcoes_filtros()["clubes"] == ["Flamengo", "Santos"]
+    carga = [c for c in db.comandos if "FROM jogadores j" in c]
+    assert len(carga) == 1 and "data_atualizacao >" in carga[0]
+
+
+def test_vinculo_removido_sem_data_atualizacao_recarrega_tudo(db):
+    with db.engine.begin() as conn:
+        # Só Ana dentro da margem da marca d'água: o delta não traz Bia
+        for tabela in ("jogadores", "vinculos_clubes"):
+            conn.execute(text(f"UPDATE {tabela} SET data_atualizacao = '2000-01-01 00:00:00' WHERE id_jogador > 1"))
+    db.buscar_todos_jogadores()
+    with db.engine.begin() as conn:
+        conn.execute(text("DELETE FROM vinculos_clubes WHERE id_jogador = 2"))
+    db.comandos.clear()
+
+    db.snapshot_jogadores.clear()
+    df = db.buscar_todos_jogadores()
+
+    assert df.loc[df["nome"] == "Bia", "clube"].isna().all()
+    carga = [c for c in db.comandos if "FROM jogadores j" in c]
+    assert len(carga) == 2 and "data_atualizacao >" not in carga[1]
+
+
+def test_recarga_completa_periodica(db):
+    db.buscar_todos_jogadores()
+    with db.engine.begin() as conn:
+        # Como scripts/maintenance/extrair_ids_tm.py: altera sem passar pela marca d'água
+        for tabela in ("jogadores", "vinculos_clubes"):
+            conn.execute(text(f"UPDATE {tabela} SET data_atualizacao = '2000-01-01 00:00:00'"))
+        conn.execute(text("UPDATE jogadores SET transfermarkt_id = '123' WHERE id_jogador = 1"))
+
+    db.snapshot_jogadores.clear()
+    assert db.buscar_todos_jogadores()["transfermarkt_id"].isna().all()
+
+    db.snapshot_jogadores._proxima_recarga = 0.0  # recarga_completa venceu
+    db.snapshot_jogadores.clear()
+    df = db.buscar_todos_jogadores()
+    assert df.loc[df["nome"] == "Ana", "transfermarkt_id"].tolist() == ["123"]
+
+
+def test_status_de_contrato_marca_apenas_linhas_alteradas(db):
+    assert db.atualizar_status_contratos() is True
+    with db.engine.begin() as conn:
+        conn.execute(text("UPDATE vinculos_clubes SET data_atualizacao = '2000-01-01 00:00:00'"))
+
+    db.atualizar_status_contratos()
+
+    with db.engine.connect() as conn:
+        alteradas = conn.execute(text(
+            "SELECT COUNT(*) FROM vinculos_clubes WHERE data_atualizacao > '2000-01-01 00:00:00'"
+        )).scalar()
+    assert alteradas == 0
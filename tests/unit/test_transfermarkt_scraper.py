@@ -0,0 +1,168 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.scraping.http_async import LimitadorPorHost, TokenBucket, requisitar_com_retry
+from src.scraping.transfermarkt_scraper import (
+    baixar_fotos_async,
+    extrair_id_da_url,
+    extrair_url_foto_do_html,
+)
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "transfermarkt"
+FOTO = b"\xff\xd8\xff" + b"0" * 2000
+
+
+def _html(nome):
+    return (FIXTURES / nome).read_text(encoding="utf-8")
+
+
+def test_extrair_url_foto_src():
+    """Foto grande no src da imagem do modal (sem ?lm=1)"""
+    assert extrair_url_foto_do_html(_html("perfil_jogador.html")) == (
+        "https://img.a.transfermarkt.technology/portrait/big/68290-1692601435.jpg"
+    )
+
+
+def test_extrair_url_foto_data_src():
+    """Imagem com lazy loading (URL em data-src)"""
+    assert extrair_url_foto_do_html(_html("perfil_data_src.html")) == (
+        "https://img.a.transfermarkt.technology/portrait/big/1046580-1700000000.jpg"
+    )
+
+
+def test_extrair_url_foto_ausente():
+    assert extrair_url_foto_do_html("<html><body>sem foto</body></html>") is None
+
+
+def test_extrair_id_da_url():
+    assert extrair_id_da_url("https://www.transfermarkt.com.br/adriano/profil/spieler/1046580") == "1046580"
+    assert extrair_id_da_url("68290") == "68290"
+    assert extrair_id_da_url("") is None
+
+
+def test_token_bucket_limita_taxa():
+    """Após a rajada inicial, as requisições seguem a taxa do bucket"""
+    async def cenario():
+        bucket = TokenBucket(taxa=20, capacidade=1)
+        inicio = time.monotonic()
+        for _ in range(5):
+            await bucket.adquirir()
+        return time.monotonic() - inicio
+
+    # 1 token imediato + 4 a 20/s = ~0.2s
+    assert asyncio.run(cenario()) >= 0.18
+
+
+def test_retry_em_429_respeita_retry_after():
+    chamadas = []
+
+    def handler(request):
+        chamadas.append(request.url)
+        if len(chamadas) < 3:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, text="ok")
+
+    async def cenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await requisitar_com_retry(
+                client, "https://stub.local/x", LimitadorPorHost(1000, 10), backoff_base=0.01
+            )
+
+    response = asyncio.run(cenario())
+    assert response.status_code == 200
+    assert len(chamadas) == 3
+
+
+def test_token_bucket_pausado():
+    async def cenario():
+        bucket = TokenBucket(taxa=1000, capacidade=10)
+        bucket.pausar(0.2)
+        bucket.pausar(0.05)  # não encurta a pausa maior
+        inicio = time.monotonic()
+        await bucket.adquirir()
+        return time.monotonic() - inicio
+
+    assert asyncio.run(cenario()) >= 0.18
+
+
+def test_429_pausa_o_host_para_todas_as_tarefas():
+    """Retry-After recebido por uma tarefa segura as requisições das outras ao mesmo host"""
+    horarios = {}
+
+    def handler(request):
+        horarios.setdefault(request.url.path, []).append(time.monotonic())
+        if request.url.path == "/a" and len(horarios["/a"]) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.3"})
+        return httpx.Response(200, text="ok")
+
+    async def cenario():
+        limitador = LimitadorPorHost(1000, 10)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            async def outra_tarefa():
+                await asyncio.sleep(0.05)
+                return await requisitar_com_retry(client, "https://stub.local/b", limitador)
+
+            return await asyncio.gather(
+                requisitar_com_retry(client, "https://stub.local/a", limitador),
+                outra_tarefa(),
+            )
+
+    respostas = asyncio.run(cenario())
+    assert [r.status_code for r in respostas] == [200, 200]
+    assert horarios["/b"][0] - horarios["/a"][0] >= 0.28
+
+
+def test_retry_esgotado_retorna_ultimo_status():
+    def handler(request):
+        return httpx.Response(503)
+
+    async def cenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await requisitar_com_retry(
+                client, "https://stub.local/x", LimitadorPorHost(1000, 10),
+                tentativas=2, backoff_base=0.01,
+            )
+
+    assert asyncio.run(cenario()).status_code == 503
+
+
+def test_baixar_fotos_async_servidor_stub(tmp_path):
+    """Pipeline completo contra um servidor stub (página + foto)"""
+    html = _html("perfil_jogador.html")
+
+    def handler(request):
+        if request.url.host == "img.a.transfermarkt.technology":
+            return httpx.Response(200, content=FOTO)
+        if request.url.path.endswith("/spieler/404"):
+            return httpx.Response(404)
+        return httpx.Response(200, text=html)
+
+    jogadores = [
+        (1, "Neymar", "68290"),
+        (2, "Adriano", "https://www.transfermarkt.com.br/adriano/profil/spieler/1046580"),
+        (3, "Sumiu", "404"),
+        (4, "Sem ID", "abc"),
+    ]
+    concluidos = []
+
+    resumo = asyncio.run(baixar_fotos_async(
+        jogadores,
+        pasta=str(tmp_path),
+        concorrencia=4,
+        taxa_por_host=1000,
+        transport=httpx.MockTransport(handler),
+        ao_concluir=lambda *args: concluidos.append(args),
+    ))
+
+    assert resumo["sucessos"] == 2
+    assert resumo["erros"] == {"Status 404": 1, "ID inválido": 1}
+    assert (tmp_path / "1.jpg").read_bytes() == FOTO
+    assert (tmp_path / "2.jpg").exists()
+    assert not (tmp_path / "3.jpg").exists()
+    assert sorted(c[0] for c in concluidos) == [1, 2, 3, 4]
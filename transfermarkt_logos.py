@@ -7,11 +7,12 @@ Autor: Scout Pro
 Data: 2025-12-09
 """
 
-import requests
 from bs4 import BeautifulSoup
 from typing import Optional, Tuple
 import streamlit as st
 
+from src.utils import http_cache
+
 
 @st.cache_data(ttl=86400)  # Cache de 24 horas
 def buscar_logos_transfermarkt(jogador_id: str) -> Tuple[Optional[str], Optional[str]]:
@@ -35,7 +36,8 @@ def buscar_logos_transfermarkt(jogador_id: str) -> Tuple[Optional[str], Optional
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
-        response = requests.get(url, headers=headers, timeout=10)
+        # Mesma página de perfil usada pelas fotos: compartilha o cache em disco
+        response = http_cache.get(url, headers=headers, timeout=10)
 
         if response.status_code != 200:
             return None, None